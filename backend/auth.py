@@ -0,0 +1,83 @@
+from typing import Annotated, Optional
+from fastapi import Depends, Header, HTTPException
+from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
+from pydantic import BaseModel
+import os
+import secrets
+import time
+
+class Session(BaseModel):
+    user_id: int
+    is_admin: bool
+
+class Auth:
+    serializer: URLSafeTimedSerializer
+    max_age: int
+    # Token fixo para o Prometheus ler /metrics, ja que os de sessao expiram
+    metrics_token: Optional[str] = None
+    # user_id -> momento da revogacao. Tokens emitidos antes disso sao recusados
+    revoked: dict[int, float] = {}
+
+def config_auth():
+    # Sem um padrao: com uma chave conhecida qualquer um assinaria um token de admin
+    secret = os.getenv("SECRET_KEY")
+    if not secret:
+        raise RuntimeError("SECRET_KEY is not set")
+
+    max_age = os.getenv("TOKEN_MAX_AGE")
+    if max_age is None:
+        max_age = "86400"
+
+    Auth.serializer = URLSafeTimedSerializer(secret, salt="session")
+    Auth.max_age = int(max_age)
+    Auth.metrics_token = os.getenv("METRICS_TOKEN") or None
+
+def issue_token(user_id: int, is_admin: bool) -> str:
+    return Auth.serializer.dumps({"user_id": user_id, "is_admin": is_admin})
+
+def revoke(user_id: int):
+    now = time.time()
+    Auth.revoked[user_id] = now
+
+    # Depois de max_age os tokens antigos ja expiraram sozinhos
+    expired = [u for u, at in Auth.revoked.items() if at < now - Auth.max_age]
+    for u in expired:
+        del Auth.revoked[u]
+
+def verify_token(token: str) -> Optional[Session]:
+    try:
+        data, issued_at = Auth.serializer.loads(token, max_age=Auth.max_age, return_timestamp=True)
+    except (SignatureExpired, BadSignature):
+        return None
+
+    session = Session(**data)
+    revoked_at = Auth.revoked.get(session.user_id)
+    if revoked_at is not None and issued_at.timestamp() <= revoked_at:
+        return None
+    return session
+
+async def get_session(authorization: Annotated[Optional[str], Header()] = None) -> Session:
+    if authorization is None or not authorization.startswith("Bearer "):
+        raise HTTPException(status_code=401, detail="Missing token")
+
+    session = verify_token(authorization.removeprefix("Bearer "))
+    if session is None:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    return session
+
+async def get_admin_session(session: Annotated[Session, Depends(get_session)]) -> Session:
+    if not session.is_admin:
+        raise HTTPException(status_code=403, detail="Admin only")
+    return session
+
+async def get_metrics_session(authorization: Annotated[Optional[str], Header()] = None):
+    # METRICS_TOKEN ou um token de admin
+    if authorization is not None and Auth.metrics_token is not None and secrets.compare_digest(
+        authorization.removeprefix("Bearer "), Auth.metrics_token
+    ):
+        return
+    await get_admin_session(await get_session(authorization))
+
+def check_owner(session: Session, user_id: int):
+    if session.user_id != user_id and not session.is_admin:
+        raise HTTPException(status_code=403, detail="Not allowed")
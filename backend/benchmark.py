@@ -0,0 +1,450 @@
+from datetime import timedelta
+from typing import Awaitable, Callable, Optional
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+import httpx
+import psycopg
+import bulk_load
+import generate_data
+from seed import connect
+
+class Fixtures:
+    turma_ids: list[int]
+    professor_ids: list[int]
+    disciplina_ids: list[int]
+    users: list[tuple[int, str]]
+    avaliacao_ids: list[int]
+    # Palavras dos nomes de professores e disciplinas, para busca e sugestoes
+    termos: list[str]
+    # user_id -> token, preenchido por login_fixtures
+    tokens: dict[int, str]
+    admin_token: str
+    # Ids criados pelo proprio benchmark, consumidos pelas rotas destrutivas
+    created_avaliacoes: list[tuple[int, int]]
+    created_users: list[int]
+
+    def __init__(self, conn: psycopg.Connection, sample: int):
+        def ids(query: str) -> list:
+            with conn.cursor() as curr:
+                curr.execute(query, (sample,))
+                return curr.fetchall()
+
+        self.turma_ids = [r[0] for r in ids("SELECT id FROM Turmas ORDER BY random() LIMIT %s")]
+        self.professor_ids = [r[0] for r in ids("SELECT id FROM Professores ORDER BY random() LIMIT %s")]
+        self.disciplina_ids = [r[0] for r in ids("SELECT id FROM Disciplinas ORDER BY random() LIMIT %s")]
+        self.users = ids("SELECT id, email FROM Users WHERE NOT is_admin ORDER BY random() LIMIT %s")
+        self.avaliacao_ids = [r[0] for r in ids("SELECT id FROM Avaliacoes ORDER BY random() LIMIT %s")]
+        nomes = ids("SELECT nome FROM Professores ORDER BY random() LIMIT %s")
+        nomes += ids("SELECT nome FROM Disciplinas ORDER BY random() LIMIT %s")
+        self.termos = [palavra for (nome,) in nomes for palavra in nome.split() if len(palavra) >= 3]
+        self.tokens = {}
+        self.admin_token = ""
+        self.created_avaliacoes = []
+        self.created_users = []
+
+    def auth(self, user_id: int) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.tokens[user_id]}"}
+
+    def admin(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.admin_token}"}
+
+    def logged_user(self, rng: random.Random) -> int:
+        return rng.choice(list(self.tokens))
+
+async def login_fixtures(base_url: str, fx: Fixtures, logins: int, admin_email: str, admin_password: str):
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        res = await client.post("/api/user", json={"email": admin_email, "password": admin_password})
+        res.raise_for_status()
+        fx.admin_token = res.json()["token"]
+
+        # Todos os logins saem do mesmo IP: acima do limite "login" do servidor o benchmark
+        # rodaria com menos usuarios do que o pedido, entao para com o motivo
+        for user_id, email in fx.users[:logins]:
+            res = await client.post("/api/user", json={"email": email, "password": USER_PASSWORD})
+            if res.status_code == 429:
+                raise SystemExit(
+                    f"Login limitado pelo servidor depois de {len(fx.tokens)} de {logins} usuarios: "
+                    "aumente RATELIMIT_LOGIN_BURST no dev.env do servidor ou diminua --logins"
+                )
+            res.raise_for_status()
+            fx.tokens[user_id] = res.json()["token"]
+
+    if not fx.tokens:
+        raise SystemExit("Nenhum usuario logado: as rotas autenticadas precisam de --logins maior que 0")
+
+# Senha dos usuarios do seed.py e do generate_data.py
+USER_PASSWORD = "123"
+# Avaliacoes por POST /api/avaliacoes/lote
+LOTE_SIZE = 50
+# Itens da fila de moderacao resolvidos ou descartados por requisicao
+MODERACAO_SIZE = 10
+# Sem o evento nesse prazo, a entrega conta como erro
+EVENT_TIMEOUT = 10
+
+Request = Callable[[httpx.AsyncClient, Fixtures, random.Random], Awaitable[Optional[httpx.Response]]]
+
+async def get_professores(client, fx, rng):
+    return await client.get("/api/professores")
+
+async def get_disciplinas(client, fx, rng):
+    return await client.get("/api/disciplinas")
+
+async def get_disciplina(client, fx, rng):
+    return await client.get(f"/api/disciplina/{rng.choice(fx.disciplina_ids)}")
+
+async def get_professor(client, fx, rng):
+    return await client.get(f"/api/professor/{rng.choice(fx.professor_ids)}")
+
+async def get_professor_image(client, fx, rng):
+    return await client.get(f"/api/professor/{rng.choice(fx.professor_ids)}/image", params={"size": "thumb"})
+
+async def get_turma(client, fx, rng):
+    return await client.get(f"/api/turma/{rng.choice(fx.turma_ids)}")
+
+async def search(client, fx, rng):
+    return await client.get("/api/search", params={"q": rng.choice(fx.termos)})
+
+async def suggest(client, fx, rng):
+    # Prefixos curtos, como os de quem ainda esta digitando
+    termo = rng.choice(fx.termos)
+    return await client.get("/api/suggest", params={"prefix": termo[:rng.randint(1, 4)]})
+
+async def post_avaliacao_turma(client, fx, rng, turma_id: int) -> httpx.Response:
+    user_id = fx.logged_user(rng)
+    res = await client.post(f"/api/turma/{turma_id}/avaliacao", json={
+        "user_id": user_id, "comentario": "benchmark", "pontuacao": rng.randint(1, 5),
+    }, headers=fx.auth(user_id))
+    if res.status_code == 200:
+        fx.created_avaliacoes.append((res.json()["id"], user_id))
+    return res
+
+async def add_avaliacao_turma(client, fx, rng):
+    return await post_avaliacao_turma(client, fx, rng, rng.choice(fx.turma_ids))
+
+async def add_avaliacao_professor(client, fx, rng):
+    user_id = fx.logged_user(rng)
+    return await client.post(f"/api/professor/{rng.choice(fx.professor_ids)}/avaliacao", json={
+        "user_id": user_id, "comentario": "benchmark", "pontuacao": rng.randint(1, 5),
+    }, headers=fx.auth(user_id))
+
+async def add_avaliacoes_lote(client, fx, rng):
+    turmas = [{
+        "turma_id": rng.choice(fx.turma_ids), "user_id": fx.logged_user(rng),
+        "comentario": "benchmark", "pontuacao": rng.randint(1, 5),
+    } for _ in range(LOTE_SIZE)]
+    res = await client.post("/api/avaliacoes/lote", json={"turmas": turmas}, headers=fx.admin())
+    if res.status_code == 200:
+        for resultado in res.json()["turmas"]:
+            if resultado["id"] is not None:
+                fx.created_avaliacoes.append((resultado["id"], turmas[resultado["indice"]]["user_id"]))
+    return res
+
+async def turma_eventos(client, fx, rng):
+    # Mede a entrega: do POST de uma avaliacao ate o evento chegar no stream aberto da turma.
+    # O stream usa um cliente proprio, para nao prender as conexoes limitadas do cenario
+    turma_id = rng.choice(fx.turma_ids)
+    async with httpx.AsyncClient(base_url=client.base_url, timeout=30) as events, \
+            events.stream("GET", f"/api/turma/{turma_id}/eventos") as res:
+        if res.status_code != 200:
+            return res
+
+        async def delivered():
+            async for line in res.aiter_lines():
+                if line.startswith("event: avaliacao"):
+                    return
+
+        start = time.perf_counter()
+        post = await post_avaliacao_turma(client, fx, rng, turma_id)
+        if post.status_code != 200:
+            return post
+        try:
+            await asyncio.wait_for(delivered(), EVENT_TIMEOUT)
+        except TimeoutError:
+            res = httpx.Response(504, request=res.request)
+        elapsed = time.perf_counter() - start
+
+    res.elapsed = timedelta(seconds=elapsed)
+    return res
+
+async def login_user(client, fx, rng):
+    _, email = rng.choice(fx.users)
+    return await client.post("/api/user", json={"email": email, "password": USER_PASSWORD})
+
+async def register_user(client, fx, rng):
+    n = rng.getrandbits(48)
+    res = await client.post("/api/user/register", json={
+        "email": f"bench{n}@email.com", "nome": "Benchmark", "matricula": f"b{n}",
+        "curso": "CIC", "password": USER_PASSWORD,
+    })
+    if res.status_code == 200:
+        user_id = res.json()["user_id"]
+        fx.tokens[user_id] = res.json()["token"]
+        fx.created_users.append(user_id)
+    return res
+
+async def get_user(client, fx, rng):
+    user_id = fx.logged_user(rng)
+    return await client.get(f"/api/user/{user_id}", headers=fx.auth(user_id))
+
+async def update_user(client, fx, rng):
+    if not fx.created_users:
+        return None
+    user_id = rng.choice(fx.created_users)
+    return await client.put(f"/api/user/{user_id}", json={
+        "email": f"bench{user_id}@email.com", "nome": "Benchmark", "matricula": f"u{user_id}", "curso": "CIC",
+    }, headers=fx.auth(user_id))
+
+async def update_password(client, fx, rng):
+    if not fx.created_users:
+        return None
+    user_id = rng.choice(fx.created_users)
+    return await client.put(f"/api/user/{user_id}/password", json={
+        "current_password": USER_PASSWORD, "new_password": USER_PASSWORD,
+    }, headers=fx.auth(user_id))
+
+def pop_created_user(fx: Fixtures) -> tuple[int, dict[str, str]]:
+    user_id = fx.created_users.pop()
+    headers = fx.auth(user_id)
+    del fx.tokens[user_id]
+    return user_id, headers
+
+async def delete_user(client, fx, rng):
+    if not fx.created_users:
+        return None
+    user_id, headers = pop_created_user(fx)
+    return await client.delete(f"/api/user/{user_id}", headers=headers)
+
+async def add_denuncia(client, fx, rng):
+    return await client.post(
+        "/api/denuncias", json={"avaliacao_id": rng.choice(fx.avaliacao_ids)},
+        headers=fx.auth(fx.logged_user(rng)),
+    )
+
+async def get_denuncias(client, fx, rng):
+    return await client.get("/api/denuncias", headers=fx.admin())
+
+async def delete_denuncia(client, fx, rng):
+    res = await client.get("/api/denuncias", params={"limit": 1}, headers=fx.admin())
+    if res.status_code != 200 or not res.json():
+        return None
+    return await client.delete(f"/api/denuncia/{res.json()[0]['id']}", headers=fx.admin())
+
+async def get_moderacao(client, fx, rng):
+    return await client.get("/api/moderacao", headers=fx.admin())
+
+async def moderar(client, fx, acao: str) -> Optional[httpx.Response]:
+    res = await client.get("/api/moderacao", params={"limit": MODERACAO_SIZE}, headers=fx.admin())
+    if res.status_code != 200 or not res.json():
+        return None
+    itens = [{"tipo": item["tipo"], "avaliacao_id": item["avaliacao_id"]} for item in res.json()]
+    return await client.post(f"/api/moderacao/{acao}", json={"itens": itens}, headers=fx.admin())
+
+async def resolve_denuncias(client, fx, rng):
+    return await moderar(client, fx, "resolver")
+
+async def dismiss_denuncias(client, fx, rng):
+    return await moderar(client, fx, "descartar")
+
+async def update_avaliacao(client, fx, rng):
+    if not fx.created_avaliacoes:
+        return None
+    avaliacao_id, user_id = rng.choice(fx.created_avaliacoes)
+    return await client.put(f"/api/avaliacao/{avaliacao_id}", json={
+        "comentario": "benchmark editado", "pontuacao": rng.randint(1, 5),
+    }, headers=fx.auth(user_id))
+
+async def delete_avaliacao(client, fx, rng):
+    if not fx.created_avaliacoes:
+        return None
+    avaliacao_id, user_id = fx.created_avaliacoes.pop()
+    return await client.delete(f"/api/avaliacao/{avaliacao_id}", headers=fx.auth(user_id))
+
+async def ban_user(client, fx, rng):
+    if not fx.created_users:
+        return None
+    user_id, headers = pop_created_user(fx)
+    res = await client.post(f"/api/turma/{rng.choice(fx.turma_ids)}/avaliacao", json={
+        "user_id": user_id, "comentario": "benchmark", "pontuacao": 1,
+    }, headers=headers)
+    if res.status_code != 200:
+        return None
+    return await client.delete(f"/api/avaliacao/userban/{res.json()['id']}", headers=fx.admin())
+
+# (nome, peso no cenario misto, requisicao). Peso 0: medida so isoladamente
+ROUTES: list[tuple[str, int, Request]] = [
+    ("GET /api/professores", 10, get_professores),
+    ("GET /api/disciplinas", 10, get_disciplinas),
+    ("GET /api/disciplina/{id}", 15, get_disciplina),
+    ("GET /api/professor/{id}", 15, get_professor),
+    ("GET /api/professor/{id}/image", 10, get_professor_image),
+    ("GET /api/turma/{id}", 25, get_turma),
+    ("GET /api/search", 5, search),
+    ("GET /api/suggest", 10, suggest),
+    ("POST /api/turma/{id}/avaliacao", 3, add_avaliacao_turma),
+    ("POST /api/professor/{id}/avaliacao", 1, add_avaliacao_professor),
+    ("POST /api/avaliacoes/lote", 0, add_avaliacoes_lote),
+    ("GET /api/turma/{id}/eventos", 0, turma_eventos),
+    ("POST /api/user", 5, login_user),
+    ("POST /api/user/register", 1, register_user),
+    ("GET /api/user/{id}", 2, get_user),
+    ("PUT /api/user/{id}", 0, update_user),
+    ("PUT /api/user/{id}/password", 0, update_password),
+    ("POST /api/denuncias", 1, add_denuncia),
+    ("GET /api/denuncias", 1, get_denuncias),
+    ("DELETE /api/denuncia/{id}", 0, delete_denuncia),
+    ("GET /api/moderacao", 1, get_moderacao),
+    ("POST /api/moderacao/resolver", 0, resolve_denuncias),
+    ("POST /api/moderacao/descartar", 0, dismiss_denuncias),
+    ("PUT /api/avaliacao/{id}", 1, update_avaliacao),
+    ("DELETE /api/avaliacao/{id}", 0, delete_avaliacao),
+    ("DELETE /api/avaliacao/userban/{id}", 0, ban_user),
+    ("DELETE /api/user/{id}", 0, delete_user),
+]
+
+def db_statements(conn: psycopg.Connection) -> Optional[int]:
+    # Requer a extensao pg_stat_statements; sem ela as idas ao banco nao sao medidas
+    try:
+        with conn.cursor() as curr:
+            curr.execute("""
+                SELECT COALESCE(SUM(calls), 0)
+                FROM pg_stat_statements
+                WHERE query NOT LIKE '%pg_stat_statements%'
+            """)
+            return int(curr.fetchone()[0])
+    except psycopg.Error:
+        conn.rollback()
+        return None
+
+def summarize(latencies: list[float], errors: int, elapsed: float, statements: Optional[int]) -> dict:
+    count = len(latencies)
+    if count >= 2:
+        q = statistics.quantiles(latencies, n=100)
+        p50, p95, p99 = q[49], q[94], q[98]
+    else:
+        p50 = p95 = p99 = latencies[0] if latencies else 0.0
+    return {
+        "requests": count,
+        "errors": errors,
+        "rps": round(count / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "p99_ms": round(p99 * 1000, 3),
+        "db_statements_per_request": round(statements / count, 2) if statements is not None and count else None,
+    }
+
+async def run_scenario(
+        base_url: str, routes: list[tuple[Request, int]], fx: Fixtures,
+        concurrency: int, duration: float, seed: int,
+) -> tuple[list[float], int, float]:
+    latencies: list[float] = []
+    errors = 0
+    requests = [r for r, _ in routes]
+    weights = [w for _, w in routes]
+
+    async def worker(client: httpx.AsyncClient, rng: random.Random, deadline: float):
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            request = rng.choices(requests, weights)[0]
+            res = await request(client, fx, rng)
+            if res is None:
+                await asyncio.sleep(0)
+                continue
+            # elapsed cobre so a ultima requisicao, sem as de preparacao
+            latencies.append(res.elapsed.total_seconds())
+            if res.status_code >= 400 and res.status_code != 404:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(*(
+            worker(client, random.Random(seed + i), deadline) for i in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - start
+
+    return latencies, errors, elapsed
+
+def seed_database(conn: psycopg.Connection, folder: str, scale: float, seed: int):
+    generate_data.generate(
+        folder, seed,
+        professores=int(1_000 * scale), disciplinas=int(500 * scale), turmas=int(5_000 * scale),
+        users=int(50_000 * scale), avaliacoes=int(1_000_000 * scale),
+        avaliacoes_professores=int(200_000 * scale), denuncias=int(10_000 * scale),
+        skew=1.1,
+    )
+    bulk_load.load(conn, folder)
+
+def compare(results: dict, baseline_path: str):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+
+    print(f"\n{'cenario':45} {'rps':>16} {'p50 ms':>16} {'p99 ms':>16}")
+    for name, now in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+
+        def delta(key: str) -> str:
+            if not before[key]:
+                return f"{now[key]:>16}"
+            return f"{now[key]:>8} ({(now[key] - before[key]) / before[key]:+.0%})"
+
+        print(f"{name:45} {delta('rps'):>16} {delta('p50_ms'):>16} {delta('p99_ms'):>16}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTTP das rotas do main.py")
+    parser.add_argument("--url", default="http://127.0.0.1:5000")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10, help="segundos por cenario")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--load-scale", type=float, default=None,
+                        help="gera e carrega dados nessa escala antes (banco vazio)")
+    parser.add_argument("--data-folder", default="./data")
+    parser.add_argument("--only-mix", action="store_true", help="roda apenas o cenario misto")
+    parser.add_argument("--out", default="benchmark.json")
+    parser.add_argument("--baseline", default=None, help="arquivo de resultados anterior para comparar")
+    parser.add_argument("--logins", type=int, default=50, help="usuarios logados para as rotas autenticadas")
+    # Admin criado pelo generate_data.py
+    parser.add_argument("--admin-email", default="user1@email.com")
+    parser.add_argument("--admin-password", default=USER_PASSWORD)
+    args = parser.parse_args()
+
+    with connect() as conn:
+        conn.autocommit = True
+        if args.load_scale is not None:
+            seed_database(conn, args.data_folder, args.load_scale, args.seed)
+        fx = Fixtures(conn, 1_000)
+        asyncio.run(login_fixtures(args.url, fx, args.logins, args.admin_email, args.admin_password))
+
+        scenarios: list[tuple[str, list[tuple[Request, int]]]] = []
+        if not args.only_mix:
+            # Rotas destrutivas consomem ids criados pelas rotas anteriores da lista
+            scenarios += [(name, [(request, 1)]) for name, _, request in ROUTES]
+        scenarios.append(("mix", [(request, weight) for _, weight, request in ROUTES if weight]))
+
+        results = {}
+        for name, routes in scenarios:
+            before = db_statements(conn)
+            latencies, errors, elapsed = asyncio.run(run_scenario(
+                args.url, routes, fx, args.concurrency, args.duration, args.seed,
+            ))
+            after = db_statements(conn)
+            statements = after - before if before is not None and after is not None else None
+            results[name] = summarize(latencies, errors, elapsed, statements)
+            print(name, results[name])
+
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Resultados salvos em {args.out}")
+
+    if args.baseline is not None:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+from typing import Optional
+import argparse
+import json
+import os
+import psycopg
+from seed import connect
+
+# Ordem de carga respeita as chaves estrangeiras
+TABLES = [
+    ("Departamentos", ["id", "nome"]),
+    ("Professores", ["id", "nome", "departamento_id"]),
+    ("Disciplinas", ["id", "nome", "departamento_id"]),
+    ("Turmas", ["id", "numero", "professor_id", "disciplina_id"]),
+    ("Users", ["id", "email", "nome", "matricula", "curso", "senha", "is_admin"]),
+    ("Avaliacoes", ["id", "pontuacao", "comentario", "user_id", "turma_id"]),
+    ("AvaliacoesProfessores", ["id", "pontuacao", "comentario", "user_id", "professor_id"]),
+    ("Denuncias", ["id", "avaliacao_id"]),
+    ("DenunciasProfessor", ["id", "avaliacao_id"]),
+]
+
+# Triggers de contadores sao desligadas durante a carga e os contadores recalculados no final
+COUNTER_TRIGGERS = [
+    ("Avaliacoes", "update_avaliacao_turma_on_change_avaliacao"),
+    ("AvaliacoesProfessores", "update_avaliacao_professor_on_change_avaliacao"),
+    ("Denuncias", "update_moderacao_fila_on_change_denuncia"),
+    ("DenunciasProfessor", "update_moderacao_fila_on_change_denuncia"),
+]
+# Tambem desligadas: seria um NOTIFY por linha carregada
+NOTIFY_TRIGGERS = [
+    ("Avaliacoes", "notify_avaliacao_on_change"),
+    ("AvaliacoesProfessores", "notify_avaliacao_on_change"),
+]
+
+CHUNK_SIZE = 1 << 20
+
+def copy_csv(curr: psycopg.Cursor, table: str, columns: list[str], path: str):
+    with open(path, "rb") as f:
+        with curr.copy(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, HEADER true)"
+        ) as copy:
+            while data := f.read(CHUNK_SIZE):
+                copy.write(data)
+
+def copy_ndjson(curr: psycopg.Cursor, table: str, columns: list[str], path: str):
+    with open(path, encoding="utf-8") as f:
+        with curr.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                copy.write_row(tuple(row.get(c) for c in columns))
+
+def find_file(folder: str, table: str) -> Optional[tuple[str, str]]:
+    for ext in ("csv", "ndjson"):
+        path = os.path.join(folder, f"{table.lower()}.{ext}")
+        if os.path.exists(path):
+            return ext, path
+    return None
+
+def load(conn: psycopg.Connection, folder: str):
+    with conn.cursor() as curr:
+        for table, trigger in COUNTER_TRIGGERS + NOTIFY_TRIGGERS:
+            curr.execute(f"ALTER TABLE {table} DISABLE TRIGGER {trigger}")
+
+        for table, columns in TABLES:
+            found = find_file(folder, table)
+            if found is None:
+                continue
+
+            ext, path = found
+            print(f"Carregando {table} de {path}")
+            if ext == "csv":
+                copy_csv(curr, table, columns, path)
+            else:
+                copy_ndjson(curr, table, columns, path)
+
+            # Os ids vem dos arquivos, entao a sequence precisa ser ajustada
+            curr.execute(f"""
+                SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 0) + 1, false)
+                FROM {table}
+            """)
+
+        for table, trigger in COUNTER_TRIGGERS + NOTIFY_TRIGGERS:
+            curr.execute(f"ALTER TABLE {table} ENABLE TRIGGER {trigger}")
+
+        curr.execute("SELECT recompute_avaliacao_counters()")
+        curr.execute("SELECT recompute_moderacao_fila()")
+    conn.commit()
+
+    conn.autocommit = True
+    with conn.cursor() as curr:
+        for table, _ in TABLES:
+            curr.execute(f"ANALYZE {table}")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Carrega arquivos <tabela>.csv ou <tabela>.ndjson de uma pasta usando COPY"
+    )
+    parser.add_argument("folder")
+    args = parser.parse_args()
+
+    with connect() as conn:
+        load(conn, args.folder)
+
+
+if __name__ == "__main__":
+    main()
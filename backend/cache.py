@@ -0,0 +1,102 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import functools
+import time
+from connection import after_commit, fresh_reads, lagging_reads
+
+class TTLCache:
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        # (tipo, id) -> chaves em cache, para invalidar todas as paginas de uma vez
+        self.groups: dict[tuple[str, int], set[Hashable]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # Muda a cada invalidate. Uma leitura que comecou antes nao grava no cache
+        self.generation = 0
+
+    def get(self, key: tuple) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires, value = entry
+        if expires < time.monotonic():
+            self.remove(key)
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: tuple, value: Any):
+        self.entries[key] = (time.monotonic() + self.ttl, value)
+        self.entries.move_to_end(key)
+        self.groups.setdefault(key[:2], set()).add(key)
+
+        while len(self.entries) > self.max_size:
+            oldest = next(iter(self.entries))
+            self.remove(oldest)
+            self.evictions += 1
+
+    def remove(self, key: tuple):
+        self.entries.pop(key, None)
+        group = self.groups.get(key[:2])
+        if group is not None:
+            group.discard(key)
+            if not group:
+                del self.groups[key[:2]]
+
+    def invalidate(self, kind: str, id: int):
+        self.generation += 1
+        for key in self.groups.pop((kind, id), set()):
+            self.entries.pop(key, None)
+            self.invalidations += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.groups.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+detail_cache = TTLCache(max_size=1024, ttl=60)
+
+def cached(kind: str):
+    # Chave: (kind, id, funcao, *demais argumentos). Resultados None nao sao guardados
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(conn, id: int, *args):
+            key = (kind, id, func.__name__, *args)
+            # Leitura logo apos uma escrita do mesmo cliente: vai ao banco e renova o cache
+            value = None if fresh_reads.get() else detail_cache.get(key)
+            if value is not None:
+                return value
+
+            generation = detail_cache.generation
+            value = await func(conn, id, *args)
+            # Se algo foi invalidado durante a consulta, o valor lido pode ser o anterior ao
+            # commit. O mesmo vale para a replica atrasada, mesmo sem invalidacao no meio
+            if value is not None and generation == detail_cache.generation and not lagging_reads.get():
+                detail_cache.set(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+def invalidate_on_commit(conn, kind: str, id: int):
+    # Invalidar antes do commit deixaria uma leitura concorrente guardar a versao antiga
+    after_commit(conn, lambda: detail_cache.invalidate(kind, id))
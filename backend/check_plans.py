@@ -0,0 +1,105 @@
+from typing import Any
+import argparse
+import asyncio
+import sys
+import psycopg
+import models
+from auth import config_auth
+from connection import config_db, conninfo
+
+class ExplainCursor(psycopg.AsyncCursor):
+    # Antes de executar cada comando, guarda o plano do EXPLAIN
+    plans: list[tuple[str, Any]] = []
+
+    async def execute(self, query, params=None, **kwargs):
+        await super().execute("EXPLAIN (FORMAT JSON) " + query, params)
+        plan = (await self.fetchone())[0]
+        ExplainCursor.plans.append((query, plan))
+        return await super().execute(query, params, **kwargs)
+
+def seq_scans(node: dict) -> list[str]:
+    found = []
+    if node.get("Node Type") == "Seq Scan":
+        found.append(node["Relation Name"].lower())
+    for child in node.get("Plans", []):
+        found += seq_scans(child)
+    return found
+
+async def sample_id(conn: psycopg.AsyncConnection, table: str) -> int:
+    async with conn.cursor() as curr:
+        await curr.execute(f"SELECT COALESCE(MAX(id), 1) FROM {table}")
+        return (await curr.fetchone())[0]
+
+async def large_tables(conn: psycopg.AsyncConnection, min_rows: int) -> set[str]:
+    async with conn.cursor() as curr:
+        await curr.execute("""
+            SELECT relname
+            FROM pg_class
+            WHERE relkind='r' AND reltuples >= %s
+        """, (min_rows,))
+        return {relname for relname, in await curr.fetchall()}
+
+async def run_models(conn: psycopg.AsyncConnection):
+    turma_id = await sample_id(conn, "Turmas")
+    professor_id = await sample_id(conn, "Professores")
+    disciplina_id = await sample_id(conn, "Disciplinas")
+    user_id = await sample_id(conn, "Users")
+    avaliacao_id = await sample_id(conn, "Avaliacoes")
+
+    conn.cursor_factory = ExplainCursor
+    # Funcoes com cache sao chamadas direto, sem passar pelo cache
+    await models.get_professor_info.__wrapped__(conn, professor_id)
+    await models.get_disciplina_info.__wrapped__(conn, disciplina_id)
+    await models.get_turma_info.__wrapped__(conn, turma_id)
+    await models.get_turma_json.__wrapped__(conn, turma_id)
+    await models.get_all_disciplinas(conn)
+    await models.get_all_professores(conn)
+    await models.get_all_professores_json(conn)
+    await models.get_professor_image(conn, professor_id, "thumb")
+    await models.get_user_info(conn, user_id)
+    await models.get_denuncias(conn)
+    await models.search(conn, "professor")
+    await models.logg_user(conn, models.UserLogginIn(email="check@email.com", password="check"))
+    await models.register_user(conn, models.UserRegisterIn(
+        email="check@email.com", nome="Check", matricula="check", curso="CIC", password="check",
+    ))
+    await models.update_avaliacao(conn, avaliacao_id, models.UpdateAvaliacaoIn(comentario="check", pontuacao=1))
+    await models.delete_avaliacao(conn, avaliacao_id)
+    await models.delete_user(conn, user_id)
+
+async def check(min_rows: int) -> int:
+    await config_db()
+    # delete_user revoga os tokens do usuario, o que usa a configuracao de auth
+    config_auth()
+    async with await psycopg.AsyncConnection.connect(conninfo()) as conn:
+        large = await large_tables(conn, min_rows)
+        try:
+            await run_models(conn)
+        finally:
+            # Os comandos de escrita tambem sao executados: nada pode ser gravado
+            await conn.rollback()
+
+    failures = 0
+    for query, plan in ExplainCursor.plans:
+        scanned = [t for t in seq_scans(plan[0]["Plan"]) if t in large]
+        if scanned:
+            failures += 1
+            print(f"Seq Scan em {', '.join(scanned)}:\n{query.strip()}\n")
+
+    print(f"{len(ExplainCursor.plans)} consultas verificadas, {failures} com Seq Scan em tabelas grandes")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Falha se alguma consulta do models.py fizer Seq Scan em tabela grande"
+    )
+    parser.add_argument("--min-rows", type=int, default=10_000,
+                        help="tabelas com pelo menos essa quantidade de linhas sao consideradas grandes")
+    args = parser.parse_args()
+
+    failures = asyncio.run(check(args.min_rows))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,15 @@
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Callable, Optional
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
 import psycopg
+import psycopg_pool
+import asyncio
 import dotenv
 import os
+import time
+from metrics import observe_acquire
 
 class Database:
     host: str
@@ -8,18 +17,244 @@ class Database:
     db_name: str
     password: str
     user: str
+    replica_host: Optional[str]
+    replica_port: str
+    pool_min_size: int
+    pool_max_size: int
+    pool_max_idle: float
+    pool_timeout: float
+    pool_check_interval: float
+    pool: psycopg_pool.AsyncConnectionPool
+    # O mesmo objeto que pool quando nao ha replica configurada
+    replica_pool: psycopg_pool.AsyncConnectionPool
+    check_tasks: list[asyncio.Task] = []
+    # conexao -> acoes que so podem rodar depois do commit, como invalidar o cache
+    pending_actions: dict[psycopg.AsyncConnection, list[Callable[[], None]]] = {}
 
-async def get_db():
-    async with await psycopg.AsyncConnection.connect(
-            f"""
-            host={Database.host}
-            port={Database.port}
+# Depois de uma escrita, o cliente le do primario ate a replica aplicar o commit.
+# Passado esse tempo (s) o cliente volta para a replica de qualquer jeito
+PIN_MAX_AGE = 30
+
+class Replication:
+    # cliente -> (LSN do ultimo commit, momento do commit), ordenado pelo commit
+    pinned: OrderedDict[str, tuple[int, float]] = OrderedDict()
+    # Maior LSN que a replica ja aplicou, visto na ultima consulta
+    replayed: int = 0
+    # LSN do ultimo commit desta instancia que invalidou o cache
+    last_commit: int = 0
+    primary_reads: int = 0
+    replica_reads: int = 0
+    # Leituras da replica ainda atras de last_commit, que nao foram para o cache
+    lagging_reads: int = 0
+
+# Ligada quando a leitura precisa ver as proprias escritas: o cache de detalhes e ignorado
+fresh_reads: ContextVar[bool] = ContextVar("fresh_reads", default=False)
+# Ligada quando a leitura vem de uma replica que ainda nao aplicou o ultimo commit: o
+# resultado pode ser de antes de uma invalidacao que ja rodou, e nao vai para o cache
+lagging_reads: ContextVar[bool] = ContextVar("lagging_reads", default=False)
+
+def conninfo(host: Optional[str] = None, port: Optional[str] = None) -> str:
+    return f"""
+            host={host or Database.host}
+            port={port or Database.port}
             dbname={Database.db_name}
             password={Database.password}
             user={Database.user}
             """
-    ) as aconn:
-        yield aconn
+
+async def check_connection(conn: psycopg.AsyncConnection):
+    # Executado quando a conexao volta ao pool (o psycopg-pool 3.1 nao tem check no
+    # checkout). Se falhar, o pool descarta a conexao em vez de guarda-la quebrada
+    await conn.execute("SELECT 1")
+    await conn.rollback()
+
+async def check_loop(pool: psycopg_pool.AsyncConnectionPool):
+    # Conexoes paradas no pool tambem caem (restart do banco, timeout de rede):
+    # pool.check() testa as ociosas e repoe as quebradas
+    while True:
+        await asyncio.sleep(Database.pool_check_interval)
+        await pool.check()
+
+def make_pool(info: str) -> psycopg_pool.AsyncConnectionPool:
+    return psycopg_pool.AsyncConnectionPool(
+        info,
+        min_size=Database.pool_min_size,
+        max_size=Database.pool_max_size,
+        max_idle=Database.pool_max_idle,
+        timeout=Database.pool_timeout,
+        reset=check_connection,
+        open=False,
+    )
+
+def has_replica() -> bool:
+    return Database.replica_pool is not Database.pool
+
+async def open_pool():
+    Database.pool = make_pool(conninfo())
+    await Database.pool.open(wait=True)
+
+    Database.replica_pool = Database.pool
+    if Database.replica_host is not None:
+        Database.replica_pool = make_pool(conninfo(Database.replica_host, Database.replica_port))
+        await Database.replica_pool.open(wait=True)
+
+    pools = [Database.pool, Database.replica_pool] if has_replica() else [Database.pool]
+    Database.check_tasks = [asyncio.create_task(check_loop(pool)) for pool in pools]
+
+async def close_pool():
+    for task in Database.check_tasks:
+        task.cancel()
+    await asyncio.gather(*Database.check_tasks, return_exceptions=True)
+    if has_replica():
+        await Database.replica_pool.close()
+    await Database.pool.close()
+
+def pool_stats() -> dict[str, int]:
+    stats = Database.pool.get_stats()
+    if has_replica():
+        stats.update({f"replica_{k}": v for k, v in Database.replica_pool.get_stats().items()})
+        stats["pinned_clients"] = len(Replication.pinned)
+        stats["primary_reads"] = Replication.primary_reads
+        stats["replica_reads"] = Replication.replica_reads
+        stats["lagging_reads"] = Replication.lagging_reads
+    return stats
+
+def client_key(request: Request) -> str:
+    return request.client.host if request.client is not None else ""
+
+def parse_lsn(lsn: str) -> int:
+    # LSN no formato "16/B374D848"
+    high, low = lsn.split("/")
+    return (int(high, 16) << 32) + int(low, 16)
+
+def pin(client: str, lsn: int):
+    now = time.monotonic()
+    Replication.pinned.pop(client, None)
+    Replication.pinned[client] = (lsn, now)
+
+    # Os mais antigos ficam no inicio: so olha ate o primeiro ainda valido
+    while True:
+        oldest, (_, at) = next(iter(Replication.pinned.items()))
+        if at >= now - PIN_MAX_AGE:
+            break
+        del Replication.pinned[oldest]
+
+def pinned_lsn(client: str) -> Optional[int]:
+    entry = Replication.pinned.get(client)
+    if entry is None:
+        return None
+
+    lsn, at = entry
+    if lsn <= Replication.replayed or at < time.monotonic() - PIN_MAX_AGE:
+        del Replication.pinned[client]
+        return None
+    return lsn
+
+async def replica_caught_up(conn: psycopg.AsyncConnection, lsn: int) -> bool:
+    # Fora de recovery (replica promovida) pg_last_wal_replay_lsn() e NULL
+    cur = await conn.execute("""
+        SELECT COALESCE(pg_last_wal_replay_lsn(), pg_current_wal_lsn())::text
+    """)
+    Replication.replayed = max(Replication.replayed, parse_lsn((await cur.fetchone())[0]))
+    return lsn <= Replication.replayed
+
+async def check_replica_lag(conn: psycopg.AsyncConnection):
+    # So consulta a replica enquanto ela nao confirmou o ultimo commit
+    if Replication.last_commit > Replication.replayed and not await replica_caught_up(conn, Replication.last_commit):
+        Replication.lagging_reads += 1
+        lagging_reads.set(True)
+
+async def current_lsn(conn: psycopg.AsyncConnection) -> int:
+    cur = await conn.execute("SELECT pg_current_wal_lsn()::text")
+    return parse_lsn((await cur.fetchone())[0])
+
+def after_commit(conn: psycopg.AsyncConnection, action: Callable[[], None]):
+    Database.pending_actions.setdefault(conn, []).append(action)
+
+async def commit(conn: psycopg.AsyncConnection):
+    await conn.commit()
+    actions = Database.pending_actions.pop(conn, [])
+    if actions and has_replica():
+        # Registrado antes de invalidar: uma leitura da replica que comece depois da
+        # invalidacao ja sabe que ela pode estar atras e nao grava no cache
+        Replication.last_commit = max(Replication.last_commit, await current_lsn(conn))
+    for action in actions:
+        action()
+
+async def commit_request(request: Request):
+    # Commit da conexao de get_db, antes de enviar a resposta (ver CommitRoute)
+    conn = getattr(request.state, "db", None)
+    if conn is None:
+        return
+    request.state.db = None
+
+    await commit(conn)
+    if has_replica() and request.method not in ("GET", "HEAD"):
+        pin(client_key(request), await current_lsn(conn))
+
+class CommitRoute(APIRoute):
+    # O fim do yield de get_db so roda depois que a resposta foi enviada. Aqui o commit
+    # acontece antes: o cliente so recebe sucesso de uma escrita confirmada, e ja esta
+    # preso ao primario quando fizer a proxima leitura
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def commit_handler(request: Request) -> Response:
+            response = await handler(request)
+            await commit_request(request)
+            return response
+
+        return commit_handler
+
+async def get_db(request: Request):
+    # Primario, para as rotas de escrita
+    try:
+        start = time.perf_counter()
+        async with Database.pool.connection() as aconn:
+            observe_acquire("primary", time.perf_counter() - start)
+            request.state.db = aconn
+            try:
+                yield aconn
+            finally:
+                # Com erro a transacao e desfeita: as acoes pendentes nao valem mais
+                Database.pending_actions.pop(aconn, None)
+    except psycopg_pool.PoolTimeout:
+        raise HTTPException(status_code=503, detail="Database busy, try again later")
+
+    return
+
+async def get_read_db(request: Request):
+    # Replica, a menos que o cliente tenha escrito algo que ela ainda nao aplicou
+    try:
+        lsn = pinned_lsn(client_key(request))
+        start = time.perf_counter()
+        if lsn is not None:
+            async with Database.replica_pool.connection() as aconn:
+                observe_acquire("replica", time.perf_counter() - start)
+                caught_up = await replica_caught_up(aconn, lsn)
+                if caught_up:
+                    Replication.replica_reads += 1
+                    await check_replica_lag(aconn)
+                    yield aconn
+            if caught_up:
+                return
+
+            fresh_reads.set(True)
+            Replication.primary_reads += 1
+            start = time.perf_counter()
+            async with Database.pool.connection() as aconn:
+                observe_acquire("primary", time.perf_counter() - start)
+                yield aconn
+            return
+
+        Replication.replica_reads += 1
+        async with Database.replica_pool.connection() as aconn:
+            observe_acquire("replica", time.perf_counter() - start)
+            if has_replica():
+                await check_replica_lag(aconn)
+            yield aconn
+    except psycopg_pool.PoolTimeout:
+        raise HTTPException(status_code=503, detail="Database busy, try again later")
 
     return
 
@@ -45,10 +280,43 @@ async def config_db():
     if password is None:
         password = "1234"
 
-    Database.host = host 
-    Database.db_name = db_name 
-    Database.user = user 
-    Database.port = port 
-    Database.password = password 
+    # Sem HOST_REPLICA_DB todas as rotas usam o primario
+    replica_host = os.getenv("HOST_REPLICA_DB")
+
+    replica_port = os.getenv("PORT_REPLICA_DB")
+    if replica_port is None:
+        replica_port = port
+
+    pool_min_size = os.getenv("POOL_MIN_SIZE_DB")
+    if pool_min_size is None:
+        pool_min_size = "2"
+
+    pool_max_size = os.getenv("POOL_MAX_SIZE_DB")
+    if pool_max_size is None:
+        pool_max_size = "10"
+
+    pool_max_idle = os.getenv("POOL_MAX_IDLE_DB")
+    if pool_max_idle is None:
+        pool_max_idle = "300"
+
+    pool_timeout = os.getenv("POOL_TIMEOUT_DB")
+    if pool_timeout is None:
+        pool_timeout = "5"
+
+    pool_check_interval = os.getenv("POOL_CHECK_INTERVAL_DB")
+    if pool_check_interval is None:
+        pool_check_interval = "60"
 
+    Database.host = host
+    Database.db_name = db_name
+    Database.user = user
+    Database.port = port
+    Database.password = password
+    Database.replica_host = replica_host
+    Database.replica_port = replica_port
+    Database.pool_min_size = int(pool_min_size)
+    Database.pool_max_size = int(pool_max_size)
+    Database.pool_max_idle = float(pool_max_idle)
+    Database.pool_timeout = float(pool_timeout)
+    Database.pool_check_interval = float(pool_check_interval)
 
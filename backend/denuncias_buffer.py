@@ -0,0 +1,121 @@
+from typing import Optional
+from fastapi import HTTPException
+import asyncio
+import logging
+import models
+from connection import Database
+
+logger = logging.getLogger(__name__)
+
+# Grava quando juntar BATCH_SIZE denuncias ou a cada FLUSH_INTERVAL segundos
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.005
+# Maximo de avaliacoes distintas esperando gravacao. Denuncias repetidas so somam
+MAX_PENDING = 10_000
+# Quanto tempo (s) uma requisicao espera por espaco no buffer antes do 503
+PENDING_TIMEOUT = 1
+# Espera (s) depois de uma gravacao que falhou, antes de tentar de novo
+RETRY_DELAY = 1
+
+class DenunciasBuffer:
+    def __init__(self):
+        self.pending: dict[tuple[str, int], int] = {}
+        self.size = 0
+        self.has_items = asyncio.Event()
+        self.full = asyncio.Event()
+        self.flushed = asyncio.Event()
+        self.closing = False
+        self.task: Optional[asyncio.Task] = None
+        self.received = 0
+        self.coalesced = 0
+        self.written = 0
+        self.rejected = 0
+        # Avaliacoes apagadas entre o 202 e a gravacao: as denuncias delas sao descartadas
+        self.dropped = 0
+        self.failed_flushes = 0
+
+    async def add(self, tipo: str, avaliacao_id: int):
+        key = (tipo, avaliacao_id)
+        while key not in self.pending and len(self.pending) >= MAX_PENDING:
+            self.flushed.clear()
+            try:
+                await asyncio.wait_for(self.flushed.wait(), PENDING_TIMEOUT)
+            except TimeoutError:
+                self.rejected += 1
+                raise HTTPException(status_code=503, detail="Too many pending denuncias, try again later")
+
+        self.received += 1
+        if key in self.pending:
+            self.coalesced += 1
+        self.pending[key] = self.pending.get(key, 0) + 1
+        self.size += 1
+        self.has_items.set()
+        if self.size >= BATCH_SIZE:
+            self.full.set()
+
+    async def flush(self) -> bool:
+        if not self.pending:
+            return True
+
+        batch, self.pending, self.size = self.pending, {}, 0
+        try:
+            async with Database.pool.connection() as conn:
+                dropped = await models.add_denuncias_lote(conn, batch)
+            self.written += sum(batch.values())
+            if dropped:
+                logger.warning("Dropped denuncias for %d missing avaliacoes", dropped)
+                self.dropped += dropped
+            return True
+        except Exception:
+            # Qualquer erro, nao so do banco: a task nao pode morrer e deixar as
+            # proximas requisicoes esperando ate o 503.
+            # Devolve o lote para a proxima tentativa, sem passar do limite
+            logger.exception("Fail to write %d denuncias", sum(batch.values()))
+            self.failed_flushes += 1
+            for key, qtd in batch.items():
+                if key in self.pending or len(self.pending) < MAX_PENDING:
+                    self.pending[key] = self.pending.get(key, 0) + qtd
+                    self.size += qtd
+            return False
+        finally:
+            self.flushed.set()
+
+    async def run(self):
+        while not self.closing:
+            await self.has_items.wait()
+            try:
+                await asyncio.wait_for(self.full.wait(), FLUSH_INTERVAL)
+            except TimeoutError:
+                pass
+            self.has_items.clear()
+            self.full.clear()
+            if not await self.flush() and not self.closing:
+                await asyncio.sleep(RETRY_DELAY)
+            if self.pending:
+                self.has_items.set()
+
+    def start(self):
+        self.task = asyncio.create_task(self.run())
+
+    async def close(self):
+        # Sem cancelar a task, para nao perder um lote no meio da gravacao
+        self.closing = True
+        self.has_items.set()
+        self.full.set()
+        if self.task is not None:
+            await self.task
+        await self.flush()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending": self.size,
+            "pending_avaliacoes": len(self.pending),
+            "received": self.received,
+            "coalesced": self.coalesced,
+            "written": self.written,
+            "rejected": self.rejected,
+            "dropped": self.dropped,
+            "failed_flushes": self.failed_flushes,
+        }
+
+denuncias_buffer = DenunciasBuffer()
@@ -0,0 +1,134 @@
+from itertools import accumulate
+import argparse
+import csv
+import os
+import random
+from bulk_load import TABLES
+
+PRIMEIROS_NOMES = [
+    "Ana", "Bruno", "Carla", "Daniel", "Eduarda", "Felipe", "Gabriela", "Henrique",
+    "Isabela", "João", "Larissa", "Lucas", "Mariana", "Natália", "Otávio", "Paulo",
+    "Rafaela", "Rodrigo", "Sofia", "Thiago", "Vinícius", "Yasmin",
+]
+SOBRENOMES = [
+    "Almeida", "Barbosa", "Cardoso", "Costa", "Fernandes", "Gomes", "Lemos", "Lima",
+    "Martins", "Oliveira", "Pereira", "Ribeiro", "Rocha", "Santos", "Silva", "Souza",
+]
+DEPARTAMENTOS = ["CIC", "MAT", "EST", "FIS", "ENE", "ENM", "QUI", "LET"]
+AREAS = [
+    "Algoritmos", "Cálculo", "Estatística", "Física", "Programação", "Redes",
+    "Bancos de Dados", "Compiladores", "Probabilidade", "Álgebra Linear",
+]
+NIVEIS = ["1", "2", "3", "Avançado", "Introdução a", "Tópicos em"]
+COMENTARIOS = [
+    "O professor explica muito bem",
+    "Matéria difícil, mas vale a pena",
+    "Provas muito longas",
+    "Achei a matéria interessante",
+    "Não gostei da metodologia",
+    "Listas de exercício ajudam bastante",
+    "Aulas confusas e pouco material",
+    "Melhor matéria do curso",
+]
+# Notas tendem a ser altas, como em avaliações reais
+PESOS_NOTAS = [(1, 5), (2, 7), (3, 18), (4, 35), (5, 35)]
+
+def zipf_weights(n: int, s: float) -> list[float]:
+    return list(accumulate(1 / (rank ** s) for rank in range(1, n + 1)))
+
+def nome(rng: random.Random) -> str:
+    return f"{rng.choice(PRIMEIROS_NOMES)} {rng.choice(SOBRENOMES)} {rng.choice(SOBRENOMES)}"
+
+class Writer:
+    def __init__(self, folder: str):
+        self.folder = folder
+        self.columns = dict(TABLES)
+
+    def write(self, table: str, rows):
+        path = os.path.join(self.folder, f"{table.lower()}.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            out = csv.writer(f)
+            out.writerow(self.columns[table])
+            out.writerows(rows)
+        print(f"Gerado {path}")
+
+def generate(
+        folder: str, seed: int,
+        professores: int, disciplinas: int, turmas: int, users: int,
+        avaliacoes: int, avaliacoes_professores: int, denuncias: int,
+        skew: float,
+):
+    rng = random.Random(seed)
+    os.makedirs(folder, exist_ok=True)
+    writer = Writer(folder)
+    notas, pesos_notas = zip(*PESOS_NOTAS)
+    cum_notas = list(accumulate(pesos_notas))
+
+    writer.write("Departamentos", (
+        (i, d) for i, d in enumerate(DEPARTAMENTOS, start=1)
+    ))
+    writer.write("Professores", (
+        (i, nome(rng), rng.randint(1, len(DEPARTAMENTOS)))
+        for i in range(1, professores + 1)
+    ))
+    writer.write("Disciplinas", (
+        (i, f"{rng.choice(NIVEIS)} {rng.choice(AREAS)} {i}", rng.randint(1, len(DEPARTAMENTOS)))
+        for i in range(1, disciplinas + 1)
+    ))
+    writer.write("Turmas", (
+        (i, f"{rng.randint(1, 20):02}", rng.randint(1, professores), rng.randint(1, disciplinas))
+        for i in range(1, turmas + 1)
+    ))
+    writer.write("Users", (
+        (i, f"user{i}@email.com", nome(rng), f"{200000000 + i}", rng.choice(DEPARTAMENTOS), "123", i == 1)
+        for i in range(1, users + 1)
+    ))
+
+    # Poucas turmas, professores e usuarios concentram a maior parte das avaliacoes
+    cum_turmas = zipf_weights(turmas, skew)
+    cum_professores = zipf_weights(professores, skew)
+    cum_users = zipf_weights(users, skew)
+
+    def avaliacao_rows(n: int, cum_alvo: list[float], n_alvo: int):
+        for i in range(1, n + 1):
+            alvo = rng.choices(range(1, n_alvo + 1), cum_weights=cum_alvo)[0]
+            user = rng.choices(range(1, users + 1), cum_weights=cum_users)[0]
+            nota = rng.choices(notas, cum_weights=cum_notas)[0]
+            yield (i, nota, rng.choice(COMENTARIOS), user, alvo)
+
+    writer.write("Avaliacoes", avaliacao_rows(avaliacoes, cum_turmas, turmas))
+    writer.write("AvaliacoesProfessores", avaliacao_rows(avaliacoes_professores, cum_professores, professores))
+
+    # Denuncias se concentram em poucas avaliacoes
+    cum_avaliacoes = zipf_weights(avaliacoes, skew) if avaliacoes else []
+    writer.write("Denuncias", (
+        (i, rng.choices(range(1, avaliacoes + 1), cum_weights=cum_avaliacoes)[0])
+        for i in range(1, denuncias + 1 if avaliacoes else 1)
+    ))
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Gera um conjunto de dados sintetico e deterministico para o bulk_load.py"
+    )
+    parser.add_argument("folder")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--professores", type=int, default=1_000)
+    parser.add_argument("--disciplinas", type=int, default=500)
+    parser.add_argument("--turmas", type=int, default=5_000)
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--avaliacoes", type=int, default=1_000_000)
+    parser.add_argument("--avaliacoes-professores", type=int, default=200_000)
+    parser.add_argument("--denuncias", type=int, default=10_000)
+    parser.add_argument("--skew", type=float, default=1.1)
+    args = parser.parse_args()
+
+    generate(
+        args.folder, args.seed,
+        args.professores, args.disciplinas, args.turmas, args.users,
+        args.avaliacoes, args.avaliacoes_professores, args.denuncias,
+        args.skew,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+from io import BytesIO
+from typing import Optional
+from PIL import Image
+import hashlib
+import psycopg
+
+# Lado maior, em pixels, de cada miniatura pre-gerada
+THUMBNAIL_SIZES = {
+    "thumb": 64,
+    "medium": 256,
+}
+
+def image_etag(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:32]
+
+def image_content_type(data: bytes) -> str:
+    with Image.open(BytesIO(data)) as img:
+        return img.get_format_mimetype()
+
+def make_thumbnail(data: bytes, size: int) -> bytes:
+    with Image.open(BytesIO(data)) as img:
+        img = img.convert("RGB")
+        img.thumbnail((size, size))
+        out = BytesIO()
+        img.save(out, format="JPEG", quality=85, optimize=True)
+        return out.getvalue()
+
+def image_variants(data: bytes) -> list[tuple[str, str, bytes]]:
+    variants = [("original", image_content_type(data), data)]
+    for tamanho, size in THUMBNAIL_SIZES.items():
+        variants.append((tamanho, "image/jpeg", make_thumbnail(data, size)))
+    return variants
+
+def generate_images(conn: psycopg.Connection, professor_id: Optional[int] = None):
+    with conn.cursor() as curr:
+        curr.execute("""
+            SELECT id, img
+            FROM Professores
+            WHERE img IS NOT NULL AND (%s::int IS NULL OR id=%s)
+        """, (professor_id, professor_id))
+        professores = curr.fetchall()
+
+        for p_id, img in professores:
+            for tamanho, content_type, data in image_variants(img):
+                curr.execute("""
+                    INSERT INTO ProfessoresImagens(professor_id, tamanho, content_type, etag, img)
+                    VALUES (%s, %s, %s, %s, %s)
+                    ON CONFLICT (professor_id, tamanho) DO UPDATE SET
+                        content_type = EXCLUDED.content_type,
+                        etag = EXCLUDED.etag,
+                        img = EXCLUDED.img
+                """, (p_id, tamanho, content_type, image_etag(data), data))
+    conn.commit()
+
+
+if __name__ == "__main__":
+    from seed import connect
+
+    with connect() as conn:
+        generate_images(conn)
@@ -1,21 +1,119 @@
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 import models
+from cache import detail_cache
+from auth import Session, config_auth, get_session, get_admin_session, get_metrics_session, check_owner, issue_token
 from contextlib import asynccontextmanager
-from connection import config_db, get_db
-from typing import Annotated
+from connection import CommitRoute, Database, after_commit, config_db, get_db, get_read_db, open_pool, close_pool, pool_stats
+from denuncias_buffer import denuncias_buffer
+from notifications import notifications
+from purge import purge_worker
+import queries
+import versions
+import metrics
+from ratelimit import config_ratelimit, rate_limit
+import ratelimit
+from suggest import Suggestion, SUGGEST_LIMIT, catalog_index, load_catalog, refresh_loop
+import asyncio
+import re
+from typing import Annotated, AsyncIterator, Literal, Optional
 import psycopg
 from fastapi.middleware.cors import CORSMiddleware
+from brotli_asgi import BrotliMiddleware
 
 
 Connection = Annotated[psycopg.AsyncConnection, Depends(get_db)]
+# Replica quando configurada
+ReadConnection = Annotated[psycopg.AsyncConnection, Depends(get_read_db)]
+# Declaradas antes de Connection nas rotas, para recusar o token sem pegar conexao do pool
+UserSession = Annotated[Session, Depends(get_session)]
+AdminSession = Annotated[Session, Depends(get_admin_session)]
+PageSize = Annotated[int, Query(ge=1, le=models.MAX_PAGE_SIZE)]
+# Respostas menores que isso nao compensam a compressao
+COMPRESS_MIN_SIZE = 1024
+# Um entity-tag (RFC 9110): "valor" ou W/"valor". O valor pode conter virgulas
+ENTITY_TAG = re.compile(r'\*|(?:W/)?"([^"]*)"')
+
+def entity_tags(if_none_match: Optional[str]) -> list[str]:
+    # Valores da lista do If-None-Match, sem W/ e sem aspas: o If-None-Match usa
+    # comparacao fraca, entao W/"x" e "x" sao o mesmo ETag. "*" vale para qualquer um
+    if if_none_match is None:
+        return []
+    return [m.group(1) if m.group(1) is not None else "*" for m in ENTITY_TAG.finditer(if_none_match)]
+
+def etag_check(*tables: str):
+    # Usa a mesma conexao da rota e roda antes da consulta dela: se uma escrita
+    # confirmar no meio, a resposta tem dados novos com o ETag antigo, nunca o contrario
+    async def check(
+            response: Response,
+            conn: ReadConnection,
+            if_none_match: Annotated[Optional[str], Header()] = None,
+    ) -> str:
+        etag = await versions.etag(conn, *tables)
+        tags = entity_tags(if_none_match)
+        if "*" in tags or etag.removeprefix("W/").strip('"') in tags:
+            raise HTTPException(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return etag
+
+    return Depends(check)
+
+def set_next_cursor(response: Response, items: list[BaseModel], limit: int):
+    if len(items) == limit:
+        response.headers["X-Next-Cursor"] = str(items[-1].id)
+
+def json_page_response(page: models.JsonPage, limit: int, etag: Optional[str] = None) -> Response:
+    # Os bytes vindos do Postgres vao direto na resposta, sem passar pelos modelos
+    response = Response(content=page.content, media_type="application/json")
+    if etag is not None:
+        response.headers["ETag"] = etag
+    if page.count == limit:
+        response.headers["X-Next-Cursor"] = str(page.last_id)
+    return response
+
+def sse_response(tipo: str, alvo_id: int) -> StreamingResponse:
+    return StreamingResponse(
+        notifications.events(tipo, alvo_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+def ndjson_response(items: AsyncIterator[BaseModel]) -> StreamingResponse:
+    async def lines():
+        async for item in items:
+            yield item.json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await config_db()
+    config_auth()
+    config_ratelimit()
+    await open_pool()
+    async with Database.pool.connection() as conn:
+        await queries.check_statements(conn)
+        await load_catalog(conn)
+    refresh_task = asyncio.create_task(refresh_loop())
+    denuncias_buffer.start()
+    notifications.start()
+    purge_worker.start()
     yield
+    refresh_task.cancel()
+    try:
+        await refresh_task
+    except asyncio.CancelledError:
+        pass
+    await purge_worker.close()
+    await notifications.close()
+    await denuncias_buffer.close()
+    await close_pool()
 
 
 app = FastAPI(lifespan=lifespan)
+# Definida antes das rotas: todas fazem o commit antes de enviar a resposta
+app.router.route_class = CommitRoute
 
 origins = [
     "http://localhost",
@@ -28,30 +126,60 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
+# brotli quando o cliente aceita, senao gzip. Imagens ja sao comprimidas, e o
+# compressor seguraria os eventos SSE no buffer
+app.add_middleware(
+    BrotliMiddleware,
+    minimum_size=COMPRESS_MIN_SIZE,
+    gzip_fallback=True,
+    excluded_handlers=[r"^/api/professor/\d+/image$", r"/eventos$"],
+)
+# Por ultimo, para ser a mais externa: a latencia inclui a compressao
+app.add_middleware(metrics.MetricsMiddleware)
 
 @app.get("/api/professores")
 async def get_professores(
-        conn: Connection
+        etag: Annotated[str, etag_check("professores", "disciplinas", "turmas")],
+        conn: ReadConnection,
+        after: int = 0,
+        limit: PageSize = models.PAGE_SIZE,
+        stream: bool = False,
     ) -> list[models.ProfessorItem]:
-    return await models.get_all_professores(conn)
+    if stream:
+        return ndjson_response(models.stream_professores(conn))
+
+    page = await models.get_all_professores_json(conn, after, limit)
+    return json_page_response(page, limit, etag)
 
 @app.get("/api/disciplinas")
 async def get_disciplinas(
-        conn: Connection
+        etag: Annotated[str, etag_check("disciplinas")],
+        conn: ReadConnection,
+        response: Response,
+        after: int = 0,
+        limit: PageSize = models.PAGE_SIZE,
+        stream: bool = False,
     ) -> list[models.DisciplinaItem]:
-    return await models.get_all_disciplinas(conn)
+    if stream:
+        return ndjson_response(models.stream_disciplinas(conn))
+
+    disciplinas = await models.get_all_disciplinas(conn, after, limit)
+    set_next_cursor(response, disciplinas, limit)
+    return disciplinas
 
 @app.get("/api/disciplina/{disciplina_id}")
 async def get_disciplina(
-        conn: Connection,
+        etag: Annotated[str, etag_check("professores", "disciplinas", "turmas")],
+        conn: ReadConnection,
         disciplina_id: int
     ) -> models.DisciplinaInfo:
     return await models.get_disciplina_info(conn, disciplina_id)
 
 @app.get("/api/professor/{professor_id}")
 async def get_professor(
-        conn: Connection,
+        conn: ReadConnection,
         professor_id: int
     ) -> models.ProfessorInfo:
     professor =  await models.get_professor_info(conn, professor_id)
@@ -60,23 +188,62 @@ async def get_professor(
     return professor
         
 
+@app.get("/api/professor/{professor_id}/image")
+async def get_professor_image(
+        conn: ReadConnection,
+        professor_id: int,
+        size: Literal["original", "medium", "thumb"] = "original",
+        v: Optional[str] = None,
+        if_none_match: Annotated[Optional[str], Header()] = None,
+    ) -> Response:
+    image = await models.get_professor_image(conn, professor_id, size, entity_tags(if_none_match))
+
+    if image is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    # URLs versionadas (?v=etag) nunca mudam de conteudo
+    if v == image.etag:
+        cache_control = "public, max-age=31536000, immutable"
+    else:
+        cache_control = "public, max-age=86400"
+    headers = {"ETag": f'"{image.etag}"', "Cache-Control": cache_control}
+
+    if image.data is None:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=image.data, media_type=image.content_type, headers=headers)
+
+# Eventos SSE com as avaliacoes novas, alteradas ou removidas. Nao usam conexao do pool
+@app.get("/api/professor/{professor_id}/eventos")
+async def get_professor_eventos(professor_id: int):
+    return sse_response("professor", professor_id)
+
 @app.get("/api/turma/{turma_id}")
 async def get_turma(
-        conn: Connection,
-        turma_id: int
+        conn: ReadConnection,
+        turma_id: int,
+        after: int = 0,
+        limit: PageSize = models.PAGE_SIZE,
     ) -> models.TurmaInfo:
-    turma = await models.get_turma_info(conn, turma_id)
+    page = await models.get_turma_json(conn, turma_id, after, limit)
 
-    if turma is None:
+    if page is None:
         raise HTTPException(status_code=404, detail="Turma not found")
-    return turma
+    return json_page_response(page, limit)
+
+@app.get("/api/turma/{turma_id}/eventos")
+async def get_turma_eventos(turma_id: int):
+    return sse_response("turma", turma_id)
 
 @app.post("/api/turma/{turma_id}/avaliacao")
 async def add_avaliacao_turma(
+        session: UserSession,
+        limit: Annotated[None, rate_limit("avaliacao", by_user=True)],
         conn: Connection,
         turma_id: int,
         avaliacao: models.AvaliacaoIn
     ) -> models.Avaliacao:
+    check_owner(session, avaliacao.user_id)
     new_avaliacao = await models.add_avaliacao_to_turma(conn, turma_id, avaliacao)
 
     if new_avaliacao is None:
@@ -86,10 +253,13 @@ async def add_avaliacao_turma(
 
 @app.post("/api/professor/{professor_id}/avaliacao")
 async def add_avaliacao_professor(
+        session: UserSession,
+        limit: Annotated[None, rate_limit("avaliacao", by_user=True)],
         conn: Connection,
         professor_id: int,
         avaliacao: models.AvaliacaoIn
     ) -> models.Avaliacao:
+    check_owner(session, avaliacao.user_id)
     new_avaliacao = await models.add_avaliacao_to_professor(conn, professor_id, avaliacao)
 
     if new_avaliacao is None:
@@ -97,8 +267,19 @@ async def add_avaliacao_professor(
 
     return new_avaliacao
 
+@app.post("/api/avaliacoes/lote")
+async def add_avaliacoes_lote(
+        session: AdminSession,
+        conn: Connection,
+        lote: models.AvaliacoesLoteIn,
+    ) -> models.AvaliacoesLoteOut:
+    if len(lote.turmas) + len(lote.professores) > models.MAX_LOTE:
+        raise HTTPException(status_code=400, detail=f"At most {models.MAX_LOTE} avaliacoes per request")
+    return await models.add_avaliacoes_lote(conn, lote)
+
 @app.post("/api/user")
 async def login_user(
+        limit: Annotated[None, rate_limit("login")],
         conn: Connection,
         user_info: models.UserLogginIn,
     ) -> models.UserId:
@@ -107,10 +288,12 @@ async def login_user(
     if user_id is None:
         raise HTTPException(status_code=400, detail="email or password invalid")
 
+    user_id.token = issue_token(user_id.user_id, user_id.is_admin)
     return user_id
 
 @app.post("/api/user/register")
 async def register_user(
+        limit: Annotated[None, rate_limit("login")],
         conn: Connection,
         user_info: models.UserRegisterIn,
     ) -> models.UserId:
@@ -119,13 +302,16 @@ async def register_user(
     if user_id is None:
         raise HTTPException(status_code=400, detail="fail to register user")
 
+    user_id.token = issue_token(user_id.user_id, user_id.is_admin)
     return user_id
 
 @app.get("/api/user/{user_id}")
 async def get_user(
-        conn: Connection,
+        session: UserSession,
+        conn: ReadConnection,
         user_id: int
     ) -> models.UserInfo:
+    check_owner(session, user_id)
     user = await models.get_user_info(conn, user_id)
 
     if user is None:
@@ -135,22 +321,28 @@ async def get_user(
 
 @app.delete("/api/user/{user_id}")
 async def delete_user(
+        session: UserSession,
         conn: Connection,
         user_id: int
     ) -> dict[str, str]:
+    check_owner(session, user_id)
     ok = await models.delete_user(conn, user_id)
 
     if not ok:
         raise HTTPException(status_code=400, detail="Fail to delete user")
+    # Antes do commit o worker nao veria a marcacao e dormiria ate o IDLE_INTERVAL
+    after_commit(conn, purge_worker.wake)
 
     return {"message": "User deleted sucessfully"}
 
 @app.put("/api/user/{user_id}")
 async def update_user(
+        session: UserSession,
         conn: Connection,
         user_id: int,
         user_info: models.UserUpdateIn,
     ) -> models.UserInfo:
+    check_owner(session, user_id)
     user = await models.update_user(conn, user_id, user_info)
 
     if user is None:
@@ -160,10 +352,13 @@ async def update_user(
 
 @app.put("/api/user/{user_id}/password")
 async def update_password(
+        session: UserSession,
+        limit: Annotated[None, rate_limit("login")],
         conn: Connection,
         user_id: int,
         password_info: models.PasswordUpdateIn,
     ) -> dict[str, str]:
+    check_owner(session, user_id)
     ok = await models.update_password(conn, user_id, password_info)
 
     if not ok:
@@ -171,26 +366,39 @@ async def update_password(
 
     return {"message" : "password update sucessful"}
 
-@app.post("/api/denuncias")
+@app.post("/api/denuncias", status_code=202)
 async def add_denuncia(
-        conn: Connection,
+        session: UserSession,
+        limit: Annotated[None, rate_limit("denuncia", by_user=True)],
+        conn: ReadConnection,
         denuncia: models.DenunciaIn,
     ) -> dict[str, str]:
-    ok = await models.add_denuncia(conn, denuncia)
-
-    if not ok:
-        raise HTTPException(status_code=404, detail="Fail to add denucia")
+    # So uma busca pela chave primaria, na replica: a gravacao fica com o denuncias_buffer
+    if not await models.avaliacao_exists(conn, denuncia.tipo, denuncia.avaliacao_id):
+        raise HTTPException(status_code=404, detail="Avaliacao not found")
+    await denuncias_buffer.add(denuncia.tipo, denuncia.avaliacao_id)
 
     return {"message" : "Denucia add sucessfully"}
 
 @app.get("/api/denuncias")
 async def get_denuncias(
-        conn: Connection,
+        session: AdminSession,
+        conn: ReadConnection,
+        response: Response,
+        after: int = 0,
+        limit: PageSize = models.PAGE_SIZE,
+        stream: bool = False,
     ) -> list[models.Denuncia]:
-    return await models.get_denuncias(conn)
+    if stream:
+        return ndjson_response(models.stream_denuncias(conn))
+
+    denuncias = await models.get_denuncias(conn, after, limit)
+    set_next_cursor(response, denuncias, limit)
+    return denuncias
 
 @app.delete("/api/denuncia/{denuncia_id}")
 async def delete_denuncia(
+        session: AdminSession,
         conn: Connection,
         denuncia_id: int
     ) -> dict[str, str]:
@@ -201,12 +409,57 @@ async def delete_denuncia(
 
     return {"message": "Denuncia deleted sucessfully"}
 
+@app.get("/api/moderacao")
+async def get_moderacao(
+        session: AdminSession,
+        conn: ReadConnection,
+        response: Response,
+        after: Optional[str] = None,
+        limit: PageSize = models.PAGE_SIZE,
+    ) -> list[models.ModeracaoItem]:
+    cursor = None
+    if after is not None:
+        try:
+            qtd, avaliacao_id, tipo = after.split(".")
+            cursor = (int(qtd), int(avaliacao_id), tipo)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    itens = await models.get_moderacao_fila(conn, cursor, limit)
+    if len(itens) == limit:
+        last = itens[-1]
+        response.headers["X-Next-Cursor"] = f"{last.qtd_denuncias}.{last.avaliacao_id}.{last.tipo}"
+    return itens
+
+@app.post("/api/moderacao/resolver")
+async def resolve_denuncias(
+        session: AdminSession,
+        conn: Connection,
+        acao: models.ModeracaoAcaoIn,
+    ) -> dict[str, int]:
+    if len(acao.itens) > models.MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail="Too many items")
+    return {"processadas": await models.resolve_denuncias(conn, acao.itens)}
+
+@app.post("/api/moderacao/descartar")
+async def dismiss_denuncias(
+        session: AdminSession,
+        conn: Connection,
+        acao: models.ModeracaoAcaoIn,
+    ) -> dict[str, int]:
+    if len(acao.itens) > models.MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail="Too many items")
+    return {"processadas": await models.dismiss_denuncias(conn, acao.itens)}
+
 @app.delete("/api/avaliacao/{avaliacao_id}")
 async def delete_avaliacao(
+        session: UserSession,
         conn: Connection,
         avaliacao_id: int
     ) -> dict[str, str]:
-    ok = await models.delete_avaliacao(conn, avaliacao_id)
+    # Admin apaga qualquer avaliacao, os demais apenas as proprias
+    owner_id = None if session.is_admin else session.user_id
+    ok = await models.delete_avaliacao(conn, avaliacao_id, owner_id)
 
     if not ok:
         raise HTTPException(status_code=400, detail="Fail to delete avaliacao")
@@ -215,11 +468,14 @@ async def delete_avaliacao(
 
 @app.put("/api/avaliacao/{avaliacao_id}")
 async def update_avaliacao(
+        session: UserSession,
+        limit: Annotated[None, rate_limit("avaliacao", by_user=True)],
         conn: Connection,
         avaliacao_id: int,
         update_avaliacao_in: models.UpdateAvaliacaoIn,
     ) -> dict[str, str]:
-    ok = await models.update_avaliacao(conn, avaliacao_id, update_avaliacao_in)
+    owner_id = None if session.is_admin else session.user_id
+    ok = await models.update_avaliacao(conn, avaliacao_id, update_avaliacao_in, owner_id)
 
     if not ok:
         raise HTTPException(status_code=400, detail="Fail to udpate avaliacao")
@@ -228,6 +484,7 @@ async def update_avaliacao(
 
 @app.delete("/api/avaliacao/userban/{avaliacao_id}")
 async def ban_user(
+        session: AdminSession,
         conn: Connection,
         avaliacao_id: int
     ) -> dict[str, str]:
@@ -235,5 +492,54 @@ async def ban_user(
 
     if not ok:
         raise HTTPException(status_code=400, detail="Fail to ban user")
+    after_commit(conn, purge_worker.wake)
 
     return {"message": "User ban sucessfully sucessfully"}
+
+@app.get("/api/search")
+async def search(
+        conn: ReadConnection,
+        q: Annotated[str, Query(min_length=2, max_length=200)],
+        limit: Annotated[int, Query(ge=1, le=100)] = models.SEARCH_LIMIT,
+    ) -> list[models.SearchResult]:
+    return await models.search(conn, q, limit)
+
+@app.get("/api/suggest")
+async def suggest(
+        prefix: Annotated[str, Query(min_length=1, max_length=100)],
+        limit: Annotated[int, Query(ge=1, le=50)] = SUGGEST_LIMIT,
+    ) -> list[Suggestion]:
+    return catalog_index.lookup(prefix, limit)
+
+@app.get("/api/stats/pool")
+async def get_pool_stats(session: AdminSession) -> dict[str, int]:
+    return pool_stats()
+
+@app.get("/api/stats/cache")
+async def get_cache_stats(session: AdminSession) -> dict[str, int]:
+    return detail_cache.stats()
+
+@app.get("/api/stats/denuncias")
+async def get_denuncias_stats(session: AdminSession) -> dict[str, int]:
+    return denuncias_buffer.stats()
+
+@app.get("/api/stats/queries")
+async def get_queries_stats(session: AdminSession) -> dict[str, dict[str, float]]:
+    return queries.stats()
+
+@app.get("/api/stats/eventos")
+async def get_eventos_stats(session: AdminSession) -> dict[str, int]:
+    return notifications.stats()
+
+@app.get("/metrics")
+async def get_metrics(session: Annotated[None, Depends(get_metrics_session)]) -> Response:
+    content, media_type = metrics.render(pool_stats())
+    return Response(content=content, media_type=media_type)
+
+@app.get("/api/stats/ratelimit")
+async def get_ratelimit_stats(session: AdminSession) -> dict[str, dict[str, int]]:
+    return ratelimit.stats()
+
+@app.get("/api/stats/remocoes")
+async def get_remocoes_stats(session: AdminSession) -> dict[str, Optional[int]]:
+    return purge_worker.stats()
@@ -0,0 +1,98 @@
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+import time
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "Tempo total de cada requisicao", ["method", "route"],
+)
+REQUESTS = Counter(
+    "http_requests_total", "Requisicoes por rota e status", ["method", "route", "status"],
+)
+IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "Requisicoes em andamento, sem contar streams",
+)
+# SSE e NDJSON ficam abertos por minutos: medidos a parte, para nao distorcer a
+# latencia e as requisicoes em andamento das demais rotas
+STREAM_DURATION = Histogram(
+    "http_stream_duration_seconds", "Tempo que cada stream (SSE, NDJSON) ficou aberto", ["route"],
+    buckets=(1, 5, 15, 60, 300, 900, 1800, 3600, 7200),
+)
+STREAMS = Gauge(
+    "http_streams_open", "Streams abertos", ["route"],
+)
+STREAM_TYPES = (b"text/event-stream", b"application/x-ndjson")
+QUERY_LATENCY = Histogram(
+    "db_query_duration_seconds", "Tempo de execucao de cada comando do queries.py", ["statement"],
+    buckets=(.0005, .001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5),
+)
+QUERY_ROWS = Counter(
+    "db_query_rows_total", "Linhas devolvidas ou alteradas por comando", ["statement"],
+)
+ACQUIRE_LATENCY = Histogram(
+    "db_pool_acquire_seconds", "Espera por uma conexao do pool", ["pool"],
+    buckets=(.0005, .001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5),
+)
+POOL = Gauge(
+    "db_pool", "Estatisticas do pool de conexoes (GET /api/stats/pool)", ["stat"],
+)
+
+def route_name(scope) -> str:
+    # O caminho com parametros (/api/turma/{turma_id}), para nao criar uma serie por id.
+    # O router do FastAPI guarda no scope a rota encontrada
+    route = scope.get("route")
+    return route.path if route is not None else "unmatched"
+
+def is_stream(headers) -> bool:
+    return any(
+        name == b"content-type" and value.startswith(STREAM_TYPES) for name, value in headers
+    )
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        stream = False
+
+        async def send_with_status(message):
+            nonlocal status, stream
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if is_stream(message.get("headers", [])):
+                    # A partir daqui conta como stream, nao como requisicao em andamento
+                    stream = True
+                    IN_FLIGHT.dec()
+                    STREAMS.labels(route_name(scope)).inc()
+            await send(message)
+
+        IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            route = route_name(scope)
+            if stream:
+                STREAM_DURATION.labels(route).observe(elapsed)
+                STREAMS.labels(route).dec()
+            else:
+                REQUEST_LATENCY.labels(scope["method"], route).observe(elapsed)
+                IN_FLIGHT.dec()
+            REQUESTS.labels(scope["method"], route, status).inc()
+
+def observe_query(statement: str, elapsed: float, rows: int):
+    QUERY_LATENCY.labels(statement).observe(elapsed)
+    if rows > 0:
+        QUERY_ROWS.labels(statement).inc(rows)
+
+def observe_acquire(pool: str, elapsed: float):
+    ACQUIRE_LATENCY.labels(pool).observe(elapsed)
+
+def render(pool_stats: dict[str, int]) -> tuple[bytes, str]:
+    for stat, value in pool_stats.items():
+        POOL.labels(stat).set(value)
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,76 @@
+import argparse
+import os
+import re
+import psycopg
+from seed import connect
+
+MIGRATIONS_FOLDER = "./sql/migrations/"
+NO_TRANSACTION = "-- migrate: no-transaction"
+
+def migration_files() -> list[tuple[int, str]]:
+    migrations = []
+    for name in sorted(os.listdir(MIGRATIONS_FOLDER)):
+        match = re.match(r"^(\d+)_.*\.sql$", name)
+        if match is not None:
+            migrations.append((int(match.group(1)), name))
+    return migrations
+
+def applied_versions(conn: psycopg.Connection) -> set[int]:
+    with conn.cursor() as curr:
+        curr.execute("""
+            CREATE TABLE IF NOT EXISTS SchemaMigrations (
+                version INT,
+                nome VARCHAR NOT NULL,
+                applied_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+                PRIMARY KEY(version)
+            )
+        """)
+        curr.execute("SELECT version FROM SchemaMigrations")
+        return {version for version, in curr.fetchall()}
+
+def apply(conn: psycopg.Connection, version: int, name: str):
+    with open(MIGRATIONS_FOLDER + name) as f:
+        sql = f.read()
+
+    if sql.startswith(NO_TRANSACTION):
+        # CREATE INDEX CONCURRENTLY nao roda dentro de transacao, nem em
+        # varios comandos enviados juntos: cada comando vai separado
+        for statement in sql.split(";"):
+            lines = [l for l in statement.splitlines() if not l.strip().startswith("--")]
+            statement = "\n".join(lines).strip()
+            if statement:
+                conn.execute(statement)
+        conn.execute(
+            "INSERT INTO SchemaMigrations(version, nome) VALUES (%s, %s)", (version, name)
+        )
+        return
+
+    with conn.transaction():
+        conn.execute(sql)
+        conn.execute(
+            "INSERT INTO SchemaMigrations(version, nome) VALUES (%s, %s)", (version, name)
+        )
+
+def migrate(conn: psycopg.Connection, dry_run: bool = False):
+    conn.autocommit = True
+    applied = applied_versions(conn)
+    for version, name in migration_files():
+        if version in applied:
+            continue
+
+        print(f"Aplicando {name}")
+        if not dry_run:
+            apply(conn, version, name)
+
+def main():
+    parser = argparse.ArgumentParser(description="Aplica as migrations pendentes de sql/migrations")
+    parser.add_argument("--dry-run", action="store_true", help="apenas lista as migrations pendentes")
+    args = parser.parse_args()
+
+    with connect() as conn:
+        migrate(conn, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
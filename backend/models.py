@@ -1,17 +1,26 @@
 from __future__ import annotations
-from typing import Optional, Any
-from pydantic import BaseModel
+from typing import Optional, Any, AsyncIterator, Literal
+from pydantic import BaseModel, Field
+from datetime import datetime
 import psycopg
+from cache import cached, invalidate_on_commit
+from passwords import hash_password, verify_password
+from auth import revoke
+from queries import run, run_many
 
+# Mesmo intervalo do CHECK da migration 015. O lote confere item a item (validate_lote),
+# para recusar so o item e nao a requisicao inteira
+PONTUACAO_MIN = 0
+PONTUACAO_MAX = 5
 
 class AvaliacaoIn(BaseModel):
     user_id: int
     comentario: str
-    pontuacao: int
+    pontuacao: int = Field(ge=PONTUACAO_MIN, le=PONTUACAO_MAX)
 
 class UpdateAvaliacaoIn(BaseModel):
     comentario: str
-    pontuacao: int
+    pontuacao: int = Field(ge=PONTUACAO_MIN, le=PONTUACAO_MAX)
 
 class UserLogginIn(BaseModel):
     email: str
@@ -27,6 +36,7 @@ class UserRegisterIn(BaseModel):
 class UserId(BaseModel):
     user_id: int
     is_admin: bool
+    token: Optional[str] = None
 
 class UserUpdateIn(BaseModel):
     email: str
@@ -104,158 +114,190 @@ class DisciplinaInfo(BaseModel):
 
 class DenunciaIn(BaseModel):
     avaliacao_id: int
+    tipo: Literal["turma", "professor"] = "turma"
 
 class Denuncia(BaseModel):
     id: int
     avaliacao_id: int
     comentario: str
 
+class ProfessorImage(BaseModel):
+    content_type: str
+    etag: str
+    data: Optional[bytes]
+
+class SearchResult(BaseModel):
+    tipo: str
+    id: int
+    # Pagina de destino: a turma ou o professor da avaliacao, ou o proprio item
+    alvo_id: int
+    titulo: str
+    trecho: Optional[str]
+    score: float
+
+class ModeracaoItem(BaseModel):
+    tipo: str
+    avaliacao_id: int
+    # Turma ou professor da avaliacao
+    alvo_id: int
+    comentario: Optional[str]
+    qtd_denuncias: int
+    primeira_denuncia: datetime
+    ultima_denuncia: datetime
+
+class ModeracaoRef(BaseModel):
+    tipo: Literal["turma", "professor"]
+    avaliacao_id: int
+
+class ModeracaoAcaoIn(BaseModel):
+    itens: list[ModeracaoRef]
+
+class AvaliacaoLoteTurmaIn(BaseModel):
+    turma_id: int
+    user_id: int
+    comentario: str
+    pontuacao: int
+
+class AvaliacaoLoteProfessorIn(BaseModel):
+    professor_id: int
+    user_id: int
+    comentario: str
+    pontuacao: int
+
+class AvaliacoesLoteIn(BaseModel):
+    turmas: list[AvaliacaoLoteTurmaIn] = []
+    professores: list[AvaliacaoLoteProfessorIn] = []
+
+class LoteResultado(BaseModel):
+    indice: int
+    id: Optional[int] = None
+    erro: Optional[str] = None
+
+class AvaliacoesLoteOut(BaseModel):
+    turmas: list[LoteResultado]
+    professores: list[LoteResultado]
+
+class JsonPage(BaseModel):
+    # JSON pronto, montado pelo Postgres, e o necessario para o cursor da proxima pagina
+    content: str
+    count: int
+    last_id: Optional[int] = None
+
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+MAX_LOTE = 1000
+SEARCH_LIMIT = 20
+
+@cached("professor")
 async def get_professor_info(conn: psycopg.AsyncConnection, professor_id: int) -> Optional[ProfessorInfo]:
     async with conn.cursor() as curr:
-        await curr.execute("""
-                           SELECT nome, qtd_avaliacoes, sum_avaliacoes
-                           FROM Professores
-                           WHERE id=%s
-        """, (professor_id,))
+        await run(curr, "professor_info", (professor_id,))
         result = await curr.fetchone()
         if result is None:
             return None
-        nome, qtd_avaliacoes, sum_avaliacoes = result
-
-    async with conn.cursor() as curr:
-        await curr.execute("""
-                           SELECT T.id, T.numero, D.nome
-                           FROM Turmas AS T
-                           INNER JOIN Disciplinas AS D
-                           ON T.disciplina_id=D.id
-                           WHERE T.professor_id=%s
-        """, (professor_id,))
-        turmas = [
-            ProfessorInfoTurma(
-                id=id,
-                nome=nome, numero=numero,
-            )
-            for id, numero, nome
-            in await curr.fetchall()
-        ]
-
-    async with conn.cursor() as curr:
-        await curr.execute("""
-                           SELECT A.id, A.pontuacao, A.comentario, U.id, U.nome
-                           FROM AvaliacoesProfessores AS A
-                           INNER JOIN Users AS U
-                           ON A.user_id=U.id
-                           WHERE A.professor_id=%s
-        """, (professor_id,))
-        avaliacoes = [
-            Avaliacao(
-                id=id,
-                user_id=user_id, user_nome=user_nome,
-                comentario=comentario, pontuacao=pontuacao
-            )
-            for id, pontuacao, comentario, user_id,  user_nome
-            in await curr.fetchall()
-        ]
+        nome, qtd_avaliacoes, sum_avaliacoes, img, turmas, avaliacoes = result
 
     return ProfessorInfo(
         id=professor_id, nome=nome,
-        turmas=turmas, avaliacoes=avaliacoes,
+        turmas=[ProfessorInfoTurma(**t) for t in turmas],
+        avaliacoes=[Avaliacao(**a) for a in avaliacoes],
         qtd_avaliacoes=qtd_avaliacoes, sum_avaliacoes=sum_avaliacoes,
+        img=img,
     )
 
-async def get_disciplina_info(conn: psycopg.AsyncConnection, disciplina_id: int) -> DisciplinaInfo:
-    professores: dict[int, DisciplinasProfessor] = {}
-    def add_professor(
-            professor_id: int, professor_nome: str,
-            qtd_avaliacoes: int, sum_avaliacoes: int
-    ):
-        if professor_id in professores:
-            p = professores[professor_id]
-            p.sum_avaliacoes += sum_avaliacoes
-            p.qtd_avaliacoes += qtd_avaliacoes
-            return
-
-        professores[professor_id] = DisciplinasProfessor(
-                id=professor_id, nome=professor_nome,
-                sum_avaliacoes=sum_avaliacoes, qtd_avaliacoes=qtd_avaliacoes,
-                turmas=[]
-        )
+async def get_professor_image(
+        conn: psycopg.AsyncConnection,
+        professor_id: int, tamanho: str,
+        if_none_match: Optional[list[str]] = None,
+) -> Optional[ProfessorImage]:
+    # if_none_match: ETags ja guardados pelo cliente, sem aspas. Com um deles os bytes nao vem
+    async with conn.cursor() as curr:
+        await run(curr, "professor_image", {
+            "etags": if_none_match or [], "professor_id": professor_id, "tamanho": tamanho,
+        })
+        res = await curr.fetchone()
+        if res is None:
+            return None
 
+        content_type, etag, data = res
+        return ProfessorImage(content_type=content_type, etag=etag, data=data)
+
+@cached("disciplina")
+async def get_disciplina_info(conn: psycopg.AsyncConnection, disciplina_id: int) -> DisciplinaInfo:
     async with conn.cursor() as curr:
-        await curr.execute(
-                """SELECT professor_id, professor_nome, qtd_avaliacoes, sum_avaliacoes, disciplina_nome
-                FROM Turmas_Avaliacoes_View
-                WHERE disciplina_id=%s""", (disciplina_id,)
-        )
+        await run(curr, "disciplina_info", (disciplina_id,))
         nome_disciplina = ""
-        for p_id, p_nome, qtd_a, sum_a, d_nome in await curr.fetchall():
+        professores = []
+        for d_nome, p_id, p_nome, qtd_a, sum_a in await curr.fetchall():
             nome_disciplina = d_nome
-            add_professor(p_id, p_nome, qtd_a, sum_a)
+            professores.append(DisciplinasProfessor(
+                id=p_id, nome=p_nome,
+                qtd_avaliacoes=qtd_a, sum_avaliacoes=sum_a,
+            ))
 
-        return DisciplinaInfo(id=disciplina_id, nome=nome_disciplina, professores=list(professores.values()))
+        return DisciplinaInfo(id=disciplina_id, nome=nome_disciplina, professores=professores)
 
 
-async def get_all_disciplinas(conn: psycopg.AsyncConnection) -> list[DisciplinaItem]:
+async def get_all_disciplinas(
+        conn: psycopg.AsyncConnection,
+        after: int = 0, limit: int = PAGE_SIZE,
+) -> list[DisciplinaItem]:
     async with conn.cursor() as curr:
-        await curr.execute("SELECT id, nome FROM Disciplinas")
+        await run(curr, "disciplinas", (after, limit))
         return [DisciplinaItem(id=id, nome=nome) for id, nome in await curr.fetchall()]
 
-async def get_all_professores(conn: psycopg.AsyncConnection) -> list[ProfessorItem]:
-    professores: dict[int, ProfessorItem] = {}
-    def add_professor(
-            professor_id: int, disciplina_id: int, 
-            professor_nome: str, disciplina_nome: str, 
-            qtd_avaliacoes: int, sum_avaliacoes: int
-    ):
-        if professor_id in professores:
-            p = professores[professor_id]
-            p.sum_avaliacoes += sum_avaliacoes
-            p.qtd_avaliacoes += qtd_avaliacoes
-            p.disciplinas.add(disciplina_nome)
-            return
-
-        professores[professor_id] = ProfessorItem(
-                id=professor_id, nome=professor_nome,
-                sum_avaliacoes=sum_avaliacoes, qtd_avaliacoes=qtd_avaliacoes,
-                disciplinas=set([disciplina_nome])
-        )
+async def stream_disciplinas(conn: psycopg.AsyncConnection) -> AsyncIterator[DisciplinaItem]:
+    async with conn.cursor(name="stream_disciplinas") as curr:
+        await run(curr, "stream_disciplinas")
+        async for id, nome in curr:
+            yield DisciplinaItem(id=id, nome=nome)
 
+async def get_all_professores(
+        conn: psycopg.AsyncConnection,
+        after: int = 0, limit: int = PAGE_SIZE,
+) -> list[ProfessorItem]:
     async with conn.cursor() as curr:
-        await curr.execute("""
-                           SELECT professor_id, disciplina_id, 
-                           professor_nome, disciplina_nome,  
-                           qtd_avaliacoes, sum_avaliacoes
-                           FROM Turmas_Avaliacoes_View
-        """)
-        for p_id, d_id, p_nome, d_nome, qtd_a, sum_a in await curr.fetchall():
-            add_professor(p_id, d_id, p_nome, d_nome, qtd_a, sum_a)
-
-        return list(professores.values())
-
-async def get_turma_info(conn: psycopg.AsyncConnection, turma_id: int) -> Optional[TurmaInfo]:
+        await run(curr, "professores", (after, limit))
+        return [
+            ProfessorItem(
+                id=p_id, nome=p_nome, disciplinas=d_nomes,
+                qtd_avaliacoes=qtd_a, sum_avaliacoes=sum_a,
+            )
+            for p_id, p_nome, d_nomes, qtd_a, sum_a in await curr.fetchall()
+        ]
+
+async def get_all_professores_json(
+        conn: psycopg.AsyncConnection,
+        after: int = 0, limit: int = PAGE_SIZE,
+) -> JsonPage:
     async with conn.cursor() as curr:
-        await curr.execute("""
-                           SELECT turma_numero, professor_id, professor_nome, 
-                           disciplina_id, disciplina_nome, 
-                           qtd_avaliacoes, sum_avaliacoes
-                           FROM Turmas_Avaliacoes_View
-                           WHERE turma_id=%s
-        """, (turma_id,))
+        await run(curr, "professores_json", (after, limit))
+        content, count, last_id = await curr.fetchone()
+        return JsonPage(content=content, count=count, last_id=last_id)
+
+async def stream_professores(conn: psycopg.AsyncConnection) -> AsyncIterator[ProfessorItem]:
+    async with conn.cursor(name="stream_professores") as curr:
+        await run(curr, "stream_professores", (0,))
+        async for p_id, p_nome, d_nomes, qtd_a, sum_a in curr:
+            yield ProfessorItem(
+                id=p_id, nome=p_nome, disciplinas=d_nomes,
+                qtd_avaliacoes=qtd_a, sum_avaliacoes=sum_a,
+            )
+
+@cached("turma")
+async def get_turma_info(
+        conn: psycopg.AsyncConnection, turma_id: int,
+        after: int = 0, limit: int = PAGE_SIZE,
+) -> Optional[TurmaInfo]:
+    async with conn.cursor() as curr:
+        await run(curr, "turma_info", (turma_id,))
         res = await curr.fetchone()
         if res is None:
             return res
 
         t_numero, p_id, p_nome, d_id, d_nome, qtd_a, sum_a = res
 
-        await curr.execute("""
-                           SELECT Avaliacoes.id as avaliacao_id ,
-                           Users.nome as user_nome, Avaliacoes.user_id, 
-                           Avaliacoes.pontuacao, Avaliacoes.comentario
-                           FROM Avaliacoes
-                           INNER JOIN Users
-                           ON Avaliacoes.user_id=Users.id
-                           WHERE Avaliacoes.turma_id=%s
-        """, (turma_id,))
+        await run(curr, "turma_avaliacoes", (turma_id, after, limit))
         avaliacoes = [
                 Avaliacao(id=a_id, user_id=u_id, user_nome=u_nome, pontuacao=pontuacao, comentario=comentario)
                 for a_id, u_nome, u_id, pontuacao, comentario in await curr.fetchall()
@@ -270,23 +312,36 @@ async def get_turma_info(conn: psycopg.AsyncConnection, turma_id: int) -> Option
                 avaliacoes=avaliacoes
         )
 
+@cached("turma")
+async def get_turma_json(
+        conn: psycopg.AsyncConnection, turma_id: int,
+        after: int = 0, limit: int = PAGE_SIZE,
+) -> Optional[JsonPage]:
+    async with conn.cursor() as curr:
+        await run(curr, "turma_json", {"turma_id": turma_id, "after": after, "limit": limit})
+        res = await curr.fetchone()
+        if res is None:
+            return None
+
+        content, count, last_id = res
+        return JsonPage(content=content, count=count, last_id=last_id)
+
 async def add_avaliacao_to_turma(
         conn: psycopg.AsyncConnection, 
         turma_id: int, 
         avaliacao: AvaliacaoIn
 ) -> Optional[Avaliacao]:
     async with conn.cursor() as curr:
-        await curr.execute("""
-        INSERT INTO Avaliacoes(pontuacao, comentario, user_id, turma_id)
-        VALUES
-            (%s, %s, %s, %s)
-        RETURNING id, (SELECT nome FROM Users WHERE id=user_id);
-        """, (avaliacao.pontuacao, avaliacao.comentario, avaliacao.user_id, turma_id))
+        await run(curr, "add_avaliacao_turma", (
+            avaliacao.pontuacao, avaliacao.comentario, avaliacao.user_id, turma_id
+        ))
         res = await curr.fetchone()
         if res is None:
             return None
 
-        avaliacao_id, user_nome = res
+        avaliacao_id, user_nome, disciplina_id = res
+        invalidate_on_commit(conn, "turma", turma_id)
+        invalidate_on_commit(conn, "disciplina", disciplina_id)
         return Avaliacao(
                 id=avaliacao_id, user_id=avaliacao.user_id,
                 user_nome=user_nome, comentario=avaliacao.comentario, pontuacao=avaliacao.pontuacao
@@ -298,17 +353,15 @@ async def add_avaliacao_to_professor(
         avaliacao: AvaliacaoIn
 ) -> Optional[Avaliacao]:
     async with conn.cursor() as curr:
-        await curr.execute("""
-        INSERT INTO AvaliacoesProfessores(pontuacao, comentario, user_id, professor_id)
-        VALUES
-            (%s, %s, %s, %s)
-        RETURNING id, (SELECT nome FROM Users WHERE id=user_id);
-        """, (avaliacao.pontuacao, avaliacao.comentario, avaliacao.user_id, professor_id))
+        await run(curr, "add_avaliacao_professor", (
+            avaliacao.pontuacao, avaliacao.comentario, avaliacao.user_id, professor_id
+        ))
         res = await curr.fetchone()
         if res is None:
             return None
 
         avaliacao_id, user_nome = res
+        invalidate_on_commit(conn, "professor", professor_id)
         return Avaliacao(
                 id=avaliacao_id, user_id=avaliacao.user_id,
                 user_nome=user_nome, comentario=avaliacao.comentario, pontuacao=avaliacao.pontuacao
@@ -319,24 +372,23 @@ async def logg_user(
         user_info: UserLogginIn,
 )-> Optional[UserId]:
     async with conn.cursor() as curr:
-        await curr.execute("""
-        SELECT id, is_admin
-        FROM Users
-        WHERE email=%s AND senha=%s
-        """, (user_info.email, user_info.password))
+        await run(curr, "login", (user_info.email,))
         res = await curr.fetchone()
         if res is None:
             return None
-        return UserId(user_id=res[0], is_admin=res[1])
+
+        user_id, is_admin, senha = res
+        ok, new_hash = await verify_password(senha, user_info.password)
+        if not ok:
+            return None
+
+        if new_hash is not None:
+            await run(curr, "update_senha", (new_hash, user_id))
+        return UserId(user_id=user_id, is_admin=is_admin)
 
 async def get_user_info(conn: psycopg.AsyncConnection, user_id: int) -> Optional[UserInfo]:
     async with conn.cursor() as curr:
-        await curr.execute("""
-                           SELECT email, nome, 
-                           matricula, curso
-                           FROM Users
-                           WHERE id=%s
-        """, (user_id,))
+        await run(curr, "user_info", (user_id,))
         res = await curr.fetchone()
         if res is None:
             return res
@@ -344,18 +396,24 @@ async def get_user_info(conn: psycopg.AsyncConnection, user_id: int) -> Optional
         email, nome, matricula, curso = res
         return UserInfo(email=email, nome=nome, matricula=matricula, curso=curso)
 
+async def user_content_keys(
+        curr: psycopg.AsyncCursor,
+        user_id: int
+) -> list[tuple[str, int]]:
+    await run(curr, "user_content_keys", {"user_id": user_id})
+    return await curr.fetchall()
+
+def invalidate_keys(conn: psycopg.AsyncConnection, keys: list[tuple[str, int]]):
+    for kind, id in keys:
+        invalidate_on_commit(conn, kind, id)
+
 async def update_user(
         conn: psycopg.AsyncConnection,
         user_id: int, user_info: UserUpdateInfo
 ) -> Optional[UserInfo]:
     async with conn.cursor() as curr:
-        await curr.execute("""
-                           UPDATE Users SET (email, nome, matricula, curso)
-                               = (%s, %s, %s, %s)
-                           WHERE id=%s
-                           RETURNING email, nome, matricula, curso
-
-        """, (
+        keys = await user_content_keys(curr, user_id)
+        await run(curr, "update_user", (
             user_info.email, user_info.nome,
             user_info.matricula, user_info.curso,
             user_id
@@ -364,6 +422,7 @@ async def update_user(
         if res is None:
             return res
 
+        invalidate_keys(conn, keys)
         email, nome, matricula, curso = res
         return UserInfo(email=email, nome=nome, matricula=matricula, curso=curso)
 
@@ -372,15 +431,18 @@ async def update_password(
         user_id: int, password_info: PasswordUpdateIn
 ) -> bool:
     async with conn.cursor() as curr:
-        await curr.execute("""
-                           UPDATE Users SET
-                             senha = %s
-                           WHERE id=%s and senha=%s
-                           RETURNING id
-
-        """, (
-            password_info.new_password,
-            user_id, password_info.current_password,
+        await run(curr, "user_senha", (user_id,))
+        res = await curr.fetchone()
+        if res is None:
+            return False
+
+        ok, _ = await verify_password(res[0], password_info.current_password)
+        if not ok:
+            return False
+
+        await run(curr, "update_senha", (
+            await hash_password(password_info.new_password),
+            user_id,
         ))
         res = await curr.fetchone()
         if res is None:
@@ -393,25 +455,16 @@ async def register_user(
         user_info: UserRegisterIn
 ) -> bool:
     async with conn.cursor() as curr:
-        await curr.execute("""
-             SELECT id, is_admin
-             FROM Users
-             WHERE matricula=%s OR email=%s
-        """, ( user_info.matricula, user_info.email)
-        )
+        await run(curr, "user_existente", {"matricula": user_info.matricula, "email": user_info.email})
         res = await curr.fetchone()
         if res is not None:
             return None
 
-        await curr.execute("""
-            INSERT INTO Users(email, nome, matricula, curso, senha, is_admin)
-            VALUES
-                (%s, %s, %s, %s, %s, false)
-            RETURNING id
-        """, (
+        senha = await hash_password(user_info.password)
+        await run(curr, "register_user", (
                   user_info.email, user_info.nome,
                   user_info.matricula, user_info.curso,
-                  user_info.password,
+                  senha,
              )
         )
         res = await curr.fetchone()
@@ -424,63 +477,66 @@ async def delete_user(
         conn: psycopg.AsyncConnection,
         user_id: int
 ) -> bool:
+    # So marca o usuario: as avaliacoes sao apagadas em lotes pelo purge.py
     async with conn.cursor() as curr:
-        await curr.execute("""
-             DELETE
-             FROM Users
-             WHERE id=%s
-             RETURNING id
-        """, ( user_id,)
-        )
+        keys = await user_content_keys(curr, user_id)
+        await run(curr, "soft_delete_user", {"id": user_id, "banido": False})
         res = await curr.fetchone()
         if res is None:
             return False
+        invalidate_keys(conn, keys)
+        revoke(res[0])
         return True
 
-async def add_denuncia(
+async def avaliacao_exists(conn: psycopg.AsyncConnection, tipo: str, avaliacao_id: int) -> bool:
+    async with conn.cursor() as curr:
+        return bool(await existing_ids(curr, f"avaliacoes_existentes_{tipo}", {avaliacao_id}))
+
+async def add_denuncias_lote(
         conn: psycopg.AsyncConnection,
-        denuncia: DenunciaIn
-) -> bool:
+        pendentes: dict[tuple[str, int], int],
+) -> int:
+    # pendentes: (tipo, avaliacao_id) -> quantidade de denuncias recebidas.
+    # Avaliacoes que nao existem mais sao ignoradas, e a fila de moderacao
+    # recebe um unico upsert por avaliacao. Retorna quantas avaliacoes foram ignoradas
+    ignoradas = 0
     async with conn.cursor() as curr:
-        await curr.execute("""
-            INSERT INTO Denuncias(avaliacao_id)
-            VALUES (%s)
-            RETURNING id;
-        """, ( denuncia.avaliacao_id,)
-        )
-        res = await curr.fetchone()
-        if res is None:
-            return False
-        return True
+        await run(curr, "skip_counters", ("on",))
+        for tipo in ("turma", "professor"):
+            ids = [id for (t, id) in pendentes if t == tipo]
+            if not ids:
+                continue
+            qtds = [pendentes[(tipo, id)] for id in ids]
+            await run(curr, f"denuncias_lote_{tipo}", (ids, qtds))
+            # Uma linha da fila por avaliacao encontrada
+            ignoradas += len(ids) - curr.rowcount
+        await run(curr, "skip_counters", ("off",))
+    return ignoradas
 
 async def get_denuncias(
         conn: psycopg.AsyncConnection,
+        after: int = 0, limit: int = PAGE_SIZE,
 ) -> list[Denuncia]:
     async with conn.cursor() as curr:
-        await curr.execute("""
-            SELECT D.id, A.id, A.comentario
-            FROM DENUNCIAS as D
-            INNER JOIN Avaliacoes as A
-            ON A.id=D.avaliacao_id
-        """ )
+        await run(curr, "denuncias", (after, limit))
         return [
             Denuncia(id=id, avaliacao_id=avalicao_id, comentario=comentario)
             for id, avalicao_id, comentario
             in await curr.fetchall()
         ]
 
+async def stream_denuncias(conn: psycopg.AsyncConnection) -> AsyncIterator[Denuncia]:
+    async with conn.cursor(name="stream_denuncias") as curr:
+        await run(curr, "stream_denuncias")
+        async for id, avalicao_id, comentario in curr:
+            yield Denuncia(id=id, avaliacao_id=avalicao_id, comentario=comentario)
+
 async def delete_denuncia(
         conn: psycopg.AsyncConnection,
         denuncia_id: int
 ) -> bool:
     async with conn.cursor() as curr:
-        await curr.execute("""
-             DELETE
-             FROM Denuncias
-             WHERE id=%s
-             RETURNING id
-        """, ( denuncia_id,)
-        )
+        await run(curr, "delete_denuncia", (denuncia_id,))
         res = await curr.fetchone()
         if res is None:
             return False
@@ -488,19 +544,16 @@ async def delete_denuncia(
 
 async def delete_avaliacao(
         conn: psycopg.AsyncConnection,
-        avaliacao_id: int
+        avaliacao_id: int,
+        user_id: Optional[int] = None,
 ) -> bool:
     async with conn.cursor() as curr:
-        await curr.execute("""
-             DELETE
-             FROM Avaliacoes
-             WHERE id=%s
-             RETURNING id
-        """, ( avaliacao_id,)
-        )
+        await run(curr, "delete_avaliacao", {"id": avaliacao_id, "user_id": user_id})
         res = await curr.fetchone()
         if res is None:
             return False
+        invalidate_on_commit(conn, "turma", res[0])
+        invalidate_on_commit(conn, "disciplina", res[1])
         return True
 
 async def ban_user(
@@ -508,32 +561,228 @@ async def ban_user(
         avaliacao_id: int
 ) -> bool:
     async with conn.cursor() as curr:
-        await curr.execute("""
-             DELETE
-             FROM Users
-             WHERE id=(SELECT user_id FROM Avaliacoes WHERE id=%s)
-             RETURNING id
-        """, ( avaliacao_id,)
-        )
+        await run(curr, "avaliacao_user", (avaliacao_id,))
         res = await curr.fetchone()
         if res is None:
             return False
+        user_id = res[0]
+
+        keys = await user_content_keys(curr, user_id)
+        await run(curr, "soft_delete_user", {"id": user_id, "banido": True})
+        res = await curr.fetchone()
+        if res is None:
+            return False
+        invalidate_keys(conn, keys)
+        revoke(res[0])
         return True
 
 async def update_avaliacao(
         conn: psycopg.AsyncConnection,
         avaliacao_id: int,
         update_avaliacao: UpdateAvaliacaoIn,
+        user_id: Optional[int] = None,
 ) -> bool:
     async with conn.cursor() as curr:
-        await curr.execute("""
-            UPDATE Avaliacoes SET (comentario, pontuacao)
-                = (%s, %s)
-            WHERE id=%s
-            RETURNING id
-        """, ( update_avaliacao.comentario, update_avaliacao.pontuacao, avaliacao_id)
-        )
+        await run(curr, "update_avaliacao", {
+            "comentario": update_avaliacao.comentario,
+            "pontuacao": update_avaliacao.pontuacao,
+            "id": avaliacao_id, "user_id": user_id,
+        })
         res = await curr.fetchone()
         if res is None:
             return False
+        invalidate_on_commit(conn, "turma", res[0])
+        invalidate_on_commit(conn, "disciplina", res[1])
         return True
+
+async def search(
+        conn: psycopg.AsyncConnection,
+        q: str, limit: int = SEARCH_LIMIT,
+) -> list[SearchResult]:
+    async with conn.cursor() as curr:
+        await run(curr, "search", {"q": q, "limit": limit})
+        return [
+            SearchResult(
+                tipo=tipo, id=id, alvo_id=alvo_id,
+                titulo=titulo, trecho=trecho, score=score,
+            )
+            for tipo, id, alvo_id, titulo, trecho, score
+            in await curr.fetchall()
+        ]
+
+async def get_moderacao_fila(
+        conn: psycopg.AsyncConnection,
+        after: Optional[tuple[int, int, str]] = None,
+        limit: int = PAGE_SIZE,
+) -> list[ModeracaoItem]:
+    async with conn.cursor() as curr:
+        if after is None:
+            await run(curr, "moderacao_fila", (limit,))
+        else:
+            await run(curr, "moderacao_fila_after", (*after, limit))
+        return [
+            ModeracaoItem(
+                tipo=tipo, avaliacao_id=avaliacao_id, alvo_id=alvo_id,
+                comentario=comentario, qtd_denuncias=qtd,
+                primeira_denuncia=primeira, ultima_denuncia=ultima,
+            )
+            for tipo, avaliacao_id, alvo_id, comentario, qtd, primeira, ultima
+            in await curr.fetchall()
+        ]
+
+def split_refs(itens: list[ModeracaoRef]) -> tuple[list[int], list[int]]:
+    turma = [i.avaliacao_id for i in itens if i.tipo == "turma"]
+    professor = [i.avaliacao_id for i in itens if i.tipo == "professor"]
+    return turma, professor
+
+async def resolve_denuncias(
+        conn: psycopg.AsyncConnection,
+        itens: list[ModeracaoRef],
+) -> int:
+    # Remove as avaliacoes denunciadas; denuncias e fila saem em cascata
+    turma, professor = split_refs(itens)
+    async with conn.cursor() as curr:
+        await run(curr, "resolve_avaliacoes_turma", (turma,))
+        removed = await curr.fetchall()
+        for turma_id, disciplina_id in removed:
+            invalidate_on_commit(conn, "turma", turma_id)
+            invalidate_on_commit(conn, "disciplina", disciplina_id)
+
+        await run(curr, "resolve_avaliacoes_professor", (professor,))
+        removed_professor = await curr.fetchall()
+        for professor_id, in removed_professor:
+            invalidate_on_commit(conn, "professor", professor_id)
+
+        return len(removed) + len(removed_professor)
+
+async def dismiss_denuncias(
+        conn: psycopg.AsyncConnection,
+        itens: list[ModeracaoRef],
+) -> int:
+    # Mantem as avaliacoes e apaga as denuncias. A linha da fila sai de uma vez;
+    # sem skip_counters a trigger de cada denuncia apagada ainda procuraria a linha
+    turma, professor = split_refs(itens)
+    async with conn.cursor() as curr:
+        await run(curr, "skip_counters", ("on",))
+        await run(curr, "dismiss_fila", (turma, professor))
+        dismissed = curr.rowcount
+        await run(curr, "dismiss_denuncias_turma", (turma,))
+        await run(curr, "dismiss_denuncias_professor", (professor,))
+        await run(curr, "skip_counters", ("off",))
+        return dismissed
+
+async def existing_ids(curr: psycopg.AsyncCursor, name: str, ids: set[int]) -> set[int]:
+    await run(curr, name, (list(ids),))
+    return {id for id, in await curr.fetchall()}
+
+def validate_lote(
+        itens: list, alvo: str, alvos: set[int], users: set[int]
+) -> tuple[list, list[LoteResultado]]:
+    validos = []
+    resultados = []
+    for indice, item in enumerate(itens):
+        resultado = LoteResultado(indice=indice)
+        if not PONTUACAO_MIN <= item.pontuacao <= PONTUACAO_MAX:
+            resultado.erro = f"pontuacao must be between {PONTUACAO_MIN} and {PONTUACAO_MAX}"
+        elif getattr(item, alvo) not in alvos:
+            resultado.erro = f"{alvo} not found"
+        elif item.user_id not in users:
+            resultado.erro = "user_id not found"
+        else:
+            validos.append((resultado, item))
+        resultados.append(resultado)
+    return validos, resultados
+
+def sum_by(validos: list, alvo: str) -> tuple[list[int], list[int], list[int]]:
+    totais: dict[int, tuple[int, int]] = {}
+    for _, item in validos:
+        qtd, total = totais.get(getattr(item, alvo), (0, 0))
+        totais[getattr(item, alvo)] = (qtd + 1, total + item.pontuacao)
+    return list(totais), [q for q, _ in totais.values()], [t for _, t in totais.values()]
+
+async def add_avaliacoes_lote(
+        conn: psycopg.AsyncConnection,
+        lote: AvaliacoesLoteIn,
+) -> AvaliacoesLoteOut:
+    async with conn.cursor() as curr:
+        turmas = await existing_ids(curr, "turmas_existentes", {a.turma_id for a in lote.turmas})
+        professores = await existing_ids(curr, "professores_existentes", {a.professor_id for a in lote.professores})
+        users = await existing_ids(curr, "users_existentes", {a.user_id for a in lote.turmas + lote.professores})
+
+        validos_turma, resultados_turma = validate_lote(lote.turmas, "turma_id", turmas, users)
+        validos_professor, resultados_professor = validate_lote(
+            lote.professores, "professor_id", professores, users
+        )
+
+        # Contadores sao somados uma vez por turma/professor no fim do lote, nao por linha
+        await run(curr, "skip_counters", ("on",))
+
+        if validos_turma:
+            await run_many(curr, "add_avaliacoes_lote_turma", [
+                (a.pontuacao, a.comentario, a.user_id, a.turma_id) for _, a in validos_turma
+            ], returning=True)
+            for resultado, _ in validos_turma:
+                resultado.id = (await curr.fetchone())[0]
+                curr.nextset()
+
+            ids, qtds, totais = sum_by(validos_turma, "turma_id")
+            await run(curr, "contadores_lote_turma", (ids, qtds, totais))
+            for turma_id in ids:
+                invalidate_on_commit(conn, "turma", turma_id)
+            for disciplina_id, in await curr.fetchall():
+                invalidate_on_commit(conn, "disciplina", disciplina_id)
+
+        if validos_professor:
+            await run_many(curr, "add_avaliacoes_lote_professor", [
+                (a.pontuacao, a.comentario, a.user_id, a.professor_id) for _, a in validos_professor
+            ], returning=True)
+            for resultado, _ in validos_professor:
+                resultado.id = (await curr.fetchone())[0]
+                curr.nextset()
+
+            ids, qtds, totais = sum_by(validos_professor, "professor_id")
+            await run(curr, "contadores_lote_professor", (ids, qtds, totais))
+            for professor_id in ids:
+                invalidate_on_commit(conn, "professor", professor_id)
+
+        await run(curr, "skip_counters", ("off",))
+
+    return AvaliacoesLoteOut(turmas=resultados_turma, professores=resultados_professor)
+
+async def next_purge(conn: psycopg.AsyncConnection) -> tuple[Optional[int], int]:
+    # (proximo usuario marcado para remocao, quantos estao marcados)
+    async with conn.cursor() as curr:
+        await run(curr, "purge_proximo")
+        res = await curr.fetchone()
+        if res is None:
+            return None, 0
+        return res[0], res[1]
+
+async def purge_avaliacoes(
+        conn: psycopg.AsyncConnection,
+        user_id: int, limit: int,
+) -> int:
+    # Apaga ate limit avaliacoes de turma e ate limit de professor do usuario.
+    # Cada linha devolvida e uma turma/professor afetado, com o total apagado no lote
+    removed_turma = 0
+    removed_professor = 0
+    async with conn.cursor() as curr:
+        await run(curr, "skip_counters", ("on",))
+
+        await run(curr, "purge_avaliacoes_turma", (user_id, limit))
+        for removed_turma, turma_id, disciplina_id in await curr.fetchall():
+            invalidate_on_commit(conn, "turma", turma_id)
+            invalidate_on_commit(conn, "disciplina", disciplina_id)
+
+        await run(curr, "purge_avaliacoes_professor", (user_id, limit))
+        for removed_professor, professor_id, _ in await curr.fetchall():
+            invalidate_on_commit(conn, "professor", professor_id)
+
+        await run(curr, "skip_counters", ("off",))
+    return removed_turma + removed_professor
+
+async def purge_user(conn: psycopg.AsyncConnection, user_id: int) -> bool:
+    # Sem avaliacoes restantes, o DELETE nao tem mais o que apagar em cascata
+    async with conn.cursor() as curr:
+        await run(curr, "purge_user", (user_id,))
+        return await curr.fetchone() is not None
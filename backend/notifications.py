@@ -0,0 +1,127 @@
+from typing import AsyncIterator, Optional
+import asyncio
+import json
+import logging
+import psycopg
+from connection import conninfo
+
+logger = logging.getLogger(__name__)
+
+# Canal usado pelas triggers da migration 009
+CHANNEL = "avaliacoes"
+# Eventos esperando envio por cliente. Um cliente mais lento que isso e desconectado
+QUEUE_SIZE = 100
+# Intervalo (s) entre comentarios de keep-alive, para proxies nao fecharem a conexao
+KEEPALIVE_INTERVAL = 15
+# Espera (s) antes de reconectar quando a conexao de escuta cai
+RECONNECT_DELAY = 1
+
+class Notifications:
+    def __init__(self):
+        # (tipo, alvo_id) -> filas dos clientes inscritos. None na fila encerra o stream
+        self.subscribers: dict[tuple[str, int], set[asyncio.Queue]] = {}
+        self.task: Optional[asyncio.Task] = None
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.reconnects = 0
+
+    def subscribe(self, tipo: str, alvo_id: int) -> asyncio.Queue:
+        queue = asyncio.Queue(QUEUE_SIZE)
+        self.subscribers.setdefault((tipo, alvo_id), set()).add(queue)
+        return queue
+
+    def unsubscribe(self, tipo: str, alvo_id: int, queue: asyncio.Queue):
+        queues = self.subscribers.get((tipo, alvo_id))
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self.subscribers[(tipo, alvo_id)]
+
+    @staticmethod
+    def end(queue: asyncio.Queue):
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def end_all(self):
+        # Eventos podem ter sido perdidos: os clientes reconectam e buscam a pagina de novo
+        for queues in self.subscribers.values():
+            for queue in queues:
+                self.end(queue)
+        self.subscribers.clear()
+
+    def dispatch(self, payload: str):
+        self.received += 1
+        try:
+            event = json.loads(payload)
+            key = (event["tipo"], event["alvo_id"])
+        except (ValueError, KeyError):
+            logger.warning("Invalid notification payload: %s", payload)
+            return
+
+        # O payload e repassado como veio do Postgres, sem serializar de novo
+        for queue in list(self.subscribers.get(key, ())):
+            try:
+                queue.put_nowait(payload)
+                self.delivered += 1
+            except asyncio.QueueFull:
+                self.unsubscribe(*key, queue)
+                self.end(queue)
+                self.dropped += 1
+
+    async def run(self):
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(conninfo(), autocommit=True) as conn:
+                    await conn.execute(f"LISTEN {CHANNEL}")
+                    async for notify in conn.notifies():
+                        self.dispatch(notify.payload)
+            except Exception:
+                # Qualquer erro, nao so de conexao (payload inesperado, bug no dispatch):
+                # se a task morrer, nenhum stream recebe mais eventos
+                logger.exception("Lost connection listening on %s", CHANNEL)
+                self.reconnects += 1
+                self.end_all()
+                await asyncio.sleep(RECONNECT_DELAY)
+
+    def start(self):
+        self.task = asyncio.create_task(self.run())
+
+    async def close(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+        self.end_all()
+
+    async def events(self, tipo: str, alvo_id: int) -> AsyncIterator[str]:
+        queue = self.subscribe(tipo, alvo_id)
+        try:
+            while True:
+                try:
+                    payload = await asyncio.wait_for(queue.get(), KEEPALIVE_INTERVAL)
+                except TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+
+                if payload is None:
+                    return
+                yield f"event: avaliacao\ndata: {payload}\n\n"
+        finally:
+            self.unsubscribe(tipo, alvo_id, queue)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "subscribers": sum(len(queues) for queues in self.subscribers.values()),
+            "channels": len(self.subscribers),
+            "received": self.received,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "reconnects": self.reconnects,
+        }
+
+notifications = Notifications()
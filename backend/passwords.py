@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHash, VerificationError
+from fastapi import HTTPException
+import asyncio
+import hmac
+
+# O argon2 libera o GIL, entao threads bastam para tirar o hash do event loop.
+# Poucos workers deixam CPU livre para as rotas de leitura
+HASH_WORKERS = 2
+# Quantos hashes podem estar em execucao ou na fila ao mesmo tempo
+HASH_CONCURRENCY = 8
+# Tempo maximo (s) esperando uma vaga antes de responder 503
+HASH_QUEUE_TIMEOUT = 2
+
+hasher = PasswordHasher()
+executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="password-hash")
+slots = asyncio.Semaphore(HASH_CONCURRENCY)
+
+async def run_limited(func, *args):
+    try:
+        async with asyncio.timeout(HASH_QUEUE_TIMEOUT):
+            await slots.acquire()
+    except TimeoutError:
+        raise HTTPException(status_code=503, detail="Too many login attempts, try again later")
+
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+    finally:
+        slots.release()
+
+def is_hashed(stored: str) -> bool:
+    return stored.startswith("$argon2")
+
+async def hash_password(password: str) -> str:
+    return await run_limited(hasher.hash, password)
+
+def verify_sync(stored: str, password: str) -> tuple[bool, Optional[str]]:
+    if not is_hashed(stored):
+        # Senha antiga em texto puro: se conferir, ja devolve o hash para gravar
+        if not hmac.compare_digest(stored.encode(), password.encode()):
+            return False, None
+        return True, hasher.hash(password)
+
+    try:
+        hasher.verify(stored, password)
+    except (VerificationError, InvalidHash):
+        return False, None
+
+    if hasher.check_needs_rehash(stored):
+        return True, hasher.hash(password)
+    return True, None
+
+# Retorna se a senha confere e, quando precisa ser regravado, o novo hash
+async def verify_password(stored: str, password: str) -> tuple[bool, Optional[str]]:
+    return await run_limited(verify_sync, stored, password)
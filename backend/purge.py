@@ -0,0 +1,102 @@
+from typing import Optional
+import asyncio
+import logging
+import models
+from connection import Database, commit
+
+logger = logging.getLogger(__name__)
+
+# Avaliacoes de turma (e de professor) apagadas por transacao
+BATCH_SIZE = 500
+# Pausa (s) entre lotes, para nao ocupar o primario seguido
+BATCH_PAUSE = 0.05
+# Sem usuarios marcados, verifica de novo apos esse tempo (s)
+IDLE_INTERVAL = 30
+
+class PurgeWorker:
+    def __init__(self):
+        self.wake_up = asyncio.Event()
+        self.closing = False
+        self.task: Optional[asyncio.Task] = None
+        self.pending_users = 0
+        self.current_user: Optional[int] = None
+        self.current_removed = 0
+        self.removed = 0
+        self.purged_users = 0
+        self.batches = 0
+        self.failed_batches = 0
+
+    def wake(self):
+        self.wake_up.set()
+
+    async def purge_next(self) -> bool:
+        # Apaga um lote do proximo usuario marcado. False quando nao ha nada a fazer
+        async with Database.pool.connection() as conn:
+            user_id, self.pending_users = await models.next_purge(conn)
+        if user_id is None:
+            self.current_user = None
+            return False
+
+        if user_id != self.current_user:
+            self.current_user = user_id
+            self.current_removed = 0
+
+        # Cada lote e uma transacao: os locks duram so o lote
+        async with Database.pool.connection() as conn:
+            removed = await models.purge_avaliacoes(conn, user_id, BATCH_SIZE)
+            await commit(conn)
+        self.batches += 1
+        self.current_removed += removed
+        self.removed += removed
+
+        if removed == 0:
+            async with Database.pool.connection() as conn:
+                if await models.purge_user(conn, user_id):
+                    self.purged_users += 1
+            self.current_user = None
+        return True
+
+    async def run(self):
+        while not self.closing:
+            # Limpo antes do lote: um wake() durante o lote nao se perde
+            self.wake_up.clear()
+            try:
+                busy = await self.purge_next()
+            except Exception:
+                # Qualquer erro, nao so do banco: a task nao pode morrer e deixar os
+                # usuarios marcados para sempre
+                logger.exception("Fail to purge user %s", self.current_user)
+                self.failed_batches += 1
+                busy = False
+
+            if busy:
+                await asyncio.sleep(BATCH_PAUSE)
+                continue
+
+            try:
+                await asyncio.wait_for(self.wake_up.wait(), IDLE_INTERVAL)
+            except TimeoutError:
+                pass
+
+    def start(self):
+        self.task = asyncio.create_task(self.run())
+
+    async def close(self):
+        # Espera o lote atual terminar; o restante continua na proxima inicializacao
+        self.closing = True
+        self.wake()
+        if self.task is not None:
+            await self.task
+
+    def stats(self) -> dict[str, Optional[int]]:
+        return {
+            "pending_users": self.pending_users,
+            "current_user": self.current_user,
+            "current_removed": self.current_removed,
+            "removed": self.removed,
+            "purged_users": self.purged_users,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+        }
+
+purge_worker = PurgeWorker()
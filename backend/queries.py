@@ -0,0 +1,549 @@
+import logging
+import re
+import time
+import psycopg
+from metrics import observe_query
+
+logger = logging.getLogger(__name__)
+
+# Comandos mais lentos que isso (s) vao para o log, com o formato dos parametros
+SLOW_QUERY_SECONDS = 0.2
+
+# Todos os comandos SQL do models.py, por nome. Sao executados com prepare=True:
+# cada conexao do pool prepara o comando no primeiro uso e depois so envia os
+# parametros, sem o Postgres analisar e planejar o texto de novo
+
+DENUNCIAS_LOTE = """
+    WITH lote AS (
+        SELECT L.avaliacao_id, L.qtd
+        FROM unnest(%s::int[], %s::int[]) AS L(avaliacao_id, qtd)
+        INNER JOIN {avaliacoes} AS A
+        ON A.id=L.avaliacao_id
+    ), inseridas AS (
+        INSERT INTO {denuncias}(avaliacao_id)
+        SELECT avaliacao_id
+        FROM lote, generate_series(1, lote.qtd)
+        RETURNING avaliacao_id, created_at
+    )
+    INSERT INTO ModeracaoFila(tipo, avaliacao_id, qtd_denuncias, primeira_denuncia, ultima_denuncia)
+    SELECT '{tipo}', avaliacao_id, COUNT(*), MIN(created_at), MAX(created_at)
+    FROM inseridas
+    GROUP BY avaliacao_id
+    ON CONFLICT (tipo, avaliacao_id) DO UPDATE SET
+        qtd_denuncias = ModeracaoFila.qtd_denuncias + EXCLUDED.qtd_denuncias,
+        ultima_denuncia = GREATEST(ModeracaoFila.ultima_denuncia, EXCLUDED.ultima_denuncia)
+"""
+
+PROFESSORES = """
+    SELECT professor_id, professor_nome,
+    array_agg(DISTINCT disciplina_nome),
+    SUM(qtd_avaliacoes), SUM(sum_avaliacoes)
+    FROM Turmas_Avaliacoes_View
+    WHERE professor_id > %s
+    GROUP BY professor_id, professor_nome
+    ORDER BY professor_id
+"""
+
+MODERACAO_FILA = """
+    SELECT F.tipo, F.avaliacao_id,
+    COALESCE(A.turma_id, AP.professor_id), COALESCE(A.comentario, AP.comentario),
+    F.qtd_denuncias, F.primeira_denuncia, F.ultima_denuncia
+    FROM ModeracaoFila AS F
+    LEFT JOIN Avaliacoes AS A
+    ON F.tipo='turma' AND A.id=F.avaliacao_id
+    LEFT JOIN AvaliacoesProfessores AS AP
+    ON F.tipo='professor' AND AP.id=F.avaliacao_id
+    {where}
+    ORDER BY F.qtd_denuncias DESC, F.avaliacao_id DESC, F.tipo DESC
+    LIMIT %s
+"""
+
+CONTADORES_LOTE = """
+    UPDATE {tabela} AS X SET
+        qtd_avaliacoes = X.qtd_avaliacoes + L.qtd,
+        sum_avaliacoes = X.sum_avaliacoes + L.total
+    FROM unnest(%s::int[], %s::int[], %s::int[]) AS L(id, qtd, total)
+    WHERE X.id=L.id
+"""
+
+PURGE_AVALIACOES = """
+    WITH removidas AS (
+        DELETE
+        FROM {avaliacoes}
+        WHERE id IN (SELECT id FROM {avaliacoes} WHERE user_id=%s LIMIT %s)
+        RETURNING id, {alvo} AS alvo_id, pontuacao
+    ), fila AS (
+        DELETE
+        FROM ModeracaoFila
+        WHERE tipo='{tipo}' AND avaliacao_id IN (SELECT id FROM removidas)
+    ), contadores AS (
+        UPDATE {tabela} AS T SET
+            qtd_avaliacoes = T.qtd_avaliacoes - L.qtd,
+            sum_avaliacoes = T.sum_avaliacoes - L.total
+        FROM (
+            SELECT alvo_id, COUNT(pontuacao) AS qtd, COALESCE(SUM(pontuacao), 0) AS total
+            FROM removidas
+            GROUP BY alvo_id
+        ) AS L
+        WHERE T.id=L.alvo_id
+        RETURNING {retorno}
+    )
+    SELECT (SELECT COUNT(*) FROM removidas), contadores.*
+    FROM contadores
+"""
+
+QUERIES: dict[str, str] = {
+    "professor_info": """
+        SELECT P.nome, P.qtd_avaliacoes, P.sum_avaliacoes,
+        (
+            SELECT '/api/professor/' || I.professor_id || '/image?v=' || I.etag
+            FROM ProfessoresImagens AS I
+            WHERE I.professor_id=P.id AND I.tamanho='original'
+        ),
+        COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', T.id, 'numero', T.numero, 'nome', D.nome
+            ) ORDER BY T.id)
+            FROM Turmas AS T
+            INNER JOIN Disciplinas AS D
+            ON T.disciplina_id=D.id
+            WHERE T.professor_id=P.id
+        ), '[]'),
+        COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', A.id, 'pontuacao', A.pontuacao,
+                'comentario', A.comentario,
+                'user_id', U.id, 'user_nome', U.nome
+            ) ORDER BY A.id)
+            FROM AvaliacoesProfessores AS A
+            INNER JOIN Users AS U
+            ON A.user_id=U.id
+            WHERE A.professor_id=P.id AND U.removido_em IS NULL
+        ), '[]')
+        FROM Professores AS P
+        WHERE P.id=%s
+    """,
+    # Se o cliente ja tem a versao atual, os bytes nao sao lidos do banco
+    "professor_image": """
+        SELECT content_type, etag,
+        CASE WHEN etag = ANY(%(etags)s) OR '*' = ANY(%(etags)s) THEN NULL ELSE img END
+        FROM ProfessoresImagens
+        WHERE professor_id=%(professor_id)s AND tamanho=%(tamanho)s
+    """,
+    "disciplina_info": """
+        SELECT disciplina_nome, professor_id, professor_nome,
+        SUM(qtd_avaliacoes), SUM(sum_avaliacoes)
+        FROM Turmas_Avaliacoes_View
+        WHERE disciplina_id=%s
+        GROUP BY disciplina_nome, professor_id, professor_nome
+        ORDER BY professor_id
+    """,
+    "disciplinas": """
+        SELECT id, nome
+        FROM Disciplinas
+        WHERE id > %s
+        ORDER BY id
+        LIMIT %s
+    """,
+    "stream_disciplinas": "SELECT id, nome FROM Disciplinas ORDER BY id",
+    "professores": PROFESSORES + "LIMIT %s",
+    "stream_professores": PROFESSORES,
+    # Mesmas linhas de "professores", ja no formato JSON de ProfessorItem
+    "professores_json": f"""
+        SELECT COALESCE(json_agg(P ORDER BY P.id), '[]')::text, COUNT(*), MAX(P.id)
+        FROM ({PROFESSORES} LIMIT %s) AS P(id, nome, disciplinas, qtd_avaliacoes, sum_avaliacoes)
+    """,
+    "turma_info": """
+        SELECT turma_numero, professor_id, professor_nome,
+        disciplina_id, disciplina_nome,
+        qtd_avaliacoes, sum_avaliacoes
+        FROM Turmas_Avaliacoes_View
+        WHERE turma_id=%s
+    """,
+    "turma_avaliacoes": """
+        SELECT Avaliacoes.id as avaliacao_id ,
+        Users.nome as user_nome, Avaliacoes.user_id,
+        Avaliacoes.pontuacao, Avaliacoes.comentario
+        FROM Avaliacoes
+        INNER JOIN Users
+        ON Avaliacoes.user_id=Users.id
+        WHERE Avaliacoes.turma_id=%s AND Avaliacoes.id > %s
+        AND Users.removido_em IS NULL
+        ORDER BY Avaliacoes.id
+        LIMIT %s
+    """,
+    # TurmaInfo inteiro montado pelo Postgres, com uma pagina de avaliacoes
+    "turma_json": """
+        WITH avaliacoes AS (
+            SELECT A.id, A.user_id, U.nome AS user_nome, A.comentario, A.pontuacao
+            FROM Avaliacoes AS A
+            INNER JOIN Users AS U
+            ON A.user_id=U.id
+            WHERE A.turma_id=%(turma_id)s AND A.id > %(after)s
+            AND U.removido_em IS NULL
+            ORDER BY A.id
+            LIMIT %(limit)s
+        )
+        SELECT json_build_object(
+            'id', V.turma_id, 'numero', V.turma_numero,
+            'professor_id', V.professor_id, 'professor_nome', V.professor_nome,
+            'disciplina_id', V.disciplina_id, 'disciplina_nome', V.disciplina_nome,
+            'qtd_avaliacoes', V.qtd_avaliacoes, 'sum_avaliacoes', V.sum_avaliacoes,
+            'avaliacoes', (SELECT COALESCE(json_agg(A ORDER BY A.id), '[]') FROM avaliacoes AS A)
+        )::text,
+        (SELECT COUNT(*) FROM avaliacoes), (SELECT MAX(id) FROM avaliacoes)
+        FROM Turmas_Avaliacoes_View AS V
+        WHERE V.turma_id=%(turma_id)s
+    """,
+    "add_avaliacao_turma": """
+        INSERT INTO Avaliacoes(pontuacao, comentario, user_id, turma_id)
+        VALUES
+            (%s, %s, %s, %s)
+        RETURNING id, (SELECT nome FROM Users WHERE id=user_id),
+            (SELECT disciplina_id FROM Turmas WHERE id=turma_id)
+    """,
+    "add_avaliacao_professor": """
+        INSERT INTO AvaliacoesProfessores(pontuacao, comentario, user_id, professor_id)
+        VALUES
+            (%s, %s, %s, %s)
+        RETURNING id, (SELECT nome FROM Users WHERE id=user_id)
+    """,
+    "login": """
+        SELECT id, is_admin, senha
+        FROM Users
+        WHERE email=%s AND removido_em IS NULL
+    """,
+    "user_senha": """
+        SELECT senha
+        FROM Users
+        WHERE id=%s
+    """,
+    "update_senha": """
+        UPDATE Users SET
+          senha = %s
+        WHERE id=%s
+        RETURNING id
+    """,
+    "user_info": """
+        SELECT email, nome,
+        matricula, curso
+        FROM Users
+        WHERE id=%s AND removido_em IS NULL
+    """,
+    "user_content_keys": """
+        SELECT 'turma', A.turma_id
+        FROM Avaliacoes AS A
+        WHERE A.user_id=%(user_id)s
+        UNION
+        SELECT 'disciplina', T.disciplina_id
+        FROM Avaliacoes AS A
+        INNER JOIN Turmas AS T
+        ON T.id=A.turma_id
+        WHERE A.user_id=%(user_id)s
+        UNION
+        SELECT 'professor', A.professor_id
+        FROM AvaliacoesProfessores AS A
+        WHERE A.user_id=%(user_id)s
+    """,
+    "update_user": """
+        UPDATE Users SET (email, nome, matricula, curso)
+            = (%s, %s, %s, %s)
+        WHERE id=%s
+        RETURNING email, nome, matricula, curso
+    """,
+    # Email e matricula de banidos continuam ocupados depois que o purge apaga a linha
+    "user_existente": """
+        SELECT id
+        FROM Users
+        WHERE matricula=%(matricula)s OR email=%(email)s
+        UNION ALL
+        SELECT NULL
+        FROM UsuariosBanidos
+        WHERE matricula=%(matricula)s OR email=%(email)s
+        LIMIT 1
+    """,
+    "register_user": """
+        INSERT INTO Users(email, nome, matricula, curso, senha, is_admin)
+        VALUES
+            (%s, %s, %s, %s, %s, false)
+        RETURNING id
+    """,
+    # O conteudo some das leituras na hora; o purge.py apaga as linhas depois.
+    # Banidos deixam email e matricula em UsuariosBanidos (migration 014)
+    "soft_delete_user": """
+        WITH marcado AS (
+            UPDATE Users SET removido_em = now(), banido = %(banido)s
+            WHERE id=%(id)s AND removido_em IS NULL
+            RETURNING id, email, matricula, banido
+        ), banido AS (
+            INSERT INTO UsuariosBanidos(email, matricula)
+            SELECT email, matricula
+            FROM marcado
+            WHERE banido
+        )
+        SELECT id
+        FROM marcado
+    """,
+    # Versoes mantidas pelas triggers das migrations 011 e 013, para os ETags. A de
+    # turmas tambem leva a soma das versoes das linhas, que muda com os contadores
+    "versoes": """
+        SELECT tabela, versao || CASE
+            WHEN tabela = 'turmas' THEN '.' || (SELECT COALESCE(SUM(versao), 0) FROM Turmas)
+            ELSE ''
+        END
+        FROM Versoes
+        WHERE tabela = ANY(%s)
+    """,
+    # Equivale a SET LOCAL, que nao pode ser preparado
+    "skip_counters": "SELECT set_config('app.skip_counters', %s, true)",
+    "denuncias_lote_turma": DENUNCIAS_LOTE.format(
+        tipo="turma", denuncias="Denuncias", avaliacoes="Avaliacoes",
+    ),
+    "denuncias_lote_professor": DENUNCIAS_LOTE.format(
+        tipo="professor", denuncias="DenunciasProfessor", avaliacoes="AvaliacoesProfessores",
+    ),
+    "denuncias": """
+        SELECT D.id, A.id, A.comentario
+        FROM DENUNCIAS as D
+        INNER JOIN Avaliacoes as A
+        ON A.id=D.avaliacao_id
+        WHERE D.id > %s
+        ORDER BY D.id
+        LIMIT %s
+    """,
+    "stream_denuncias": """
+        SELECT D.id, A.id, A.comentario
+        FROM DENUNCIAS as D
+        INNER JOIN Avaliacoes as A
+        ON A.id=D.avaliacao_id
+        ORDER BY D.id
+    """,
+    "delete_denuncia": """
+        DELETE
+        FROM Denuncias
+        WHERE id=%s
+        RETURNING id
+    """,
+    "delete_avaliacao": """
+        DELETE
+        FROM Avaliacoes
+        WHERE id=%(id)s AND (%(user_id)s::int IS NULL OR user_id=%(user_id)s)
+        RETURNING turma_id, (SELECT disciplina_id FROM Turmas WHERE id=turma_id)
+    """,
+    "avaliacao_user": """
+        SELECT user_id
+        FROM Avaliacoes
+        WHERE id=%s
+    """,
+    "update_avaliacao": """
+        UPDATE Avaliacoes SET (comentario, pontuacao)
+            = (%(comentario)s, %(pontuacao)s)
+        WHERE id=%(id)s AND (%(user_id)s::int IS NULL OR user_id=%(user_id)s)
+        RETURNING turma_id, (SELECT disciplina_id FROM Turmas WHERE id=turma_id)
+    """,
+    # Nomes casam por texto ou por trigramas (erros de digitacao); comentarios so por texto.
+    # Cada parte e limitada antes do UNION para usar os indices GIN
+    "search": """
+        WITH query AS (SELECT websearch_to_tsquery('portuguese', %(q)s) AS tsq)
+        (
+            SELECT 'professor', P.id, P.id, P.nome, NULL,
+            greatest(ts_rank(P.busca, query.tsq), similarity(P.nome, %(q)s)) AS score
+            FROM Professores AS P, query
+            WHERE P.busca @@ query.tsq OR P.nome %% %(q)s
+            ORDER BY score DESC
+            LIMIT %(limit)s
+        )
+        UNION ALL
+        (
+            SELECT 'disciplina', D.id, D.id, D.nome, NULL,
+            greatest(ts_rank(D.busca, query.tsq), similarity(D.nome, %(q)s)) AS score
+            FROM Disciplinas AS D, query
+            WHERE D.busca @@ query.tsq OR D.nome %% %(q)s
+            ORDER BY score DESC
+            LIMIT %(limit)s
+        )
+        UNION ALL
+        (
+            SELECT 'avaliacao_turma', A.id, A.turma_id, T.disciplina_nome,
+            ts_headline('portuguese', A.comentario, query.tsq),
+            A.score
+            FROM (
+                SELECT A.id, A.turma_id, A.comentario, ts_rank(A.busca, query.tsq) AS score
+                FROM Avaliacoes AS A, query
+                WHERE A.busca @@ query.tsq
+                AND NOT EXISTS (SELECT 1 FROM Users AS U WHERE U.id=A.user_id AND U.removido_em IS NOT NULL)
+                ORDER BY score DESC
+                LIMIT %(limit)s
+            ) AS A
+            INNER JOIN Turmas_Avaliacoes_View AS T
+            ON T.turma_id=A.turma_id, query
+        )
+        UNION ALL
+        (
+            SELECT 'avaliacao_professor', A.id, A.professor_id, P.nome,
+            ts_headline('portuguese', A.comentario, query.tsq),
+            A.score
+            FROM (
+                SELECT A.id, A.professor_id, A.comentario, ts_rank(A.busca, query.tsq) AS score
+                FROM AvaliacoesProfessores AS A, query
+                WHERE A.busca @@ query.tsq
+                AND NOT EXISTS (SELECT 1 FROM Users AS U WHERE U.id=A.user_id AND U.removido_em IS NOT NULL)
+                ORDER BY score DESC
+                LIMIT %(limit)s
+            ) AS A
+            INNER JOIN Professores AS P
+            ON P.id=A.professor_id, query
+        )
+        ORDER BY 6 DESC
+        LIMIT %(limit)s
+    """,
+    "moderacao_fila": MODERACAO_FILA.format(where=""),
+    # Cursor (qtd_denuncias, avaliacao_id, tipo) do ultimo item da pagina anterior
+    "moderacao_fila_after": MODERACAO_FILA.format(
+        where="WHERE (F.qtd_denuncias, F.avaliacao_id, F.tipo) < (%s::int, %s::int, %s::text)",
+    ),
+    "resolve_avaliacoes_turma": """
+        DELETE
+        FROM Avaliacoes
+        WHERE id = ANY(%s::int[])
+        RETURNING turma_id, (SELECT disciplina_id FROM Turmas WHERE id=turma_id)
+    """,
+    "resolve_avaliacoes_professor": """
+        DELETE
+        FROM AvaliacoesProfessores
+        WHERE id = ANY(%s::int[])
+        RETURNING professor_id
+    """,
+    "dismiss_fila": """
+        DELETE
+        FROM ModeracaoFila
+        WHERE (tipo='turma' AND avaliacao_id = ANY(%s::int[]))
+        OR (tipo='professor' AND avaliacao_id = ANY(%s::int[]))
+    """,
+    "dismiss_denuncias_turma": "DELETE FROM Denuncias WHERE avaliacao_id = ANY(%s::int[])",
+    "dismiss_denuncias_professor": "DELETE FROM DenunciasProfessor WHERE avaliacao_id = ANY(%s::int[])",
+    "turmas_existentes": "SELECT id FROM Turmas WHERE id = ANY(%s::int[])",
+    "professores_existentes": "SELECT id FROM Professores WHERE id = ANY(%s::int[])",
+    "users_existentes": "SELECT id FROM Users WHERE id = ANY(%s::int[])",
+    "avaliacoes_existentes_turma": "SELECT id FROM Avaliacoes WHERE id = ANY(%s::int[])",
+    "avaliacoes_existentes_professor": "SELECT id FROM AvaliacoesProfessores WHERE id = ANY(%s::int[])",
+    "add_avaliacoes_lote_turma": """
+        INSERT INTO Avaliacoes(pontuacao, comentario, user_id, turma_id)
+        VALUES (%s, %s, %s, %s)
+        RETURNING id
+    """,
+    "add_avaliacoes_lote_professor": """
+        INSERT INTO AvaliacoesProfessores(pontuacao, comentario, user_id, professor_id)
+        VALUES (%s, %s, %s, %s)
+        RETURNING id
+    """,
+    "contadores_lote_turma": CONTADORES_LOTE.format(tabela="Turmas") + "RETURNING X.disciplina_id",
+    "contadores_lote_professor": CONTADORES_LOTE.format(tabela="Professores"),
+    "purge_proximo": """
+        SELECT id, (SELECT COUNT(*) FROM Users WHERE removido_em IS NOT NULL)
+        FROM Users
+        WHERE removido_em IS NOT NULL
+        ORDER BY removido_em
+        LIMIT 1
+    """,
+    # Um lote de avaliacoes apagado por vez, com os contadores descontados uma vez por
+    # turma/professor. Com skip_counters as triggers nao mexem nos contadores nem na
+    # fila de moderacao, entao a fila das avaliacoes apagadas sai aqui
+    "purge_avaliacoes_turma": PURGE_AVALIACOES.format(
+        tipo="turma", avaliacoes="Avaliacoes", alvo="turma_id", tabela="Turmas",
+        retorno="T.id, T.disciplina_id",
+    ),
+    "purge_avaliacoes_professor": PURGE_AVALIACOES.format(
+        tipo="professor", avaliacoes="AvaliacoesProfessores", alvo="professor_id", tabela="Professores",
+        retorno="T.id, NULL::int",
+    ),
+    "purge_user": """
+        DELETE
+        FROM Users
+        WHERE id=%s AND removido_em IS NOT NULL
+        RETURNING id
+    """,
+}
+
+class QueryStats:
+    # nome -> [chamadas, tempo total (s), maior tempo (s)]
+    timings: dict[str, list] = {}
+
+def shape(params) -> str:
+    # So os tipos e tamanhos: os valores podem ter senhas e dados pessoais
+    if isinstance(params, dict):
+        return "{" + ", ".join(f"{k}: {shape(v)}" for k, v in params.items()) + "}"
+    if isinstance(params, tuple):
+        return "(" + ", ".join(shape(p) for p in params) + ")"
+    if isinstance(params, list):
+        return f"list[{len(params)}]"
+    return type(params).__name__
+
+def record(name: str, elapsed: float, rows: int, params=None):
+    timing = QueryStats.timings.setdefault(name, [0, 0.0, 0.0])
+    timing[0] += 1
+    timing[1] += elapsed
+    timing[2] = max(timing[2], elapsed)
+    observe_query(name, elapsed, rows)
+    if elapsed > SLOW_QUERY_SECONDS:
+        logger.warning("Slow query %s: %.1fms, %d rows, params %s", name, elapsed * 1000, rows, shape(params))
+
+async def run(curr: psycopg.AsyncCursor, name: str, params=None):
+    # Cursores nomeados (streaming) ja sao um DECLARE no servidor e nao aceitam prepare
+    start = time.perf_counter()
+    if isinstance(curr, psycopg.AsyncServerCursor):
+        await curr.execute(QUERIES[name], params)
+    else:
+        await curr.execute(QUERIES[name], params, prepare=True)
+    record(name, time.perf_counter() - start, curr.rowcount, params)
+
+async def run_many(curr: psycopg.AsyncCursor, name: str, params_seq, returning: bool = False):
+    start = time.perf_counter()
+    await curr.executemany(QUERIES[name], params_seq, returning=returning)
+    record(name, time.perf_counter() - start, len(params_seq), params_seq[0] if params_seq else None)
+
+def stats() -> dict[str, dict[str, float]]:
+    return {
+        name: {
+            "calls": calls,
+            "total_ms": round(total * 1000, 3),
+            "mean_ms": round(total * 1000 / calls, 3),
+            "max_ms": round(longest * 1000, 3),
+        }
+        for name, (calls, total, longest) in sorted(QueryStats.timings.items())
+    }
+
+PLACEHOLDER = re.compile(r"%\((\w+)\)s|%s|%%")
+
+def numbered(sql: str) -> str:
+    # Troca os placeholders do psycopg por $1, $2... para o PREPARE do servidor
+    names: dict[str, int] = {}
+    count = 0
+
+    def replace(match: re.Match) -> str:
+        nonlocal count
+        if match.group(0) == "%%":
+            return "%"
+        name = match.group(1)
+        if name is not None and name in names:
+            return f"${names[name]}"
+        count += 1
+        if name is not None:
+            names[name] = count
+        return f"${count}"
+
+    return PLACEHOLDER.sub(replace, sql)
+
+async def check_statements(conn: psycopg.AsyncConnection):
+    # Prepara cada comando no schema atual; falha na inicializacao em vez de no primeiro request
+    failures = []
+    for name, sql in QUERIES.items():
+        try:
+            async with conn.transaction():
+                await conn.execute(f"PREPARE check_{name} AS {numbered(sql)}")
+                await conn.execute(f"DEALLOCATE check_{name}")
+        except psycopg.Error as e:
+            failures.append(f"{name}: {e}")
+
+    if failures:
+        raise RuntimeError("Statements failed to prepare:\n" + "\n".join(failures))
@@ -0,0 +1,126 @@
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Annotated
+from fastapi import Depends, HTTPException, Request
+from auth import Session, get_session
+from connection import client_key
+import math
+import os
+import time
+
+# Limite de baldes guardados por classe, caso muitos clientes diferentes aparecam de uma vez
+MAX_BUCKETS = 100_000
+
+class RateLimiter:
+    def __init__(self, rate: float, burst: int, concurrency: int):
+        self.configure(rate, burst, concurrency)
+        self.in_flight = 0
+        # cliente -> (fichas, ultimo uso), ordenado pelo ultimo uso
+        self.buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self.allowed = 0
+        self.limited = 0
+        self.busy = 0
+
+    def configure(self, rate: float, burst: int, concurrency: int):
+        # rate fichas por segundo por cliente, acumulando ate burst
+        self.rate = rate
+        self.burst = burst
+        # Um balde parado por esse tempo (s) ja estaria cheio: pode ser descartado
+        self.idle = burst / rate
+        # Requisicoes da classe em andamento ao mesmo tempo, somando todos os clientes.
+        # Deixa conexoes do pool livres para as leituras
+        self.concurrency = concurrency
+
+    def evict(self, now: float):
+        while self.buckets:
+            client, (_, last) = next(iter(self.buckets.items()))
+            if now - last < self.idle and len(self.buckets) < MAX_BUCKETS:
+                break
+            del self.buckets[client]
+
+    def take(self, client: str) -> float:
+        # Retorna 0 se havia ficha, senao quantos segundos ate a proxima
+        now = time.monotonic()
+        self.evict(now)
+        tokens, last = self.buckets.pop(client, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+        if tokens < 1:
+            self.buckets[client] = (tokens, now)
+            return (1 - tokens) / self.rate
+
+        self.buckets[client] = (tokens - 1, now)
+        return 0
+
+    @asynccontextmanager
+    async def limit(self, client: str):
+        if self.in_flight >= self.concurrency:
+            self.busy += 1
+            raise HTTPException(status_code=503, detail="Server busy, try again later", headers={"Retry-After": "1"})
+
+        wait = self.take(client)
+        if wait > 0:
+            self.limited += 1
+            raise HTTPException(
+                status_code=429, detail="Too many requests",
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+
+        self.allowed += 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "buckets": len(self.buckets),
+            "in_flight": self.in_flight,
+            "allowed": self.allowed,
+            "limited": self.limited,
+            "busy": self.busy,
+        }
+
+limiters = {
+    "avaliacao": RateLimiter(rate=0.2, burst=5, concurrency=4),
+    "denuncia": RateLimiter(rate=1, burst=10, concurrency=50),
+    "login": RateLimiter(rate=0.2, burst=10, concurrency=4),
+}
+
+def config_ratelimit():
+    # RATELIMIT_<CLASSE>_RATE, _BURST e _CONCURRENCY, com os valores acima como padrao.
+    # Os limitadores sao alterados, nao trocados: rate_limit ja guardou cada um
+    for name, limiter in limiters.items():
+        prefix = f"RATELIMIT_{name.upper()}"
+        rate = os.getenv(f"{prefix}_RATE")
+        if rate is None:
+            rate = str(limiter.rate)
+
+        burst = os.getenv(f"{prefix}_BURST")
+        if burst is None:
+            burst = str(limiter.burst)
+
+        concurrency = os.getenv(f"{prefix}_CONCURRENCY")
+        if concurrency is None:
+            concurrency = str(limiter.concurrency)
+
+        limiter.configure(float(rate), int(burst), int(concurrency))
+
+def rate_limit(route_class: str, by_user: bool = False):
+    # Declarada antes de Connection, assim uma requisicao recusada nao pega conexao do pool
+    limiter = limiters[route_class]
+    if by_user:
+        async def check_user(session: Annotated[Session, Depends(get_session)]):
+            async with limiter.limit(f"user:{session.user_id}"):
+                yield
+
+        return Depends(check_user)
+
+    async def check_client(request: Request):
+        async with limiter.limit(client_key(request)):
+            yield
+
+    return Depends(check_client)
+
+def stats() -> dict[str, dict[str, int]]:
+    return {name: limiter.stats() for name, limiter in limiters.items()}
@@ -1,6 +1,7 @@
 import psycopg
 import dotenv
 import os
+from images import generate_images
 
 IMAGE_FOLDER = "./images/"
 
@@ -123,7 +124,7 @@ def insert_professor_denuncias(conn):
         """) 
     conn.commit()
 
-def main():
+def connect():
     dotenv.load_dotenv("./dev.env")
     host = os.getenv("HOST_DB")
     if host is None:
@@ -145,7 +146,7 @@ def main():
     if password is None:
         password = "1234"
 
-    with psycopg.connect(
+    return psycopg.connect(
             f"""
             host={host}
             port={port}
@@ -153,9 +154,13 @@ def main():
             password={password}
             user={user}
             """
-    ) as conn:
+    )
+
+def main():
+    with connect() as conn:
         insert_departamentos(conn)
         insert_professores(conn)
+        generate_images(conn)
         insert_disciplinas(conn)
         insert_turmas(conn)
         insert_users(conn)
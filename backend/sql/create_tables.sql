@@ -20,6 +20,20 @@ CREATE TABLE Professores (
       ON DELETE CASCADE
 );
 
+CREATE TABLE ProfessoresImagens (
+    professor_id INT,
+    tamanho VARCHAR NOT NULL,
+    content_type VARCHAR NOT NULL,
+    etag VARCHAR NOT NULL,
+    img bytea NOT NULL,
+
+    PRIMARY KEY(professor_id, tamanho),
+    CONSTRAINT fk_professor
+      FOREIGN KEY(professor_id) 
+	  REFERENCES Professores(id)
+      ON DELETE CASCADE
+);
+
 CREATE TABLE Disciplinas (
     id SERIAL,
     nome VARCHAR NOT NULL,
@@ -37,6 +51,8 @@ CREATE TABLE Turmas (
     numero VARCHAR NOT NULL,
     professor_id INT,
     disciplina_id INT,
+    qtd_avaliacoes INT NOT NULL DEFAULT 0,
+    sum_avaliacoes INT NOT NULL DEFAULT 0,
 
     PRIMARY KEY(id),
     CONSTRAINT fk_professor
@@ -122,8 +138,7 @@ CREATE TABLE DenunciasProfessor (
 
 CREATE VIEW Turmas_Avaliacoes_View AS
     SELECT Turmas.numero as turma_numero, Turmas.id as turma_id, Turmas.professor_id, Turmas.disciplina_id, Professores.nome as professor_nome, Disciplinas.nome as disciplina_nome, 
-	(SELECT COUNT(pontuacao) FROM Avaliacoes WHERE turma_id=Turmas.id) as qtd_avaliacoes,
-	COALESCE((SELECT SUM(pontuacao) FROM Avaliacoes WHERE turma_id=Turmas.id), 0) as sum_avaliacoes
+	Turmas.qtd_avaliacoes, Turmas.sum_avaliacoes
     FROM Turmas
     INNER JOIN Professores
     ON Turmas.professor_id=Professores.id
@@ -131,6 +146,61 @@ CREATE VIEW Turmas_Avaliacoes_View AS
     ON Turmas.disciplina_id=Disciplinas.id
 ;
 
+CREATE FUNCTION update_avaliacao_turma() RETURNS trigger AS $trigger_bound$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE Turmas SET
+            qtd_avaliacoes = qtd_avaliacoes - (OLD.pontuacao IS NOT NULL)::int,
+            sum_avaliacoes = sum_avaliacoes - COALESCE(OLD.pontuacao, 0)
+        WHERE id = OLD.turma_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE Turmas SET
+            qtd_avaliacoes = qtd_avaliacoes + (NEW.pontuacao IS NOT NULL)::int,
+            sum_avaliacoes = sum_avaliacoes + COALESCE(NEW.pontuacao, 0)
+        WHERE id = NEW.turma_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$trigger_bound$
+LANGUAGE plpgsql;
+
+CREATE TRIGGER update_avaliacao_turma_on_change_avaliacao
+    AFTER INSERT OR DELETE OR UPDATE OF pontuacao, turma_id ON Avaliacoes
+    FOR EACH ROW
+    EXECUTE FUNCTION update_avaliacao_turma();
+
+CREATE FUNCTION recompute_avaliacao_counters() RETURNS void AS $function_bound$
+BEGIN
+    UPDATE Turmas SET
+        qtd_avaliacoes = COALESCE(A.qtd, 0),
+        sum_avaliacoes = COALESCE(A.total, 0)
+    FROM Turmas AS T
+    LEFT JOIN (
+        SELECT turma_id, COUNT(pontuacao) AS qtd, SUM(pontuacao) AS total
+        FROM Avaliacoes
+        GROUP BY turma_id
+    ) AS A
+    ON A.turma_id=T.id
+    WHERE Turmas.id=T.id;
+
+    UPDATE Professores SET
+        qtd_avaliacoes = COALESCE(A.qtd, 0),
+        sum_avaliacoes = COALESCE(A.total, 0)
+    FROM Professores AS P
+    LEFT JOIN (
+        SELECT professor_id, COUNT(pontuacao) AS qtd, SUM(pontuacao) AS total
+        FROM AvaliacoesProfessores
+        GROUP BY professor_id
+    ) AS A
+    ON A.professor_id=P.id
+    WHERE Professores.id=P.id;
+END;
+$function_bound$
+LANGUAGE plpgsql;
+
 CREATE FUNCTION update_avaliacao_professor() RETURNS trigger AS $trigger_bound$
 BEGIN
     UPDATE Professores SET
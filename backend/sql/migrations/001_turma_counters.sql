@@ -0,0 +1,74 @@
+-- Contadores de avaliacoes por turma mantidos por trigger
+ALTER TABLE Turmas ADD COLUMN IF NOT EXISTS qtd_avaliacoes INT NOT NULL DEFAULT 0;
+ALTER TABLE Turmas ADD COLUMN IF NOT EXISTS sum_avaliacoes INT NOT NULL DEFAULT 0;
+
+DROP VIEW IF EXISTS Turmas_Avaliacoes_View;
+
+CREATE VIEW Turmas_Avaliacoes_View AS
+    SELECT Turmas.numero as turma_numero, Turmas.id as turma_id, Turmas.professor_id, Turmas.disciplina_id, Professores.nome as professor_nome, Disciplinas.nome as disciplina_nome, 
+	Turmas.qtd_avaliacoes, Turmas.sum_avaliacoes
+    FROM Turmas
+    INNER JOIN Professores
+    ON Turmas.professor_id=Professores.id
+    INNER JOIN Disciplinas
+    ON Turmas.disciplina_id=Disciplinas.id
+;
+
+CREATE OR REPLACE FUNCTION update_avaliacao_turma() RETURNS trigger AS $trigger_bound$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE Turmas SET
+            qtd_avaliacoes = qtd_avaliacoes - (OLD.pontuacao IS NOT NULL)::int,
+            sum_avaliacoes = sum_avaliacoes - COALESCE(OLD.pontuacao, 0)
+        WHERE id = OLD.turma_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE Turmas SET
+            qtd_avaliacoes = qtd_avaliacoes + (NEW.pontuacao IS NOT NULL)::int,
+            sum_avaliacoes = sum_avaliacoes + COALESCE(NEW.pontuacao, 0)
+        WHERE id = NEW.turma_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$trigger_bound$
+LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS update_avaliacao_turma_on_change_avaliacao ON Avaliacoes;
+
+CREATE TRIGGER update_avaliacao_turma_on_change_avaliacao
+    AFTER INSERT OR DELETE OR UPDATE OF pontuacao, turma_id ON Avaliacoes
+    FOR EACH ROW
+    EXECUTE FUNCTION update_avaliacao_turma();
+
+CREATE OR REPLACE FUNCTION recompute_avaliacao_counters() RETURNS void AS $function_bound$
+BEGIN
+    UPDATE Turmas SET
+        qtd_avaliacoes = COALESCE(A.qtd, 0),
+        sum_avaliacoes = COALESCE(A.total, 0)
+    FROM Turmas AS T
+    LEFT JOIN (
+        SELECT turma_id, COUNT(pontuacao) AS qtd, SUM(pontuacao) AS total
+        FROM Avaliacoes
+        GROUP BY turma_id
+    ) AS A
+    ON A.turma_id=T.id
+    WHERE Turmas.id=T.id;
+
+    UPDATE Professores SET
+        qtd_avaliacoes = COALESCE(A.qtd, 0),
+        sum_avaliacoes = COALESCE(A.total, 0)
+    FROM Professores AS P
+    LEFT JOIN (
+        SELECT professor_id, COUNT(pontuacao) AS qtd, SUM(pontuacao) AS total
+        FROM AvaliacoesProfessores
+        GROUP BY professor_id
+    ) AS A
+    ON A.professor_id=P.id
+    WHERE Professores.id=P.id;
+END;
+$function_bound$
+LANGUAGE plpgsql;
+
+SELECT recompute_avaliacao_counters();
@@ -0,0 +1,14 @@
+-- Fotos e miniaturas dos professores
+CREATE TABLE IF NOT EXISTS ProfessoresImagens (
+    professor_id INT,
+    tamanho VARCHAR NOT NULL,
+    content_type VARCHAR NOT NULL,
+    etag VARCHAR NOT NULL,
+    img bytea NOT NULL,
+
+    PRIMARY KEY(professor_id, tamanho),
+    CONSTRAINT fk_professor
+      FOREIGN KEY(professor_id) 
+	  REFERENCES Professores(id)
+      ON DELETE CASCADE
+);
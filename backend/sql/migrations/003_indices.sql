@@ -0,0 +1,32 @@
+-- migrate: no-transaction
+-- Indices dos caminhos quentes, criados sem bloquear escritas.
+-- O DROP antes de cada CREATE remove indices invalidos deixados por uma execucao interrompida.
+DROP INDEX CONCURRENTLY IF EXISTS avaliacoes_turma_id_idx;
+CREATE INDEX CONCURRENTLY avaliacoes_turma_id_idx ON Avaliacoes(turma_id, id);
+
+DROP INDEX CONCURRENTLY IF EXISTS avaliacoes_user_id_idx;
+CREATE INDEX CONCURRENTLY avaliacoes_user_id_idx ON Avaliacoes(user_id);
+
+DROP INDEX CONCURRENTLY IF EXISTS avaliacoes_professores_professor_id_idx;
+CREATE INDEX CONCURRENTLY avaliacoes_professores_professor_id_idx ON AvaliacoesProfessores(professor_id, id);
+
+DROP INDEX CONCURRENTLY IF EXISTS avaliacoes_professores_user_id_idx;
+CREATE INDEX CONCURRENTLY avaliacoes_professores_user_id_idx ON AvaliacoesProfessores(user_id);
+
+DROP INDEX CONCURRENTLY IF EXISTS turmas_professor_id_idx;
+CREATE INDEX CONCURRENTLY turmas_professor_id_idx ON Turmas(professor_id);
+
+DROP INDEX CONCURRENTLY IF EXISTS turmas_disciplina_id_idx;
+CREATE INDEX CONCURRENTLY turmas_disciplina_id_idx ON Turmas(disciplina_id);
+
+DROP INDEX CONCURRENTLY IF EXISTS users_email_idx;
+CREATE INDEX CONCURRENTLY users_email_idx ON Users(email);
+
+DROP INDEX CONCURRENTLY IF EXISTS users_matricula_idx;
+CREATE INDEX CONCURRENTLY users_matricula_idx ON Users(matricula);
+
+DROP INDEX CONCURRENTLY IF EXISTS denuncias_avaliacao_id_idx;
+CREATE INDEX CONCURRENTLY denuncias_avaliacao_id_idx ON Denuncias(avaliacao_id);
+
+DROP INDEX CONCURRENTLY IF EXISTS denuncias_professor_avaliacao_id_idx;
+CREATE INDEX CONCURRENTLY denuncias_professor_avaliacao_id_idx ON DenunciasProfessor(avaliacao_id);
@@ -0,0 +1,14 @@
+-- Colunas tsvector (portugues) para a busca textual. Os indices ficam na 005
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE Professores ADD COLUMN IF NOT EXISTS busca tsvector
+    GENERATED ALWAYS AS (to_tsvector('portuguese', nome)) STORED;
+
+ALTER TABLE Disciplinas ADD COLUMN IF NOT EXISTS busca tsvector
+    GENERATED ALWAYS AS (to_tsvector('portuguese', nome)) STORED;
+
+ALTER TABLE Avaliacoes ADD COLUMN IF NOT EXISTS busca tsvector
+    GENERATED ALWAYS AS (to_tsvector('portuguese', COALESCE(comentario, ''))) STORED;
+
+ALTER TABLE AvaliacoesProfessores ADD COLUMN IF NOT EXISTS busca tsvector
+    GENERATED ALWAYS AS (to_tsvector('portuguese', COALESCE(comentario, ''))) STORED;
@@ -0,0 +1,19 @@
+-- migrate: no-transaction
+-- GIN para a busca textual e trigramas para tolerar erros de digitacao nos nomes
+DROP INDEX CONCURRENTLY IF EXISTS professores_busca_idx;
+CREATE INDEX CONCURRENTLY professores_busca_idx ON Professores USING GIN (busca);
+
+DROP INDEX CONCURRENTLY IF EXISTS disciplinas_busca_idx;
+CREATE INDEX CONCURRENTLY disciplinas_busca_idx ON Disciplinas USING GIN (busca);
+
+DROP INDEX CONCURRENTLY IF EXISTS avaliacoes_busca_idx;
+CREATE INDEX CONCURRENTLY avaliacoes_busca_idx ON Avaliacoes USING GIN (busca);
+
+DROP INDEX CONCURRENTLY IF EXISTS avaliacoes_professores_busca_idx;
+CREATE INDEX CONCURRENTLY avaliacoes_professores_busca_idx ON AvaliacoesProfessores USING GIN (busca);
+
+DROP INDEX CONCURRENTLY IF EXISTS professores_nome_trgm_idx;
+CREATE INDEX CONCURRENTLY professores_nome_trgm_idx ON Professores USING GIN (nome gin_trgm_ops);
+
+DROP INDEX CONCURRENTLY IF EXISTS disciplinas_nome_trgm_idx;
+CREATE INDEX CONCURRENTLY disciplinas_nome_trgm_idx ON Disciplinas USING GIN (nome gin_trgm_ops);
@@ -0,0 +1,71 @@
+-- Fila de moderacao: uma linha por avaliacao denunciada, mantida por triggers,
+-- para a fila ser lida sem agrupar todas as denuncias a cada carga
+ALTER TABLE Denuncias ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ NOT NULL DEFAULT now();
+ALTER TABLE DenunciasProfessor ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ NOT NULL DEFAULT now();
+
+CREATE TABLE IF NOT EXISTS ModeracaoFila (
+    tipo VARCHAR NOT NULL,
+    avaliacao_id INT NOT NULL,
+    qtd_denuncias INT NOT NULL,
+    primeira_denuncia TIMESTAMPTZ NOT NULL,
+    ultima_denuncia TIMESTAMPTZ NOT NULL,
+
+    PRIMARY KEY(tipo, avaliacao_id)
+);
+
+CREATE INDEX IF NOT EXISTS moderacao_fila_ordem_idx
+    ON ModeracaoFila(qtd_denuncias, avaliacao_id, tipo);
+
+CREATE OR REPLACE FUNCTION update_moderacao_fila() RETURNS trigger AS $trigger_bound$
+DECLARE
+    fila_tipo VARCHAR := TG_ARGV[0];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO ModeracaoFila(tipo, avaliacao_id, qtd_denuncias, primeira_denuncia, ultima_denuncia)
+        VALUES (fila_tipo, NEW.avaliacao_id, 1, NEW.created_at, NEW.created_at)
+        ON CONFLICT (tipo, avaliacao_id) DO UPDATE SET
+            qtd_denuncias = ModeracaoFila.qtd_denuncias + 1,
+            primeira_denuncia = LEAST(ModeracaoFila.primeira_denuncia, EXCLUDED.primeira_denuncia),
+            ultima_denuncia = GREATEST(ModeracaoFila.ultima_denuncia, EXCLUDED.ultima_denuncia);
+        RETURN NULL;
+    END IF;
+
+    UPDATE ModeracaoFila SET
+        qtd_denuncias = qtd_denuncias - 1
+    WHERE tipo = fila_tipo AND avaliacao_id = OLD.avaliacao_id;
+
+    DELETE FROM ModeracaoFila
+    WHERE tipo = fila_tipo AND avaliacao_id = OLD.avaliacao_id AND qtd_denuncias <= 0;
+    RETURN NULL;
+END;
+$trigger_bound$
+LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS update_moderacao_fila_on_change_denuncia ON Denuncias;
+CREATE TRIGGER update_moderacao_fila_on_change_denuncia
+    AFTER INSERT OR DELETE ON Denuncias
+    FOR EACH ROW
+    EXECUTE FUNCTION update_moderacao_fila('turma');
+
+DROP TRIGGER IF EXISTS update_moderacao_fila_on_change_denuncia ON DenunciasProfessor;
+CREATE TRIGGER update_moderacao_fila_on_change_denuncia
+    AFTER INSERT OR DELETE ON DenunciasProfessor
+    FOR EACH ROW
+    EXECUTE FUNCTION update_moderacao_fila('professor');
+
+CREATE OR REPLACE FUNCTION recompute_moderacao_fila() RETURNS void AS $function_bound$
+BEGIN
+    DELETE FROM ModeracaoFila;
+    INSERT INTO ModeracaoFila(tipo, avaliacao_id, qtd_denuncias, primeira_denuncia, ultima_denuncia)
+        SELECT 'turma', avaliacao_id, COUNT(*), MIN(created_at), MAX(created_at)
+        FROM Denuncias
+        GROUP BY avaliacao_id
+        UNION ALL
+        SELECT 'professor', avaliacao_id, COUNT(*), MIN(created_at), MAX(created_at)
+        FROM DenunciasProfessor
+        GROUP BY avaliacao_id;
+END;
+$function_bound$
+LANGUAGE plpgsql;
+
+SELECT recompute_moderacao_fila();
@@ -0,0 +1,42 @@
+-- Permite que uma transacao desligue as triggers de contadores com
+-- SET LOCAL app.skip_counters = 'on' e atualize os contadores uma vez por lote
+CREATE OR REPLACE FUNCTION update_avaliacao_professor() RETURNS trigger AS $trigger_bound$
+BEGIN
+    IF current_setting('app.skip_counters', true) = 'on' THEN
+        RETURN NEW;
+    END IF;
+
+    UPDATE Professores SET
+        qtd_avaliacoes = qtd_avaliacoes + 1,
+        sum_avaliacoes = sum_avaliacoes + NEW.pontuacao
+    WHERE id = NEW.professor_id;
+
+    RETURN NEW;
+END;
+$trigger_bound$
+LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION update_avaliacao_turma() RETURNS trigger AS $trigger_bound$
+BEGIN
+    IF current_setting('app.skip_counters', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE Turmas SET
+            qtd_avaliacoes = qtd_avaliacoes - (OLD.pontuacao IS NOT NULL)::int,
+            sum_avaliacoes = sum_avaliacoes - COALESCE(OLD.pontuacao, 0)
+        WHERE id = OLD.turma_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE Turmas SET
+            qtd_avaliacoes = qtd_avaliacoes + (NEW.pontuacao IS NOT NULL)::int,
+            sum_avaliacoes = sum_avaliacoes + COALESCE(NEW.pontuacao, 0)
+        WHERE id = NEW.turma_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$trigger_bound$
+LANGUAGE plpgsql;
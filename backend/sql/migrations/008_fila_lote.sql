@@ -0,0 +1,30 @@
+-- A fila de moderacao tambem respeita app.skip_counters, para o buffer de
+-- denuncias atualizar a fila uma vez por avaliacao em cada lote
+CREATE OR REPLACE FUNCTION update_moderacao_fila() RETURNS trigger AS $trigger_bound$
+DECLARE
+    fila_tipo VARCHAR := TG_ARGV[0];
+BEGIN
+    IF current_setting('app.skip_counters', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO ModeracaoFila(tipo, avaliacao_id, qtd_denuncias, primeira_denuncia, ultima_denuncia)
+        VALUES (fila_tipo, NEW.avaliacao_id, 1, NEW.created_at, NEW.created_at)
+        ON CONFLICT (tipo, avaliacao_id) DO UPDATE SET
+            qtd_denuncias = ModeracaoFila.qtd_denuncias + 1,
+            primeira_denuncia = LEAST(ModeracaoFila.primeira_denuncia, EXCLUDED.primeira_denuncia),
+            ultima_denuncia = GREATEST(ModeracaoFila.ultima_denuncia, EXCLUDED.ultima_denuncia);
+        RETURN NULL;
+    END IF;
+
+    UPDATE ModeracaoFila SET
+        qtd_denuncias = qtd_denuncias - 1
+    WHERE tipo = fila_tipo AND avaliacao_id = OLD.avaliacao_id;
+
+    DELETE FROM ModeracaoFila
+    WHERE tipo = fila_tipo AND avaliacao_id = OLD.avaliacao_id AND qtd_denuncias <= 0;
+    RETURN NULL;
+END;
+$trigger_bound$
+LANGUAGE plpgsql;
@@ -0,0 +1,52 @@
+-- Cada avaliacao inserida, alterada ou removida gera um NOTIFY no canal 'avaliacoes'.
+-- O backend escuta o canal com uma unica conexao e repassa para os clientes (SSE)
+CREATE OR REPLACE FUNCTION notify_avaliacao() RETURNS trigger AS $trigger_bound$
+DECLARE
+    alvo_tipo VARCHAR := TG_ARGV[0];
+    linha JSONB;
+    payload TEXT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        linha := to_jsonb(OLD);
+        payload := json_build_object(
+            'op', TG_OP, 'tipo', alvo_tipo, 'alvo_id', linha->TG_ARGV[1],
+            'avaliacao', json_build_object('id', linha->'id')
+        )::text;
+    ELSE
+        linha := to_jsonb(NEW);
+        payload := json_build_object(
+            'op', TG_OP, 'tipo', alvo_tipo, 'alvo_id', linha->TG_ARGV[1],
+            'avaliacao', json_build_object(
+                'id', linha->'id', 'user_id', linha->'user_id',
+                'user_nome', (SELECT nome FROM Users WHERE id=NEW.user_id),
+                'comentario', linha->'comentario', 'pontuacao', linha->'pontuacao'
+            )
+        )::text;
+    END IF;
+
+    -- O payload do NOTIFY tem limite de 8000 bytes: comentarios muito grandes vao sem
+    -- o texto e o cliente busca a pagina de novo
+    IF octet_length(payload) > 7500 THEN
+        payload := json_build_object(
+            'op', TG_OP, 'tipo', alvo_tipo, 'alvo_id', linha->TG_ARGV[1],
+            'avaliacao', json_build_object('id', linha->'id'), 'incompleto', true
+        )::text;
+    END IF;
+
+    PERFORM pg_notify('avaliacoes', payload);
+    RETURN NULL;
+END;
+$trigger_bound$
+LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS notify_avaliacao_on_change ON Avaliacoes;
+CREATE TRIGGER notify_avaliacao_on_change
+    AFTER INSERT OR UPDATE OR DELETE ON Avaliacoes
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_avaliacao('turma', 'turma_id');
+
+DROP TRIGGER IF EXISTS notify_avaliacao_on_change ON AvaliacoesProfessores;
+CREATE TRIGGER notify_avaliacao_on_change
+    AFTER INSERT OR UPDATE OR DELETE ON AvaliacoesProfessores
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_avaliacao('professor', 'professor_id');
@@ -0,0 +1,7 @@
+-- Remover ou banir um usuario so marca a linha: o conteudo some das leituras na hora
+-- e o purge.py apaga as avaliacoes em lotes, corrigindo os contadores
+ALTER TABLE Users ADD COLUMN IF NOT EXISTS removido_em TIMESTAMP;
+ALTER TABLE Users ADD COLUMN IF NOT EXISTS banido BOOLEAN NOT NULL DEFAULT false;
+
+-- Fila do purge: so os usuarios marcados
+CREATE INDEX IF NOT EXISTS users_removido_em_idx ON Users(removido_em) WHERE removido_em IS NOT NULL;
@@ -0,0 +1,41 @@
+-- Versao de cada tabela usada nos ETags das listagens. Incrementada por uma trigger
+-- de comando na mesma transacao da escrita: a versao nova so aparece junto com o
+-- commit, e todas as instancias do backend leem o mesmo valor
+CREATE TABLE IF NOT EXISTS Versoes (
+    tabela VARCHAR,
+    -- Comeca no horario de criacao, para um ETag de antes de recriar o banco nao valer
+    versao BIGINT NOT NULL DEFAULT (extract(epoch FROM clock_timestamp()) * 1000)::bigint,
+
+    PRIMARY KEY(tabela)
+);
+
+INSERT INTO Versoes(tabela) VALUES ('professores'), ('disciplinas'), ('turmas')
+ON CONFLICT DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_versao() RETURNS trigger AS $trigger_bound$
+BEGIN
+    UPDATE Versoes SET versao = versao + 1 WHERE tabela = TG_ARGV[0];
+    RETURN NULL;
+END;
+$trigger_bound$
+LANGUAGE plpgsql;
+
+-- Os contadores de Turmas e Professores mudam a cada avaliacao, entao essas
+-- triggers tambem rodam nas escritas de avaliacoes
+DROP TRIGGER IF EXISTS bump_versao_on_change ON Professores;
+CREATE TRIGGER bump_versao_on_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON Professores
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_versao('professores');
+
+DROP TRIGGER IF EXISTS bump_versao_on_change ON Disciplinas;
+CREATE TRIGGER bump_versao_on_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON Disciplinas
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_versao('disciplinas');
+
+DROP TRIGGER IF EXISTS bump_versao_on_change ON Turmas;
+CREATE TRIGGER bump_versao_on_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON Turmas
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_versao('turmas');
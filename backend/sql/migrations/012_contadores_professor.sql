@@ -0,0 +1,38 @@
+-- A trigger dos contadores de Professores so tratava INSERT: avaliacoes de professor
+-- removidas pela moderacao (ou alteradas) nao descontavam qtd/sum_avaliacoes.
+-- Passa a funcionar como a de Turmas
+CREATE OR REPLACE FUNCTION update_avaliacao_professor() RETURNS trigger AS $trigger_bound$
+BEGIN
+    IF current_setting('app.skip_counters', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE Professores SET
+            qtd_avaliacoes = qtd_avaliacoes - (OLD.pontuacao IS NOT NULL)::int,
+            sum_avaliacoes = sum_avaliacoes - COALESCE(OLD.pontuacao, 0)
+        WHERE id = OLD.professor_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE Professores SET
+            qtd_avaliacoes = qtd_avaliacoes + (NEW.pontuacao IS NOT NULL)::int,
+            sum_avaliacoes = sum_avaliacoes + COALESCE(NEW.pontuacao, 0)
+        WHERE id = NEW.professor_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$trigger_bound$
+LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS update_avaliacao_professor_on_inserting_avaliacao ON AvaliacoesProfessores;
+DROP TRIGGER IF EXISTS update_avaliacao_professor_on_change_avaliacao ON AvaliacoesProfessores;
+
+CREATE TRIGGER update_avaliacao_professor_on_change_avaliacao
+    AFTER INSERT OR DELETE OR UPDATE OF pontuacao, professor_id ON AvaliacoesProfessores
+    FOR EACH ROW
+    EXECUTE FUNCTION update_avaliacao_professor();
+
+-- Corrige os contadores que ja ficaram para tras
+SELECT recompute_avaliacao_counters();
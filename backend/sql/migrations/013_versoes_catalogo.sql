@@ -0,0 +1,43 @@
+-- As triggers da 011 rodavam em qualquer escrita, inclusive na dos contadores que
+-- cada avaliacao atualiza: toda escrita de avaliacao travava a linha de Versoes ate
+-- o commit, e as escritas do site inteiro esperavam umas pelas outras.
+-- Agora Versoes so muda com as colunas do catalogo que as listagens mostram
+DROP TRIGGER IF EXISTS bump_versao_on_change ON Professores;
+CREATE TRIGGER bump_versao_on_change
+    AFTER INSERT OR UPDATE OF nome OR DELETE OR TRUNCATE ON Professores
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_versao('professores');
+
+DROP TRIGGER IF EXISTS bump_versao_on_change ON Disciplinas;
+CREATE TRIGGER bump_versao_on_change
+    AFTER INSERT OR UPDATE OF nome OR DELETE OR TRUNCATE ON Disciplinas
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_versao('disciplinas');
+
+DROP TRIGGER IF EXISTS bump_versao_on_change ON Turmas;
+CREATE TRIGGER bump_versao_on_change
+    AFTER INSERT OR UPDATE OF numero, professor_id, disciplina_id OR DELETE OR TRUNCATE ON Turmas
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_versao('turmas');
+
+-- Os contadores das turmas aparecem nas listagens, entao tambem entram no ETag, mas
+-- por uma versao na propria linha: o UPDATE dos contadores ja trava essa linha, e
+-- escritas em turmas diferentes nao disputam nada. O ETag usa a soma dessas versoes,
+-- que so cresce enquanto nenhuma turma e criada ou removida
+ALTER TABLE Turmas ADD COLUMN IF NOT EXISTS versao BIGINT NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION bump_versao_linha() RETURNS trigger AS $trigger_bound$
+BEGIN
+    NEW.versao := OLD.versao + 1;
+    RETURN NEW;
+END;
+$trigger_bound$
+LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS bump_versao_on_counters ON Turmas;
+CREATE TRIGGER bump_versao_on_counters
+    BEFORE UPDATE OF qtd_avaliacoes, sum_avaliacoes ON Turmas
+    FOR EACH ROW
+    WHEN (OLD.qtd_avaliacoes IS DISTINCT FROM NEW.qtd_avaliacoes
+        OR OLD.sum_avaliacoes IS DISTINCT FROM NEW.sum_avaliacoes)
+    EXECUTE FUNCTION bump_versao_linha();
@@ -0,0 +1,17 @@
+-- Banir so marcava Users.banido, e o purge.py apaga a linha de Users depois: o mesmo
+-- email podia se cadastrar de novo logo em seguida. O email e a matricula de quem foi
+-- banido ficam aqui, e o cadastro consulta esta tabela
+CREATE TABLE IF NOT EXISTS UsuariosBanidos (
+    email VARCHAR NOT NULL,
+    matricula VARCHAR NOT NULL,
+    banido_em TIMESTAMP NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS usuarios_banidos_email_idx ON UsuariosBanidos(email);
+CREATE INDEX IF NOT EXISTS usuarios_banidos_matricula_idx ON UsuariosBanidos(matricula);
+
+-- Banidos que ainda nao foram apagados pelo purge
+INSERT INTO UsuariosBanidos(email, matricula)
+SELECT email, matricula
+FROM Users
+WHERE banido;
@@ -0,0 +1,9 @@
+-- As rotas de uma avaliacao so aceitavam qualquer inteiro em pontuacao; o lote ja
+-- recusava fora de 0..5. NOT VALID: vale para toda escrita nova sem varrer (e travar)
+-- as tabelas grandes. Linhas antigas fora do intervalo continuam ate serem corrigidas;
+-- depois disso, VALIDATE CONSTRAINT confere o resto sem bloquear escritas
+ALTER TABLE Avaliacoes
+    ADD CONSTRAINT avaliacoes_pontuacao_check CHECK (pontuacao BETWEEN 0 AND 5) NOT VALID;
+
+ALTER TABLE AvaliacoesProfessores
+    ADD CONSTRAINT avaliacoes_professores_pontuacao_check CHECK (pontuacao BETWEEN 0 AND 5) NOT VALID;
@@ -0,0 +1,4 @@
+-- Recalcula do zero os contadores qtd_avaliacoes/sum_avaliacoes de Turmas e Professores
+SELECT recompute_avaliacao_counters();
+-- e a fila de moderacao (criada pela migration 006)
+SELECT recompute_moderacao_fila();
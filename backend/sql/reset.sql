@@ -1,8 +1,17 @@
-DROP TRIGGER update_avaliacao_professor_on_inserting_avaliacao ON AvaliacoesProfessores;
+DROP TRIGGER update_avaliacao_professor_on_change_avaliacao ON AvaliacoesProfessores;
+DROP TRIGGER update_avaliacao_turma_on_change_avaliacao ON Avaliacoes;
 
-DROP TABLE Departamentos, Professores, 
+DROP TABLE Departamentos, Professores, ProfessoresImagens,
                     Disciplinas, Turmas, Users,
-                    Avaliacoes, Denuncias, AvaliacoesProfessores, DenunciasProfessor
+                    Avaliacoes, Denuncias, AvaliacoesProfessores, DenunciasProfessor,
+                    SchemaMigrations, ModeracaoFila, Versoes, UsuariosBanidos
             CASCADE;
 
-DROP FUNCTION update_avaliacao_professor
+DROP FUNCTION update_avaliacao_professor;
+DROP FUNCTION update_avaliacao_turma;
+DROP FUNCTION recompute_avaliacao_counters;
+DROP FUNCTION update_moderacao_fila;
+DROP FUNCTION recompute_moderacao_fila;
+DROP FUNCTION notify_avaliacao;
+DROP FUNCTION bump_versao;
+DROP FUNCTION bump_versao_linha;
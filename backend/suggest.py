@@ -0,0 +1,124 @@
+from bisect import bisect_left
+from pydantic import BaseModel
+import asyncio
+import logging
+import unicodedata
+import psycopg
+from connection import Database
+
+logger = logging.getLogger(__name__)
+
+# Intervalo (s) entre verificacoes de mudancas no catalogo
+REFRESH_INTERVAL = 30
+# A cada quantas verificacoes o indice e reconstruido do zero (pega renomeacoes)
+FULL_REBUILD_EVERY = 20
+SUGGEST_LIMIT = 10
+
+class Suggestion(BaseModel):
+    tipo: str
+    id: int
+    nome: str
+
+def fold(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+class PrefixIndex:
+    def __init__(self):
+        # Listas paralelas ordenadas por chave. Cada nome entra uma vez por palavra,
+        # para "gomes" achar "João Gomes"
+        self.keys: list[str] = []
+        self.entries: list[tuple[str, int, str]] = []
+        self.max_ids: dict[str, int] = {}
+        self.counts: dict[str, int] = {}
+
+    def build(self, rows: list[tuple[str, int, str]]):
+        pairs = sorted(
+            (key, entry) for entry in rows for key in self.word_keys(entry[2])
+        )
+        self.keys = [key for key, _ in pairs]
+        self.entries = [entry for _, entry in pairs]
+        self.max_ids = {}
+        self.counts = {}
+        for tipo, id, _ in rows:
+            self.max_ids[tipo] = max(self.max_ids.get(tipo, 0), id)
+            self.counts[tipo] = self.counts.get(tipo, 0) + 1
+
+    def add(self, tipo: str, id: int, nome: str):
+        for key in self.word_keys(nome):
+            entry = (tipo, id, nome)
+            i = bisect_left(self.keys, key)
+            self.keys.insert(i, key)
+            self.entries.insert(i, entry)
+        self.max_ids[tipo] = max(self.max_ids.get(tipo, 0), id)
+        self.counts[tipo] = self.counts.get(tipo, 0) + 1
+
+    @staticmethod
+    def word_keys(nome: str) -> list[str]:
+        words = fold(nome).split()
+        return [" ".join(words[i:]) for i in range(len(words))]
+
+    def lookup(self, prefix: str, limit: int = SUGGEST_LIMIT) -> list[Suggestion]:
+        prefix = " ".join(fold(prefix).split())
+        found: list[Suggestion] = []
+        seen: set[tuple[str, int]] = set()
+        i = bisect_left(self.keys, prefix)
+        while i < len(self.keys) and self.keys[i].startswith(prefix) and len(found) < limit:
+            tipo, id, nome = self.entries[i]
+            if (tipo, id) not in seen:
+                seen.add((tipo, id))
+                found.append(Suggestion(tipo=tipo, id=id, nome=nome))
+            i += 1
+        return found
+
+catalog_index = PrefixIndex()
+
+CATALOG_QUERY = """
+    SELECT 'professor', id, nome FROM Professores WHERE id > %s
+    UNION ALL
+    SELECT 'disciplina', id, nome FROM Disciplinas WHERE id > %s
+"""
+
+async def load_catalog(conn: psycopg.AsyncConnection):
+    async with conn.cursor() as curr:
+        await curr.execute(CATALOG_QUERY, (0, 0))
+        catalog_index.build(await curr.fetchall())
+
+async def refresh_catalog(conn: psycopg.AsyncConnection):
+    async with conn.cursor() as curr:
+        await curr.execute("""
+            SELECT (SELECT COUNT(*) FROM Professores), (SELECT COUNT(*) FROM Disciplinas)
+        """)
+        professores, disciplinas = await curr.fetchone()
+        await curr.execute(CATALOG_QUERY, (
+            catalog_index.max_ids.get("professor", 0),
+            catalog_index.max_ids.get("disciplina", 0),
+        ))
+        new_rows = await curr.fetchall()
+
+    expected = {
+        "professor": professores - sum(1 for t, _, _ in new_rows if t == "professor"),
+        "disciplina": disciplinas - sum(1 for t, _, _ in new_rows if t == "disciplina"),
+    }
+    if any(catalog_index.counts.get(t, 0) != n for t, n in expected.items()):
+        # Algo foi removido: reconstroi do zero
+        await load_catalog(conn)
+        return
+
+    for tipo, id, nome in new_rows:
+        catalog_index.add(tipo, id, nome)
+
+async def refresh_loop():
+    rounds = 0
+    while True:
+        await asyncio.sleep(REFRESH_INTERVAL)
+        rounds += 1
+        try:
+            async with Database.pool.connection() as conn:
+                if rounds % FULL_REBUILD_EVERY == 0:
+                    await load_catalog(conn)
+                else:
+                    await refresh_catalog(conn)
+        except Exception:
+            # Qualquer erro so perde esta rodada: a task nao pode morrer sem ninguem ver
+            logger.exception("Fail to refresh the suggestion catalog")
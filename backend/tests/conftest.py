@@ -0,0 +1,38 @@
+from contextlib import asynccontextmanager
+import pytest
+from connection import Database
+
+class FakeCursor:
+    # Cursor assincrono minimo: guarda os execute e devolve as linhas configuradas
+    def __init__(self, rows: list):
+        self.rows = rows
+        self.rowcount = len(rows)
+        self.executed: list = []
+
+    async def execute(self, query, params=None, prepare=None):
+        self.executed.append((query, params))
+
+    async def fetchall(self):
+        return self.rows
+
+    async def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+class FakeConnection:
+    def __init__(self, rows: list = ()):
+        self.curr = FakeCursor(list(rows))
+        self.commits = 0
+
+    @asynccontextmanager
+    async def cursor(self):
+        yield self.curr
+
+    async def commit(self):
+        self.commits += 1
+
+@pytest.fixture(autouse=True)
+def database(monkeypatch):
+    # Sem replica: os testes que precisam de pools trocam estes
+    monkeypatch.setattr(Database, "pool", None, raising=False)
+    monkeypatch.setattr(Database, "replica_pool", None, raising=False)
+    monkeypatch.setattr(Database, "pending_actions", {})
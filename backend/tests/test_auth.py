@@ -0,0 +1,62 @@
+import asyncio
+import pytest
+from fastapi import HTTPException
+from auth import Auth, config_auth, get_admin_session, get_metrics_session, get_session, issue_token, revoke, verify_token
+
+@pytest.fixture
+def auth(monkeypatch):
+    monkeypatch.setenv("SECRET_KEY", "test-secret")
+    monkeypatch.delenv("TOKEN_MAX_AGE", raising=False)
+    monkeypatch.delenv("METRICS_TOKEN", raising=False)
+    monkeypatch.setattr(Auth, "revoked", {})
+    config_auth()
+    return Auth
+
+def test_issue_and_verify(auth):
+    session = verify_token(issue_token(4, True))
+    assert session.user_id == 4
+    assert session.is_admin
+
+def test_rejects_tampered_token(auth):
+    token = issue_token(4, False)
+    assert verify_token(token[:-2] + "xx") is None
+
+def test_revoke(auth):
+    token = issue_token(4, False)
+    other = issue_token(5, False)
+    revoke(4)
+    assert verify_token(token) is None
+    assert verify_token(other) is not None
+
+def test_requires_secret_key(monkeypatch):
+    monkeypatch.delenv("SECRET_KEY", raising=False)
+    with pytest.raises(RuntimeError):
+        config_auth()
+    monkeypatch.setenv("SECRET_KEY", "")
+    with pytest.raises(RuntimeError):
+        config_auth()
+
+def test_get_session(auth):
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(get_session(None))
+    assert exc.value.status_code == 401
+    with pytest.raises(HTTPException):
+        asyncio.run(get_session("Bearer invalido"))
+    session = asyncio.run(get_session(f"Bearer {issue_token(2, False)}"))
+    assert session.user_id == 2
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(get_admin_session(session))
+    assert exc.value.status_code == 403
+
+def test_metrics_session(auth, monkeypatch):
+    monkeypatch.setattr(Auth, "metrics_token", "scrape")
+    asyncio.run(get_metrics_session("Bearer scrape"))
+    asyncio.run(get_metrics_session(f"Bearer {issue_token(1, True)}"))
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(get_metrics_session(f"Bearer {issue_token(2, False)}"))
+    assert exc.value.status_code == 403
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(get_metrics_session(None))
+    assert exc.value.status_code == 401
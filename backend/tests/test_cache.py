@@ -0,0 +1,95 @@
+import asyncio
+import pytest
+import cache
+from cache import TTLCache, cached, invalidate_on_commit
+from connection import commit, fresh_reads
+from conftest import FakeConnection
+
+def test_get_set():
+    c = TTLCache(max_size=4, ttl=60)
+    assert c.get(("professor", 1, "f")) is None
+    c.set(("professor", 1, "f"), "valor")
+    assert c.get(("professor", 1, "f")) == "valor"
+    assert c.stats()["hits"] == 1
+    assert c.stats()["misses"] == 1
+
+def test_evicts_least_recently_used():
+    c = TTLCache(max_size=2, ttl=60)
+    c.set(("turma", 1, "f"), 1)
+    c.set(("turma", 2, "f"), 2)
+    c.get(("turma", 1, "f"))
+    c.set(("turma", 3, "f"), 3)
+
+    assert c.get(("turma", 2, "f")) is None
+    assert c.get(("turma", 1, "f")) == 1
+    assert c.get(("turma", 3, "f")) == 3
+    assert c.stats()["evictions"] == 1
+    assert ("turma", 2) not in c.groups
+
+def test_expires(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+    c = TTLCache(max_size=4, ttl=10)
+    c.set(("turma", 1, "f"), 1)
+
+    now = 1011.0
+    assert c.get(("turma", 1, "f")) is None
+    assert c.stats()["size"] == 0
+
+def test_invalidate_removes_every_page():
+    c = TTLCache(max_size=8, ttl=60)
+    c.set(("turma", 1, "f", 0), "pagina 1")
+    c.set(("turma", 1, "f", 100), "pagina 2")
+    c.set(("turma", 2, "f", 0), "outra turma")
+
+    c.invalidate("turma", 1)
+    assert c.get(("turma", 1, "f", 0)) is None
+    assert c.get(("turma", 1, "f", 100)) is None
+    assert c.get(("turma", 2, "f", 0)) == "outra turma"
+    assert c.stats()["invalidations"] == 2
+
+@pytest.fixture
+def detail_cache(monkeypatch):
+    c = TTLCache(max_size=8, ttl=60)
+    monkeypatch.setattr(cache, "detail_cache", c)
+    return c
+
+def test_cached_skips_set_after_concurrent_invalidate(detail_cache):
+    @cached("turma")
+    async def get_turma(conn, id):
+        # Uma escrita comitada durante a leitura
+        detail_cache.invalidate("turma", id)
+        return "antiga"
+
+    assert asyncio.run(get_turma(None, 1)) == "antiga"
+    assert detail_cache.get(("turma", 1, "get_turma")) is None
+
+def test_cached_uses_cache_unless_fresh_reads(detail_cache):
+    calls = []
+
+    @cached("turma")
+    async def get_turma(conn, id):
+        calls.append(id)
+        return f"turma {len(calls)}"
+
+    assert asyncio.run(get_turma(None, 1)) == "turma 1"
+    assert asyncio.run(get_turma(None, 1)) == "turma 1"
+    assert calls == [1]
+
+    token = fresh_reads.set(True)
+    try:
+        assert asyncio.run(get_turma(None, 1)) == "turma 2"
+    finally:
+        fresh_reads.reset(token)
+    assert asyncio.run(get_turma(None, 1)) == "turma 2"
+
+def test_invalidate_on_commit(detail_cache):
+    conn = FakeConnection()
+    detail_cache.set(("professor", 3, "f"), "valor")
+
+    invalidate_on_commit(conn, "professor", 3)
+    assert detail_cache.get(("professor", 3, "f")) == "valor"
+
+    asyncio.run(commit(conn))
+    assert conn.commits == 1
+    assert detail_cache.get(("professor", 3, "f")) is None
@@ -0,0 +1,90 @@
+from contextlib import asynccontextmanager
+import asyncio
+import pytest
+import denuncias_buffer
+import models
+from conftest import FakeConnection
+from connection import Database
+from denuncias_buffer import DenunciasBuffer
+from queries import QUERIES
+
+class FakePool:
+    @asynccontextmanager
+    async def connection(self):
+        yield None
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(Database, "pool", FakePool(), raising=False)
+
+def test_add_coalesces_repeated_avaliacoes():
+    async def run():
+        buffer = DenunciasBuffer()
+        await buffer.add("turma", 1)
+        await buffer.add("turma", 1)
+        await buffer.add("professor", 1)
+        return buffer
+
+    buffer = asyncio.run(run())
+    assert buffer.pending == {("turma", 1): 2, ("professor", 1): 1}
+    assert buffer.size == 3
+    assert buffer.received == 3
+    assert buffer.coalesced == 1
+
+def test_flush_writes_batch(pool, monkeypatch):
+    batches = []
+
+    async def add_denuncias_lote(conn, batch):
+        batches.append(batch)
+        return 1
+
+    monkeypatch.setattr(denuncias_buffer.models, "add_denuncias_lote", add_denuncias_lote)
+
+    async def run():
+        buffer = DenunciasBuffer()
+        await buffer.add("turma", 1)
+        await buffer.add("turma", 1)
+        await buffer.add("turma", 2)
+        assert await buffer.flush()
+        return buffer
+
+    buffer = asyncio.run(run())
+    assert batches == [{("turma", 1): 2, ("turma", 2): 1}]
+    assert buffer.pending == {}
+    assert buffer.size == 0
+    assert buffer.written == 3
+    assert buffer.dropped == 1
+    assert buffer.flushed.is_set()
+
+def test_flush_requeues_on_error(pool, monkeypatch):
+    async def add_denuncias_lote(conn, batch):
+        raise RuntimeError("falhou")
+
+    monkeypatch.setattr(denuncias_buffer.models, "add_denuncias_lote", add_denuncias_lote)
+
+    async def run():
+        buffer = DenunciasBuffer()
+        await buffer.add("turma", 1)
+        await buffer.add("turma", 1)
+        assert not await buffer.flush()
+        return buffer
+
+    buffer = asyncio.run(run())
+    assert buffer.pending == {("turma", 1): 2}
+    assert buffer.size == 2
+    assert buffer.written == 0
+    assert buffer.failed_flushes == 1
+    assert buffer.flushed.is_set()
+
+def test_dismiss_skips_denuncia_triggers():
+    conn = FakeConnection(rows=[(1,)])
+    itens = [models.ModeracaoRef(tipo="turma", avaliacao_id=1)]
+    assert asyncio.run(models.dismiss_denuncias(conn, itens)) == 1
+
+    assert conn.curr.executed == [
+        (QUERIES["skip_counters"], ("on",)),
+        (QUERIES["dismiss_fila"], ([1], [])),
+        (QUERIES["dismiss_denuncias_turma"], ([1],)),
+        (QUERIES["dismiss_denuncias_professor"], ([],)),
+        (QUERIES["skip_counters"], ("off",)),
+    ]
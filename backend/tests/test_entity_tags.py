@@ -0,0 +1,6 @@
+from main import entity_tags
+
+def test_entity_tags():
+    assert entity_tags(None) == []
+    assert entity_tags('"abc"') == ["abc"]
+    assert entity_tags('W/"a", "b,c" ,*, junk') == ["a", "b,c", "*"]
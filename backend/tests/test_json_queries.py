@@ -0,0 +1,51 @@
+# professores_json e turma_json montam o JSON no Postgres, sem passar pelos modelos:
+# os nomes usados no SQL tem que continuar batendo com ProfessorItem e TurmaInfo
+import asyncio
+import json
+import re
+import models
+from conftest import FakeConnection
+from queries import QUERIES
+
+def select_names(columns: str) -> list[str]:
+    # "A.id, U.nome AS user_nome" -> ["id", "user_nome"]
+    return [re.split(r"[\s.]", c.strip())[-1] for c in columns.split(",")]
+
+def test_professores_json_columns_match_model():
+    columns = re.search(r"AS P\(([^)]*)\)", QUERIES["professores_json"]).group(1)
+    assert select_names(columns) == list(models.ProfessorItem.__fields__)
+
+def test_turma_json_keys_match_model():
+    query = QUERIES["turma_json"]
+    keys = re.findall(r"'(\w+)', ", query.split("json_build_object(", 1)[1])
+    assert keys == list(models.TurmaInfo.__fields__)
+
+    columns = re.search(r"WITH avaliacoes AS \(\s*SELECT (.*?)\s+FROM", query, re.S).group(1)
+    assert sorted(select_names(columns)) == sorted(models.Avaliacao.__fields__)
+
+def test_professores_json_row_parses():
+    # Formato de saida do json_agg sobre P(id, nome, ...)
+    content = json.dumps([
+        {"id": 1, "nome": "Ana", "disciplinas": ["Cálculo 1", "Cálculo 2"], "qtd_avaliacoes": 3, "sum_avaliacoes": 11},
+        {"id": 4, "nome": "Bruno", "disciplinas": ["Álgebra"], "qtd_avaliacoes": 0, "sum_avaliacoes": 0},
+    ])
+    conn = FakeConnection([(content, 2, 4)])
+    page = asyncio.run(models.get_all_professores_json(conn))
+    assert (page.count, page.last_id) == (2, 4)
+
+    professores = [models.ProfessorItem.parse_obj(p) for p in json.loads(page.content)]
+    assert professores[0].disciplinas == {"Cálculo 1", "Cálculo 2"}
+
+def test_turma_json_row_parses():
+    content = json.dumps({
+        "id": 7, "numero": "A", "professor_id": 1, "professor_nome": "Ana",
+        "disciplina_id": 2, "disciplina_nome": "Cálculo 1",
+        "qtd_avaliacoes": 1, "sum_avaliacoes": 4,
+        "avaliacoes": [{"id": 9, "user_id": 3, "user_nome": "Caio", "comentario": "Boa", "pontuacao": 4}],
+    })
+    conn = FakeConnection([(content, 1, 9)])
+    page = asyncio.run(models.get_turma_json.__wrapped__(conn, 7))
+
+    turma = models.TurmaInfo.parse_raw(page.content)
+    assert turma.avaliacoes[0].user_nome == "Caio"
+    assert page.last_id == 9
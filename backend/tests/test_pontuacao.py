@@ -0,0 +1,27 @@
+import pytest
+from pydantic import ValidationError
+from models import (
+    AvaliacaoIn, AvaliacaoLoteTurmaIn, UpdateAvaliacaoIn, validate_lote,
+)
+
+@pytest.mark.parametrize("pontuacao", [0, 5])
+def test_single_routes_accept_bounds(pontuacao):
+    assert AvaliacaoIn(user_id=1, comentario="", pontuacao=pontuacao).pontuacao == pontuacao
+    assert UpdateAvaliacaoIn(comentario="", pontuacao=pontuacao).pontuacao == pontuacao
+
+@pytest.mark.parametrize("pontuacao", [-1, 6, 1000])
+def test_single_routes_reject_out_of_range(pontuacao):
+    with pytest.raises(ValidationError):
+        AvaliacaoIn(user_id=1, comentario="", pontuacao=pontuacao)
+    with pytest.raises(ValidationError):
+        UpdateAvaliacaoIn(comentario="", pontuacao=pontuacao)
+
+def test_lote_rejects_only_the_invalid_item():
+    itens = [
+        AvaliacaoLoteTurmaIn(turma_id=1, user_id=1, comentario="", pontuacao=5),
+        AvaliacaoLoteTurmaIn(turma_id=1, user_id=1, comentario="", pontuacao=6),
+    ]
+    validos, resultados = validate_lote(itens, "turma_id", {1}, {1})
+    assert [item for _, item in validos] == [itens[0]]
+    assert resultados[0].erro is None
+    assert resultados[1].erro == "pontuacao must be between 0 and 5"
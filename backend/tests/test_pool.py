@@ -0,0 +1,92 @@
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+import asyncio
+import pytest
+import psycopg_pool
+from fastapi import HTTPException
+import connection
+from connection import Database, after_commit, check_connection, get_db, make_pool
+from conftest import FakeConnection
+
+class FakePool:
+    def __init__(self, conn=None):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def connection(self):
+        if self.conn is None:
+            raise psycopg_pool.PoolTimeout("couldn't get a connection after 5.00 sec")
+        yield self.conn
+
+def fake_request():
+    return SimpleNamespace(state=SimpleNamespace())
+
+def test_make_pool_uses_config(monkeypatch):
+    monkeypatch.setattr(Database, "host", "localhost", raising=False)
+    monkeypatch.setattr(Database, "port", "5432", raising=False)
+    monkeypatch.setattr(Database, "db_name", "emigue", raising=False)
+    monkeypatch.setattr(Database, "user", "postgres", raising=False)
+    monkeypatch.setattr(Database, "password", "1234", raising=False)
+    monkeypatch.setattr(Database, "pool_min_size", 2, raising=False)
+    monkeypatch.setattr(Database, "pool_max_size", 7, raising=False)
+    monkeypatch.setattr(Database, "pool_max_idle", 300.0, raising=False)
+    monkeypatch.setattr(Database, "pool_timeout", 1.5, raising=False)
+
+    # Criado fechado: nenhuma conexao e aberta aqui
+    pool = make_pool(connection.conninfo())
+    assert (pool.min_size, pool.max_size) == (2, 7)
+    assert pool.timeout == 1.5
+    assert pool.max_idle == 300.0
+    assert pool._reset is check_connection
+
+def test_check_connection_rolls_back():
+    class Conn:
+        def __init__(self):
+            self.calls = []
+
+        async def execute(self, query):
+            self.calls.append(query)
+
+        async def rollback(self):
+            self.calls.append("rollback")
+
+    conn = Conn()
+    asyncio.run(check_connection(conn))
+    assert conn.calls == ["SELECT 1", "rollback"]
+
+def test_get_db_yields_pool_connection(monkeypatch):
+    conn = FakeConnection()
+    monkeypatch.setattr(Database, "pool", FakePool(conn), raising=False)
+    request = fake_request()
+
+    async def run():
+        db = get_db(request)
+        assert await db.__anext__() is conn
+        assert request.state.db is conn
+        await db.aclose()
+
+    asyncio.run(run())
+
+def test_get_db_drops_pending_actions_on_error(monkeypatch):
+    conn = FakeConnection()
+    monkeypatch.setattr(Database, "pool", FakePool(conn), raising=False)
+
+    async def run():
+        db = get_db(fake_request())
+        await db.__anext__()
+        after_commit(conn, lambda: None)
+        with pytest.raises(RuntimeError):
+            await db.athrow(RuntimeError("falhou"))
+
+    asyncio.run(run())
+    assert conn not in Database.pending_actions
+
+def test_get_db_returns_503_on_pool_timeout(monkeypatch):
+    monkeypatch.setattr(Database, "pool", FakePool(), raising=False)
+
+    async def run():
+        await get_db(fake_request()).__anext__()
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(run())
+    assert exc.value.status_code == 503
@@ -0,0 +1,51 @@
+import asyncio
+import pytest
+import main
+import purge
+from auth import Session
+from connection import commit
+from conftest import FakeConnection
+from purge import PurgeWorker
+
+def test_run_survives_any_error(monkeypatch):
+    monkeypatch.setattr(purge, "IDLE_INTERVAL", 0)
+
+    async def run():
+        worker = PurgeWorker()
+        calls = []
+
+        async def purge_next():
+            calls.append(len(calls))
+            if len(calls) == 1:
+                raise RuntimeError("falhou")
+            worker.closing = True
+            return False
+
+        worker.purge_next = purge_next
+        await worker.run()
+        return worker, calls
+
+    worker, calls = asyncio.run(run())
+    assert calls == [0, 1]
+    assert worker.failed_batches == 1
+
+@pytest.mark.parametrize("handler, model", [
+    (main.delete_user, "delete_user"),
+    (main.ban_user, "ban_user"),
+])
+def test_wakes_worker_after_commit(handler, model, monkeypatch):
+    async def marked(conn, id):
+        return True
+
+    monkeypatch.setattr(main.models, model, marked)
+
+    async def run():
+        worker = PurgeWorker()
+        monkeypatch.setattr(main, "purge_worker", worker)
+        conn = FakeConnection()
+        await handler(Session(user_id=1, is_admin=True), conn, 1)
+        assert not worker.wake_up.is_set()
+        await commit(conn)
+        assert worker.wake_up.is_set()
+
+    asyncio.run(run())
@@ -0,0 +1,77 @@
+import asyncio
+import pytest
+from fastapi import HTTPException
+import ratelimit
+from ratelimit import RateLimiter
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    return now
+
+def test_take_until_empty_then_refill(clock):
+    limiter = RateLimiter(rate=1, burst=2, concurrency=10)
+    assert limiter.take("a") == 0
+    assert limiter.take("a") == 0
+    assert limiter.take("a") == pytest.approx(1)
+
+    clock[0] += 0.5
+    assert limiter.take("a") == pytest.approx(0.5)
+    clock[0] += 0.5
+    assert limiter.take("a") == 0
+
+def test_clients_have_separate_buckets(clock):
+    limiter = RateLimiter(rate=1, burst=1, concurrency=10)
+    assert limiter.take("a") == 0
+    assert limiter.take("b") == 0
+    assert limiter.take("a") > 0
+
+def test_evicts_idle_buckets(clock):
+    limiter = RateLimiter(rate=1, burst=2, concurrency=10)
+    limiter.take("a")
+    clock[0] += 1
+    limiter.take("b")
+    clock[0] += 1.5
+
+    limiter.take("c")
+    assert list(limiter.buckets) == ["b", "c"]
+
+def test_limit_returns_429_with_retry_after(clock):
+    limiter = RateLimiter(rate=0.5, burst=1, concurrency=10)
+
+    async def request():
+        async with limiter.limit("a"):
+            pass
+
+    asyncio.run(request())
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(request())
+    assert exc.value.status_code == 429
+    assert exc.value.headers["Retry-After"] == "2"
+    assert limiter.stats()["limited"] == 1
+
+def test_limit_returns_503_when_class_is_full(clock):
+    limiter = RateLimiter(rate=1, burst=10, concurrency=1)
+
+    async def requests():
+        async with limiter.limit("a"):
+            with pytest.raises(HTTPException) as exc:
+                async with limiter.limit("b"):
+                    pass
+            assert exc.value.status_code == 503
+        assert limiter.in_flight == 0
+
+    asyncio.run(requests())
+    assert limiter.stats()["busy"] == 1
+
+def test_config_from_env_keeps_limiter_instances(monkeypatch):
+    monkeypatch.setattr(ratelimit, "limiters", {"login": RateLimiter(rate=0.2, burst=10, concurrency=4)})
+    limiter = ratelimit.limiters["login"]
+    monkeypatch.setenv("RATELIMIT_LOGIN_RATE", "2")
+    monkeypatch.setenv("RATELIMIT_LOGIN_BURST", "100")
+
+    ratelimit.config_ratelimit()
+    assert ratelimit.limiters["login"] is limiter
+    assert (limiter.rate, limiter.burst, limiter.concurrency) == (2, 100, 4)
+    assert limiter.idle == 50
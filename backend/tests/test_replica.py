@@ -0,0 +1,95 @@
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+import asyncio
+import pytest
+import cache
+from cache import TTLCache, cached
+from connection import Database, Replication, after_commit, commit, get_read_db
+
+class LsnConnection:
+    # Responde as consultas de LSN (pg_current_wal_lsn / pg_last_wal_replay_lsn)
+    def __init__(self, lsn: str):
+        self.lsn = lsn
+        self.queries = 0
+
+    async def execute(self, query):
+        self.queries += 1
+        return self
+
+    async def fetchone(self):
+        return (self.lsn,)
+
+    async def commit(self):
+        pass
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self.conn
+
+@pytest.fixture
+def replication(monkeypatch):
+    monkeypatch.setattr(Replication, "pinned", OrderedDict())
+    monkeypatch.setattr(Replication, "replayed", 0x10)
+    monkeypatch.setattr(Replication, "last_commit", 0)
+    monkeypatch.setattr(Replication, "replica_reads", 0)
+    monkeypatch.setattr(Replication, "lagging_reads", 0)
+
+@pytest.fixture
+def detail_cache(monkeypatch):
+    c = TTLCache(max_size=8, ttl=60)
+    monkeypatch.setattr(cache, "detail_cache", c)
+    return c
+
+def use_replica(monkeypatch, replica: LsnConnection):
+    monkeypatch.setattr(Database, "pool", FakePool(LsnConnection("0/0")))
+    monkeypatch.setattr(Database, "replica_pool", FakePool(replica))
+
+def read_turma(replica_lsn: str, monkeypatch) -> LsnConnection:
+    replica = LsnConnection(replica_lsn)
+    use_replica(monkeypatch, replica)
+
+    @cached("turma")
+    async def get_turma(conn, id):
+        return "turma"
+
+    async def run():
+        db = get_read_db(SimpleNamespace(client=None))
+        conn = await db.__anext__()
+        await get_turma(conn, 1)
+        await db.aclose()
+
+    asyncio.run(run())
+    return replica
+
+def test_commit_records_lsn_before_invalidating(replication, monkeypatch):
+    primary = LsnConnection("0/20")
+    use_replica(monkeypatch, LsnConnection("0/0"))
+    seen = []
+    after_commit(primary, lambda: seen.append(Replication.last_commit))
+
+    asyncio.run(commit(primary))
+    assert seen == [0x20]
+
+def test_lagging_replica_read_is_not_cached(replication, detail_cache, monkeypatch):
+    Replication.last_commit = 0x20
+    read_turma("0/18", monkeypatch)
+
+    assert detail_cache.get(("turma", 1, "get_turma")) is None
+    assert Replication.lagging_reads == 1
+
+def test_caught_up_replica_read_is_cached(replication, detail_cache, monkeypatch):
+    Replication.last_commit = 0x20
+    replica = read_turma("0/20", monkeypatch)
+    assert detail_cache.get(("turma", 1, "get_turma")) == "turma"
+    assert replica.queries == 1
+
+    # Depois de confirmar o LSN a replica nao e consultada de novo
+    detail_cache.clear()
+    replica = read_turma("0/20", monkeypatch)
+    assert replica.queries == 0
+    assert Replication.lagging_reads == 0
@@ -0,0 +1,36 @@
+from suggest import PrefixIndex, fold
+
+def nomes(found):
+    return [s.nome for s in found]
+
+def test_fold():
+    assert fold("João CONCEIÇÃO") == "joao conceicao"
+
+def test_lookup_matches_any_word():
+    index = PrefixIndex()
+    index.build([
+        ("professor", 1, "João Gomes"),
+        ("professor", 2, "Maria Gomes da Silva"),
+        ("disciplina", 1, "Cálculo 1"),
+    ])
+    assert nomes(index.lookup("gom")) == ["João Gomes", "Maria Gomes da Silva"]
+    assert nomes(index.lookup("CALC")) == ["Cálculo 1"]
+    assert nomes(index.lookup("gomes  da")) == ["Maria Gomes da Silva"]
+    assert index.lookup("xyz") == []
+
+def test_lookup_dedupes_and_limits():
+    index = PrefixIndex()
+    index.build([("professor", 1, "Ana Ana"), ("professor", 2, "Ana Paula"), ("professor", 3, "Ana Lucia")])
+    assert [s.id for s in index.lookup("ana")] == [1, 3, 2]
+    assert len(index.lookup("ana", limit=2)) == 2
+
+def test_add_keeps_order_and_counts():
+    index = PrefixIndex()
+    index.build([("disciplina", 4, "Banco de Dados")])
+    index.add("disciplina", 9, "Bancos de Sementes")
+    index.add("professor", 2, "Bruno")
+
+    assert index.keys == sorted(index.keys)
+    assert nomes(index.lookup("banco")) == ["Banco de Dados", "Bancos de Sementes"]
+    assert index.max_ids == {"disciplina": 9, "professor": 2}
+    assert index.counts == {"disciplina": 2, "professor": 1}
@@ -0,0 +1,13 @@
+import asyncio
+import versions
+from conftest import FakeConnection
+
+def test_etag_joins_versions_in_table_order():
+    conn = FakeConnection([("professores", 7), ("disciplinas", 3)])
+    assert asyncio.run(versions.etag(conn, "disciplinas", "professores")) == 'W/"3-7"'
+    _, params = conn.curr.executed[0]
+    assert params == (["disciplinas", "professores"],)
+
+def test_etag_missing_table_is_zero():
+    conn = FakeConnection([("turmas", 5)])
+    assert asyncio.run(versions.etag(conn, "turmas", "professores")) == 'W/"5-0"'
@@ -0,0 +1,11 @@
+import psycopg
+from queries import run
+
+# Versao por tabela, mantida no banco pelas triggers das migrations 011 e 013. Muda no
+# mesmo commit da escrita, entao nenhuma leitura ve a versao nova com os dados antigos, e
+# todas as instancias do backend montam o mesmo ETag
+async def etag(conn: psycopg.AsyncConnection, *tables: str) -> str:
+    async with conn.cursor() as curr:
+        await run(curr, "versoes", (list(tables),))
+        versions = dict(await curr.fetchall())
+    return 'W/"' + "-".join(str(versions.get(table, 0)) for table in tables) + '"'
@@ -1,10600 +0,0 @@
-(function(scope){
-'use strict';
-
-function F(arity, fun, wrapper) {
-  wrapper.a = arity;
-  wrapper.f = fun;
-  return wrapper;
-}
-
-function F2(fun) {
-  return F(2, fun, function(a) { return function(b) { return fun(a,b); }; })
-}
-function F3(fun) {
-  return F(3, fun, function(a) {
-    return function(b) { return function(c) { return fun(a, b, c); }; };
-  });
-}
-function F4(fun) {
-  return F(4, fun, function(a) { return function(b) { return function(c) {
-    return function(d) { return fun(a, b, c, d); }; }; };
-  });
-}
-function F5(fun) {
-  return F(5, fun, function(a) { return function(b) { return function(c) {
-    return function(d) { return function(e) { return fun(a, b, c, d, e); }; }; }; };
-  });
-}
-function F6(fun) {
-  return F(6, fun, function(a) { return function(b) { return function(c) {
-    return function(d) { return function(e) { return function(f) {
-    return fun(a, b, c, d, e, f); }; }; }; }; };
-  });
-}
-function F7(fun) {
-  return F(7, fun, function(a) { return function(b) { return function(c) {
-    return function(d) { return function(e) { return function(f) {
-    return function(g) { return fun(a, b, c, d, e, f, g); }; }; }; }; }; };
-  });
-}
-function F8(fun) {
-  return F(8, fun, function(a) { return function(b) { return function(c) {
-    return function(d) { return function(e) { return function(f) {
-    return function(g) { return function(h) {
-    return fun(a, b, c, d, e, f, g, h); }; }; }; }; }; }; };
-  });
-}
-function F9(fun) {
-  return F(9, fun, function(a) { return function(b) { return function(c) {
-    return function(d) { return function(e) { return function(f) {
-    return function(g) { return function(h) { return function(i) {
-    return fun(a, b, c, d, e, f, g, h, i); }; }; }; }; }; }; }; };
-  });
-}
-
-function A2(fun, a, b) {
-  return fun.a === 2 ? fun.f(a, b) : fun(a)(b);
-}
-function A3(fun, a, b, c) {
-  return fun.a === 3 ? fun.f(a, b, c) : fun(a)(b)(c);
-}
-function A4(fun, a, b, c, d) {
-  return fun.a === 4 ? fun.f(a, b, c, d) : fun(a)(b)(c)(d);
-}
-function A5(fun, a, b, c, d, e) {
-  return fun.a === 5 ? fun.f(a, b, c, d, e) : fun(a)(b)(c)(d)(e);
-}
-function A6(fun, a, b, c, d, e, f) {
-  return fun.a === 6 ? fun.f(a, b, c, d, e, f) : fun(a)(b)(c)(d)(e)(f);
-}
-function A7(fun, a, b, c, d, e, f, g) {
-  return fun.a === 7 ? fun.f(a, b, c, d, e, f, g) : fun(a)(b)(c)(d)(e)(f)(g);
-}
-function A8(fun, a, b, c, d, e, f, g, h) {
-  return fun.a === 8 ? fun.f(a, b, c, d, e, f, g, h) : fun(a)(b)(c)(d)(e)(f)(g)(h);
-}
-function A9(fun, a, b, c, d, e, f, g, h, i) {
-  return fun.a === 9 ? fun.f(a, b, c, d, e, f, g, h, i) : fun(a)(b)(c)(d)(e)(f)(g)(h)(i);
-}
-
-console.warn('Compiled in DEV mode. Follow the advice at https://elm-lang.org/0.19.1/optimize for better performance and smaller assets.');
-
-
-var _JsArray_empty = [];
-
-function _JsArray_singleton(value)
-{
-    return [value];
-}
-
-function _JsArray_length(array)
-{
-    return array.length;
-}
-
-var _JsArray_initialize = F3(function(size, offset, func)
-{
-    var result = new Array(size);
-
-    for (var i = 0; i < size; i++)
-    {
-        result[i] = func(offset + i);
-    }
-
-    return result;
-});
-
-var _JsArray_initializeFromList = F2(function (max, ls)
-{
-    var result = new Array(max);
-
-    for (var i = 0; i < max && ls.b; i++)
-    {
-        result[i] = ls.a;
-        ls = ls.b;
-    }
-
-    result.length = i;
-    return _Utils_Tuple2(result, ls);
-});
-
-var _JsArray_unsafeGet = F2(function(index, array)
-{
-    return array[index];
-});
-
-var _JsArray_unsafeSet = F3(function(index, value, array)
-{
-    var length = array.length;
-    var result = new Array(length);
-
-    for (var i = 0; i < length; i++)
-    {
-        result[i] = array[i];
-    }
-
-    result[index] = value;
-    return result;
-});
-
-var _JsArray_push = F2(function(value, array)
-{
-    var length = array.length;
-    var result = new Array(length + 1);
-
-    for (var i = 0; i < length; i++)
-    {
-        result[i] = array[i];
-    }
-
-    result[length] = value;
-    return result;
-});
-
-var _JsArray_foldl = F3(function(func, acc, array)
-{
-    var length = array.length;
-
-    for (var i = 0; i < length; i++)
-    {
-        acc = A2(func, array[i], acc);
-    }
-
-    return acc;
-});
-
-var _JsArray_foldr = F3(function(func, acc, array)
-{
-    for (var i = array.length - 1; i >= 0; i--)
-    {
-        acc = A2(func, array[i], acc);
-    }
-
-    return acc;
-});
-
-var _JsArray_map = F2(function(func, array)
-{
-    var length = array.length;
-    var result = new Array(length);
-
-    for (var i = 0; i < length; i++)
-    {
-        result[i] = func(array[i]);
-    }
-
-    return result;
-});
-
-var _JsArray_indexedMap = F3(function(func, offset, array)
-{
-    var length = array.length;
-    var result = new Array(length);
-
-    for (var i = 0; i < length; i++)
-    {
-        result[i] = A2(func, offset + i, array[i]);
-    }
-
-    return result;
-});
-
-var _JsArray_slice = F3(function(from, to, array)
-{
-    return array.slice(from, to);
-});
-
-var _JsArray_appendN = F3(function(n, dest, source)
-{
-    var destLen = dest.length;
-    var itemsToCopy = n - destLen;
-
-    if (itemsToCopy > source.length)
-    {
-        itemsToCopy = source.length;
-    }
-
-    var size = destLen + itemsToCopy;
-    var result = new Array(size);
-
-    for (var i = 0; i < destLen; i++)
-    {
-        result[i] = dest[i];
-    }
-
-    for (var i = 0; i < itemsToCopy; i++)
-    {
-        result[i + destLen] = source[i];
-    }
-
-    return result;
-});
-
-
-
-// LOG
-
-var _Debug_log_UNUSED = F2(function(tag, value)
-{
-	return value;
-});
-
-var _Debug_log = F2(function(tag, value)
-{
-	console.log(tag + ': ' + _Debug_toString(value));
-	return value;
-});
-
-
-// TODOS
-
-function _Debug_todo(moduleName, region)
-{
-	return function(message) {
-		_Debug_crash(8, moduleName, region, message);
-	};
-}
-
-function _Debug_todoCase(moduleName, region, value)
-{
-	return function(message) {
-		_Debug_crash(9, moduleName, region, value, message);
-	};
-}
-
-
-// TO STRING
-
-function _Debug_toString_UNUSED(value)
-{
-	return '<internals>';
-}
-
-function _Debug_toString(value)
-{
-	return _Debug_toAnsiString(false, value);
-}
-
-function _Debug_toAnsiString(ansi, value)
-{
-	if (typeof value === 'function')
-	{
-		return _Debug_internalColor(ansi, '<function>');
-	}
-
-	if (typeof value === 'boolean')
-	{
-		return _Debug_ctorColor(ansi, value ? 'True' : 'False');
-	}
-
-	if (typeof value === 'number')
-	{
-		return _Debug_numberColor(ansi, value + '');
-	}
-
-	if (value instanceof String)
-	{
-		return _Debug_charColor(ansi, "'" + _Debug_addSlashes(value, true) + "'");
-	}
-
-	if (typeof value === 'string')
-	{
-		return _Debug_stringColor(ansi, '"' + _Debug_addSlashes(value, false) + '"');
-	}
-
-	if (typeof value === 'object' && '$' in value)
-	{
-		var tag = value.$;
-
-		if (typeof tag === 'number')
-		{
-			return _Debug_internalColor(ansi, '<internals>');
-		}
-
-		if (tag[0] === '#')
-		{
-			var output = [];
-			for (var k in value)
-			{
-				if (k === '$') continue;
-				output.push(_Debug_toAnsiString(ansi, value[k]));
-			}
-			return '(' + output.join(',') + ')';
-		}
-
-		if (tag === 'Set_elm_builtin')
-		{
-			return _Debug_ctorColor(ansi, 'Set')
-				+ _Debug_fadeColor(ansi, '.fromList') + ' '
-				+ _Debug_toAnsiString(ansi, $elm$core$Set$toList(value));
-		}
-
-		if (tag === 'RBNode_elm_builtin' || tag === 'RBEmpty_elm_builtin')
-		{
-			return _Debug_ctorColor(ansi, 'Dict')
-				+ _Debug_fadeColor(ansi, '.fromList') + ' '
-				+ _Debug_toAnsiString(ansi, $elm$core$Dict$toList(value));
-		}
-
-		if (tag === 'Array_elm_builtin')
-		{
-			return _Debug_ctorColor(ansi, 'Array')
-				+ _Debug_fadeColor(ansi, '.fromList') + ' '
-				+ _Debug_toAnsiString(ansi, $elm$core$Array$toList(value));
-		}
-
-		if (tag === '::' || tag === '[]')
-		{
-			var output = '[';
-
-			value.b && (output += _Debug_toAnsiString(ansi, value.a), value = value.b)
-
-			for (; value.b; value = value.b) // WHILE_CONS
-			{
-				output += ',' + _Debug_toAnsiString(ansi, value.a);
-			}
-			return output + ']';
-		}
-
-		var output = '';
-		for (var i in value)
-		{
-			if (i === '$') continue;
-			var str = _Debug_toAnsiString(ansi, value[i]);
-			var c0 = str[0];
-			var parenless = c0 === '{' || c0 === '(' || c0 === '[' || c0 === '<' || c0 === '"' || str.indexOf(' ') < 0;
-			output += ' ' + (parenless ? str : '(' + str + ')');
-		}
-		return _Debug_ctorColor(ansi, tag) + output;
-	}
-
-	if (typeof DataView === 'function' && value instanceof DataView)
-	{
-		return _Debug_stringColor(ansi, '<' + value.byteLength + ' bytes>');
-	}
-
-	if (typeof File !== 'undefined' && value instanceof File)
-	{
-		return _Debug_internalColor(ansi, '<' + value.name + '>');
-	}
-
-	if (typeof value === 'object')
-	{
-		var output = [];
-		for (var key in value)
-		{
-			var field = key[0] === '_' ? key.slice(1) : key;
-			output.push(_Debug_fadeColor(ansi, field) + ' = ' + _Debug_toAnsiString(ansi, value[key]));
-		}
-		if (output.length === 0)
-		{
-			return '{}';
-		}
-		return '{ ' + output.join(', ') + ' }';
-	}
-
-	return _Debug_internalColor(ansi, '<internals>');
-}
-
-function _Debug_addSlashes(str, isChar)
-{
-	var s = str
-		.replace(/\\/g, '\\\\')
-		.replace(/\n/g, '\\n')
-		.replace(/\t/g, '\\t')
-		.replace(/\r/g, '\\r')
-		.replace(/\v/g, '\\v')
-		.replace(/\0/g, '\\0');
-
-	if (isChar)
-	{
-		return s.replace(/\'/g, '\\\'');
-	}
-	else
-	{
-		return s.replace(/\"/g, '\\"');
-	}
-}
-
-function _Debug_ctorColor(ansi, string)
-{
-	return ansi ? '\x1b[96m' + string + '\x1b[0m' : string;
-}
-
-function _Debug_numberColor(ansi, string)
-{
-	return ansi ? '\x1b[95m' + string + '\x1b[0m' : string;
-}
-
-function _Debug_stringColor(ansi, string)
-{
-	return ansi ? '\x1b[93m' + string + '\x1b[0m' : string;
-}
-
-function _Debug_charColor(ansi, string)
-{
-	return ansi ? '\x1b[92m' + string + '\x1b[0m' : string;
-}
-
-function _Debug_fadeColor(ansi, string)
-{
-	return ansi ? '\x1b[37m' + string + '\x1b[0m' : string;
-}
-
-function _Debug_internalColor(ansi, string)
-{
-	return ansi ? '\x1b[36m' + string + '\x1b[0m' : string;
-}
-
-function _Debug_toHexDigit(n)
-{
-	return String.fromCharCode(n < 10 ? 48 + n : 55 + n);
-}
-
-
-// CRASH
-
-
-function _Debug_crash_UNUSED(identifier)
-{
-	throw new Error('https://github.com/elm/core/blob/1.0.0/hints/' + identifier + '.md');
-}
-
-
-function _Debug_crash(identifier, fact1, fact2, fact3, fact4)
-{
-	switch(identifier)
-	{
-		case 0:
-			throw new Error('What node should I take over? In JavaScript I need something like:\n\n    Elm.Main.init({\n        node: document.getElementById("elm-node")\n    })\n\nYou need to do this with any Browser.sandbox or Browser.element program.');
-
-		case 1:
-			throw new Error('Browser.application programs cannot handle URLs like this:\n\n    ' + document.location.href + '\n\nWhat is the root? The root of your file system? Try looking at this program with `elm reactor` or some other server.');
-
-		case 2:
-			var jsonErrorString = fact1;
-			throw new Error('Problem with the flags given to your Elm program on initialization.\n\n' + jsonErrorString);
-
-		case 3:
-			var portName = fact1;
-			throw new Error('There can only be one port named `' + portName + '`, but your program has multiple.');
-
-		case 4:
-			var portName = fact1;
-			var problem = fact2;
-			throw new Error('Trying to send an unexpected type of value through port `' + portName + '`:\n' + problem);
-
-		case 5:
-			throw new Error('Trying to use `(==)` on functions.\nThere is no way to know if functions are "the same" in the Elm sense.\nRead more about this at https://package.elm-lang.org/packages/elm/core/latest/Basics#== which describes why it is this way and what the better version will look like.');
-
-		case 6:
-			var moduleName = fact1;
-			throw new Error('Your page is loading multiple Elm scripts with a module named ' + moduleName + '. Maybe a duplicate script is getting loaded accidentally? If not, rename one of them so I know which is which!');
-
-		case 8:
-			var moduleName = fact1;
-			var region = fact2;
-			var message = fact3;
-			throw new Error('TODO in module `' + moduleName + '` ' + _Debug_regionToString(region) + '\n\n' + message);
-
-		case 9:
-			var moduleName = fact1;
-			var region = fact2;
-			var value = fact3;
-			var message = fact4;
-			throw new Error(
-				'TODO in module `' + moduleName + '` from the `case` expression '
-				+ _Debug_regionToString(region) + '\n\nIt received the following value:\n\n    '
-				+ _Debug_toString(value).replace('\n', '\n    ')
-				+ '\n\nBut the branch that handles it says:\n\n    ' + message.replace('\n', '\n    ')
-			);
-
-		case 10:
-			throw new Error('Bug in https://github.com/elm/virtual-dom/issues');
-
-		case 11:
-			throw new Error('Cannot perform mod 0. Division by zero error.');
-	}
-}
-
-function _Debug_regionToString(region)
-{
-	if (region.start.line === region.end.line)
-	{
-		return 'on line ' + region.start.line;
-	}
-	return 'on lines ' + region.start.line + ' through ' + region.end.line;
-}
-
-
-
-// EQUALITY
-
-function _Utils_eq(x, y)
-{
-	for (
-		var pair, stack = [], isEqual = _Utils_eqHelp(x, y, 0, stack);
-		isEqual && (pair = stack.pop());
-		isEqual = _Utils_eqHelp(pair.a, pair.b, 0, stack)
-		)
-	{}
-
-	return isEqual;
-}
-
-function _Utils_eqHelp(x, y, depth, stack)
-{
-	if (x === y)
-	{
-		return true;
-	}
-
-	if (typeof x !== 'object' || x === null || y === null)
-	{
-		typeof x === 'function' && _Debug_crash(5);
-		return false;
-	}
-
-	if (depth > 100)
-	{
-		stack.push(_Utils_Tuple2(x,y));
-		return true;
-	}
-
-	/**/
-	if (x.$ === 'Set_elm_builtin')
-	{
-		x = $elm$core$Set$toList(x);
-		y = $elm$core$Set$toList(y);
-	}
-	if (x.$ === 'RBNode_elm_builtin' || x.$ === 'RBEmpty_elm_builtin')
-	{
-		x = $elm$core$Dict$toList(x);
-		y = $elm$core$Dict$toList(y);
-	}
-	//*/
-
-	/**_UNUSED/
-	if (x.$ < 0)
-	{
-		x = $elm$core$Dict$toList(x);
-		y = $elm$core$Dict$toList(y);
-	}
-	//*/
-
-	for (var key in x)
-	{
-		if (!_Utils_eqHelp(x[key], y[key], depth + 1, stack))
-		{
-			return false;
-		}
-	}
-	return true;
-}
-
-var _Utils_equal = F2(_Utils_eq);
-var _Utils_notEqual = F2(function(a, b) { return !_Utils_eq(a,b); });
-
-
-
-// COMPARISONS
-
-// Code in Generate/JavaScript.hs, Basics.js, and List.js depends on
-// the particular integer values assigned to LT, EQ, and GT.
-
-function _Utils_cmp(x, y, ord)
-{
-	if (typeof x !== 'object')
-	{
-		return x === y ? /*EQ*/ 0 : x < y ? /*LT*/ -1 : /*GT*/ 1;
-	}
-
-	/**/
-	if (x instanceof String)
-	{
-		var a = x.valueOf();
-		var b = y.valueOf();
-		return a === b ? 0 : a < b ? -1 : 1;
-	}
-	//*/
-
-	/**_UNUSED/
-	if (typeof x.$ === 'undefined')
-	//*/
-	/**/
-	if (x.$[0] === '#')
-	//*/
-	{
-		return (ord = _Utils_cmp(x.a, y.a))
-			? ord
-			: (ord = _Utils_cmp(x.b, y.b))
-				? ord
-				: _Utils_cmp(x.c, y.c);
-	}
-
-	// traverse conses until end of a list or a mismatch
-	for (; x.b && y.b && !(ord = _Utils_cmp(x.a, y.a)); x = x.b, y = y.b) {} // WHILE_CONSES
-	return ord || (x.b ? /*GT*/ 1 : y.b ? /*LT*/ -1 : /*EQ*/ 0);
-}
-
-var _Utils_lt = F2(function(a, b) { return _Utils_cmp(a, b) < 0; });
-var _Utils_le = F2(function(a, b) { return _Utils_cmp(a, b) < 1; });
-var _Utils_gt = F2(function(a, b) { return _Utils_cmp(a, b) > 0; });
-var _Utils_ge = F2(function(a, b) { return _Utils_cmp(a, b) >= 0; });
-
-var _Utils_compare = F2(function(x, y)
-{
-	var n = _Utils_cmp(x, y);
-	return n < 0 ? $elm$core$Basics$LT : n ? $elm$core$Basics$GT : $elm$core$Basics$EQ;
-});
-
-
-// COMMON VALUES
-
-var _Utils_Tuple0_UNUSED = 0;
-var _Utils_Tuple0 = { $: '#0' };
-
-function _Utils_Tuple2_UNUSED(a, b) { return { a: a, b: b }; }
-function _Utils_Tuple2(a, b) { return { $: '#2', a: a, b: b }; }
-
-function _Utils_Tuple3_UNUSED(a, b, c) { return { a: a, b: b, c: c }; }
-function _Utils_Tuple3(a, b, c) { return { $: '#3', a: a, b: b, c: c }; }
-
-function _Utils_chr_UNUSED(c) { return c; }
-function _Utils_chr(c) { return new String(c); }
-
-
-// RECORDS
-
-function _Utils_update(oldRecord, updatedFields)
-{
-	var newRecord = {};
-
-	for (var key in oldRecord)
-	{
-		newRecord[key] = oldRecord[key];
-	}
-
-	for (var key in updatedFields)
-	{
-		newRecord[key] = updatedFields[key];
-	}
-
-	return newRecord;
-}
-
-
-// APPEND
-
-var _Utils_append = F2(_Utils_ap);
-
-function _Utils_ap(xs, ys)
-{
-	// append Strings
-	if (typeof xs === 'string')
-	{
-		return xs + ys;
-	}
-
-	// append Lists
-	if (!xs.b)
-	{
-		return ys;
-	}
-	var root = _List_Cons(xs.a, ys);
-	xs = xs.b
-	for (var curr = root; xs.b; xs = xs.b) // WHILE_CONS
-	{
-		curr = curr.b = _List_Cons(xs.a, ys);
-	}
-	return root;
-}
-
-
-
-var _List_Nil_UNUSED = { $: 0 };
-var _List_Nil = { $: '[]' };
-
-function _List_Cons_UNUSED(hd, tl) { return { $: 1, a: hd, b: tl }; }
-function _List_Cons(hd, tl) { return { $: '::', a: hd, b: tl }; }
-
-
-var _List_cons = F2(_List_Cons);
-
-function _List_fromArray(arr)
-{
-	var out = _List_Nil;
-	for (var i = arr.length; i--; )
-	{
-		out = _List_Cons(arr[i], out);
-	}
-	return out;
-}
-
-function _List_toArray(xs)
-{
-	for (var out = []; xs.b; xs = xs.b) // WHILE_CONS
-	{
-		out.push(xs.a);
-	}
-	return out;
-}
-
-var _List_map2 = F3(function(f, xs, ys)
-{
-	for (var arr = []; xs.b && ys.b; xs = xs.b, ys = ys.b) // WHILE_CONSES
-	{
-		arr.push(A2(f, xs.a, ys.a));
-	}
-	return _List_fromArray(arr);
-});
-
-var _List_map3 = F4(function(f, xs, ys, zs)
-{
-	for (var arr = []; xs.b && ys.b && zs.b; xs = xs.b, ys = ys.b, zs = zs.b) // WHILE_CONSES
-	{
-		arr.push(A3(f, xs.a, ys.a, zs.a));
-	}
-	return _List_fromArray(arr);
-});
-
-var _List_map4 = F5(function(f, ws, xs, ys, zs)
-{
-	for (var arr = []; ws.b && xs.b && ys.b && zs.b; ws = ws.b, xs = xs.b, ys = ys.b, zs = zs.b) // WHILE_CONSES
-	{
-		arr.push(A4(f, ws.a, xs.a, ys.a, zs.a));
-	}
-	return _List_fromArray(arr);
-});
-
-var _List_map5 = F6(function(f, vs, ws, xs, ys, zs)
-{
-	for (var arr = []; vs.b && ws.b && xs.b && ys.b && zs.b; vs = vs.b, ws = ws.b, xs = xs.b, ys = ys.b, zs = zs.b) // WHILE_CONSES
-	{
-		arr.push(A5(f, vs.a, ws.a, xs.a, ys.a, zs.a));
-	}
-	return _List_fromArray(arr);
-});
-
-var _List_sortBy = F2(function(f, xs)
-{
-	return _List_fromArray(_List_toArray(xs).sort(function(a, b) {
-		return _Utils_cmp(f(a), f(b));
-	}));
-});
-
-var _List_sortWith = F2(function(f, xs)
-{
-	return _List_fromArray(_List_toArray(xs).sort(function(a, b) {
-		var ord = A2(f, a, b);
-		return ord === $elm$core$Basics$EQ ? 0 : ord === $elm$core$Basics$LT ? -1 : 1;
-	}));
-});
-
-
-
-// MATH
-
-var _Basics_add = F2(function(a, b) { return a + b; });
-var _Basics_sub = F2(function(a, b) { return a - b; });
-var _Basics_mul = F2(function(a, b) { return a * b; });
-var _Basics_fdiv = F2(function(a, b) { return a / b; });
-var _Basics_idiv = F2(function(a, b) { return (a / b) | 0; });
-var _Basics_pow = F2(Math.pow);
-
-var _Basics_remainderBy = F2(function(b, a) { return a % b; });
-
-// https://www.microsoft.com/en-us/research/wp-content/uploads/2016/02/divmodnote-letter.pdf
-var _Basics_modBy = F2(function(modulus, x)
-{
-	var answer = x % modulus;
-	return modulus === 0
-		? _Debug_crash(11)
-		:
-	((answer > 0 && modulus < 0) || (answer < 0 && modulus > 0))
-		? answer + modulus
-		: answer;
-});
-
-
-// TRIGONOMETRY
-
-var _Basics_pi = Math.PI;
-var _Basics_e = Math.E;
-var _Basics_cos = Math.cos;
-var _Basics_sin = Math.sin;
-var _Basics_tan = Math.tan;
-var _Basics_acos = Math.acos;
-var _Basics_asin = Math.asin;
-var _Basics_atan = Math.atan;
-var _Basics_atan2 = F2(Math.atan2);
-
-
-// MORE MATH
-
-function _Basics_toFloat(x) { return x; }
-function _Basics_truncate(n) { return n | 0; }
-function _Basics_isInfinite(n) { return n === Infinity || n === -Infinity; }
-
-var _Basics_ceiling = Math.ceil;
-var _Basics_floor = Math.floor;
-var _Basics_round = Math.round;
-var _Basics_sqrt = Math.sqrt;
-var _Basics_log = Math.log;
-var _Basics_isNaN = isNaN;
-
-
-// BOOLEANS
-
-function _Basics_not(bool) { return !bool; }
-var _Basics_and = F2(function(a, b) { return a && b; });
-var _Basics_or  = F2(function(a, b) { return a || b; });
-var _Basics_xor = F2(function(a, b) { return a !== b; });
-
-
-
-var _String_cons = F2(function(chr, str)
-{
-	return chr + str;
-});
-
-function _String_uncons(string)
-{
-	var word = string.charCodeAt(0);
-	return !isNaN(word)
-		? $elm$core$Maybe$Just(
-			0xD800 <= word && word <= 0xDBFF
-				? _Utils_Tuple2(_Utils_chr(string[0] + string[1]), string.slice(2))
-				: _Utils_Tuple2(_Utils_chr(string[0]), string.slice(1))
-		)
-		: $elm$core$Maybe$Nothing;
-}
-
-var _String_append = F2(function(a, b)
-{
-	return a + b;
-});
-
-function _String_length(str)
-{
-	return str.length;
-}
-
-var _String_map = F2(function(func, string)
-{
-	var len = string.length;
-	var array = new Array(len);
-	var i = 0;
-	while (i < len)
-	{
-		var word = string.charCodeAt(i);
-		if (0xD800 <= word && word <= 0xDBFF)
-		{
-			array[i] = func(_Utils_chr(string[i] + string[i+1]));
-			i += 2;
-			continue;
-		}
-		array[i] = func(_Utils_chr(string[i]));
-		i++;
-	}
-	return array.join('');
-});
-
-var _String_filter = F2(function(isGood, str)
-{
-	var arr = [];
-	var len = str.length;
-	var i = 0;
-	while (i < len)
-	{
-		var char = str[i];
-		var word = str.charCodeAt(i);
-		i++;
-		if (0xD800 <= word && word <= 0xDBFF)
-		{
-			char += str[i];
-			i++;
-		}
-
-		if (isGood(_Utils_chr(char)))
-		{
-			arr.push(char);
-		}
-	}
-	return arr.join('');
-});
-
-function _String_reverse(str)
-{
-	var len = str.length;
-	var arr = new Array(len);
-	var i = 0;
-	while (i < len)
-	{
-		var word = str.charCodeAt(i);
-		if (0xD800 <= word && word <= 0xDBFF)
-		{
-			arr[len - i] = str[i + 1];
-			i++;
-			arr[len - i] = str[i - 1];
-			i++;
-		}
-		else
-		{
-			arr[len - i] = str[i];
-			i++;
-		}
-	}
-	return arr.join('');
-}
-
-var _String_foldl = F3(function(func, state, string)
-{
-	var len = string.length;
-	var i = 0;
-	while (i < len)
-	{
-		var char = string[i];
-		var word = string.charCodeAt(i);
-		i++;
-		if (0xD800 <= word && word <= 0xDBFF)
-		{
-			char += string[i];
-			i++;
-		}
-		state = A2(func, _Utils_chr(char), state);
-	}
-	return state;
-});
-
-var _String_foldr = F3(function(func, state, string)
-{
-	var i = string.length;
-	while (i--)
-	{
-		var char = string[i];
-		var word = string.charCodeAt(i);
-		if (0xDC00 <= word && word <= 0xDFFF)
-		{
-			i--;
-			char = string[i] + char;
-		}
-		state = A2(func, _Utils_chr(char), state);
-	}
-	return state;
-});
-
-var _String_split = F2(function(sep, str)
-{
-	return str.split(sep);
-});
-
-var _String_join = F2(function(sep, strs)
-{
-	return strs.join(sep);
-});
-
-var _String_slice = F3(function(start, end, str) {
-	return str.slice(start, end);
-});
-
-function _String_trim(str)
-{
-	return str.trim();
-}
-
-function _String_trimLeft(str)
-{
-	return str.replace(/^\s+/, '');
-}
-
-function _String_trimRight(str)
-{
-	return str.replace(/\s+$/, '');
-}
-
-function _String_words(str)
-{
-	return _List_fromArray(str.trim().split(/\s+/g));
-}
-
-function _String_lines(str)
-{
-	return _List_fromArray(str.split(/\r\n|\r|\n/g));
-}
-
-function _String_toUpper(str)
-{
-	return str.toUpperCase();
-}
-
-function _String_toLower(str)
-{
-	return str.toLowerCase();
-}
-
-var _String_any = F2(function(isGood, string)
-{
-	var i = string.length;
-	while (i--)
-	{
-		var char = string[i];
-		var word = string.charCodeAt(i);
-		if (0xDC00 <= word && word <= 0xDFFF)
-		{
-			i--;
-			char = string[i] + char;
-		}
-		if (isGood(_Utils_chr(char)))
-		{
-			return true;
-		}
-	}
-	return false;
-});
-
-var _String_all = F2(function(isGood, string)
-{
-	var i = string.length;
-	while (i--)
-	{
-		var char = string[i];
-		var word = string.charCodeAt(i);
-		if (0xDC00 <= word && word <= 0xDFFF)
-		{
-			i--;
-			char = string[i] + char;
-		}
-		if (!isGood(_Utils_chr(char)))
-		{
-			return false;
-		}
-	}
-	return true;
-});
-
-var _String_contains = F2(function(sub, str)
-{
-	return str.indexOf(sub) > -1;
-});
-
-var _String_startsWith = F2(function(sub, str)
-{
-	return str.indexOf(sub) === 0;
-});
-
-var _String_endsWith = F2(function(sub, str)
-{
-	return str.length >= sub.length &&
-		str.lastIndexOf(sub) === str.length - sub.length;
-});
-
-var _String_indexes = F2(function(sub, str)
-{
-	var subLen = sub.length;
-
-	if (subLen < 1)
-	{
-		return _List_Nil;
-	}
-
-	var i = 0;
-	var is = [];
-
-	while ((i = str.indexOf(sub, i)) > -1)
-	{
-		is.push(i);
-		i = i + subLen;
-	}
-
-	return _List_fromArray(is);
-});
-
-
-// TO STRING
-
-function _String_fromNumber(number)
-{
-	return number + '';
-}
-
-
-// INT CONVERSIONS
-
-function _String_toInt(str)
-{
-	var total = 0;
-	var code0 = str.charCodeAt(0);
-	var start = code0 == 0x2B /* + */ || code0 == 0x2D /* - */ ? 1 : 0;
-
-	for (var i = start; i < str.length; ++i)
-	{
-		var code = str.charCodeAt(i);
-		if (code < 0x30 || 0x39 < code)
-		{
-			return $elm$core$Maybe$Nothing;
-		}
-		total = 10 * total + code - 0x30;
-	}
-
-	return i == start
-		? $elm$core$Maybe$Nothing
-		: $elm$core$Maybe$Just(code0 == 0x2D ? -total : total);
-}
-
-
-// FLOAT CONVERSIONS
-
-function _String_toFloat(s)
-{
-	// check if it is a hex, octal, or binary number
-	if (s.length === 0 || /[\sxbo]/.test(s))
-	{
-		return $elm$core$Maybe$Nothing;
-	}
-	var n = +s;
-	// faster isNaN check
-	return n === n ? $elm$core$Maybe$Just(n) : $elm$core$Maybe$Nothing;
-}
-
-function _String_fromList(chars)
-{
-	return _List_toArray(chars).join('');
-}
-
-
-
-
-function _Char_toCode(char)
-{
-	var code = char.charCodeAt(0);
-	if (0xD800 <= code && code <= 0xDBFF)
-	{
-		return (code - 0xD800) * 0x400 + char.charCodeAt(1) - 0xDC00 + 0x10000
-	}
-	return code;
-}
-
-function _Char_fromCode(code)
-{
-	return _Utils_chr(
-		(code < 0 || 0x10FFFF < code)
-			? '\uFFFD'
-			:
-		(code <= 0xFFFF)
-			? String.fromCharCode(code)
-			:
-		(code -= 0x10000,
-			String.fromCharCode(Math.floor(code / 0x400) + 0xD800, code % 0x400 + 0xDC00)
-		)
-	);
-}
-
-function _Char_toUpper(char)
-{
-	return _Utils_chr(char.toUpperCase());
-}
-
-function _Char_toLower(char)
-{
-	return _Utils_chr(char.toLowerCase());
-}
-
-function _Char_toLocaleUpper(char)
-{
-	return _Utils_chr(char.toLocaleUpperCase());
-}
-
-function _Char_toLocaleLower(char)
-{
-	return _Utils_chr(char.toLocaleLowerCase());
-}
-
-
-
-/**/
-function _Json_errorToString(error)
-{
-	return $elm$json$Json$Decode$errorToString(error);
-}
-//*/
-
-
-// CORE DECODERS
-
-function _Json_succeed(msg)
-{
-	return {
-		$: 0,
-		a: msg
-	};
-}
-
-function _Json_fail(msg)
-{
-	return {
-		$: 1,
-		a: msg
-	};
-}
-
-function _Json_decodePrim(decoder)
-{
-	return { $: 2, b: decoder };
-}
-
-var _Json_decodeInt = _Json_decodePrim(function(value) {
-	return (typeof value !== 'number')
-		? _Json_expecting('an INT', value)
-		:
-	(-2147483647 < value && value < 2147483647 && (value | 0) === value)
-		? $elm$core$Result$Ok(value)
-		:
-	(isFinite(value) && !(value % 1))
-		? $elm$core$Result$Ok(value)
-		: _Json_expecting('an INT', value);
-});
-
-var _Json_decodeBool = _Json_decodePrim(function(value) {
-	return (typeof value === 'boolean')
-		? $elm$core$Result$Ok(value)
-		: _Json_expecting('a BOOL', value);
-});
-
-var _Json_decodeFloat = _Json_decodePrim(function(value) {
-	return (typeof value === 'number')
-		? $elm$core$Result$Ok(value)
-		: _Json_expecting('a FLOAT', value);
-});
-
-var _Json_decodeValue = _Json_decodePrim(function(value) {
-	return $elm$core$Result$Ok(_Json_wrap(value));
-});
-
-var _Json_decodeString = _Json_decodePrim(function(value) {
-	return (typeof value === 'string')
-		? $elm$core$Result$Ok(value)
-		: (value instanceof String)
-			? $elm$core$Result$Ok(value + '')
-			: _Json_expecting('a STRING', value);
-});
-
-function _Json_decodeList(decoder) { return { $: 3, b: decoder }; }
-function _Json_decodeArray(decoder) { return { $: 4, b: decoder }; }
-
-function _Json_decodeNull(value) { return { $: 5, c: value }; }
-
-var _Json_decodeField = F2(function(field, decoder)
-{
-	return {
-		$: 6,
-		d: field,
-		b: decoder
-	};
-});
-
-var _Json_decodeIndex = F2(function(index, decoder)
-{
-	return {
-		$: 7,
-		e: index,
-		b: decoder
-	};
-});
-
-function _Json_decodeKeyValuePairs(decoder)
-{
-	return {
-		$: 8,
-		b: decoder
-	};
-}
-
-function _Json_mapMany(f, decoders)
-{
-	return {
-		$: 9,
-		f: f,
-		g: decoders
-	};
-}
-
-var _Json_andThen = F2(function(callback, decoder)
-{
-	return {
-		$: 10,
-		b: decoder,
-		h: callback
-	};
-});
-
-function _Json_oneOf(decoders)
-{
-	return {
-		$: 11,
-		g: decoders
-	};
-}
-
-
-// DECODING OBJECTS
-
-var _Json_map1 = F2(function(f, d1)
-{
-	return _Json_mapMany(f, [d1]);
-});
-
-var _Json_map2 = F3(function(f, d1, d2)
-{
-	return _Json_mapMany(f, [d1, d2]);
-});
-
-var _Json_map3 = F4(function(f, d1, d2, d3)
-{
-	return _Json_mapMany(f, [d1, d2, d3]);
-});
-
-var _Json_map4 = F5(function(f, d1, d2, d3, d4)
-{
-	return _Json_mapMany(f, [d1, d2, d3, d4]);
-});
-
-var _Json_map5 = F6(function(f, d1, d2, d3, d4, d5)
-{
-	return _Json_mapMany(f, [d1, d2, d3, d4, d5]);
-});
-
-var _Json_map6 = F7(function(f, d1, d2, d3, d4, d5, d6)
-{
-	return _Json_mapMany(f, [d1, d2, d3, d4, d5, d6]);
-});
-
-var _Json_map7 = F8(function(f, d1, d2, d3, d4, d5, d6, d7)
-{
-	return _Json_mapMany(f, [d1, d2, d3, d4, d5, d6, d7]);
-});
-
-var _Json_map8 = F9(function(f, d1, d2, d3, d4, d5, d6, d7, d8)
-{
-	return _Json_mapMany(f, [d1, d2, d3, d4, d5, d6, d7, d8]);
-});
-
-
-// DECODE
-
-var _Json_runOnString = F2(function(decoder, string)
-{
-	try
-	{
-		var value = JSON.parse(string);
-		return _Json_runHelp(decoder, value);
-	}
-	catch (e)
-	{
-		return $elm$core$Result$Err(A2($elm$json$Json$Decode$Failure, 'This is not valid JSON! ' + e.message, _Json_wrap(string)));
-	}
-});
-
-var _Json_run = F2(function(decoder, value)
-{
-	return _Json_runHelp(decoder, _Json_unwrap(value));
-});
-
-function _Json_runHelp(decoder, value)
-{
-	switch (decoder.$)
-	{
-		case 2:
-			return decoder.b(value);
-
-		case 5:
-			return (value === null)
-				? $elm$core$Result$Ok(decoder.c)
-				: _Json_expecting('null', value);
-
-		case 3:
-			if (!_Json_isArray(value))
-			{
-				return _Json_expecting('a LIST', value);
-			}
-			return _Json_runArrayDecoder(decoder.b, value, _List_fromArray);
-
-		case 4:
-			if (!_Json_isArray(value))
-			{
-				return _Json_expecting('an ARRAY', value);
-			}
-			return _Json_runArrayDecoder(decoder.b, value, _Json_toElmArray);
-
-		case 6:
-			var field = decoder.d;
-			if (typeof value !== 'object' || value === null || !(field in value))
-			{
-				return _Json_expecting('an OBJECT with a field named `' + field + '`', value);
-			}
-			var result = _Json_runHelp(decoder.b, value[field]);
-			return ($elm$core$Result$isOk(result)) ? result : $elm$core$Result$Err(A2($elm$json$Json$Decode$Field, field, result.a));
-
-		case 7:
-			var index = decoder.e;
-			if (!_Json_isArray(value))
-			{
-				return _Json_expecting('an ARRAY', value);
-			}
-			if (index >= value.length)
-			{
-				return _Json_expecting('a LONGER array. Need index ' + index + ' but only see ' + value.length + ' entries', value);
-			}
-			var result = _Json_runHelp(decoder.b, value[index]);
-			return ($elm$core$Result$isOk(result)) ? result : $elm$core$Result$Err(A2($elm$json$Json$Decode$Index, index, result.a));
-
-		case 8:
-			if (typeof value !== 'object' || value === null || _Json_isArray(value))
-			{
-				return _Json_expecting('an OBJECT', value);
-			}
-
-			var keyValuePairs = _List_Nil;
-			// TODO test perf of Object.keys and switch when support is good enough
-			for (var key in value)
-			{
-				if (value.hasOwnProperty(key))
-				{
-					var result = _Json_runHelp(decoder.b, value[key]);
-					if (!$elm$core$Result$isOk(result))
-					{
-						return $elm$core$Result$Err(A2($elm$json$Json$Decode$Field, key, result.a));
-					}
-					keyValuePairs = _List_Cons(_Utils_Tuple2(key, result.a), keyValuePairs);
-				}
-			}
-			return $elm$core$Result$Ok($elm$core$List$reverse(keyValuePairs));
-
-		case 9:
-			var answer = decoder.f;
-			var decoders = decoder.g;
-			for (var i = 0; i < decoders.length; i++)
-			{
-				var result = _Json_runHelp(decoders[i], value);
-				if (!$elm$core$Result$isOk(result))
-				{
-					return result;
-				}
-				answer = answer(result.a);
-			}
-			return $elm$core$Result$Ok(answer);
-
-		case 10:
-			var result = _Json_runHelp(decoder.b, value);
-			return (!$elm$core$Result$isOk(result))
-				? result
-				: _Json_runHelp(decoder.h(result.a), value);
-
-		case 11:
-			var errors = _List_Nil;
-			for (var temp = decoder.g; temp.b; temp = temp.b) // WHILE_CONS
-			{
-				var result = _Json_runHelp(temp.a, value);
-				if ($elm$core$Result$isOk(result))
-				{
-					return result;
-				}
-				errors = _List_Cons(result.a, errors);
-			}
-			return $elm$core$Result$Err($elm$json$Json$Decode$OneOf($elm$core$List$reverse(errors)));
-
-		case 1:
-			return $elm$core$Result$Err(A2($elm$json$Json$Decode$Failure, decoder.a, _Json_wrap(value)));
-
-		case 0:
-			return $elm$core$Result$Ok(decoder.a);
-	}
-}
-
-function _Json_runArrayDecoder(decoder, value, toElmValue)
-{
-	var len = value.length;
-	var array = new Array(len);
-	for (var i = 0; i < len; i++)
-	{
-		var result = _Json_runHelp(decoder, value[i]);
-		if (!$elm$core$Result$isOk(result))
-		{
-			return $elm$core$Result$Err(A2($elm$json$Json$Decode$Index, i, result.a));
-		}
-		array[i] = result.a;
-	}
-	return $elm$core$Result$Ok(toElmValue(array));
-}
-
-function _Json_isArray(value)
-{
-	return Array.isArray(value) || (typeof FileList !== 'undefined' && value instanceof FileList);
-}
-
-function _Json_toElmArray(array)
-{
-	return A2($elm$core$Array$initialize, array.length, function(i) { return array[i]; });
-}
-
-function _Json_expecting(type, value)
-{
-	return $elm$core$Result$Err(A2($elm$json$Json$Decode$Failure, 'Expecting ' + type, _Json_wrap(value)));
-}
-
-
-// EQUALITY
-
-function _Json_equality(x, y)
-{
-	if (x === y)
-	{
-		return true;
-	}
-
-	if (x.$ !== y.$)
-	{
-		return false;
-	}
-
-	switch (x.$)
-	{
-		case 0:
-		case 1:
-			return x.a === y.a;
-
-		case 2:
-			return x.b === y.b;
-
-		case 5:
-			return x.c === y.c;
-
-		case 3:
-		case 4:
-		case 8:
-			return _Json_equality(x.b, y.b);
-
-		case 6:
-			return x.d === y.d && _Json_equality(x.b, y.b);
-
-		case 7:
-			return x.e === y.e && _Json_equality(x.b, y.b);
-
-		case 9:
-			return x.f === y.f && _Json_listEquality(x.g, y.g);
-
-		case 10:
-			return x.h === y.h && _Json_equality(x.b, y.b);
-
-		case 11:
-			return _Json_listEquality(x.g, y.g);
-	}
-}
-
-function _Json_listEquality(aDecoders, bDecoders)
-{
-	var len = aDecoders.length;
-	if (len !== bDecoders.length)
-	{
-		return false;
-	}
-	for (var i = 0; i < len; i++)
-	{
-		if (!_Json_equality(aDecoders[i], bDecoders[i]))
-		{
-			return false;
-		}
-	}
-	return true;
-}
-
-
-// ENCODE
-
-var _Json_encode = F2(function(indentLevel, value)
-{
-	return JSON.stringify(_Json_unwrap(value), null, indentLevel) + '';
-});
-
-function _Json_wrap(value) { return { $: 0, a: value }; }
-function _Json_unwrap(value) { return value.a; }
-
-function _Json_wrap_UNUSED(value) { return value; }
-function _Json_unwrap_UNUSED(value) { return value; }
-
-function _Json_emptyArray() { return []; }
-function _Json_emptyObject() { return {}; }
-
-var _Json_addField = F3(function(key, value, object)
-{
-	object[key] = _Json_unwrap(value);
-	return object;
-});
-
-function _Json_addEntry(func)
-{
-	return F2(function(entry, array)
-	{
-		array.push(_Json_unwrap(func(entry)));
-		return array;
-	});
-}
-
-var _Json_encodeNull = _Json_wrap(null);
-
-
-
-// TASKS
-
-function _Scheduler_succeed(value)
-{
-	return {
-		$: 0,
-		a: value
-	};
-}
-
-function _Scheduler_fail(error)
-{
-	return {
-		$: 1,
-		a: error
-	};
-}
-
-function _Scheduler_binding(callback)
-{
-	return {
-		$: 2,
-		b: callback,
-		c: null
-	};
-}
-
-var _Scheduler_andThen = F2(function(callback, task)
-{
-	return {
-		$: 3,
-		b: callback,
-		d: task
-	};
-});
-
-var _Scheduler_onError = F2(function(callback, task)
-{
-	return {
-		$: 4,
-		b: callback,
-		d: task
-	};
-});
-
-function _Scheduler_receive(callback)
-{
-	return {
-		$: 5,
-		b: callback
-	};
-}
-
-
-// PROCESSES
-
-var _Scheduler_guid = 0;
-
-function _Scheduler_rawSpawn(task)
-{
-	var proc = {
-		$: 0,
-		e: _Scheduler_guid++,
-		f: task,
-		g: null,
-		h: []
-	};
-
-	_Scheduler_enqueue(proc);
-
-	return proc;
-}
-
-function _Scheduler_spawn(task)
-{
-	return _Scheduler_binding(function(callback) {
-		callback(_Scheduler_succeed(_Scheduler_rawSpawn(task)));
-	});
-}
-
-function _Scheduler_rawSend(proc, msg)
-{
-	proc.h.push(msg);
-	_Scheduler_enqueue(proc);
-}
-
-var _Scheduler_send = F2(function(proc, msg)
-{
-	return _Scheduler_binding(function(callback) {
-		_Scheduler_rawSend(proc, msg);
-		callback(_Scheduler_succeed(_Utils_Tuple0));
-	});
-});
-
-function _Scheduler_kill(proc)
-{
-	return _Scheduler_binding(function(callback) {
-		var task = proc.f;
-		if (task.$ === 2 && task.c)
-		{
-			task.c();
-		}
-
-		proc.f = null;
-
-		callback(_Scheduler_succeed(_Utils_Tuple0));
-	});
-}
-
-
-/* STEP PROCESSES
-
-type alias Process =
-  { $ : tag
-  , id : unique_id
-  , root : Task
-  , stack : null | { $: SUCCEED | FAIL, a: callback, b: stack }
-  , mailbox : [msg]
-  }
-
-*/
-
-
-var _Scheduler_working = false;
-var _Scheduler_queue = [];
-
-
-function _Scheduler_enqueue(proc)
-{
-	_Scheduler_queue.push(proc);
-	if (_Scheduler_working)
-	{
-		return;
-	}
-	_Scheduler_working = true;
-	while (proc = _Scheduler_queue.shift())
-	{
-		_Scheduler_step(proc);
-	}
-	_Scheduler_working = false;
-}
-
-
-function _Scheduler_step(proc)
-{
-	while (proc.f)
-	{
-		var rootTag = proc.f.$;
-		if (rootTag === 0 || rootTag === 1)
-		{
-			while (proc.g && proc.g.$ !== rootTag)
-			{
-				proc.g = proc.g.i;
-			}
-			if (!proc.g)
-			{
-				return;
-			}
-			proc.f = proc.g.b(proc.f.a);
-			proc.g = proc.g.i;
-		}
-		else if (rootTag === 2)
-		{
-			proc.f.c = proc.f.b(function(newRoot) {
-				proc.f = newRoot;
-				_Scheduler_enqueue(proc);
-			});
-			return;
-		}
-		else if (rootTag === 5)
-		{
-			if (proc.h.length === 0)
-			{
-				return;
-			}
-			proc.f = proc.f.b(proc.h.shift());
-		}
-		else // if (rootTag === 3 || rootTag === 4)
-		{
-			proc.g = {
-				$: rootTag === 3 ? 0 : 1,
-				b: proc.f.b,
-				i: proc.g
-			};
-			proc.f = proc.f.d;
-		}
-	}
-}
-
-
-
-function _Process_sleep(time)
-{
-	return _Scheduler_binding(function(callback) {
-		var id = setTimeout(function() {
-			callback(_Scheduler_succeed(_Utils_Tuple0));
-		}, time);
-
-		return function() { clearTimeout(id); };
-	});
-}
-
-
-
-
-// PROGRAMS
-
-
-var _Platform_worker = F4(function(impl, flagDecoder, debugMetadata, args)
-{
-	return _Platform_initialize(
-		flagDecoder,
-		args,
-		impl.init,
-		impl.update,
-		impl.subscriptions,
-		function() { return function() {} }
-	);
-});
-
-
-
-// INITIALIZE A PROGRAM
-
-
-function _Platform_initialize(flagDecoder, args, init, update, subscriptions, stepperBuilder)
-{
-	var result = A2(_Json_run, flagDecoder, _Json_wrap(args ? args['flags'] : undefined));
-	$elm$core$Result$isOk(result) || _Debug_crash(2 /**/, _Json_errorToString(result.a) /**/);
-	var managers = {};
-	var initPair = init(result.a);
-	var model = initPair.a;
-	var stepper = stepperBuilder(sendToApp, model);
-	var ports = _Platform_setupEffects(managers, sendToApp);
-
-	function sendToApp(msg, viewMetadata)
-	{
-		var pair = A2(update, msg, model);
-		stepper(model = pair.a, viewMetadata);
-		_Platform_enqueueEffects(managers, pair.b, subscriptions(model));
-	}
-
-	_Platform_enqueueEffects(managers, initPair.b, subscriptions(model));
-
-	return ports ? { ports: ports } : {};
-}
-
-
-
-// TRACK PRELOADS
-//
-// This is used by code in elm/browser and elm/http
-// to register any HTTP requests that are triggered by init.
-//
-
-
-var _Platform_preload;
-
-
-function _Platform_registerPreload(url)
-{
-	_Platform_preload.add(url);
-}
-
-
-
-// EFFECT MANAGERS
-
-
-var _Platform_effectManagers = {};
-
-
-function _Platform_setupEffects(managers, sendToApp)
-{
-	var ports;
-
-	// setup all necessary effect managers
-	for (var key in _Platform_effectManagers)
-	{
-		var manager = _Platform_effectManagers[key];
-
-		if (manager.a)
-		{
-			ports = ports || {};
-			ports[key] = manager.a(key, sendToApp);
-		}
-
-		managers[key] = _Platform_instantiateManager(manager, sendToApp);
-	}
-
-	return ports;
-}
-
-
-function _Platform_createManager(init, onEffects, onSelfMsg, cmdMap, subMap)
-{
-	return {
-		b: init,
-		c: onEffects,
-		d: onSelfMsg,
-		e: cmdMap,
-		f: subMap
-	};
-}
-
-
-function _Platform_instantiateManager(info, sendToApp)
-{
-	var router = {
-		g: sendToApp,
-		h: undefined
-	};
-
-	var onEffects = info.c;
-	var onSelfMsg = info.d;
-	var cmdMap = info.e;
-	var subMap = info.f;
-
-	function loop(state)
-	{
-		return A2(_Scheduler_andThen, loop, _Scheduler_receive(function(msg)
-		{
-			var value = msg.a;
-
-			if (msg.$ === 0)
-			{
-				return A3(onSelfMsg, router, value, state);
-			}
-
-			return cmdMap && subMap
-				? A4(onEffects, router, value.i, value.j, state)
-				: A3(onEffects, router, cmdMap ? value.i : value.j, state);
-		}));
-	}
-
-	return router.h = _Scheduler_rawSpawn(A2(_Scheduler_andThen, loop, info.b));
-}
-
-
-
-// ROUTING
-
-
-var _Platform_sendToApp = F2(function(router, msg)
-{
-	return _Scheduler_binding(function(callback)
-	{
-		router.g(msg);
-		callback(_Scheduler_succeed(_Utils_Tuple0));
-	});
-});
-
-
-var _Platform_sendToSelf = F2(function(router, msg)
-{
-	return A2(_Scheduler_send, router.h, {
-		$: 0,
-		a: msg
-	});
-});
-
-
-
-// BAGS
-
-
-function _Platform_leaf(home)
-{
-	return function(value)
-	{
-		return {
-			$: 1,
-			k: home,
-			l: value
-		};
-	};
-}
-
-
-function _Platform_batch(list)
-{
-	return {
-		$: 2,
-		m: list
-	};
-}
-
-
-var _Platform_map = F2(function(tagger, bag)
-{
-	return {
-		$: 3,
-		n: tagger,
-		o: bag
-	}
-});
-
-
-
-// PIPE BAGS INTO EFFECT MANAGERS
-//
-// Effects must be queued!
-//
-// Say your init contains a synchronous command, like Time.now or Time.here
-//
-//   - This will produce a batch of effects (FX_1)
-//   - The synchronous task triggers the subsequent `update` call
-//   - This will produce a batch of effects (FX_2)
-//
-// If we just start dispatching FX_2, subscriptions from FX_2 can be processed
-// before subscriptions from FX_1. No good! Earlier versions of this code had
-// this problem, leading to these reports:
-//
-//   https://github.com/elm/core/issues/980
-//   https://github.com/elm/core/pull/981
-//   https://github.com/elm/compiler/issues/1776
-//
-// The queue is necessary to avoid ordering issues for synchronous commands.
-
-
-// Why use true/false here? Why not just check the length of the queue?
-// The goal is to detect "are we currently dispatching effects?" If we
-// are, we need to bail and let the ongoing while loop handle things.
-//
-// Now say the queue has 1 element. When we dequeue the final element,
-// the queue will be empty, but we are still actively dispatching effects.
-// So you could get queue jumping in a really tricky category of cases.
-//
-var _Platform_effectsQueue = [];
-var _Platform_effectsActive = false;
-
-
-function _Platform_enqueueEffects(managers, cmdBag, subBag)
-{
-	_Platform_effectsQueue.push({ p: managers, q: cmdBag, r: subBag });
-
-	if (_Platform_effectsActive) return;
-
-	_Platform_effectsActive = true;
-	for (var fx; fx = _Platform_effectsQueue.shift(); )
-	{
-		_Platform_dispatchEffects(fx.p, fx.q, fx.r);
-	}
-	_Platform_effectsActive = false;
-}
-
-
-function _Platform_dispatchEffects(managers, cmdBag, subBag)
-{
-	var effectsDict = {};
-	_Platform_gatherEffects(true, cmdBag, effectsDict, null);
-	_Platform_gatherEffects(false, subBag, effectsDict, null);
-
-	for (var home in managers)
-	{
-		_Scheduler_rawSend(managers[home], {
-			$: 'fx',
-			a: effectsDict[home] || { i: _List_Nil, j: _List_Nil }
-		});
-	}
-}
-
-
-function _Platform_gatherEffects(isCmd, bag, effectsDict, taggers)
-{
-	switch (bag.$)
-	{
-		case 1:
-			var home = bag.k;
-			var effect = _Platform_toEffect(isCmd, home, taggers, bag.l);
-			effectsDict[home] = _Platform_insert(isCmd, effect, effectsDict[home]);
-			return;
-
-		case 2:
-			for (var list = bag.m; list.b; list = list.b) // WHILE_CONS
-			{
-				_Platform_gatherEffects(isCmd, list.a, effectsDict, taggers);
-			}
-			return;
-
-		case 3:
-			_Platform_gatherEffects(isCmd, bag.o, effectsDict, {
-				s: bag.n,
-				t: taggers
-			});
-			return;
-	}
-}
-
-
-function _Platform_toEffect(isCmd, home, taggers, value)
-{
-	function applyTaggers(x)
-	{
-		for (var temp = taggers; temp; temp = temp.t)
-		{
-			x = temp.s(x);
-		}
-		return x;
-	}
-
-	var map = isCmd
-		? _Platform_effectManagers[home].e
-		: _Platform_effectManagers[home].f;
-
-	return A2(map, applyTaggers, value)
-}
-
-
-function _Platform_insert(isCmd, newEffect, effects)
-{
-	effects = effects || { i: _List_Nil, j: _List_Nil };
-
-	isCmd
-		? (effects.i = _List_Cons(newEffect, effects.i))
-		: (effects.j = _List_Cons(newEffect, effects.j));
-
-	return effects;
-}
-
-
-
-// PORTS
-
-
-function _Platform_checkPortName(name)
-{
-	if (_Platform_effectManagers[name])
-	{
-		_Debug_crash(3, name)
-	}
-}
-
-
-
-// OUTGOING PORTS
-
-
-function _Platform_outgoingPort(name, converter)
-{
-	_Platform_checkPortName(name);
-	_Platform_effectManagers[name] = {
-		e: _Platform_outgoingPortMap,
-		u: converter,
-		a: _Platform_setupOutgoingPort
-	};
-	return _Platform_leaf(name);
-}
-
-
-var _Platform_outgoingPortMap = F2(function(tagger, value) { return value; });
-
-
-function _Platform_setupOutgoingPort(name)
-{
-	var subs = [];
-	var converter = _Platform_effectManagers[name].u;
-
-	// CREATE MANAGER
-
-	var init = _Process_sleep(0);
-
-	_Platform_effectManagers[name].b = init;
-	_Platform_effectManagers[name].c = F3(function(router, cmdList, state)
-	{
-		for ( ; cmdList.b; cmdList = cmdList.b) // WHILE_CONS
-		{
-			// grab a separate reference to subs in case unsubscribe is called
-			var currentSubs = subs;
-			var value = _Json_unwrap(converter(cmdList.a));
-			for (var i = 0; i < currentSubs.length; i++)
-			{
-				currentSubs[i](value);
-			}
-		}
-		return init;
-	});
-
-	// PUBLIC API
-
-	function subscribe(callback)
-	{
-		subs.push(callback);
-	}
-
-	function unsubscribe(callback)
-	{
-		// copy subs into a new array in case unsubscribe is called within a
-		// subscribed callback
-		subs = subs.slice();
-		var index = subs.indexOf(callback);
-		if (index >= 0)
-		{
-			subs.splice(index, 1);
-		}
-	}
-
-	return {
-		subscribe: subscribe,
-		unsubscribe: unsubscribe
-	};
-}
-
-
-
-// INCOMING PORTS
-
-
-function _Platform_incomingPort(name, converter)
-{
-	_Platform_checkPortName(name);
-	_Platform_effectManagers[name] = {
-		f: _Platform_incomingPortMap,
-		u: converter,
-		a: _Platform_setupIncomingPort
-	};
-	return _Platform_leaf(name);
-}
-
-
-var _Platform_incomingPortMap = F2(function(tagger, finalTagger)
-{
-	return function(value)
-	{
-		return tagger(finalTagger(value));
-	};
-});
-
-
-function _Platform_setupIncomingPort(name, sendToApp)
-{
-	var subs = _List_Nil;
-	var converter = _Platform_effectManagers[name].u;
-
-	// CREATE MANAGER
-
-	var init = _Scheduler_succeed(null);
-
-	_Platform_effectManagers[name].b = init;
-	_Platform_effectManagers[name].c = F3(function(router, subList, state)
-	{
-		subs = subList;
-		return init;
-	});
-
-	// PUBLIC API
-
-	function send(incomingValue)
-	{
-		var result = A2(_Json_run, converter, _Json_wrap(incomingValue));
-
-		$elm$core$Result$isOk(result) || _Debug_crash(4, name, result.a);
-
-		var value = result.a;
-		for (var temp = subs; temp.b; temp = temp.b) // WHILE_CONS
-		{
-			sendToApp(temp.a(value));
-		}
-	}
-
-	return { send: send };
-}
-
-
-
-// EXPORT ELM MODULES
-//
-// Have DEBUG and PROD versions so that we can (1) give nicer errors in
-// debug mode and (2) not pay for the bits needed for that in prod mode.
-//
-
-
-function _Platform_export_UNUSED(exports)
-{
-	scope['Elm']
-		? _Platform_mergeExportsProd(scope['Elm'], exports)
-		: scope['Elm'] = exports;
-}
-
-
-function _Platform_mergeExportsProd(obj, exports)
-{
-	for (var name in exports)
-	{
-		(name in obj)
-			? (name == 'init')
-				? _Debug_crash(6)
-				: _Platform_mergeExportsProd(obj[name], exports[name])
-			: (obj[name] = exports[name]);
-	}
-}
-
-
-function _Platform_export(exports)
-{
-	scope['Elm']
-		? _Platform_mergeExportsDebug('Elm', scope['Elm'], exports)
-		: scope['Elm'] = exports;
-}
-
-
-function _Platform_mergeExportsDebug(moduleName, obj, exports)
-{
-	for (var name in exports)
-	{
-		(name in obj)
-			? (name == 'init')
-				? _Debug_crash(6, moduleName)
-				: _Platform_mergeExportsDebug(moduleName + '.' + name, obj[name], exports[name])
-			: (obj[name] = exports[name]);
-	}
-}
-
-
-
-
-// HELPERS
-
-
-var _VirtualDom_divertHrefToApp;
-
-var _VirtualDom_doc = typeof document !== 'undefined' ? document : {};
-
-
-function _VirtualDom_appendChild(parent, child)
-{
-	parent.appendChild(child);
-}
-
-var _VirtualDom_init = F4(function(virtualNode, flagDecoder, debugMetadata, args)
-{
-	// NOTE: this function needs _Platform_export available to work
-
-	/**_UNUSED/
-	var node = args['node'];
-	//*/
-	/**/
-	var node = args && args['node'] ? args['node'] : _Debug_crash(0);
-	//*/
-
-	node.parentNode.replaceChild(
-		_VirtualDom_render(virtualNode, function() {}),
-		node
-	);
-
-	return {};
-});
-
-
-
-// TEXT
-
-
-function _VirtualDom_text(string)
-{
-	return {
-		$: 0,
-		a: string
-	};
-}
-
-
-
-// NODE
-
-
-var _VirtualDom_nodeNS = F2(function(namespace, tag)
-{
-	return F2(function(factList, kidList)
-	{
-		for (var kids = [], descendantsCount = 0; kidList.b; kidList = kidList.b) // WHILE_CONS
-		{
-			var kid = kidList.a;
-			descendantsCount += (kid.b || 0);
-			kids.push(kid);
-		}
-		descendantsCount += kids.length;
-
-		return {
-			$: 1,
-			c: tag,
-			d: _VirtualDom_organizeFacts(factList),
-			e: kids,
-			f: namespace,
-			b: descendantsCount
-		};
-	});
-});
-
-
-var _VirtualDom_node = _VirtualDom_nodeNS(undefined);
-
-
-
-// KEYED NODE
-
-
-var _VirtualDom_keyedNodeNS = F2(function(namespace, tag)
-{
-	return F2(function(factList, kidList)
-	{
-		for (var kids = [], descendantsCount = 0; kidList.b; kidList = kidList.b) // WHILE_CONS
-		{
-			var kid = kidList.a;
-			descendantsCount += (kid.b.b || 0);
-			kids.push(kid);
-		}
-		descendantsCount += kids.length;
-
-		return {
-			$: 2,
-			c: tag,
-			d: _VirtualDom_organizeFacts(factList),
-			e: kids,
-			f: namespace,
-			b: descendantsCount
-		};
-	});
-});
-
-
-var _VirtualDom_keyedNode = _VirtualDom_keyedNodeNS(undefined);
-
-
-
-// CUSTOM
-
-
-function _VirtualDom_custom(factList, model, render, diff)
-{
-	return {
-		$: 3,
-		d: _VirtualDom_organizeFacts(factList),
-		g: model,
-		h: render,
-		i: diff
-	};
-}
-
-
-
-// MAP
-
-
-var _VirtualDom_map = F2(function(tagger, node)
-{
-	return {
-		$: 4,
-		j: tagger,
-		k: node,
-		b: 1 + (node.b || 0)
-	};
-});
-
-
-
-// LAZY
-
-
-function _VirtualDom_thunk(refs, thunk)
-{
-	return {
-		$: 5,
-		l: refs,
-		m: thunk,
-		k: undefined
-	};
-}
-
-var _VirtualDom_lazy = F2(function(func, a)
-{
-	return _VirtualDom_thunk([func, a], function() {
-		return func(a);
-	});
-});
-
-var _VirtualDom_lazy2 = F3(function(func, a, b)
-{
-	return _VirtualDom_thunk([func, a, b], function() {
-		return A2(func, a, b);
-	});
-});
-
-var _VirtualDom_lazy3 = F4(function(func, a, b, c)
-{
-	return _VirtualDom_thunk([func, a, b, c], function() {
-		return A3(func, a, b, c);
-	});
-});
-
-var _VirtualDom_lazy4 = F5(function(func, a, b, c, d)
-{
-	return _VirtualDom_thunk([func, a, b, c, d], function() {
-		return A4(func, a, b, c, d);
-	});
-});
-
-var _VirtualDom_lazy5 = F6(function(func, a, b, c, d, e)
-{
-	return _VirtualDom_thunk([func, a, b, c, d, e], function() {
-		return A5(func, a, b, c, d, e);
-	});
-});
-
-var _VirtualDom_lazy6 = F7(function(func, a, b, c, d, e, f)
-{
-	return _VirtualDom_thunk([func, a, b, c, d, e, f], function() {
-		return A6(func, a, b, c, d, e, f);
-	});
-});
-
-var _VirtualDom_lazy7 = F8(function(func, a, b, c, d, e, f, g)
-{
-	return _VirtualDom_thunk([func, a, b, c, d, e, f, g], function() {
-		return A7(func, a, b, c, d, e, f, g);
-	});
-});
-
-var _VirtualDom_lazy8 = F9(function(func, a, b, c, d, e, f, g, h)
-{
-	return _VirtualDom_thunk([func, a, b, c, d, e, f, g, h], function() {
-		return A8(func, a, b, c, d, e, f, g, h);
-	});
-});
-
-
-
-// FACTS
-
-
-var _VirtualDom_on = F2(function(key, handler)
-{
-	return {
-		$: 'a0',
-		n: key,
-		o: handler
-	};
-});
-var _VirtualDom_style = F2(function(key, value)
-{
-	return {
-		$: 'a1',
-		n: key,
-		o: value
-	};
-});
-var _VirtualDom_property = F2(function(key, value)
-{
-	return {
-		$: 'a2',
-		n: key,
-		o: value
-	};
-});
-var _VirtualDom_attribute = F2(function(key, value)
-{
-	return {
-		$: 'a3',
-		n: key,
-		o: value
-	};
-});
-var _VirtualDom_attributeNS = F3(function(namespace, key, value)
-{
-	return {
-		$: 'a4',
-		n: key,
-		o: { f: namespace, o: value }
-	};
-});
-
-
-
-// XSS ATTACK VECTOR CHECKS
-//
-// For some reason, tabs can appear in href protocols and it still works.
-// So '\tjava\tSCRIPT:alert("!!!")' and 'javascript:alert("!!!")' are the same
-// in practice. That is why _VirtualDom_RE_js and _VirtualDom_RE_js_html look
-// so freaky.
-//
-// Pulling the regular expressions out to the top level gives a slight speed
-// boost in small benchmarks (4-10%) but hoisting values to reduce allocation
-// can be unpredictable in large programs where JIT may have a harder time with
-// functions are not fully self-contained. The benefit is more that the js and
-// js_html ones are so weird that I prefer to see them near each other.
-
-
-var _VirtualDom_RE_script = /^script$/i;
-var _VirtualDom_RE_on_formAction = /^(on|formAction$)/i;
-var _VirtualDom_RE_js = /^\s*j\s*a\s*v\s*a\s*s\s*c\s*r\s*i\s*p\s*t\s*:/i;
-var _VirtualDom_RE_js_html = /^\s*(j\s*a\s*v\s*a\s*s\s*c\s*r\s*i\s*p\s*t\s*:|d\s*a\s*t\s*a\s*:\s*t\s*e\s*x\s*t\s*\/\s*h\s*t\s*m\s*l\s*(,|;))/i;
-
-
-function _VirtualDom_noScript(tag)
-{
-	return _VirtualDom_RE_script.test(tag) ? 'p' : tag;
-}
-
-function _VirtualDom_noOnOrFormAction(key)
-{
-	return _VirtualDom_RE_on_formAction.test(key) ? 'data-' + key : key;
-}
-
-function _VirtualDom_noInnerHtmlOrFormAction(key)
-{
-	return key == 'innerHTML' || key == 'formAction' ? 'data-' + key : key;
-}
-
-function _VirtualDom_noJavaScriptUri(value)
-{
-	return _VirtualDom_RE_js.test(value)
-		? /**_UNUSED/''//*//**/'javascript:alert("This is an XSS vector. Please use ports or web components instead.")'//*/
-		: value;
-}
-
-function _VirtualDom_noJavaScriptOrHtmlUri(value)
-{
-	return _VirtualDom_RE_js_html.test(value)
-		? /**_UNUSED/''//*//**/'javascript:alert("This is an XSS vector. Please use ports or web components instead.")'//*/
-		: value;
-}
-
-function _VirtualDom_noJavaScriptOrHtmlJson(value)
-{
-	return (typeof _Json_unwrap(value) === 'string' && _VirtualDom_RE_js_html.test(_Json_unwrap(value)))
-		? _Json_wrap(
-			/**_UNUSED/''//*//**/'javascript:alert("This is an XSS vector. Please use ports or web components instead.")'//*/
-		) : value;
-}
-
-
-
-// MAP FACTS
-
-
-var _VirtualDom_mapAttribute = F2(function(func, attr)
-{
-	return (attr.$ === 'a0')
-		? A2(_VirtualDom_on, attr.n, _VirtualDom_mapHandler(func, attr.o))
-		: attr;
-});
-
-function _VirtualDom_mapHandler(func, handler)
-{
-	var tag = $elm$virtual_dom$VirtualDom$toHandlerInt(handler);
-
-	// 0 = Normal
-	// 1 = MayStopPropagation
-	// 2 = MayPreventDefault
-	// 3 = Custom
-
-	return {
-		$: handler.$,
-		a:
-			!tag
-				? A2($elm$json$Json$Decode$map, func, handler.a)
-				:
-			A3($elm$json$Json$Decode$map2,
-				tag < 3
-					? _VirtualDom_mapEventTuple
-					: _VirtualDom_mapEventRecord,
-				$elm$json$Json$Decode$succeed(func),
-				handler.a
-			)
-	};
-}
-
-var _VirtualDom_mapEventTuple = F2(function(func, tuple)
-{
-	return _Utils_Tuple2(func(tuple.a), tuple.b);
-});
-
-var _VirtualDom_mapEventRecord = F2(function(func, record)
-{
-	return {
-		message: func(record.message),
-		stopPropagation: record.stopPropagation,
-		preventDefault: record.preventDefault
-	}
-});
-
-
-
-// ORGANIZE FACTS
-
-
-function _VirtualDom_organizeFacts(factList)
-{
-	for (var facts = {}; factList.b; factList = factList.b) // WHILE_CONS
-	{
-		var entry = factList.a;
-
-		var tag = entry.$;
-		var key = entry.n;
-		var value = entry.o;
-
-		if (tag === 'a2')
-		{
-			(key === 'className')
-				? _VirtualDom_addClass(facts, key, _Json_unwrap(value))
-				: facts[key] = _Json_unwrap(value);
-
-			continue;
-		}
-
-		var subFacts = facts[tag] || (facts[tag] = {});
-		(tag === 'a3' && key === 'class')
-			? _VirtualDom_addClass(subFacts, key, value)
-			: subFacts[key] = value;
-	}
-
-	return facts;
-}
-
-function _VirtualDom_addClass(object, key, newClass)
-{
-	var classes = object[key];
-	object[key] = classes ? classes + ' ' + newClass : newClass;
-}
-
-
-
-// RENDER
-
-
-function _VirtualDom_render(vNode, eventNode)
-{
-	var tag = vNode.$;
-
-	if (tag === 5)
-	{
-		return _VirtualDom_render(vNode.k || (vNode.k = vNode.m()), eventNode);
-	}
-
-	if (tag === 0)
-	{
-		return _VirtualDom_doc.createTextNode(vNode.a);
-	}
-
-	if (tag === 4)
-	{
-		var subNode = vNode.k;
-		var tagger = vNode.j;
-
-		while (subNode.$ === 4)
-		{
-			typeof tagger !== 'object'
-				? tagger = [tagger, subNode.j]
-				: tagger.push(subNode.j);
-
-			subNode = subNode.k;
-		}
-
-		var subEventRoot = { j: tagger, p: eventNode };
-		var domNode = _VirtualDom_render(subNode, subEventRoot);
-		domNode.elm_event_node_ref = subEventRoot;
-		return domNode;
-	}
-
-	if (tag === 3)
-	{
-		var domNode = vNode.h(vNode.g);
-		_VirtualDom_applyFacts(domNode, eventNode, vNode.d);
-		return domNode;
-	}
-
-	// at this point `tag` must be 1 or 2
-
-	var domNode = vNode.f
-		? _VirtualDom_doc.createElementNS(vNode.f, vNode.c)
-		: _VirtualDom_doc.createElement(vNode.c);
-
-	if (_VirtualDom_divertHrefToApp && vNode.c == 'a')
-	{
-		domNode.addEventListener('click', _VirtualDom_divertHrefToApp(domNode));
-	}
-
-	_VirtualDom_applyFacts(domNode, eventNode, vNode.d);
-
-	for (var kids = vNode.e, i = 0; i < kids.length; i++)
-	{
-		_VirtualDom_appendChild(domNode, _VirtualDom_render(tag === 1 ? kids[i] : kids[i].b, eventNode));
-	}
-
-	return domNode;
-}
-
-
-
-// APPLY FACTS
-
-
-function _VirtualDom_applyFacts(domNode, eventNode, facts)
-{
-	for (var key in facts)
-	{
-		var value = facts[key];
-
-		key === 'a1'
-			? _VirtualDom_applyStyles(domNode, value)
-			:
-		key === 'a0'
-			? _VirtualDom_applyEvents(domNode, eventNode, value)
-			:
-		key === 'a3'
-			? _VirtualDom_applyAttrs(domNode, value)
-			:
-		key === 'a4'
-			? _VirtualDom_applyAttrsNS(domNode, value)
-			:
-		((key !== 'value' && key !== 'checked') || domNode[key] !== value) && (domNode[key] = value);
-	}
-}
-
-
-
-// APPLY STYLES
-
-
-function _VirtualDom_applyStyles(domNode, styles)
-{
-	var domNodeStyle = domNode.style;
-
-	for (var key in styles)
-	{
-		domNodeStyle[key] = styles[key];
-	}
-}
-
-
-
-// APPLY ATTRS
-
-
-function _VirtualDom_applyAttrs(domNode, attrs)
-{
-	for (var key in attrs)
-	{
-		var value = attrs[key];
-		typeof value !== 'undefined'
-			? domNode.setAttribute(key, value)
-			: domNode.removeAttribute(key);
-	}
-}
-
-
-
-// APPLY NAMESPACED ATTRS
-
-
-function _VirtualDom_applyAttrsNS(domNode, nsAttrs)
-{
-	for (var key in nsAttrs)
-	{
-		var pair = nsAttrs[key];
-		var namespace = pair.f;
-		var value = pair.o;
-
-		typeof value !== 'undefined'
-			? domNode.setAttributeNS(namespace, key, value)
-			: domNode.removeAttributeNS(namespace, key);
-	}
-}
-
-
-
-// APPLY EVENTS
-
-
-function _VirtualDom_applyEvents(domNode, eventNode, events)
-{
-	var allCallbacks = domNode.elmFs || (domNode.elmFs = {});
-
-	for (var key in events)
-	{
-		var newHandler = events[key];
-		var oldCallback = allCallbacks[key];
-
-		if (!newHandler)
-		{
-			domNode.removeEventListener(key, oldCallback);
-			allCallbacks[key] = undefined;
-			continue;
-		}
-
-		if (oldCallback)
-		{
-			var oldHandler = oldCallback.q;
-			if (oldHandler.$ === newHandler.$)
-			{
-				oldCallback.q = newHandler;
-				continue;
-			}
-			domNode.removeEventListener(key, oldCallback);
-		}
-
-		oldCallback = _VirtualDom_makeCallback(eventNode, newHandler);
-		domNode.addEventListener(key, oldCallback,
-			_VirtualDom_passiveSupported
-			&& { passive: $elm$virtual_dom$VirtualDom$toHandlerInt(newHandler) < 2 }
-		);
-		allCallbacks[key] = oldCallback;
-	}
-}
-
-
-
-// PASSIVE EVENTS
-
-
-var _VirtualDom_passiveSupported;
-
-try
-{
-	window.addEventListener('t', null, Object.defineProperty({}, 'passive', {
-		get: function() { _VirtualDom_passiveSupported = true; }
-	}));
-}
-catch(e) {}
-
-
-
-// EVENT HANDLERS
-
-
-function _VirtualDom_makeCallback(eventNode, initialHandler)
-{
-	function callback(event)
-	{
-		var handler = callback.q;
-		var result = _Json_runHelp(handler.a, event);
-
-		if (!$elm$core$Result$isOk(result))
-		{
-			return;
-		}
-
-		var tag = $elm$virtual_dom$VirtualDom$toHandlerInt(handler);
-
-		// 0 = Normal
-		// 1 = MayStopPropagation
-		// 2 = MayPreventDefault
-		// 3 = Custom
-
-		var value = result.a;
-		var message = !tag ? value : tag < 3 ? value.a : value.message;
-		var stopPropagation = tag == 1 ? value.b : tag == 3 && value.stopPropagation;
-		var currentEventNode = (
-			stopPropagation && event.stopPropagation(),
-			(tag == 2 ? value.b : tag == 3 && value.preventDefault) && event.preventDefault(),
-			eventNode
-		);
-		var tagger;
-		var i;
-		while (tagger = currentEventNode.j)
-		{
-			if (typeof tagger == 'function')
-			{
-				message = tagger(message);
-			}
-			else
-			{
-				for (var i = tagger.length; i--; )
-				{
-					message = tagger[i](message);
-				}
-			}
-			currentEventNode = currentEventNode.p;
-		}
-		currentEventNode(message, stopPropagation); // stopPropagation implies isSync
-	}
-
-	callback.q = initialHandler;
-
-	return callback;
-}
-
-function _VirtualDom_equalEvents(x, y)
-{
-	return x.$ == y.$ && _Json_equality(x.a, y.a);
-}
-
-
-
-// DIFF
-
-
-// TODO: Should we do patches like in iOS?
-//
-// type Patch
-//   = At Int Patch
-//   | Batch (List Patch)
-//   | Change ...
-//
-// How could it not be better?
-//
-function _VirtualDom_diff(x, y)
-{
-	var patches = [];
-	_VirtualDom_diffHelp(x, y, patches, 0);
-	return patches;
-}
-
-
-function _VirtualDom_pushPatch(patches, type, index, data)
-{
-	var patch = {
-		$: type,
-		r: index,
-		s: data,
-		t: undefined,
-		u: undefined
-	};
-	patches.push(patch);
-	return patch;
-}
-
-
-function _VirtualDom_diffHelp(x, y, patches, index)
-{
-	if (x === y)
-	{
-		return;
-	}
-
-	var xType = x.$;
-	var yType = y.$;
-
-	// Bail if you run into different types of nodes. Implies that the
-	// structure has changed significantly and it's not worth a diff.
-	if (xType !== yType)
-	{
-		if (xType === 1 && yType === 2)
-		{
-			y = _VirtualDom_dekey(y);
-			yType = 1;
-		}
-		else
-		{
-			_VirtualDom_pushPatch(patches, 0, index, y);
-			return;
-		}
-	}
-
-	// Now we know that both nodes are the same $.
-	switch (yType)
-	{
-		case 5:
-			var xRefs = x.l;
-			var yRefs = y.l;
-			var i = xRefs.length;
-			var same = i === yRefs.length;
-			while (same && i--)
-			{
-				same = xRefs[i] === yRefs[i];
-			}
-			if (same)
-			{
-				y.k = x.k;
-				return;
-			}
-			y.k = y.m();
-			var subPatches = [];
-			_VirtualDom_diffHelp(x.k, y.k, subPatches, 0);
-			subPatches.length > 0 && _VirtualDom_pushPatch(patches, 1, index, subPatches);
-			return;
-
-		case 4:
-			// gather nested taggers
-			var xTaggers = x.j;
-			var yTaggers = y.j;
-			var nesting = false;
-
-			var xSubNode = x.k;
-			while (xSubNode.$ === 4)
-			{
-				nesting = true;
-
-				typeof xTaggers !== 'object'
-					? xTaggers = [xTaggers, xSubNode.j]
-					: xTaggers.push(xSubNode.j);
-
-				xSubNode = xSubNode.k;
-			}
-
-			var ySubNode = y.k;
-			while (ySubNode.$ === 4)
-			{
-				nesting = true;
-
-				typeof yTaggers !== 'object'
-					? yTaggers = [yTaggers, ySubNode.j]
-					: yTaggers.push(ySubNode.j);
-
-				ySubNode = ySubNode.k;
-			}
-
-			// Just bail if different numbers of taggers. This implies the
-			// structure of the virtual DOM has changed.
-			if (nesting && xTaggers.length !== yTaggers.length)
-			{
-				_VirtualDom_pushPatch(patches, 0, index, y);
-				return;
-			}
-
-			// check if taggers are "the same"
-			if (nesting ? !_VirtualDom_pairwiseRefEqual(xTaggers, yTaggers) : xTaggers !== yTaggers)
-			{
-				_VirtualDom_pushPatch(patches, 2, index, yTaggers);
-			}
-
-			// diff everything below the taggers
-			_VirtualDom_diffHelp(xSubNode, ySubNode, patches, index + 1);
-			return;
-
-		case 0:
-			if (x.a !== y.a)
-			{
-				_VirtualDom_pushPatch(patches, 3, index, y.a);
-			}
-			return;
-
-		case 1:
-			_VirtualDom_diffNodes(x, y, patches, index, _VirtualDom_diffKids);
-			return;
-
-		case 2:
-			_VirtualDom_diffNodes(x, y, patches, index, _VirtualDom_diffKeyedKids);
-			return;
-
-		case 3:
-			if (x.h !== y.h)
-			{
-				_VirtualDom_pushPatch(patches, 0, index, y);
-				return;
-			}
-
-			var factsDiff = _VirtualDom_diffFacts(x.d, y.d);
-			factsDiff && _VirtualDom_pushPatch(patches, 4, index, factsDiff);
-
-			var patch = y.i(x.g, y.g);
-			patch && _VirtualDom_pushPatch(patches, 5, index, patch);
-
-			return;
-	}
-}
-
-// assumes the incoming arrays are the same length
-function _VirtualDom_pairwiseRefEqual(as, bs)
-{
-	for (var i = 0; i < as.length; i++)
-	{
-		if (as[i] !== bs[i])
-		{
-			return false;
-		}
-	}
-
-	return true;
-}
-
-function _VirtualDom_diffNodes(x, y, patches, index, diffKids)
-{
-	// Bail if obvious indicators have changed. Implies more serious
-	// structural changes such that it's not worth it to diff.
-	if (x.c !== y.c || x.f !== y.f)
-	{
-		_VirtualDom_pushPatch(patches, 0, index, y);
-		return;
-	}
-
-	var factsDiff = _VirtualDom_diffFacts(x.d, y.d);
-	factsDiff && _VirtualDom_pushPatch(patches, 4, index, factsDiff);
-
-	diffKids(x, y, patches, index);
-}
-
-
-
-// DIFF FACTS
-
-
-// TODO Instead of creating a new diff object, it's possible to just test if
-// there *is* a diff. During the actual patch, do the diff again and make the
-// modifications directly. This way, there's no new allocations. Worth it?
-function _VirtualDom_diffFacts(x, y, category)
-{
-	var diff;
-
-	// look for changes and removals
-	for (var xKey in x)
-	{
-		if (xKey === 'a1' || xKey === 'a0' || xKey === 'a3' || xKey === 'a4')
-		{
-			var subDiff = _VirtualDom_diffFacts(x[xKey], y[xKey] || {}, xKey);
-			if (subDiff)
-			{
-				diff = diff || {};
-				diff[xKey] = subDiff;
-			}
-			continue;
-		}
-
-		// remove if not in the new facts
-		if (!(xKey in y))
-		{
-			diff = diff || {};
-			diff[xKey] =
-				!category
-					? (typeof x[xKey] === 'string' ? '' : null)
-					:
-				(category === 'a1')
-					? ''
-					:
-				(category === 'a0' || category === 'a3')
-					? undefined
-					:
-				{ f: x[xKey].f, o: undefined };
-
-			continue;
-		}
-
-		var xValue = x[xKey];
-		var yValue = y[xKey];
-
-		// reference equal, so don't worry about it
-		if (xValue === yValue && xKey !== 'value' && xKey !== 'checked'
-			|| category === 'a0' && _VirtualDom_equalEvents(xValue, yValue))
-		{
-			continue;
-		}
-
-		diff = diff || {};
-		diff[xKey] = yValue;
-	}
-
-	// add new stuff
-	for (var yKey in y)
-	{
-		if (!(yKey in x))
-		{
-			diff = diff || {};
-			diff[yKey] = y[yKey];
-		}
-	}
-
-	return diff;
-}
-
-
-
-// DIFF KIDS
-
-
-function _VirtualDom_diffKids(xParent, yParent, patches, index)
-{
-	var xKids = xParent.e;
-	var yKids = yParent.e;
-
-	var xLen = xKids.length;
-	var yLen = yKids.length;
-
-	// FIGURE OUT IF THERE ARE INSERTS OR REMOVALS
-
-	if (xLen > yLen)
-	{
-		_VirtualDom_pushPatch(patches, 6, index, {
-			v: yLen,
-			i: xLen - yLen
-		});
-	}
-	else if (xLen < yLen)
-	{
-		_VirtualDom_pushPatch(patches, 7, index, {
-			v: xLen,
-			e: yKids
-		});
-	}
-
-	// PAIRWISE DIFF EVERYTHING ELSE
-
-	for (var minLen = xLen < yLen ? xLen : yLen, i = 0; i < minLen; i++)
-	{
-		var xKid = xKids[i];
-		_VirtualDom_diffHelp(xKid, yKids[i], patches, ++index);
-		index += xKid.b || 0;
-	}
-}
-
-
-
-// KEYED DIFF
-
-
-function _VirtualDom_diffKeyedKids(xParent, yParent, patches, rootIndex)
-{
-	var localPatches = [];
-
-	var changes = {}; // Dict String Entry
-	var inserts = []; // Array { index : Int, entry : Entry }
-	// type Entry = { tag : String, vnode : VNode, index : Int, data : _ }
-
-	var xKids = xParent.e;
-	var yKids = yParent.e;
-	var xLen = xKids.length;
-	var yLen = yKids.length;
-	var xIndex = 0;
-	var yIndex = 0;
-
-	var index = rootIndex;
-
-	while (xIndex < xLen && yIndex < yLen)
-	{
-		var x = xKids[xIndex];
-		var y = yKids[yIndex];
-
-		var xKey = x.a;
-		var yKey = y.a;
-		var xNode = x.b;
-		var yNode = y.b;
-
-		var newMatch = undefined;
-		var oldMatch = undefined;
-
-		// check if keys match
-
-		if (xKey === yKey)
-		{
-			index++;
-			_VirtualDom_diffHelp(xNode, yNode, localPatches, index);
-			index += xNode.b || 0;
-
-			xIndex++;
-			yIndex++;
-			continue;
-		}
-
-		// look ahead 1 to detect insertions and removals.
-
-		var xNext = xKids[xIndex + 1];
-		var yNext = yKids[yIndex + 1];
-
-		if (xNext)
-		{
-			var xNextKey = xNext.a;
-			var xNextNode = xNext.b;
-			oldMatch = yKey === xNextKey;
-		}
-
-		if (yNext)
-		{
-			var yNextKey = yNext.a;
-			var yNextNode = yNext.b;
-			newMatch = xKey === yNextKey;
-		}
-
-
-		// swap x and y
-		if (newMatch && oldMatch)
-		{
-			index++;
-			_VirtualDom_diffHelp(xNode, yNextNode, localPatches, index);
-			_VirtualDom_insertNode(changes, localPatches, xKey, yNode, yIndex, inserts);
-			index += xNode.b || 0;
-
-			index++;
-			_VirtualDom_removeNode(changes, localPatches, xKey, xNextNode, index);
-			index += xNextNode.b || 0;
-
-			xIndex += 2;
-			yIndex += 2;
-			continue;
-		}
-
-		// insert y
-		if (newMatch)
-		{
-			index++;
-			_VirtualDom_insertNode(changes, localPatches, yKey, yNode, yIndex, inserts);
-			_VirtualDom_diffHelp(xNode, yNextNode, localPatches, index);
-			index += xNode.b || 0;
-
-			xIndex += 1;
-			yIndex += 2;
-			continue;
-		}
-
-		// remove x
-		if (oldMatch)
-		{
-			index++;
-			_VirtualDom_removeNode(changes, localPatches, xKey, xNode, index);
-			index += xNode.b || 0;
-
-			index++;
-			_VirtualDom_diffHelp(xNextNode, yNode, localPatches, index);
-			index += xNextNode.b || 0;
-
-			xIndex += 2;
-			yIndex += 1;
-			continue;
-		}
-
-		// remove x, insert y
-		if (xNext && xNextKey === yNextKey)
-		{
-			index++;
-			_VirtualDom_removeNode(changes, localPatches, xKey, xNode, index);
-			_VirtualDom_insertNode(changes, localPatches, yKey, yNode, yIndex, inserts);
-			index += xNode.b || 0;
-
-			index++;
-			_VirtualDom_diffHelp(xNextNode, yNextNode, localPatches, index);
-			index += xNextNode.b || 0;
-
-			xIndex += 2;
-			yIndex += 2;
-			continue;
-		}
-
-		break;
-	}
-
-	// eat up any remaining nodes with removeNode and insertNode
-
-	while (xIndex < xLen)
-	{
-		index++;
-		var x = xKids[xIndex];
-		var xNode = x.b;
-		_VirtualDom_removeNode(changes, localPatches, x.a, xNode, index);
-		index += xNode.b || 0;
-		xIndex++;
-	}
-
-	while (yIndex < yLen)
-	{
-		var endInserts = endInserts || [];
-		var y = yKids[yIndex];
-		_VirtualDom_insertNode(changes, localPatches, y.a, y.b, undefined, endInserts);
-		yIndex++;
-	}
-
-	if (localPatches.length > 0 || inserts.length > 0 || endInserts)
-	{
-		_VirtualDom_pushPatch(patches, 8, rootIndex, {
-			w: localPatches,
-			x: inserts,
-			y: endInserts
-		});
-	}
-}
-
-
-
-// CHANGES FROM KEYED DIFF
-
-
-var _VirtualDom_POSTFIX = '_elmW6BL';
-
-
-function _VirtualDom_insertNode(changes, localPatches, key, vnode, yIndex, inserts)
-{
-	var entry = changes[key];
-
-	// never seen this key before
-	if (!entry)
-	{
-		entry = {
-			c: 0,
-			z: vnode,
-			r: yIndex,
-			s: undefined
-		};
-
-		inserts.push({ r: yIndex, A: entry });
-		changes[key] = entry;
-
-		return;
-	}
-
-	// this key was removed earlier, a match!
-	if (entry.c === 1)
-	{
-		inserts.push({ r: yIndex, A: entry });
-
-		entry.c = 2;
-		var subPatches = [];
-		_VirtualDom_diffHelp(entry.z, vnode, subPatches, entry.r);
-		entry.r = yIndex;
-		entry.s.s = {
-			w: subPatches,
-			A: entry
-		};
-
-		return;
-	}
-
-	// this key has already been inserted or moved, a duplicate!
-	_VirtualDom_insertNode(changes, localPatches, key + _VirtualDom_POSTFIX, vnode, yIndex, inserts);
-}
-
-
-function _VirtualDom_removeNode(changes, localPatches, key, vnode, index)
-{
-	var entry = changes[key];
-
-	// never seen this key before
-	if (!entry)
-	{
-		var patch = _VirtualDom_pushPatch(localPatches, 9, index, undefined);
-
-		changes[key] = {
-			c: 1,
-			z: vnode,
-			r: index,
-			s: patch
-		};
-
-		return;
-	}
-
-	// this key was inserted earlier, a match!
-	if (entry.c === 0)
-	{
-		entry.c = 2;
-		var subPatches = [];
-		_VirtualDom_diffHelp(vnode, entry.z, subPatches, index);
-
-		_VirtualDom_pushPatch(localPatches, 9, index, {
-			w: subPatches,
-			A: entry
-		});
-
-		return;
-	}
-
-	// this key has already been removed or moved, a duplicate!
-	_VirtualDom_removeNode(changes, localPatches, key + _VirtualDom_POSTFIX, vnode, index);
-}
-
-
-
-// ADD DOM NODES
-//
-// Each DOM node has an "index" assigned in order of traversal. It is important
-// to minimize our crawl over the actual DOM, so these indexes (along with the
-// descendantsCount of virtual nodes) let us skip touching entire subtrees of
-// the DOM if we know there are no patches there.
-
-
-function _VirtualDom_addDomNodes(domNode, vNode, patches, eventNode)
-{
-	_VirtualDom_addDomNodesHelp(domNode, vNode, patches, 0, 0, vNode.b, eventNode);
-}
-
-
-// assumes `patches` is non-empty and indexes increase monotonically.
-function _VirtualDom_addDomNodesHelp(domNode, vNode, patches, i, low, high, eventNode)
-{
-	var patch = patches[i];
-	var index = patch.r;
-
-	while (index === low)
-	{
-		var patchType = patch.$;
-
-		if (patchType === 1)
-		{
-			_VirtualDom_addDomNodes(domNode, vNode.k, patch.s, eventNode);
-		}
-		else if (patchType === 8)
-		{
-			patch.t = domNode;
-			patch.u = eventNode;
-
-			var subPatches = patch.s.w;
-			if (subPatches.length > 0)
-			{
-				_VirtualDom_addDomNodesHelp(domNode, vNode, subPatches, 0, low, high, eventNode);
-			}
-		}
-		else if (patchType === 9)
-		{
-			patch.t = domNode;
-			patch.u = eventNode;
-
-			var data = patch.s;
-			if (data)
-			{
-				data.A.s = domNode;
-				var subPatches = data.w;
-				if (subPatches.length > 0)
-				{
-					_VirtualDom_addDomNodesHelp(domNode, vNode, subPatches, 0, low, high, eventNode);
-				}
-			}
-		}
-		else
-		{
-			patch.t = domNode;
-			patch.u = eventNode;
-		}
-
-		i++;
-
-		if (!(patch = patches[i]) || (index = patch.r) > high)
-		{
-			return i;
-		}
-	}
-
-	var tag = vNode.$;
-
-	if (tag === 4)
-	{
-		var subNode = vNode.k;
-
-		while (subNode.$ === 4)
-		{
-			subNode = subNode.k;
-		}
-
-		return _VirtualDom_addDomNodesHelp(domNode, subNode, patches, i, low + 1, high, domNode.elm_event_node_ref);
-	}
-
-	// tag must be 1 or 2 at this point
-
-	var vKids = vNode.e;
-	var childNodes = domNode.childNodes;
-	for (var j = 0; j < vKids.length; j++)
-	{
-		low++;
-		var vKid = tag === 1 ? vKids[j] : vKids[j].b;
-		var nextLow = low + (vKid.b || 0);
-		if (low <= index && index <= nextLow)
-		{
-			i = _VirtualDom_addDomNodesHelp(childNodes[j], vKid, patches, i, low, nextLow, eventNode);
-			if (!(patch = patches[i]) || (index = patch.r) > high)
-			{
-				return i;
-			}
-		}
-		low = nextLow;
-	}
-	return i;
-}
-
-
-
-// APPLY PATCHES
-
-
-function _VirtualDom_applyPatches(rootDomNode, oldVirtualNode, patches, eventNode)
-{
-	if (patches.length === 0)
-	{
-		return rootDomNode;
-	}
-
-	_VirtualDom_addDomNodes(rootDomNode, oldVirtualNode, patches, eventNode);
-	return _VirtualDom_applyPatchesHelp(rootDomNode, patches);
-}
-
-function _VirtualDom_applyPatchesHelp(rootDomNode, patches)
-{
-	for (var i = 0; i < patches.length; i++)
-	{
-		var patch = patches[i];
-		var localDomNode = patch.t
-		var newNode = _VirtualDom_applyPatch(localDomNode, patch);
-		if (localDomNode === rootDomNode)
-		{
-			rootDomNode = newNode;
-		}
-	}
-	return rootDomNode;
-}
-
-function _VirtualDom_applyPatch(domNode, patch)
-{
-	switch (patch.$)
-	{
-		case 0:
-			return _VirtualDom_applyPatchRedraw(domNode, patch.s, patch.u);
-
-		case 4:
-			_VirtualDom_applyFacts(domNode, patch.u, patch.s);
-			return domNode;
-
-		case 3:
-			domNode.replaceData(0, domNode.length, patch.s);
-			return domNode;
-
-		case 1:
-			return _VirtualDom_applyPatchesHelp(domNode, patch.s);
-
-		case 2:
-			if (domNode.elm_event_node_ref)
-			{
-				domNode.elm_event_node_ref.j = patch.s;
-			}
-			else
-			{
-				domNode.elm_event_node_ref = { j: patch.s, p: patch.u };
-			}
-			return domNode;
-
-		case 6:
-			var data = patch.s;
-			for (var i = 0; i < data.i; i++)
-			{
-				domNode.removeChild(domNode.childNodes[data.v]);
-			}
-			return domNode;
-
-		case 7:
-			var data = patch.s;
-			var kids = data.e;
-			var i = data.v;
-			var theEnd = domNode.childNodes[i];
-			for (; i < kids.length; i++)
-			{
-				domNode.insertBefore(_VirtualDom_render(kids[i], patch.u), theEnd);
-			}
-			return domNode;
-
-		case 9:
-			var data = patch.s;
-			if (!data)
-			{
-				domNode.parentNode.removeChild(domNode);
-				return domNode;
-			}
-			var entry = data.A;
-			if (typeof entry.r !== 'undefined')
-			{
-				domNode.parentNode.removeChild(domNode);
-			}
-			entry.s = _VirtualDom_applyPatchesHelp(domNode, data.w);
-			return domNode;
-
-		case 8:
-			return _VirtualDom_applyPatchReorder(domNode, patch);
-
-		case 5:
-			return patch.s(domNode);
-
-		default:
-			_Debug_crash(10); // 'Ran into an unknown patch!'
-	}
-}
-
-
-function _VirtualDom_applyPatchRedraw(domNode, vNode, eventNode)
-{
-	var parentNode = domNode.parentNode;
-	var newNode = _VirtualDom_render(vNode, eventNode);
-
-	if (!newNode.elm_event_node_ref)
-	{
-		newNode.elm_event_node_ref = domNode.elm_event_node_ref;
-	}
-
-	if (parentNode && newNode !== domNode)
-	{
-		parentNode.replaceChild(newNode, domNode);
-	}
-	return newNode;
-}
-
-
-function _VirtualDom_applyPatchReorder(domNode, patch)
-{
-	var data = patch.s;
-
-	// remove end inserts
-	var frag = _VirtualDom_applyPatchReorderEndInsertsHelp(data.y, patch);
-
-	// removals
-	domNode = _VirtualDom_applyPatchesHelp(domNode, data.w);
-
-	// inserts
-	var inserts = data.x;
-	for (var i = 0; i < inserts.length; i++)
-	{
-		var insert = inserts[i];
-		var entry = insert.A;
-		var node = entry.c === 2
-			? entry.s
-			: _VirtualDom_render(entry.z, patch.u);
-		domNode.insertBefore(node, domNode.childNodes[insert.r]);
-	}
-
-	// add end inserts
-	if (frag)
-	{
-		_VirtualDom_appendChild(domNode, frag);
-	}
-
-	return domNode;
-}
-
-
-function _VirtualDom_applyPatchReorderEndInsertsHelp(endInserts, patch)
-{
-	if (!endInserts)
-	{
-		return;
-	}
-
-	var frag = _VirtualDom_doc.createDocumentFragment();
-	for (var i = 0; i < endInserts.length; i++)
-	{
-		var insert = endInserts[i];
-		var entry = insert.A;
-		_VirtualDom_appendChild(frag, entry.c === 2
-			? entry.s
-			: _VirtualDom_render(entry.z, patch.u)
-		);
-	}
-	return frag;
-}
-
-
-function _VirtualDom_virtualize(node)
-{
-	// TEXT NODES
-
-	if (node.nodeType === 3)
-	{
-		return _VirtualDom_text(node.textContent);
-	}
-
-
-	// WEIRD NODES
-
-	if (node.nodeType !== 1)
-	{
-		return _VirtualDom_text('');
-	}
-
-
-	// ELEMENT NODES
-
-	var attrList = _List_Nil;
-	var attrs = node.attributes;
-	for (var i = attrs.length; i--; )
-	{
-		var attr = attrs[i];
-		var name = attr.name;
-		var value = attr.value;
-		attrList = _List_Cons( A2(_VirtualDom_attribute, name, value), attrList );
-	}
-
-	var tag = node.tagName.toLowerCase();
-	var kidList = _List_Nil;
-	var kids = node.childNodes;
-
-	for (var i = kids.length; i--; )
-	{
-		kidList = _List_Cons(_VirtualDom_virtualize(kids[i]), kidList);
-	}
-	return A3(_VirtualDom_node, tag, attrList, kidList);
-}
-
-function _VirtualDom_dekey(keyedNode)
-{
-	var keyedKids = keyedNode.e;
-	var len = keyedKids.length;
-	var kids = new Array(len);
-	for (var i = 0; i < len; i++)
-	{
-		kids[i] = keyedKids[i].b;
-	}
-
-	return {
-		$: 1,
-		c: keyedNode.c,
-		d: keyedNode.d,
-		e: kids,
-		f: keyedNode.f,
-		b: keyedNode.b
-	};
-}
-
-
-
-
-// ELEMENT
-
-
-var _Debugger_element;
-
-var _Browser_element = _Debugger_element || F4(function(impl, flagDecoder, debugMetadata, args)
-{
-	return _Platform_initialize(
-		flagDecoder,
-		args,
-		impl.init,
-		impl.update,
-		impl.subscriptions,
-		function(sendToApp, initialModel) {
-			var view = impl.view;
-			/**_UNUSED/
-			var domNode = args['node'];
-			//*/
-			/**/
-			var domNode = args && args['node'] ? args['node'] : _Debug_crash(0);
-			//*/
-			var currNode = _VirtualDom_virtualize(domNode);
-
-			return _Browser_makeAnimator(initialModel, function(model)
-			{
-				var nextNode = view(model);
-				var patches = _VirtualDom_diff(currNode, nextNode);
-				domNode = _VirtualDom_applyPatches(domNode, currNode, patches, sendToApp);
-				currNode = nextNode;
-			});
-		}
-	);
-});
-
-
-
-// DOCUMENT
-
-
-var _Debugger_document;
-
-var _Browser_document = _Debugger_document || F4(function(impl, flagDecoder, debugMetadata, args)
-{
-	return _Platform_initialize(
-		flagDecoder,
-		args,
-		impl.init,
-		impl.update,
-		impl.subscriptions,
-		function(sendToApp, initialModel) {
-			var divertHrefToApp = impl.setup && impl.setup(sendToApp)
-			var view = impl.view;
-			var title = _VirtualDom_doc.title;
-			var bodyNode = _VirtualDom_doc.body;
-			var currNode = _VirtualDom_virtualize(bodyNode);
-			return _Browser_makeAnimator(initialModel, function(model)
-			{
-				_VirtualDom_divertHrefToApp = divertHrefToApp;
-				var doc = view(model);
-				var nextNode = _VirtualDom_node('body')(_List_Nil)(doc.body);
-				var patches = _VirtualDom_diff(currNode, nextNode);
-				bodyNode = _VirtualDom_applyPatches(bodyNode, currNode, patches, sendToApp);
-				currNode = nextNode;
-				_VirtualDom_divertHrefToApp = 0;
-				(title !== doc.title) && (_VirtualDom_doc.title = title = doc.title);
-			});
-		}
-	);
-});
-
-
-
-// ANIMATION
-
-
-var _Browser_cancelAnimationFrame =
-	typeof cancelAnimationFrame !== 'undefined'
-		? cancelAnimationFrame
-		: function(id) { clearTimeout(id); };
-
-var _Browser_requestAnimationFrame =
-	typeof requestAnimationFrame !== 'undefined'
-		? requestAnimationFrame
-		: function(callback) { return setTimeout(callback, 1000 / 60); };
-
-
-function _Browser_makeAnimator(model, draw)
-{
-	draw(model);
-
-	var state = 0;
-
-	function updateIfNeeded()
-	{
-		state = state === 1
-			? 0
-			: ( _Browser_requestAnimationFrame(updateIfNeeded), draw(model), 1 );
-	}
-
-	return function(nextModel, isSync)
-	{
-		model = nextModel;
-
-		isSync
-			? ( draw(model),
-				state === 2 && (state = 1)
-				)
-			: ( state === 0 && _Browser_requestAnimationFrame(updateIfNeeded),
-				state = 2
-				);
-	};
-}
-
-
-
-// APPLICATION
-
-
-function _Browser_application(impl)
-{
-	var onUrlChange = impl.onUrlChange;
-	var onUrlRequest = impl.onUrlRequest;
-	var key = function() { key.a(onUrlChange(_Browser_getUrl())); };
-
-	return _Browser_document({
-		setup: function(sendToApp)
-		{
-			key.a = sendToApp;
-			_Browser_window.addEventListener('popstate', key);
-			_Browser_window.navigator.userAgent.indexOf('Trident') < 0 || _Browser_window.addEventListener('hashchange', key);
-
-			return F2(function(domNode, event)
-			{
-				if (!event.ctrlKey && !event.metaKey && !event.shiftKey && event.button < 1 && !domNode.target && !domNode.hasAttribute('download'))
-				{
-					event.preventDefault();
-					var href = domNode.href;
-					var curr = _Browser_getUrl();
-					var next = $elm$url$Url$fromString(href).a;
-					sendToApp(onUrlRequest(
-						(next
-							&& curr.protocol === next.protocol
-							&& curr.host === next.host
-							&& curr.port_.a === next.port_.a
-						)
-							? $elm$browser$Browser$Internal(next)
-							: $elm$browser$Browser$External(href)
-					));
-				}
-			});
-		},
-		init: function(flags)
-		{
-			return A3(impl.init, flags, _Browser_getUrl(), key);
-		},
-		view: impl.view,
-		update: impl.update,
-		subscriptions: impl.subscriptions
-	});
-}
-
-function _Browser_getUrl()
-{
-	return $elm$url$Url$fromString(_VirtualDom_doc.location.href).a || _Debug_crash(1);
-}
-
-var _Browser_go = F2(function(key, n)
-{
-	return A2($elm$core$Task$perform, $elm$core$Basics$never, _Scheduler_binding(function() {
-		n && history.go(n);
-		key();
-	}));
-});
-
-var _Browser_pushUrl = F2(function(key, url)
-{
-	return A2($elm$core$Task$perform, $elm$core$Basics$never, _Scheduler_binding(function() {
-		history.pushState({}, '', url);
-		key();
-	}));
-});
-
-var _Browser_replaceUrl = F2(function(key, url)
-{
-	return A2($elm$core$Task$perform, $elm$core$Basics$never, _Scheduler_binding(function() {
-		history.replaceState({}, '', url);
-		key();
-	}));
-});
-
-
-
-// GLOBAL EVENTS
-
-
-var _Browser_fakeNode = { addEventListener: function() {}, removeEventListener: function() {} };
-var _Browser_doc = typeof document !== 'undefined' ? document : _Browser_fakeNode;
-var _Browser_window = typeof window !== 'undefined' ? window : _Browser_fakeNode;
-
-var _Browser_on = F3(function(node, eventName, sendToSelf)
-{
-	return _Scheduler_spawn(_Scheduler_binding(function(callback)
-	{
-		function handler(event)	{ _Scheduler_rawSpawn(sendToSelf(event)); }
-		node.addEventListener(eventName, handler, _VirtualDom_passiveSupported && { passive: true });
-		return function() { node.removeEventListener(eventName, handler); };
-	}));
-});
-
-var _Browser_decodeEvent = F2(function(decoder, event)
-{
-	var result = _Json_runHelp(decoder, event);
-	return $elm$core$Result$isOk(result) ? $elm$core$Maybe$Just(result.a) : $elm$core$Maybe$Nothing;
-});
-
-
-
-// PAGE VISIBILITY
-
-
-function _Browser_visibilityInfo()
-{
-	return (typeof _VirtualDom_doc.hidden !== 'undefined')
-		? { hidden: 'hidden', change: 'visibilitychange' }
-		:
-	(typeof _VirtualDom_doc.mozHidden !== 'undefined')
-		? { hidden: 'mozHidden', change: 'mozvisibilitychange' }
-		:
-	(typeof _VirtualDom_doc.msHidden !== 'undefined')
-		? { hidden: 'msHidden', change: 'msvisibilitychange' }
-		:
-	(typeof _VirtualDom_doc.webkitHidden !== 'undefined')
-		? { hidden: 'webkitHidden', change: 'webkitvisibilitychange' }
-		: { hidden: 'hidden', change: 'visibilitychange' };
-}
-
-
-
-// ANIMATION FRAMES
-
-
-function _Browser_rAF()
-{
-	return _Scheduler_binding(function(callback)
-	{
-		var id = _Browser_requestAnimationFrame(function() {
-			callback(_Scheduler_succeed(Date.now()));
-		});
-
-		return function() {
-			_Browser_cancelAnimationFrame(id);
-		};
-	});
-}
-
-
-function _Browser_now()
-{
-	return _Scheduler_binding(function(callback)
-	{
-		callback(_Scheduler_succeed(Date.now()));
-	});
-}
-
-
-
-// DOM STUFF
-
-
-function _Browser_withNode(id, doStuff)
-{
-	return _Scheduler_binding(function(callback)
-	{
-		_Browser_requestAnimationFrame(function() {
-			var node = document.getElementById(id);
-			callback(node
-				? _Scheduler_succeed(doStuff(node))
-				: _Scheduler_fail($elm$browser$Browser$Dom$NotFound(id))
-			);
-		});
-	});
-}
-
-
-function _Browser_withWindow(doStuff)
-{
-	return _Scheduler_binding(function(callback)
-	{
-		_Browser_requestAnimationFrame(function() {
-			callback(_Scheduler_succeed(doStuff()));
-		});
-	});
-}
-
-
-// FOCUS and BLUR
-
-
-var _Browser_call = F2(function(functionName, id)
-{
-	return _Browser_withNode(id, function(node) {
-		node[functionName]();
-		return _Utils_Tuple0;
-	});
-});
-
-
-
-// WINDOW VIEWPORT
-
-
-function _Browser_getViewport()
-{
-	return {
-		scene: _Browser_getScene(),
-		viewport: {
-			x: _Browser_window.pageXOffset,
-			y: _Browser_window.pageYOffset,
-			width: _Browser_doc.documentElement.clientWidth,
-			height: _Browser_doc.documentElement.clientHeight
-		}
-	};
-}
-
-function _Browser_getScene()
-{
-	var body = _Browser_doc.body;
-	var elem = _Browser_doc.documentElement;
-	return {
-		width: Math.max(body.scrollWidth, body.offsetWidth, elem.scrollWidth, elem.offsetWidth, elem.clientWidth),
-		height: Math.max(body.scrollHeight, body.offsetHeight, elem.scrollHeight, elem.offsetHeight, elem.clientHeight)
-	};
-}
-
-var _Browser_setViewport = F2(function(x, y)
-{
-	return _Browser_withWindow(function()
-	{
-		_Browser_window.scroll(x, y);
-		return _Utils_Tuple0;
-	});
-});
-
-
-
-// ELEMENT VIEWPORT
-
-
-function _Browser_getViewportOf(id)
-{
-	return _Browser_withNode(id, function(node)
-	{
-		return {
-			scene: {
-				width: node.scrollWidth,
-				height: node.scrollHeight
-			},
-			viewport: {
-				x: node.scrollLeft,
-				y: node.scrollTop,
-				width: node.clientWidth,
-				height: node.clientHeight
-			}
-		};
-	});
-}
-
-
-var _Browser_setViewportOf = F3(function(id, x, y)
-{
-	return _Browser_withNode(id, function(node)
-	{
-		node.scrollLeft = x;
-		node.scrollTop = y;
-		return _Utils_Tuple0;
-	});
-});
-
-
-
-// ELEMENT
-
-
-function _Browser_getElement(id)
-{
-	return _Browser_withNode(id, function(node)
-	{
-		var rect = node.getBoundingClientRect();
-		var x = _Browser_window.pageXOffset;
-		var y = _Browser_window.pageYOffset;
-		return {
-			scene: _Browser_getScene(),
-			viewport: {
-				x: x,
-				y: y,
-				width: _Browser_doc.documentElement.clientWidth,
-				height: _Browser_doc.documentElement.clientHeight
-			},
-			element: {
-				x: x + rect.left,
-				y: y + rect.top,
-				width: rect.width,
-				height: rect.height
-			}
-		};
-	});
-}
-
-
-
-// LOAD and RELOAD
-
-
-function _Browser_reload(skipCache)
-{
-	return A2($elm$core$Task$perform, $elm$core$Basics$never, _Scheduler_binding(function(callback)
-	{
-		_VirtualDom_doc.location.reload(skipCache);
-	}));
-}
-
-function _Browser_load(url)
-{
-	return A2($elm$core$Task$perform, $elm$core$Basics$never, _Scheduler_binding(function(callback)
-	{
-		try
-		{
-			_Browser_window.location = url;
-		}
-		catch(err)
-		{
-			// Only Firefox can throw a NS_ERROR_MALFORMED_URI exception here.
-			// Other browsers reload the page, so let's be consistent about that.
-			_VirtualDom_doc.location.reload(false);
-		}
-	}));
-}
-
-
-
-// SEND REQUEST
-
-var _Http_toTask = F3(function(router, toTask, request)
-{
-	return _Scheduler_binding(function(callback)
-	{
-		function done(response) {
-			callback(toTask(request.expect.a(response)));
-		}
-
-		var xhr = new XMLHttpRequest();
-		xhr.addEventListener('error', function() { done($elm$http$Http$NetworkError_); });
-		xhr.addEventListener('timeout', function() { done($elm$http$Http$Timeout_); });
-		xhr.addEventListener('load', function() { done(_Http_toResponse(request.expect.b, xhr)); });
-		$elm$core$Maybe$isJust(request.tracker) && _Http_track(router, xhr, request.tracker.a);
-
-		try {
-			xhr.open(request.method, request.url, true);
-		} catch (e) {
-			return done($elm$http$Http$BadUrl_(request.url));
-		}
-
-		_Http_configureRequest(xhr, request);
-
-		request.body.a && xhr.setRequestHeader('Content-Type', request.body.a);
-		xhr.send(request.body.b);
-
-		return function() { xhr.c = true; xhr.abort(); };
-	});
-});
-
-
-// CONFIGURE
-
-function _Http_configureRequest(xhr, request)
-{
-	for (var headers = request.headers; headers.b; headers = headers.b) // WHILE_CONS
-	{
-		xhr.setRequestHeader(headers.a.a, headers.a.b);
-	}
-	xhr.timeout = request.timeout.a || 0;
-	xhr.responseType = request.expect.d;
-	xhr.withCredentials = request.allowCookiesFromOtherDomains;
-}
-
-
-// RESPONSES
-
-function _Http_toResponse(toBody, xhr)
-{
-	return A2(
-		200 <= xhr.status && xhr.status < 300 ? $elm$http$Http$GoodStatus_ : $elm$http$Http$BadStatus_,
-		_Http_toMetadata(xhr),
-		toBody(xhr.response)
-	);
-}
-
-
-// METADATA
-
-function _Http_toMetadata(xhr)
-{
-	return {
-		url: xhr.responseURL,
-		statusCode: xhr.status,
-		statusText: xhr.statusText,
-		headers: _Http_parseHeaders(xhr.getAllResponseHeaders())
-	};
-}
-
-
-// HEADERS
-
-function _Http_parseHeaders(rawHeaders)
-{
-	if (!rawHeaders)
-	{
-		return $elm$core$Dict$empty;
-	}
-
-	var headers = $elm$core$Dict$empty;
-	var headerPairs = rawHeaders.split('\r\n');
-	for (var i = headerPairs.length; i--; )
-	{
-		var headerPair = headerPairs[i];
-		var index = headerPair.indexOf(': ');
-		if (index > 0)
-		{
-			var key = headerPair.substring(0, index);
-			var value = headerPair.substring(index + 2);
-
-			headers = A3($elm$core$Dict$update, key, function(oldValue) {
-				return $elm$core$Maybe$Just($elm$core$Maybe$isJust(oldValue)
-					? value + ', ' + oldValue.a
-					: value
-				);
-			}, headers);
-		}
-	}
-	return headers;
-}
-
-
-// EXPECT
-
-var _Http_expect = F3(function(type, toBody, toValue)
-{
-	return {
-		$: 0,
-		d: type,
-		b: toBody,
-		a: toValue
-	};
-});
-
-var _Http_mapExpect = F2(function(func, expect)
-{
-	return {
-		$: 0,
-		d: expect.d,
-		b: expect.b,
-		a: function(x) { return func(expect.a(x)); }
-	};
-});
-
-function _Http_toDataView(arrayBuffer)
-{
-	return new DataView(arrayBuffer);
-}
-
-
-// BODY and PARTS
-
-var _Http_emptyBody = { $: 0 };
-var _Http_pair = F2(function(a, b) { return { $: 0, a: a, b: b }; });
-
-function _Http_toFormData(parts)
-{
-	for (var formData = new FormData(); parts.b; parts = parts.b) // WHILE_CONS
-	{
-		var part = parts.a;
-		formData.append(part.a, part.b);
-	}
-	return formData;
-}
-
-var _Http_bytesToBlob = F2(function(mime, bytes)
-{
-	return new Blob([bytes], { type: mime });
-});
-
-
-// PROGRESS
-
-function _Http_track(router, xhr, tracker)
-{
-	// TODO check out lengthComputable on loadstart event
-
-	xhr.upload.addEventListener('progress', function(event) {
-		if (xhr.c) { return; }
-		_Scheduler_rawSpawn(A2($elm$core$Platform$sendToSelf, router, _Utils_Tuple2(tracker, $elm$http$Http$Sending({
-			sent: event.loaded,
-			size: event.total
-		}))));
-	});
-	xhr.addEventListener('progress', function(event) {
-		if (xhr.c) { return; }
-		_Scheduler_rawSpawn(A2($elm$core$Platform$sendToSelf, router, _Utils_Tuple2(tracker, $elm$http$Http$Receiving({
-			received: event.loaded,
-			size: event.lengthComputable ? $elm$core$Maybe$Just(event.total) : $elm$core$Maybe$Nothing
-		}))));
-	});
-}
-
-function _Url_percentEncode(string)
-{
-	return encodeURIComponent(string);
-}
-
-function _Url_percentDecode(string)
-{
-	try
-	{
-		return $elm$core$Maybe$Just(decodeURIComponent(string));
-	}
-	catch (e)
-	{
-		return $elm$core$Maybe$Nothing;
-	}
-}var $elm$core$Maybe$Just = function (a) {
-	return {$: 'Just', a: a};
-};
-var $author$project$Main$LinkClicked = function (a) {
-	return {$: 'LinkClicked', a: a};
-};
-var $elm$core$Maybe$Nothing = {$: 'Nothing'};
-var $author$project$Main$UrlChanged = function (a) {
-	return {$: 'UrlChanged', a: a};
-};
-var $elm$core$List$cons = _List_cons;
-var $elm$core$Elm$JsArray$foldr = _JsArray_foldr;
-var $elm$core$Array$foldr = F3(
-	function (func, baseCase, _v0) {
-		var tree = _v0.c;
-		var tail = _v0.d;
-		var helper = F2(
-			function (node, acc) {
-				if (node.$ === 'SubTree') {
-					var subTree = node.a;
-					return A3($elm$core$Elm$JsArray$foldr, helper, acc, subTree);
-				} else {
-					var values = node.a;
-					return A3($elm$core$Elm$JsArray$foldr, func, acc, values);
-				}
-			});
-		return A3(
-			$elm$core$Elm$JsArray$foldr,
-			helper,
-			A3($elm$core$Elm$JsArray$foldr, func, baseCase, tail),
-			tree);
-	});
-var $elm$core$Array$toList = function (array) {
-	return A3($elm$core$Array$foldr, $elm$core$List$cons, _List_Nil, array);
-};
-var $elm$core$Dict$foldr = F3(
-	function (func, acc, t) {
-		foldr:
-		while (true) {
-			if (t.$ === 'RBEmpty_elm_builtin') {
-				return acc;
-			} else {
-				var key = t.b;
-				var value = t.c;
-				var left = t.d;
-				var right = t.e;
-				var $temp$func = func,
-					$temp$acc = A3(
-					func,
-					key,
-					value,
-					A3($elm$core$Dict$foldr, func, acc, right)),
-					$temp$t = left;
-				func = $temp$func;
-				acc = $temp$acc;
-				t = $temp$t;
-				continue foldr;
-			}
-		}
-	});
-var $elm$core$Dict$toList = function (dict) {
-	return A3(
-		$elm$core$Dict$foldr,
-		F3(
-			function (key, value, list) {
-				return A2(
-					$elm$core$List$cons,
-					_Utils_Tuple2(key, value),
-					list);
-			}),
-		_List_Nil,
-		dict);
-};
-var $elm$core$Dict$keys = function (dict) {
-	return A3(
-		$elm$core$Dict$foldr,
-		F3(
-			function (key, value, keyList) {
-				return A2($elm$core$List$cons, key, keyList);
-			}),
-		_List_Nil,
-		dict);
-};
-var $elm$core$Set$toList = function (_v0) {
-	var dict = _v0.a;
-	return $elm$core$Dict$keys(dict);
-};
-var $elm$core$Basics$EQ = {$: 'EQ'};
-var $elm$core$Basics$GT = {$: 'GT'};
-var $elm$core$Basics$LT = {$: 'LT'};
-var $elm$core$Result$Err = function (a) {
-	return {$: 'Err', a: a};
-};
-var $elm$json$Json$Decode$Failure = F2(
-	function (a, b) {
-		return {$: 'Failure', a: a, b: b};
-	});
-var $elm$json$Json$Decode$Field = F2(
-	function (a, b) {
-		return {$: 'Field', a: a, b: b};
-	});
-var $elm$json$Json$Decode$Index = F2(
-	function (a, b) {
-		return {$: 'Index', a: a, b: b};
-	});
-var $elm$core$Result$Ok = function (a) {
-	return {$: 'Ok', a: a};
-};
-var $elm$json$Json$Decode$OneOf = function (a) {
-	return {$: 'OneOf', a: a};
-};
-var $elm$core$Basics$False = {$: 'False'};
-var $elm$core$Basics$add = _Basics_add;
-var $elm$core$String$all = _String_all;
-var $elm$core$Basics$and = _Basics_and;
-var $elm$core$Basics$append = _Utils_append;
-var $elm$json$Json$Encode$encode = _Json_encode;
-var $elm$core$String$fromInt = _String_fromNumber;
-var $elm$core$String$join = F2(
-	function (sep, chunks) {
-		return A2(
-			_String_join,
-			sep,
-			_List_toArray(chunks));
-	});
-var $elm$core$String$split = F2(
-	function (sep, string) {
-		return _List_fromArray(
-			A2(_String_split, sep, string));
-	});
-var $elm$json$Json$Decode$indent = function (str) {
-	return A2(
-		$elm$core$String$join,
-		'\n    ',
-		A2($elm$core$String$split, '\n', str));
-};
-var $elm$core$List$foldl = F3(
-	function (func, acc, list) {
-		foldl:
-		while (true) {
-			if (!list.b) {
-				return acc;
-			} else {
-				var x = list.a;
-				var xs = list.b;
-				var $temp$func = func,
-					$temp$acc = A2(func, x, acc),
-					$temp$list = xs;
-				func = $temp$func;
-				acc = $temp$acc;
-				list = $temp$list;
-				continue foldl;
-			}
-		}
-	});
-var $elm$core$List$length = function (xs) {
-	return A3(
-		$elm$core$List$foldl,
-		F2(
-			function (_v0, i) {
-				return i + 1;
-			}),
-		0,
-		xs);
-};
-var $elm$core$List$map2 = _List_map2;
-var $elm$core$Basics$le = _Utils_le;
-var $elm$core$Basics$sub = _Basics_sub;
-var $elm$core$List$rangeHelp = F3(
-	function (lo, hi, list) {
-		rangeHelp:
-		while (true) {
-			if (_Utils_cmp(lo, hi) < 1) {
-				var $temp$lo = lo,
-					$temp$hi = hi - 1,
-					$temp$list = A2($elm$core$List$cons, hi, list);
-				lo = $temp$lo;
-				hi = $temp$hi;
-				list = $temp$list;
-				continue rangeHelp;
-			} else {
-				return list;
-			}
-		}
-	});
-var $elm$core$List$range = F2(
-	function (lo, hi) {
-		return A3($elm$core$List$rangeHelp, lo, hi, _List_Nil);
-	});
-var $elm$core$List$indexedMap = F2(
-	function (f, xs) {
-		return A3(
-			$elm$core$List$map2,
-			f,
-			A2(
-				$elm$core$List$range,
-				0,
-				$elm$core$List$length(xs) - 1),
-			xs);
-	});
-var $elm$core$Char$toCode = _Char_toCode;
-var $elm$core$Char$isLower = function (_char) {
-	var code = $elm$core$Char$toCode(_char);
-	return (97 <= code) && (code <= 122);
-};
-var $elm$core$Char$isUpper = function (_char) {
-	var code = $elm$core$Char$toCode(_char);
-	return (code <= 90) && (65 <= code);
-};
-var $elm$core$Basics$or = _Basics_or;
-var $elm$core$Char$isAlpha = function (_char) {
-	return $elm$core$Char$isLower(_char) || $elm$core$Char$isUpper(_char);
-};
-var $elm$core$Char$isDigit = function (_char) {
-	var code = $elm$core$Char$toCode(_char);
-	return (code <= 57) && (48 <= code);
-};
-var $elm$core$Char$isAlphaNum = function (_char) {
-	return $elm$core$Char$isLower(_char) || ($elm$core$Char$isUpper(_char) || $elm$core$Char$isDigit(_char));
-};
-var $elm$core$List$reverse = function (list) {
-	return A3($elm$core$List$foldl, $elm$core$List$cons, _List_Nil, list);
-};
-var $elm$core$String$uncons = _String_uncons;
-var $elm$json$Json$Decode$errorOneOf = F2(
-	function (i, error) {
-		return '\n\n(' + ($elm$core$String$fromInt(i + 1) + (') ' + $elm$json$Json$Decode$indent(
-			$elm$json$Json$Decode$errorToString(error))));
-	});
-var $elm$json$Json$Decode$errorToString = function (error) {
-	return A2($elm$json$Json$Decode$errorToStringHelp, error, _List_Nil);
-};
-var $elm$json$Json$Decode$errorToStringHelp = F2(
-	function (error, context) {
-		errorToStringHelp:
-		while (true) {
-			switch (error.$) {
-				case 'Field':
-					var f = error.a;
-					var err = error.b;
-					var isSimple = function () {
-						var _v1 = $elm$core$String$uncons(f);
-						if (_v1.$ === 'Nothing') {
-							return false;
-						} else {
-							var _v2 = _v1.a;
-							var _char = _v2.a;
-							var rest = _v2.b;
-							return $elm$core$Char$isAlpha(_char) && A2($elm$core$String$all, $elm$core$Char$isAlphaNum, rest);
-						}
-					}();
-					var fieldName = isSimple ? ('.' + f) : ('[\'' + (f + '\']'));
-					var $temp$error = err,
-						$temp$context = A2($elm$core$List$cons, fieldName, context);
-					error = $temp$error;
-					context = $temp$context;
-					continue errorToStringHelp;
-				case 'Index':
-					var i = error.a;
-					var err = error.b;
-					var indexName = '[' + ($elm$core$String$fromInt(i) + ']');
-					var $temp$error = err,
-						$temp$context = A2($elm$core$List$cons, indexName, context);
-					error = $temp$error;
-					context = $temp$context;
-					continue errorToStringHelp;
-				case 'OneOf':
-					var errors = error.a;
-					if (!errors.b) {
-						return 'Ran into a Json.Decode.oneOf with no possibilities' + function () {
-							if (!context.b) {
-								return '!';
-							} else {
-								return ' at json' + A2(
-									$elm$core$String$join,
-									'',
-									$elm$core$List$reverse(context));
-							}
-						}();
-					} else {
-						if (!errors.b.b) {
-							var err = errors.a;
-							var $temp$error = err,
-								$temp$context = context;
-							error = $temp$error;
-							context = $temp$context;
-							continue errorToStringHelp;
-						} else {
-							var starter = function () {
-								if (!context.b) {
-									return 'Json.Decode.oneOf';
-								} else {
-									return 'The Json.Decode.oneOf at json' + A2(
-										$elm$core$String$join,
-										'',
-										$elm$core$List$reverse(context));
-								}
-							}();
-							var introduction = starter + (' failed in the following ' + ($elm$core$String$fromInt(
-								$elm$core$List$length(errors)) + ' ways:'));
-							return A2(
-								$elm$core$String$join,
-								'\n\n',
-								A2(
-									$elm$core$List$cons,
-									introduction,
-									A2($elm$core$List$indexedMap, $elm$json$Json$Decode$errorOneOf, errors)));
-						}
-					}
-				default:
-					var msg = error.a;
-					var json = error.b;
-					var introduction = function () {
-						if (!context.b) {
-							return 'Problem with the given value:\n\n';
-						} else {
-							return 'Problem with the value at json' + (A2(
-								$elm$core$String$join,
-								'',
-								$elm$core$List$reverse(context)) + ':\n\n    ');
-						}
-					}();
-					return introduction + ($elm$json$Json$Decode$indent(
-						A2($elm$json$Json$Encode$encode, 4, json)) + ('\n\n' + msg));
-			}
-		}
-	});
-var $elm$core$Array$branchFactor = 32;
-var $elm$core$Array$Array_elm_builtin = F4(
-	function (a, b, c, d) {
-		return {$: 'Array_elm_builtin', a: a, b: b, c: c, d: d};
-	});
-var $elm$core$Elm$JsArray$empty = _JsArray_empty;
-var $elm$core$Basics$ceiling = _Basics_ceiling;
-var $elm$core$Basics$fdiv = _Basics_fdiv;
-var $elm$core$Basics$logBase = F2(
-	function (base, number) {
-		return _Basics_log(number) / _Basics_log(base);
-	});
-var $elm$core$Basics$toFloat = _Basics_toFloat;
-var $elm$core$Array$shiftStep = $elm$core$Basics$ceiling(
-	A2($elm$core$Basics$logBase, 2, $elm$core$Array$branchFactor));
-var $elm$core$Array$empty = A4($elm$core$Array$Array_elm_builtin, 0, $elm$core$Array$shiftStep, $elm$core$Elm$JsArray$empty, $elm$core$Elm$JsArray$empty);
-var $elm$core$Elm$JsArray$initialize = _JsArray_initialize;
-var $elm$core$Array$Leaf = function (a) {
-	return {$: 'Leaf', a: a};
-};
-var $elm$core$Basics$apL = F2(
-	function (f, x) {
-		return f(x);
-	});
-var $elm$core$Basics$apR = F2(
-	function (x, f) {
-		return f(x);
-	});
-var $elm$core$Basics$eq = _Utils_equal;
-var $elm$core$Basics$floor = _Basics_floor;
-var $elm$core$Elm$JsArray$length = _JsArray_length;
-var $elm$core$Basics$gt = _Utils_gt;
-var $elm$core$Basics$max = F2(
-	function (x, y) {
-		return (_Utils_cmp(x, y) > 0) ? x : y;
-	});
-var $elm$core$Basics$mul = _Basics_mul;
-var $elm$core$Array$SubTree = function (a) {
-	return {$: 'SubTree', a: a};
-};
-var $elm$core$Elm$JsArray$initializeFromList = _JsArray_initializeFromList;
-var $elm$core$Array$compressNodes = F2(
-	function (nodes, acc) {
-		compressNodes:
-		while (true) {
-			var _v0 = A2($elm$core$Elm$JsArray$initializeFromList, $elm$core$Array$branchFactor, nodes);
-			var node = _v0.a;
-			var remainingNodes = _v0.b;
-			var newAcc = A2(
-				$elm$core$List$cons,
-				$elm$core$Array$SubTree(node),
-				acc);
-			if (!remainingNodes.b) {
-				return $elm$core$List$reverse(newAcc);
-			} else {
-				var $temp$nodes = remainingNodes,
-					$temp$acc = newAcc;
-				nodes = $temp$nodes;
-				acc = $temp$acc;
-				continue compressNodes;
-			}
-		}
-	});
-var $elm$core$Tuple$first = function (_v0) {
-	var x = _v0.a;
-	return x;
-};
-var $elm$core$Array$treeFromBuilder = F2(
-	function (nodeList, nodeListSize) {
-		treeFromBuilder:
-		while (true) {
-			var newNodeSize = $elm$core$Basics$ceiling(nodeListSize / $elm$core$Array$branchFactor);
-			if (newNodeSize === 1) {
-				return A2($elm$core$Elm$JsArray$initializeFromList, $elm$core$Array$branchFactor, nodeList).a;
-			} else {
-				var $temp$nodeList = A2($elm$core$Array$compressNodes, nodeList, _List_Nil),
-					$temp$nodeListSize = newNodeSize;
-				nodeList = $temp$nodeList;
-				nodeListSize = $temp$nodeListSize;
-				continue treeFromBuilder;
-			}
-		}
-	});
-var $elm$core$Array$builderToArray = F2(
-	function (reverseNodeList, builder) {
-		if (!builder.nodeListSize) {
-			return A4(
-				$elm$core$Array$Array_elm_builtin,
-				$elm$core$Elm$JsArray$length(builder.tail),
-				$elm$core$Array$shiftStep,
-				$elm$core$Elm$JsArray$empty,
-				builder.tail);
-		} else {
-			var treeLen = builder.nodeListSize * $elm$core$Array$branchFactor;
-			var depth = $elm$core$Basics$floor(
-				A2($elm$core$Basics$logBase, $elm$core$Array$branchFactor, treeLen - 1));
-			var correctNodeList = reverseNodeList ? $elm$core$List$reverse(builder.nodeList) : builder.nodeList;
-			var tree = A2($elm$core$Array$treeFromBuilder, correctNodeList, builder.nodeListSize);
-			return A4(
-				$elm$core$Array$Array_elm_builtin,
-				$elm$core$Elm$JsArray$length(builder.tail) + treeLen,
-				A2($elm$core$Basics$max, 5, depth * $elm$core$Array$shiftStep),
-				tree,
-				builder.tail);
-		}
-	});
-var $elm$core$Basics$idiv = _Basics_idiv;
-var $elm$core$Basics$lt = _Utils_lt;
-var $elm$core$Array$initializeHelp = F5(
-	function (fn, fromIndex, len, nodeList, tail) {
-		initializeHelp:
-		while (true) {
-			if (fromIndex < 0) {
-				return A2(
-					$elm$core$Array$builderToArray,
-					false,
-					{nodeList: nodeList, nodeListSize: (len / $elm$core$Array$branchFactor) | 0, tail: tail});
-			} else {
-				var leaf = $elm$core$Array$Leaf(
-					A3($elm$core$Elm$JsArray$initialize, $elm$core$Array$branchFactor, fromIndex, fn));
-				var $temp$fn = fn,
-					$temp$fromIndex = fromIndex - $elm$core$Array$branchFactor,
-					$temp$len = len,
-					$temp$nodeList = A2($elm$core$List$cons, leaf, nodeList),
-					$temp$tail = tail;
-				fn = $temp$fn;
-				fromIndex = $temp$fromIndex;
-				len = $temp$len;
-				nodeList = $temp$nodeList;
-				tail = $temp$tail;
-				continue initializeHelp;
-			}
-		}
-	});
-var $elm$core$Basics$remainderBy = _Basics_remainderBy;
-var $elm$core$Array$initialize = F2(
-	function (len, fn) {
-		if (len <= 0) {
-			return $elm$core$Array$empty;
-		} else {
-			var tailLen = len % $elm$core$Array$branchFactor;
-			var tail = A3($elm$core$Elm$JsArray$initialize, tailLen, len - tailLen, fn);
-			var initialFromIndex = (len - tailLen) - $elm$core$Array$branchFactor;
-			return A5($elm$core$Array$initializeHelp, fn, initialFromIndex, len, _List_Nil, tail);
-		}
-	});
-var $elm$core$Basics$True = {$: 'True'};
-var $elm$core$Result$isOk = function (result) {
-	if (result.$ === 'Ok') {
-		return true;
-	} else {
-		return false;
-	}
-};
-var $elm$json$Json$Decode$andThen = _Json_andThen;
-var $elm$json$Json$Decode$map = _Json_map1;
-var $elm$json$Json$Decode$map2 = _Json_map2;
-var $elm$json$Json$Decode$succeed = _Json_succeed;
-var $elm$virtual_dom$VirtualDom$toHandlerInt = function (handler) {
-	switch (handler.$) {
-		case 'Normal':
-			return 0;
-		case 'MayStopPropagation':
-			return 1;
-		case 'MayPreventDefault':
-			return 2;
-		default:
-			return 3;
-	}
-};
-var $elm$browser$Browser$External = function (a) {
-	return {$: 'External', a: a};
-};
-var $elm$browser$Browser$Internal = function (a) {
-	return {$: 'Internal', a: a};
-};
-var $elm$core$Basics$identity = function (x) {
-	return x;
-};
-var $elm$browser$Browser$Dom$NotFound = function (a) {
-	return {$: 'NotFound', a: a};
-};
-var $elm$url$Url$Http = {$: 'Http'};
-var $elm$url$Url$Https = {$: 'Https'};
-var $elm$url$Url$Url = F6(
-	function (protocol, host, port_, path, query, fragment) {
-		return {fragment: fragment, host: host, path: path, port_: port_, protocol: protocol, query: query};
-	});
-var $elm$core$String$contains = _String_contains;
-var $elm$core$String$length = _String_length;
-var $elm$core$String$slice = _String_slice;
-var $elm$core$String$dropLeft = F2(
-	function (n, string) {
-		return (n < 1) ? string : A3(
-			$elm$core$String$slice,
-			n,
-			$elm$core$String$length(string),
-			string);
-	});
-var $elm$core$String$indexes = _String_indexes;
-var $elm$core$String$isEmpty = function (string) {
-	return string === '';
-};
-var $elm$core$String$left = F2(
-	function (n, string) {
-		return (n < 1) ? '' : A3($elm$core$String$slice, 0, n, string);
-	});
-var $elm$core$String$toInt = _String_toInt;
-var $elm$url$Url$chompBeforePath = F5(
-	function (protocol, path, params, frag, str) {
-		if ($elm$core$String$isEmpty(str) || A2($elm$core$String$contains, '@', str)) {
-			return $elm$core$Maybe$Nothing;
-		} else {
-			var _v0 = A2($elm$core$String$indexes, ':', str);
-			if (!_v0.b) {
-				return $elm$core$Maybe$Just(
-					A6($elm$url$Url$Url, protocol, str, $elm$core$Maybe$Nothing, path, params, frag));
-			} else {
-				if (!_v0.b.b) {
-					var i = _v0.a;
-					var _v1 = $elm$core$String$toInt(
-						A2($elm$core$String$dropLeft, i + 1, str));
-					if (_v1.$ === 'Nothing') {
-						return $elm$core$Maybe$Nothing;
-					} else {
-						var port_ = _v1;
-						return $elm$core$Maybe$Just(
-							A6(
-								$elm$url$Url$Url,
-								protocol,
-								A2($elm$core$String$left, i, str),
-								port_,
-								path,
-								params,
-								frag));
-					}
-				} else {
-					return $elm$core$Maybe$Nothing;
-				}
-			}
-		}
-	});
-var $elm$url$Url$chompBeforeQuery = F4(
-	function (protocol, params, frag, str) {
-		if ($elm$core$String$isEmpty(str)) {
-			return $elm$core$Maybe$Nothing;
-		} else {
-			var _v0 = A2($elm$core$String$indexes, '/', str);
-			if (!_v0.b) {
-				return A5($elm$url$Url$chompBeforePath, protocol, '/', params, frag, str);
-			} else {
-				var i = _v0.a;
-				return A5(
-					$elm$url$Url$chompBeforePath,
-					protocol,
-					A2($elm$core$String$dropLeft, i, str),
-					params,
-					frag,
-					A2($elm$core$String$left, i, str));
-			}
-		}
-	});
-var $elm$url$Url$chompBeforeFragment = F3(
-	function (protocol, frag, str) {
-		if ($elm$core$String$isEmpty(str)) {
-			return $elm$core$Maybe$Nothing;
-		} else {
-			var _v0 = A2($elm$core$String$indexes, '?', str);
-			if (!_v0.b) {
-				return A4($elm$url$Url$chompBeforeQuery, protocol, $elm$core$Maybe$Nothing, frag, str);
-			} else {
-				var i = _v0.a;
-				return A4(
-					$elm$url$Url$chompBeforeQuery,
-					protocol,
-					$elm$core$Maybe$Just(
-						A2($elm$core$String$dropLeft, i + 1, str)),
-					frag,
-					A2($elm$core$String$left, i, str));
-			}
-		}
-	});
-var $elm$url$Url$chompAfterProtocol = F2(
-	function (protocol, str) {
-		if ($elm$core$String$isEmpty(str)) {
-			return $elm$core$Maybe$Nothing;
-		} else {
-			var _v0 = A2($elm$core$String$indexes, '#', str);
-			if (!_v0.b) {
-				return A3($elm$url$Url$chompBeforeFragment, protocol, $elm$core$Maybe$Nothing, str);
-			} else {
-				var i = _v0.a;
-				return A3(
-					$elm$url$Url$chompBeforeFragment,
-					protocol,
-					$elm$core$Maybe$Just(
-						A2($elm$core$String$dropLeft, i + 1, str)),
-					A2($elm$core$String$left, i, str));
-			}
-		}
-	});
-var $elm$core$String$startsWith = _String_startsWith;
-var $elm$url$Url$fromString = function (str) {
-	return A2($elm$core$String$startsWith, 'http://', str) ? A2(
-		$elm$url$Url$chompAfterProtocol,
-		$elm$url$Url$Http,
-		A2($elm$core$String$dropLeft, 7, str)) : (A2($elm$core$String$startsWith, 'https://', str) ? A2(
-		$elm$url$Url$chompAfterProtocol,
-		$elm$url$Url$Https,
-		A2($elm$core$String$dropLeft, 8, str)) : $elm$core$Maybe$Nothing);
-};
-var $elm$core$Basics$never = function (_v0) {
-	never:
-	while (true) {
-		var nvr = _v0.a;
-		var $temp$_v0 = nvr;
-		_v0 = $temp$_v0;
-		continue never;
-	}
-};
-var $elm$core$Task$Perform = function (a) {
-	return {$: 'Perform', a: a};
-};
-var $elm$core$Task$succeed = _Scheduler_succeed;
-var $elm$core$Task$init = $elm$core$Task$succeed(_Utils_Tuple0);
-var $elm$core$List$foldrHelper = F4(
-	function (fn, acc, ctr, ls) {
-		if (!ls.b) {
-			return acc;
-		} else {
-			var a = ls.a;
-			var r1 = ls.b;
-			if (!r1.b) {
-				return A2(fn, a, acc);
-			} else {
-				var b = r1.a;
-				var r2 = r1.b;
-				if (!r2.b) {
-					return A2(
-						fn,
-						a,
-						A2(fn, b, acc));
-				} else {
-					var c = r2.a;
-					var r3 = r2.b;
-					if (!r3.b) {
-						return A2(
-							fn,
-							a,
-							A2(
-								fn,
-								b,
-								A2(fn, c, acc)));
-					} else {
-						var d = r3.a;
-						var r4 = r3.b;
-						var res = (ctr > 500) ? A3(
-							$elm$core$List$foldl,
-							fn,
-							acc,
-							$elm$core$List$reverse(r4)) : A4($elm$core$List$foldrHelper, fn, acc, ctr + 1, r4);
-						return A2(
-							fn,
-							a,
-							A2(
-								fn,
-								b,
-								A2(
-									fn,
-									c,
-									A2(fn, d, res))));
-					}
-				}
-			}
-		}
-	});
-var $elm$core$List$foldr = F3(
-	function (fn, acc, ls) {
-		return A4($elm$core$List$foldrHelper, fn, acc, 0, ls);
-	});
-var $elm$core$List$map = F2(
-	function (f, xs) {
-		return A3(
-			$elm$core$List$foldr,
-			F2(
-				function (x, acc) {
-					return A2(
-						$elm$core$List$cons,
-						f(x),
-						acc);
-				}),
-			_List_Nil,
-			xs);
-	});
-var $elm$core$Task$andThen = _Scheduler_andThen;
-var $elm$core$Task$map = F2(
-	function (func, taskA) {
-		return A2(
-			$elm$core$Task$andThen,
-			function (a) {
-				return $elm$core$Task$succeed(
-					func(a));
-			},
-			taskA);
-	});
-var $elm$core$Task$map2 = F3(
-	function (func, taskA, taskB) {
-		return A2(
-			$elm$core$Task$andThen,
-			function (a) {
-				return A2(
-					$elm$core$Task$andThen,
-					function (b) {
-						return $elm$core$Task$succeed(
-							A2(func, a, b));
-					},
-					taskB);
-			},
-			taskA);
-	});
-var $elm$core$Task$sequence = function (tasks) {
-	return A3(
-		$elm$core$List$foldr,
-		$elm$core$Task$map2($elm$core$List$cons),
-		$elm$core$Task$succeed(_List_Nil),
-		tasks);
-};
-var $elm$core$Platform$sendToApp = _Platform_sendToApp;
-var $elm$core$Task$spawnCmd = F2(
-	function (router, _v0) {
-		var task = _v0.a;
-		return _Scheduler_spawn(
-			A2(
-				$elm$core$Task$andThen,
-				$elm$core$Platform$sendToApp(router),
-				task));
-	});
-var $elm$core$Task$onEffects = F3(
-	function (router, commands, state) {
-		return A2(
-			$elm$core$Task$map,
-			function (_v0) {
-				return _Utils_Tuple0;
-			},
-			$elm$core$Task$sequence(
-				A2(
-					$elm$core$List$map,
-					$elm$core$Task$spawnCmd(router),
-					commands)));
-	});
-var $elm$core$Task$onSelfMsg = F3(
-	function (_v0, _v1, _v2) {
-		return $elm$core$Task$succeed(_Utils_Tuple0);
-	});
-var $elm$core$Task$cmdMap = F2(
-	function (tagger, _v0) {
-		var task = _v0.a;
-		return $elm$core$Task$Perform(
-			A2($elm$core$Task$map, tagger, task));
-	});
-_Platform_effectManagers['Task'] = _Platform_createManager($elm$core$Task$init, $elm$core$Task$onEffects, $elm$core$Task$onSelfMsg, $elm$core$Task$cmdMap);
-var $elm$core$Task$command = _Platform_leaf('Task');
-var $elm$core$Task$perform = F2(
-	function (toMessage, task) {
-		return $elm$core$Task$command(
-			$elm$core$Task$Perform(
-				A2($elm$core$Task$map, toMessage, task)));
-	});
-var $elm$browser$Browser$application = _Browser_application;
-var $elm$json$Json$Decode$bool = _Json_decodeBool;
-var $elm$json$Json$Decode$index = _Json_decodeIndex;
-var $author$project$Main$NotFoundPage = {$: 'NotFoundPage'};
-var $author$project$Main$Denuncias = function (a) {
-	return {$: 'Denuncias', a: a};
-};
-var $author$project$Main$DenunciasMsg = function (a) {
-	return {$: 'DenunciasMsg', a: a};
-};
-var $author$project$Main$Disciplina = function (a) {
-	return {$: 'Disciplina', a: a};
-};
-var $author$project$Main$DisciplinaMsg = function (a) {
-	return {$: 'DisciplinaMsg', a: a};
-};
-var $author$project$Main$Disciplinas = function (a) {
-	return {$: 'Disciplinas', a: a};
-};
-var $author$project$Main$DisciplinasMsg = function (a) {
-	return {$: 'DisciplinasMsg', a: a};
-};
-var $author$project$Main$Home = function (a) {
-	return {$: 'Home', a: a};
-};
-var $author$project$Main$HomeMsg = function (a) {
-	return {$: 'HomeMsg', a: a};
-};
-var $author$project$Main$Login = function (a) {
-	return {$: 'Login', a: a};
-};
-var $author$project$Route$Login = {$: 'Login'};
-var $author$project$Main$LoginMsg = function (a) {
-	return {$: 'LoginMsg', a: a};
-};
-var $author$project$Main$Perfil = function (a) {
-	return {$: 'Perfil', a: a};
-};
-var $author$project$Main$PerfilMsg = function (a) {
-	return {$: 'PerfilMsg', a: a};
-};
-var $author$project$Main$Professor = function (a) {
-	return {$: 'Professor', a: a};
-};
-var $author$project$Main$ProfessorMsg = function (a) {
-	return {$: 'ProfessorMsg', a: a};
-};
-var $author$project$Main$Professores = function (a) {
-	return {$: 'Professores', a: a};
-};
-var $author$project$Main$ProfessoresMsg = function (a) {
-	return {$: 'ProfessoresMsg', a: a};
-};
-var $author$project$Main$Turma = function (a) {
-	return {$: 'Turma', a: a};
-};
-var $author$project$Main$TurmaMsg = function (a) {
-	return {$: 'TurmaMsg', a: a};
-};
-var $elm$core$Platform$Cmd$batch = _Platform_batch;
-var $author$project$Page$Denuncias$Loading = {$: 'Loading'};
-var $author$project$Page$Denuncias$WebData = function (a) {
-	return {$: 'WebData', a: a};
-};
-var $author$project$Page$Denuncias$Denuncia = F3(
-	function (id, comentario, avaliacaoId) {
-		return {avaliacaoId: avaliacaoId, comentario: comentario, id: id};
-	});
-var $elm$json$Json$Decode$field = _Json_decodeField;
-var $elm$json$Json$Decode$int = _Json_decodeInt;
-var $elm$json$Json$Decode$map3 = _Json_map3;
-var $elm$json$Json$Decode$string = _Json_decodeString;
-var $author$project$Page$Denuncias$denunciaDecoder = A4(
-	$elm$json$Json$Decode$map3,
-	$author$project$Page$Denuncias$Denuncia,
-	A2($elm$json$Json$Decode$field, 'id', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'comentario', $elm$json$Json$Decode$string),
-	A2($elm$json$Json$Decode$field, 'avaliacao_id', $elm$json$Json$Decode$int));
-var $author$project$Page$Denuncias$denunciasUrl = 'http://127.0.0.1:5000/api/denuncias';
-var $elm$json$Json$Decode$decodeString = _Json_runOnString;
-var $elm$http$Http$BadStatus_ = F2(
-	function (a, b) {
-		return {$: 'BadStatus_', a: a, b: b};
-	});
-var $elm$http$Http$BadUrl_ = function (a) {
-	return {$: 'BadUrl_', a: a};
-};
-var $elm$http$Http$GoodStatus_ = F2(
-	function (a, b) {
-		return {$: 'GoodStatus_', a: a, b: b};
-	});
-var $elm$http$Http$NetworkError_ = {$: 'NetworkError_'};
-var $elm$http$Http$Receiving = function (a) {
-	return {$: 'Receiving', a: a};
-};
-var $elm$http$Http$Sending = function (a) {
-	return {$: 'Sending', a: a};
-};
-var $elm$http$Http$Timeout_ = {$: 'Timeout_'};
-var $elm$core$Dict$RBEmpty_elm_builtin = {$: 'RBEmpty_elm_builtin'};
-var $elm$core$Dict$empty = $elm$core$Dict$RBEmpty_elm_builtin;
-var $elm$core$Maybe$isJust = function (maybe) {
-	if (maybe.$ === 'Just') {
-		return true;
-	} else {
-		return false;
-	}
-};
-var $elm$core$Platform$sendToSelf = _Platform_sendToSelf;
-var $elm$core$Basics$compare = _Utils_compare;
-var $elm$core$Dict$get = F2(
-	function (targetKey, dict) {
-		get:
-		while (true) {
-			if (dict.$ === 'RBEmpty_elm_builtin') {
-				return $elm$core$Maybe$Nothing;
-			} else {
-				var key = dict.b;
-				var value = dict.c;
-				var left = dict.d;
-				var right = dict.e;
-				var _v1 = A2($elm$core$Basics$compare, targetKey, key);
-				switch (_v1.$) {
-					case 'LT':
-						var $temp$targetKey = targetKey,
-							$temp$dict = left;
-						targetKey = $temp$targetKey;
-						dict = $temp$dict;
-						continue get;
-					case 'EQ':
-						return $elm$core$Maybe$Just(value);
-					default:
-						var $temp$targetKey = targetKey,
-							$temp$dict = right;
-						targetKey = $temp$targetKey;
-						dict = $temp$dict;
-						continue get;
-				}
-			}
-		}
-	});
-var $elm$core$Dict$Black = {$: 'Black'};
-var $elm$core$Dict$RBNode_elm_builtin = F5(
-	function (a, b, c, d, e) {
-		return {$: 'RBNode_elm_builtin', a: a, b: b, c: c, d: d, e: e};
-	});
-var $elm$core$Dict$Red = {$: 'Red'};
-var $elm$core$Dict$balance = F5(
-	function (color, key, value, left, right) {
-		if ((right.$ === 'RBNode_elm_builtin') && (right.a.$ === 'Red')) {
-			var _v1 = right.a;
-			var rK = right.b;
-			var rV = right.c;
-			var rLeft = right.d;
-			var rRight = right.e;
-			if ((left.$ === 'RBNode_elm_builtin') && (left.a.$ === 'Red')) {
-				var _v3 = left.a;
-				var lK = left.b;
-				var lV = left.c;
-				var lLeft = left.d;
-				var lRight = left.e;
-				return A5(
-					$elm$core$Dict$RBNode_elm_builtin,
-					$elm$core$Dict$Red,
-					key,
-					value,
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Black, lK, lV, lLeft, lRight),
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Black, rK, rV, rLeft, rRight));
-			} else {
-				return A5(
-					$elm$core$Dict$RBNode_elm_builtin,
-					color,
-					rK,
-					rV,
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Red, key, value, left, rLeft),
-					rRight);
-			}
-		} else {
-			if ((((left.$ === 'RBNode_elm_builtin') && (left.a.$ === 'Red')) && (left.d.$ === 'RBNode_elm_builtin')) && (left.d.a.$ === 'Red')) {
-				var _v5 = left.a;
-				var lK = left.b;
-				var lV = left.c;
-				var _v6 = left.d;
-				var _v7 = _v6.a;
-				var llK = _v6.b;
-				var llV = _v6.c;
-				var llLeft = _v6.d;
-				var llRight = _v6.e;
-				var lRight = left.e;
-				return A5(
-					$elm$core$Dict$RBNode_elm_builtin,
-					$elm$core$Dict$Red,
-					lK,
-					lV,
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Black, llK, llV, llLeft, llRight),
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Black, key, value, lRight, right));
-			} else {
-				return A5($elm$core$Dict$RBNode_elm_builtin, color, key, value, left, right);
-			}
-		}
-	});
-var $elm$core$Dict$insertHelp = F3(
-	function (key, value, dict) {
-		if (dict.$ === 'RBEmpty_elm_builtin') {
-			return A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Red, key, value, $elm$core$Dict$RBEmpty_elm_builtin, $elm$core$Dict$RBEmpty_elm_builtin);
-		} else {
-			var nColor = dict.a;
-			var nKey = dict.b;
-			var nValue = dict.c;
-			var nLeft = dict.d;
-			var nRight = dict.e;
-			var _v1 = A2($elm$core$Basics$compare, key, nKey);
-			switch (_v1.$) {
-				case 'LT':
-					return A5(
-						$elm$core$Dict$balance,
-						nColor,
-						nKey,
-						nValue,
-						A3($elm$core$Dict$insertHelp, key, value, nLeft),
-						nRight);
-				case 'EQ':
-					return A5($elm$core$Dict$RBNode_elm_builtin, nColor, nKey, value, nLeft, nRight);
-				default:
-					return A5(
-						$elm$core$Dict$balance,
-						nColor,
-						nKey,
-						nValue,
-						nLeft,
-						A3($elm$core$Dict$insertHelp, key, value, nRight));
-			}
-		}
-	});
-var $elm$core$Dict$insert = F3(
-	function (key, value, dict) {
-		var _v0 = A3($elm$core$Dict$insertHelp, key, value, dict);
-		if ((_v0.$ === 'RBNode_elm_builtin') && (_v0.a.$ === 'Red')) {
-			var _v1 = _v0.a;
-			var k = _v0.b;
-			var v = _v0.c;
-			var l = _v0.d;
-			var r = _v0.e;
-			return A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Black, k, v, l, r);
-		} else {
-			var x = _v0;
-			return x;
-		}
-	});
-var $elm$core$Dict$getMin = function (dict) {
-	getMin:
-	while (true) {
-		if ((dict.$ === 'RBNode_elm_builtin') && (dict.d.$ === 'RBNode_elm_builtin')) {
-			var left = dict.d;
-			var $temp$dict = left;
-			dict = $temp$dict;
-			continue getMin;
-		} else {
-			return dict;
-		}
-	}
-};
-var $elm$core$Dict$moveRedLeft = function (dict) {
-	if (((dict.$ === 'RBNode_elm_builtin') && (dict.d.$ === 'RBNode_elm_builtin')) && (dict.e.$ === 'RBNode_elm_builtin')) {
-		if ((dict.e.d.$ === 'RBNode_elm_builtin') && (dict.e.d.a.$ === 'Red')) {
-			var clr = dict.a;
-			var k = dict.b;
-			var v = dict.c;
-			var _v1 = dict.d;
-			var lClr = _v1.a;
-			var lK = _v1.b;
-			var lV = _v1.c;
-			var lLeft = _v1.d;
-			var lRight = _v1.e;
-			var _v2 = dict.e;
-			var rClr = _v2.a;
-			var rK = _v2.b;
-			var rV = _v2.c;
-			var rLeft = _v2.d;
-			var _v3 = rLeft.a;
-			var rlK = rLeft.b;
-			var rlV = rLeft.c;
-			var rlL = rLeft.d;
-			var rlR = rLeft.e;
-			var rRight = _v2.e;
-			return A5(
-				$elm$core$Dict$RBNode_elm_builtin,
-				$elm$core$Dict$Red,
-				rlK,
-				rlV,
-				A5(
-					$elm$core$Dict$RBNode_elm_builtin,
-					$elm$core$Dict$Black,
-					k,
-					v,
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Red, lK, lV, lLeft, lRight),
-					rlL),
-				A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Black, rK, rV, rlR, rRight));
-		} else {
-			var clr = dict.a;
-			var k = dict.b;
-			var v = dict.c;
-			var _v4 = dict.d;
-			var lClr = _v4.a;
-			var lK = _v4.b;
-			var lV = _v4.c;
-			var lLeft = _v4.d;
-			var lRight = _v4.e;
-			var _v5 = dict.e;
-			var rClr = _v5.a;
-			var rK = _v5.b;
-			var rV = _v5.c;
-			var rLeft = _v5.d;
-			var rRight = _v5.e;
-			if (clr.$ === 'Black') {
-				return A5(
-					$elm$core$Dict$RBNode_elm_builtin,
-					$elm$core$Dict$Black,
-					k,
-					v,
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Red, lK, lV, lLeft, lRight),
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Red, rK, rV, rLeft, rRight));
-			} else {
-				return A5(
-					$elm$core$Dict$RBNode_elm_builtin,
-					$elm$core$Dict$Black,
-					k,
-					v,
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Red, lK, lV, lLeft, lRight),
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Red, rK, rV, rLeft, rRight));
-			}
-		}
-	} else {
-		return dict;
-	}
-};
-var $elm$core$Dict$moveRedRight = function (dict) {
-	if (((dict.$ === 'RBNode_elm_builtin') && (dict.d.$ === 'RBNode_elm_builtin')) && (dict.e.$ === 'RBNode_elm_builtin')) {
-		if ((dict.d.d.$ === 'RBNode_elm_builtin') && (dict.d.d.a.$ === 'Red')) {
-			var clr = dict.a;
-			var k = dict.b;
-			var v = dict.c;
-			var _v1 = dict.d;
-			var lClr = _v1.a;
-			var lK = _v1.b;
-			var lV = _v1.c;
-			var _v2 = _v1.d;
-			var _v3 = _v2.a;
-			var llK = _v2.b;
-			var llV = _v2.c;
-			var llLeft = _v2.d;
-			var llRight = _v2.e;
-			var lRight = _v1.e;
-			var _v4 = dict.e;
-			var rClr = _v4.a;
-			var rK = _v4.b;
-			var rV = _v4.c;
-			var rLeft = _v4.d;
-			var rRight = _v4.e;
-			return A5(
-				$elm$core$Dict$RBNode_elm_builtin,
-				$elm$core$Dict$Red,
-				lK,
-				lV,
-				A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Black, llK, llV, llLeft, llRight),
-				A5(
-					$elm$core$Dict$RBNode_elm_builtin,
-					$elm$core$Dict$Black,
-					k,
-					v,
-					lRight,
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Red, rK, rV, rLeft, rRight)));
-		} else {
-			var clr = dict.a;
-			var k = dict.b;
-			var v = dict.c;
-			var _v5 = dict.d;
-			var lClr = _v5.a;
-			var lK = _v5.b;
-			var lV = _v5.c;
-			var lLeft = _v5.d;
-			var lRight = _v5.e;
-			var _v6 = dict.e;
-			var rClr = _v6.a;
-			var rK = _v6.b;
-			var rV = _v6.c;
-			var rLeft = _v6.d;
-			var rRight = _v6.e;
-			if (clr.$ === 'Black') {
-				return A5(
-					$elm$core$Dict$RBNode_elm_builtin,
-					$elm$core$Dict$Black,
-					k,
-					v,
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Red, lK, lV, lLeft, lRight),
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Red, rK, rV, rLeft, rRight));
-			} else {
-				return A5(
-					$elm$core$Dict$RBNode_elm_builtin,
-					$elm$core$Dict$Black,
-					k,
-					v,
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Red, lK, lV, lLeft, lRight),
-					A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Red, rK, rV, rLeft, rRight));
-			}
-		}
-	} else {
-		return dict;
-	}
-};
-var $elm$core$Dict$removeHelpPrepEQGT = F7(
-	function (targetKey, dict, color, key, value, left, right) {
-		if ((left.$ === 'RBNode_elm_builtin') && (left.a.$ === 'Red')) {
-			var _v1 = left.a;
-			var lK = left.b;
-			var lV = left.c;
-			var lLeft = left.d;
-			var lRight = left.e;
-			return A5(
-				$elm$core$Dict$RBNode_elm_builtin,
-				color,
-				lK,
-				lV,
-				lLeft,
-				A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Red, key, value, lRight, right));
-		} else {
-			_v2$2:
-			while (true) {
-				if ((right.$ === 'RBNode_elm_builtin') && (right.a.$ === 'Black')) {
-					if (right.d.$ === 'RBNode_elm_builtin') {
-						if (right.d.a.$ === 'Black') {
-							var _v3 = right.a;
-							var _v4 = right.d;
-							var _v5 = _v4.a;
-							return $elm$core$Dict$moveRedRight(dict);
-						} else {
-							break _v2$2;
-						}
-					} else {
-						var _v6 = right.a;
-						var _v7 = right.d;
-						return $elm$core$Dict$moveRedRight(dict);
-					}
-				} else {
-					break _v2$2;
-				}
-			}
-			return dict;
-		}
-	});
-var $elm$core$Dict$removeMin = function (dict) {
-	if ((dict.$ === 'RBNode_elm_builtin') && (dict.d.$ === 'RBNode_elm_builtin')) {
-		var color = dict.a;
-		var key = dict.b;
-		var value = dict.c;
-		var left = dict.d;
-		var lColor = left.a;
-		var lLeft = left.d;
-		var right = dict.e;
-		if (lColor.$ === 'Black') {
-			if ((lLeft.$ === 'RBNode_elm_builtin') && (lLeft.a.$ === 'Red')) {
-				var _v3 = lLeft.a;
-				return A5(
-					$elm$core$Dict$RBNode_elm_builtin,
-					color,
-					key,
-					value,
-					$elm$core$Dict$removeMin(left),
-					right);
-			} else {
-				var _v4 = $elm$core$Dict$moveRedLeft(dict);
-				if (_v4.$ === 'RBNode_elm_builtin') {
-					var nColor = _v4.a;
-					var nKey = _v4.b;
-					var nValue = _v4.c;
-					var nLeft = _v4.d;
-					var nRight = _v4.e;
-					return A5(
-						$elm$core$Dict$balance,
-						nColor,
-						nKey,
-						nValue,
-						$elm$core$Dict$removeMin(nLeft),
-						nRight);
-				} else {
-					return $elm$core$Dict$RBEmpty_elm_builtin;
-				}
-			}
-		} else {
-			return A5(
-				$elm$core$Dict$RBNode_elm_builtin,
-				color,
-				key,
-				value,
-				$elm$core$Dict$removeMin(left),
-				right);
-		}
-	} else {
-		return $elm$core$Dict$RBEmpty_elm_builtin;
-	}
-};
-var $elm$core$Dict$removeHelp = F2(
-	function (targetKey, dict) {
-		if (dict.$ === 'RBEmpty_elm_builtin') {
-			return $elm$core$Dict$RBEmpty_elm_builtin;
-		} else {
-			var color = dict.a;
-			var key = dict.b;
-			var value = dict.c;
-			var left = dict.d;
-			var right = dict.e;
-			if (_Utils_cmp(targetKey, key) < 0) {
-				if ((left.$ === 'RBNode_elm_builtin') && (left.a.$ === 'Black')) {
-					var _v4 = left.a;
-					var lLeft = left.d;
-					if ((lLeft.$ === 'RBNode_elm_builtin') && (lLeft.a.$ === 'Red')) {
-						var _v6 = lLeft.a;
-						return A5(
-							$elm$core$Dict$RBNode_elm_builtin,
-							color,
-							key,
-							value,
-							A2($elm$core$Dict$removeHelp, targetKey, left),
-							right);
-					} else {
-						var _v7 = $elm$core$Dict$moveRedLeft(dict);
-						if (_v7.$ === 'RBNode_elm_builtin') {
-							var nColor = _v7.a;
-							var nKey = _v7.b;
-							var nValue = _v7.c;
-							var nLeft = _v7.d;
-							var nRight = _v7.e;
-							return A5(
-								$elm$core$Dict$balance,
-								nColor,
-								nKey,
-								nValue,
-								A2($elm$core$Dict$removeHelp, targetKey, nLeft),
-								nRight);
-						} else {
-							return $elm$core$Dict$RBEmpty_elm_builtin;
-						}
-					}
-				} else {
-					return A5(
-						$elm$core$Dict$RBNode_elm_builtin,
-						color,
-						key,
-						value,
-						A2($elm$core$Dict$removeHelp, targetKey, left),
-						right);
-				}
-			} else {
-				return A2(
-					$elm$core$Dict$removeHelpEQGT,
-					targetKey,
-					A7($elm$core$Dict$removeHelpPrepEQGT, targetKey, dict, color, key, value, left, right));
-			}
-		}
-	});
-var $elm$core$Dict$removeHelpEQGT = F2(
-	function (targetKey, dict) {
-		if (dict.$ === 'RBNode_elm_builtin') {
-			var color = dict.a;
-			var key = dict.b;
-			var value = dict.c;
-			var left = dict.d;
-			var right = dict.e;
-			if (_Utils_eq(targetKey, key)) {
-				var _v1 = $elm$core$Dict$getMin(right);
-				if (_v1.$ === 'RBNode_elm_builtin') {
-					var minKey = _v1.b;
-					var minValue = _v1.c;
-					return A5(
-						$elm$core$Dict$balance,
-						color,
-						minKey,
-						minValue,
-						left,
-						$elm$core$Dict$removeMin(right));
-				} else {
-					return $elm$core$Dict$RBEmpty_elm_builtin;
-				}
-			} else {
-				return A5(
-					$elm$core$Dict$balance,
-					color,
-					key,
-					value,
-					left,
-					A2($elm$core$Dict$removeHelp, targetKey, right));
-			}
-		} else {
-			return $elm$core$Dict$RBEmpty_elm_builtin;
-		}
-	});
-var $elm$core$Dict$remove = F2(
-	function (key, dict) {
-		var _v0 = A2($elm$core$Dict$removeHelp, key, dict);
-		if ((_v0.$ === 'RBNode_elm_builtin') && (_v0.a.$ === 'Red')) {
-			var _v1 = _v0.a;
-			var k = _v0.b;
-			var v = _v0.c;
-			var l = _v0.d;
-			var r = _v0.e;
-			return A5($elm$core$Dict$RBNode_elm_builtin, $elm$core$Dict$Black, k, v, l, r);
-		} else {
-			var x = _v0;
-			return x;
-		}
-	});
-var $elm$core$Dict$update = F3(
-	function (targetKey, alter, dictionary) {
-		var _v0 = alter(
-			A2($elm$core$Dict$get, targetKey, dictionary));
-		if (_v0.$ === 'Just') {
-			var value = _v0.a;
-			return A3($elm$core$Dict$insert, targetKey, value, dictionary);
-		} else {
-			return A2($elm$core$Dict$remove, targetKey, dictionary);
-		}
-	});
-var $elm$core$Basics$composeR = F3(
-	function (f, g, x) {
-		return g(
-			f(x));
-	});
-var $elm$http$Http$expectStringResponse = F2(
-	function (toMsg, toResult) {
-		return A3(
-			_Http_expect,
-			'',
-			$elm$core$Basics$identity,
-			A2($elm$core$Basics$composeR, toResult, toMsg));
-	});
-var $elm$core$Result$mapError = F2(
-	function (f, result) {
-		if (result.$ === 'Ok') {
-			var v = result.a;
-			return $elm$core$Result$Ok(v);
-		} else {
-			var e = result.a;
-			return $elm$core$Result$Err(
-				f(e));
-		}
-	});
-var $elm$http$Http$BadBody = function (a) {
-	return {$: 'BadBody', a: a};
-};
-var $elm$http$Http$BadStatus = function (a) {
-	return {$: 'BadStatus', a: a};
-};
-var $elm$http$Http$BadUrl = function (a) {
-	return {$: 'BadUrl', a: a};
-};
-var $elm$http$Http$NetworkError = {$: 'NetworkError'};
-var $elm$http$Http$Timeout = {$: 'Timeout'};
-var $elm$http$Http$resolve = F2(
-	function (toResult, response) {
-		switch (response.$) {
-			case 'BadUrl_':
-				var url = response.a;
-				return $elm$core$Result$Err(
-					$elm$http$Http$BadUrl(url));
-			case 'Timeout_':
-				return $elm$core$Result$Err($elm$http$Http$Timeout);
-			case 'NetworkError_':
-				return $elm$core$Result$Err($elm$http$Http$NetworkError);
-			case 'BadStatus_':
-				var metadata = response.a;
-				return $elm$core$Result$Err(
-					$elm$http$Http$BadStatus(metadata.statusCode));
-			default:
-				var body = response.b;
-				return A2(
-					$elm$core$Result$mapError,
-					$elm$http$Http$BadBody,
-					toResult(body));
-		}
-	});
-var $elm$http$Http$expectJson = F2(
-	function (toMsg, decoder) {
-		return A2(
-			$elm$http$Http$expectStringResponse,
-			toMsg,
-			$elm$http$Http$resolve(
-				function (string) {
-					return A2(
-						$elm$core$Result$mapError,
-						$elm$json$Json$Decode$errorToString,
-						A2($elm$json$Json$Decode$decodeString, decoder, string));
-				}));
-	});
-var $elm$http$Http$emptyBody = _Http_emptyBody;
-var $elm$http$Http$Request = function (a) {
-	return {$: 'Request', a: a};
-};
-var $elm$http$Http$State = F2(
-	function (reqs, subs) {
-		return {reqs: reqs, subs: subs};
-	});
-var $elm$http$Http$init = $elm$core$Task$succeed(
-	A2($elm$http$Http$State, $elm$core$Dict$empty, _List_Nil));
-var $elm$core$Process$kill = _Scheduler_kill;
-var $elm$core$Process$spawn = _Scheduler_spawn;
-var $elm$http$Http$updateReqs = F3(
-	function (router, cmds, reqs) {
-		updateReqs:
-		while (true) {
-			if (!cmds.b) {
-				return $elm$core$Task$succeed(reqs);
-			} else {
-				var cmd = cmds.a;
-				var otherCmds = cmds.b;
-				if (cmd.$ === 'Cancel') {
-					var tracker = cmd.a;
-					var _v2 = A2($elm$core$Dict$get, tracker, reqs);
-					if (_v2.$ === 'Nothing') {
-						var $temp$router = router,
-							$temp$cmds = otherCmds,
-							$temp$reqs = reqs;
-						router = $temp$router;
-						cmds = $temp$cmds;
-						reqs = $temp$reqs;
-						continue updateReqs;
-					} else {
-						var pid = _v2.a;
-						return A2(
-							$elm$core$Task$andThen,
-							function (_v3) {
-								return A3(
-									$elm$http$Http$updateReqs,
-									router,
-									otherCmds,
-									A2($elm$core$Dict$remove, tracker, reqs));
-							},
-							$elm$core$Process$kill(pid));
-					}
-				} else {
-					var req = cmd.a;
-					return A2(
-						$elm$core$Task$andThen,
-						function (pid) {
-							var _v4 = req.tracker;
-							if (_v4.$ === 'Nothing') {
-								return A3($elm$http$Http$updateReqs, router, otherCmds, reqs);
-							} else {
-								var tracker = _v4.a;
-								return A3(
-									$elm$http$Http$updateReqs,
-									router,
-									otherCmds,
-									A3($elm$core$Dict$insert, tracker, pid, reqs));
-							}
-						},
-						$elm$core$Process$spawn(
-							A3(
-								_Http_toTask,
-								router,
-								$elm$core$Platform$sendToApp(router),
-								req)));
-				}
-			}
-		}
-	});
-var $elm$http$Http$onEffects = F4(
-	function (router, cmds, subs, state) {
-		return A2(
-			$elm$core$Task$andThen,
-			function (reqs) {
-				return $elm$core$Task$succeed(
-					A2($elm$http$Http$State, reqs, subs));
-			},
-			A3($elm$http$Http$updateReqs, router, cmds, state.reqs));
-	});
-var $elm$core$List$maybeCons = F3(
-	function (f, mx, xs) {
-		var _v0 = f(mx);
-		if (_v0.$ === 'Just') {
-			var x = _v0.a;
-			return A2($elm$core$List$cons, x, xs);
-		} else {
-			return xs;
-		}
-	});
-var $elm$core$List$filterMap = F2(
-	function (f, xs) {
-		return A3(
-			$elm$core$List$foldr,
-			$elm$core$List$maybeCons(f),
-			_List_Nil,
-			xs);
-	});
-var $elm$http$Http$maybeSend = F4(
-	function (router, desiredTracker, progress, _v0) {
-		var actualTracker = _v0.a;
-		var toMsg = _v0.b;
-		return _Utils_eq(desiredTracker, actualTracker) ? $elm$core$Maybe$Just(
-			A2(
-				$elm$core$Platform$sendToApp,
-				router,
-				toMsg(progress))) : $elm$core$Maybe$Nothing;
-	});
-var $elm$http$Http$onSelfMsg = F3(
-	function (router, _v0, state) {
-		var tracker = _v0.a;
-		var progress = _v0.b;
-		return A2(
-			$elm$core$Task$andThen,
-			function (_v1) {
-				return $elm$core$Task$succeed(state);
-			},
-			$elm$core$Task$sequence(
-				A2(
-					$elm$core$List$filterMap,
-					A3($elm$http$Http$maybeSend, router, tracker, progress),
-					state.subs)));
-	});
-var $elm$http$Http$Cancel = function (a) {
-	return {$: 'Cancel', a: a};
-};
-var $elm$http$Http$cmdMap = F2(
-	function (func, cmd) {
-		if (cmd.$ === 'Cancel') {
-			var tracker = cmd.a;
-			return $elm$http$Http$Cancel(tracker);
-		} else {
-			var r = cmd.a;
-			return $elm$http$Http$Request(
-				{
-					allowCookiesFromOtherDomains: r.allowCookiesFromOtherDomains,
-					body: r.body,
-					expect: A2(_Http_mapExpect, func, r.expect),
-					headers: r.headers,
-					method: r.method,
-					timeout: r.timeout,
-					tracker: r.tracker,
-					url: r.url
-				});
-		}
-	});
-var $elm$http$Http$MySub = F2(
-	function (a, b) {
-		return {$: 'MySub', a: a, b: b};
-	});
-var $elm$http$Http$subMap = F2(
-	function (func, _v0) {
-		var tracker = _v0.a;
-		var toMsg = _v0.b;
-		return A2(
-			$elm$http$Http$MySub,
-			tracker,
-			A2($elm$core$Basics$composeR, toMsg, func));
-	});
-_Platform_effectManagers['Http'] = _Platform_createManager($elm$http$Http$init, $elm$http$Http$onEffects, $elm$http$Http$onSelfMsg, $elm$http$Http$cmdMap, $elm$http$Http$subMap);
-var $elm$http$Http$command = _Platform_leaf('Http');
-var $elm$http$Http$subscription = _Platform_leaf('Http');
-var $elm$http$Http$request = function (r) {
-	return $elm$http$Http$command(
-		$elm$http$Http$Request(
-			{allowCookiesFromOtherDomains: false, body: r.body, expect: r.expect, headers: r.headers, method: r.method, timeout: r.timeout, tracker: r.tracker, url: r.url}));
-};
-var $elm$http$Http$get = function (r) {
-	return $elm$http$Http$request(
-		{body: $elm$http$Http$emptyBody, expect: r.expect, headers: _List_Nil, method: 'GET', timeout: $elm$core$Maybe$Nothing, tracker: $elm$core$Maybe$Nothing, url: r.url});
-};
-var $elm$json$Json$Decode$list = _Json_decodeList;
-var $author$project$Page$Denuncias$getDenuncias = $elm$http$Http$get(
-	{
-		expect: A2(
-			$elm$http$Http$expectJson,
-			$author$project$Page$Denuncias$WebData,
-			$elm$json$Json$Decode$list($author$project$Page$Denuncias$denunciaDecoder)),
-		url: $author$project$Page$Denuncias$denunciasUrl
-	});
-var $author$project$Page$Denuncias$init = _Utils_Tuple2(
-	{denuncias: _List_Nil, errorMsg: $elm$core$Maybe$Nothing, state: $author$project$Page$Denuncias$Loading},
-	$author$project$Page$Denuncias$getDenuncias);
-var $author$project$Page$Disciplina$Loading = {$: 'Loading'};
-var $author$project$Page$Disciplina$emptyDisciplina = {nome: '', professores: _List_Nil};
-var $author$project$Page$Disciplina$WebData = function (a) {
-	return {$: 'WebData', a: a};
-};
-var $author$project$Page$Disciplina$Disciplina = F2(
-	function (nome, professores) {
-		return {nome: nome, professores: professores};
-	});
-var $author$project$Page$Disciplina$Professor = F4(
-	function (id, nome, qtdAvaliacoes, sumAvaliacoes) {
-		return {id: id, nome: nome, qtdAvaliacoes: qtdAvaliacoes, sumAvaliacoes: sumAvaliacoes};
-	});
-var $elm$json$Json$Decode$map4 = _Json_map4;
-var $author$project$Page$Disciplina$professorDecoder = A5(
-	$elm$json$Json$Decode$map4,
-	$author$project$Page$Disciplina$Professor,
-	A2($elm$json$Json$Decode$field, 'id', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'nome', $elm$json$Json$Decode$string),
-	A2($elm$json$Json$Decode$field, 'qtd_avaliacoes', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'sum_avaliacoes', $elm$json$Json$Decode$int));
-var $author$project$Page$Disciplina$disciplinaDecoder = A3(
-	$elm$json$Json$Decode$map2,
-	$author$project$Page$Disciplina$Disciplina,
-	A2($elm$json$Json$Decode$field, 'nome', $elm$json$Json$Decode$string),
-	A2(
-		$elm$json$Json$Decode$field,
-		'professores',
-		$elm$json$Json$Decode$list($author$project$Page$Disciplina$professorDecoder)));
-var $author$project$Page$Disciplina$disciplinaUrl = function (id) {
-	return 'http://127.0.0.1:5000/api/disciplina/' + $elm$core$String$fromInt(id);
-};
-var $author$project$Page$Disciplina$getDisciplina = function (disciplinaId) {
-	return $elm$http$Http$get(
-		{
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Disciplina$WebData, $author$project$Page$Disciplina$disciplinaDecoder),
-			url: $author$project$Page$Disciplina$disciplinaUrl(disciplinaId)
-		});
-};
-var $author$project$Page$Disciplina$init = function (disciplinaId) {
-	return _Utils_Tuple2(
-		{disciplina: $author$project$Page$Disciplina$emptyDisciplina, disciplinaId: disciplinaId, errorMsg: $elm$core$Maybe$Nothing, state: $author$project$Page$Disciplina$Loading},
-		$author$project$Page$Disciplina$getDisciplina(disciplinaId));
-};
-var $elm$core$Platform$Cmd$none = $elm$core$Platform$Cmd$batch(_List_Nil);
-var $author$project$Page$Home$init = function (isAdmin) {
-	return _Utils_Tuple2(
-		{isAdmin: isAdmin},
-		$elm$core$Platform$Cmd$none);
-};
-var $author$project$Page$ListDisciplinas$WebData = function (a) {
-	return {$: 'WebData', a: a};
-};
-var $author$project$Page$ListDisciplinas$DisciplinaItem = F2(
-	function (id, nome) {
-		return {id: id, nome: nome};
-	});
-var $author$project$Page$ListDisciplinas$disciplinaItemDecoder = A3(
-	$elm$json$Json$Decode$map2,
-	$author$project$Page$ListDisciplinas$DisciplinaItem,
-	A2($elm$json$Json$Decode$field, 'id', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'nome', $elm$json$Json$Decode$string));
-var $author$project$Page$ListDisciplinas$disciplinaListDecoder = $elm$json$Json$Decode$list($author$project$Page$ListDisciplinas$disciplinaItemDecoder);
-var $author$project$Page$ListDisciplinas$disciplinaListUrl = 'http://127.0.0.1:5000/api/disciplinas';
-var $author$project$Page$ListDisciplinas$getDisciplinaList = $elm$http$Http$get(
-	{
-		expect: A2($elm$http$Http$expectJson, $author$project$Page$ListDisciplinas$WebData, $author$project$Page$ListDisciplinas$disciplinaListDecoder),
-		url: $author$project$Page$ListDisciplinas$disciplinaListUrl
-	});
-var $author$project$Page$ListDisciplinas$init = _Utils_Tuple2(
-	{disciplinas: _List_Nil, errorMsg: $elm$core$Maybe$Nothing},
-	$author$project$Page$ListDisciplinas$getDisciplinaList);
-var $author$project$Page$Login$emptyLoginUser = {email: '', password: ''};
-var $author$project$Page$Login$emptyRegisterUser = {curso: '', email: '', matricula: '', nome: '', password: ''};
-var $author$project$Page$Login$init = _Utils_Tuple2(
-	{loginErrorMsg: $elm$core$Maybe$Nothing, loginUser: $author$project$Page$Login$emptyLoginUser, registerErrorMsg: $elm$core$Maybe$Nothing, registerUser: $author$project$Page$Login$emptyRegisterUser, user: $elm$core$Maybe$Nothing},
-	$elm$core$Platform$Cmd$none);
-var $author$project$Page$Perfil$Showing = {$: 'Showing'};
-var $author$project$Page$Perfil$emptyPasswordInfo = {currentPassword: '', newPassword: ''};
-var $author$project$Page$Perfil$emptyUser = {curso: '', email: '', matricula: '', nome: ''};
-var $author$project$Page$Perfil$WebUserData = function (a) {
-	return {$: 'WebUserData', a: a};
-};
-var $author$project$Page$Perfil$User = F4(
-	function (email, nome, matricula, curso) {
-		return {curso: curso, email: email, matricula: matricula, nome: nome};
-	});
-var $author$project$Page$Perfil$userDecoder = A5(
-	$elm$json$Json$Decode$map4,
-	$author$project$Page$Perfil$User,
-	A2($elm$json$Json$Decode$field, 'email', $elm$json$Json$Decode$string),
-	A2($elm$json$Json$Decode$field, 'nome', $elm$json$Json$Decode$string),
-	A2($elm$json$Json$Decode$field, 'matricula', $elm$json$Json$Decode$string),
-	A2($elm$json$Json$Decode$field, 'curso', $elm$json$Json$Decode$string));
-var $author$project$Page$Perfil$userUrl = function (userId) {
-	return 'http://127.0.0.1:5000/api/user/' + $elm$core$String$fromInt(userId);
-};
-var $author$project$Page$Perfil$getUserCmd = function (userId) {
-	return $elm$http$Http$get(
-		{
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Perfil$WebUserData, $author$project$Page$Perfil$userDecoder),
-			url: $author$project$Page$Perfil$userUrl(userId)
-		});
-};
-var $author$project$Page$Perfil$init = function (userId) {
-	return _Utils_Tuple2(
-		{errorMsg: $elm$core$Maybe$Nothing, infoMsg: $elm$core$Maybe$Nothing, passwordInfo: $author$project$Page$Perfil$emptyPasswordInfo, state: $author$project$Page$Perfil$Showing, updatingUser: $author$project$Page$Perfil$emptyUser, user: $elm$core$Maybe$Nothing, userId: userId},
-		$author$project$Page$Perfil$getUserCmd(userId));
-};
-var $author$project$Page$Professor$Loading = {$: 'Loading'};
-var $author$project$Page$Professor$emptyProfessor = {avaliacoes: _List_Nil, nome: '', qtdAvaliacoes: 0, sumAvaliacoes: 0, turmas: _List_Nil};
-var $author$project$Page$Professor$WebProfessorData = function (a) {
-	return {$: 'WebProfessorData', a: a};
-};
-var $author$project$Page$Professor$Professor = F5(
-	function (nome, turmas, qtdAvaliacoes, sumAvaliacoes, avaliacoes) {
-		return {avaliacoes: avaliacoes, nome: nome, qtdAvaliacoes: qtdAvaliacoes, sumAvaliacoes: sumAvaliacoes, turmas: turmas};
-	});
-var $author$project$Page$Professor$Avaliacao = F5(
-	function (id, userId, userNome, comentario, pontuacao) {
-		return {comentario: comentario, id: id, pontuacao: pontuacao, userId: userId, userNome: userNome};
-	});
-var $elm$json$Json$Decode$map5 = _Json_map5;
-var $author$project$Page$Professor$avaliacaoDecoder = A6(
-	$elm$json$Json$Decode$map5,
-	$author$project$Page$Professor$Avaliacao,
-	A2($elm$json$Json$Decode$field, 'id', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'user_id', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'user_nome', $elm$json$Json$Decode$string),
-	A2($elm$json$Json$Decode$field, 'comentario', $elm$json$Json$Decode$string),
-	A2($elm$json$Json$Decode$field, 'pontuacao', $elm$json$Json$Decode$int));
-var $author$project$Page$Professor$Turma = F3(
-	function (id, numero, nome) {
-		return {id: id, nome: nome, numero: numero};
-	});
-var $author$project$Page$Professor$turmaDecoder = A4(
-	$elm$json$Json$Decode$map3,
-	$author$project$Page$Professor$Turma,
-	A2($elm$json$Json$Decode$field, 'id', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'numero', $elm$json$Json$Decode$string),
-	A2($elm$json$Json$Decode$field, 'nome', $elm$json$Json$Decode$string));
-var $author$project$Page$Professor$professorDecoder = A6(
-	$elm$json$Json$Decode$map5,
-	$author$project$Page$Professor$Professor,
-	A2($elm$json$Json$Decode$field, 'nome', $elm$json$Json$Decode$string),
-	A2(
-		$elm$json$Json$Decode$field,
-		'turmas',
-		$elm$json$Json$Decode$list($author$project$Page$Professor$turmaDecoder)),
-	A2($elm$json$Json$Decode$field, 'qtd_avaliacoes', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'sum_avaliacoes', $elm$json$Json$Decode$int),
-	A2(
-		$elm$json$Json$Decode$field,
-		'avaliacoes',
-		$elm$json$Json$Decode$list($author$project$Page$Professor$avaliacaoDecoder)));
-var $author$project$Page$Professor$professorUrl = function (id) {
-	return 'http://127.0.0.1:5000/api/professor/' + $elm$core$String$fromInt(id);
-};
-var $author$project$Page$Professor$getProfessor = function (professorId) {
-	return $elm$http$Http$get(
-		{
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Professor$WebProfessorData, $author$project$Page$Professor$professorDecoder),
-			url: $author$project$Page$Professor$professorUrl(professorId)
-		});
-};
-var $author$project$Page$Professor$init = function (_v0) {
-	var userId = _v0.a;
-	var professorId = _v0.b;
-	return _Utils_Tuple2(
-		{
-			errorMsg: $elm$core$Maybe$Nothing,
-			newAvaliacao: {comentario: '', pontuacao: 0, userId: userId},
-			professor: $author$project$Page$Professor$emptyProfessor,
-			professorId: professorId,
-			state: $author$project$Page$Professor$Loading
-		},
-		$author$project$Page$Professor$getProfessor(professorId));
-};
-var $author$project$Page$Professores$Loading = {$: 'Loading'};
-var $author$project$Page$Professores$WebData = function (a) {
-	return {$: 'WebData', a: a};
-};
-var $author$project$Page$Professores$Professor = F5(
-	function (id, nome, disciplinas, qtdAvaliacoes, sumAvaliacoes) {
-		return {disciplinas: disciplinas, id: id, nome: nome, qtdAvaliacoes: qtdAvaliacoes, sumAvaliacoes: sumAvaliacoes};
-	});
-var $author$project$Page$Professores$professoresDecoder = A6(
-	$elm$json$Json$Decode$map5,
-	$author$project$Page$Professores$Professor,
-	A2($elm$json$Json$Decode$field, 'id', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'nome', $elm$json$Json$Decode$string),
-	A2(
-		$elm$json$Json$Decode$field,
-		'disciplinas',
-		$elm$json$Json$Decode$list($elm$json$Json$Decode$string)),
-	A2($elm$json$Json$Decode$field, 'qtd_avaliacoes', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'sum_avaliacoes', $elm$json$Json$Decode$int));
-var $author$project$Page$Professores$professoresUrl = 'http://127.0.0.1:5000/api/professores/';
-var $author$project$Page$Professores$getProfessores = $elm$http$Http$get(
-	{
-		expect: A2(
-			$elm$http$Http$expectJson,
-			$author$project$Page$Professores$WebData,
-			$elm$json$Json$Decode$list($author$project$Page$Professores$professoresDecoder)),
-		url: $author$project$Page$Professores$professoresUrl
-	});
-var $author$project$Page$Professores$init = _Utils_Tuple2(
-	{errorMsg: $elm$core$Maybe$Nothing, professores: _List_Nil, state: $author$project$Page$Professores$Loading},
-	$author$project$Page$Professores$getProfessores);
-var $author$project$Page$Turma$Loading = {$: 'Loading'};
-var $author$project$Page$Turma$emptyTurma = {avaliacoes: _List_Nil, disciplinaId: 0, disciplinaNome: '', numero: '', professorId: 0, professorNome: '', qtdAvaliacoes: 0, sumAvaliacoes: 0};
-var $author$project$Page$Turma$WebTurmaData = function (a) {
-	return {$: 'WebTurmaData', a: a};
-};
-var $author$project$Page$Turma$Turma = F8(
-	function (numero, professorId, professorNome, disciplinaId, disciplinaNome, qtdAvaliacoes, sumAvaliacoes, avaliacoes) {
-		return {avaliacoes: avaliacoes, disciplinaId: disciplinaId, disciplinaNome: disciplinaNome, numero: numero, professorId: professorId, professorNome: professorNome, qtdAvaliacoes: qtdAvaliacoes, sumAvaliacoes: sumAvaliacoes};
-	});
-var $author$project$Page$Turma$Avaliacao = F5(
-	function (id, userId, userNome, comentario, pontuacao) {
-		return {comentario: comentario, id: id, pontuacao: pontuacao, userId: userId, userNome: userNome};
-	});
-var $author$project$Page$Turma$avaliacaoDecoder = A6(
-	$elm$json$Json$Decode$map5,
-	$author$project$Page$Turma$Avaliacao,
-	A2($elm$json$Json$Decode$field, 'id', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'user_id', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'user_nome', $elm$json$Json$Decode$string),
-	A2($elm$json$Json$Decode$field, 'comentario', $elm$json$Json$Decode$string),
-	A2($elm$json$Json$Decode$field, 'pontuacao', $elm$json$Json$Decode$int));
-var $elm$json$Json$Decode$map8 = _Json_map8;
-var $author$project$Page$Turma$turmaDecoder = A9(
-	$elm$json$Json$Decode$map8,
-	$author$project$Page$Turma$Turma,
-	A2($elm$json$Json$Decode$field, 'numero', $elm$json$Json$Decode$string),
-	A2($elm$json$Json$Decode$field, 'professor_id', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'professor_nome', $elm$json$Json$Decode$string),
-	A2($elm$json$Json$Decode$field, 'disciplina_id', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'disciplina_nome', $elm$json$Json$Decode$string),
-	A2($elm$json$Json$Decode$field, 'qtd_avaliacoes', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'sum_avaliacoes', $elm$json$Json$Decode$int),
-	A2(
-		$elm$json$Json$Decode$field,
-		'avaliacoes',
-		$elm$json$Json$Decode$list($author$project$Page$Turma$avaliacaoDecoder)));
-var $author$project$Page$Turma$turmaUrl = function (id) {
-	return 'http://127.0.0.1:5000/api/turma/' + $elm$core$String$fromInt(id);
-};
-var $author$project$Page$Turma$getTurma = function (turmaId) {
-	return $elm$http$Http$get(
-		{
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Turma$WebTurmaData, $author$project$Page$Turma$turmaDecoder),
-			url: $author$project$Page$Turma$turmaUrl(turmaId)
-		});
-};
-var $author$project$Page$Turma$init = function (_v0) {
-	var userId = _v0.a;
-	var turmaId = _v0.b;
-	return _Utils_Tuple2(
-		{
-			editingAvaliacao: {comentario: '', pontuacao: 0, userNome: ''},
-			errorMsg: $elm$core$Maybe$Nothing,
-			newAvaliacao: {comentario: '', pontuacao: 0, userId: userId},
-			state: $author$project$Page$Turma$Loading,
-			turma: $author$project$Page$Turma$emptyTurma,
-			turmaId: turmaId,
-			userId: userId
-		},
-		$author$project$Page$Turma$getTurma(turmaId));
-};
-var $elm$core$Platform$Cmd$map = _Platform_map;
-var $elm$core$Tuple$second = function (_v0) {
-	var y = _v0.b;
-	return y;
-};
-var $author$project$Main$initCurrentPage = function (_v0) {
-	var model = _v0.a;
-	var existingCmds = _v0.b;
-	var _v1 = model.user;
-	if (_v1.$ === 'Just') {
-		var user = _v1.a;
-		var _v2 = function () {
-			var _v3 = model.route;
-			switch (_v3.$) {
-				case 'NotFound':
-					return _Utils_Tuple2($author$project$Main$NotFoundPage, $elm$core$Platform$Cmd$none);
-				case 'Disciplinas':
-					var _v4 = $author$project$Page$ListDisciplinas$init;
-					var pageModel = _v4.a;
-					var pageCmds = _v4.b;
-					return _Utils_Tuple2(
-						$author$project$Main$Disciplinas(pageModel),
-						A2($elm$core$Platform$Cmd$map, $author$project$Main$DisciplinasMsg, pageCmds));
-				case 'Home':
-					var _v5 = $author$project$Page$Home$init(user.b);
-					var pageModel = _v5.a;
-					var pageCmds = _v5.b;
-					return _Utils_Tuple2(
-						$author$project$Main$Home(pageModel),
-						A2($elm$core$Platform$Cmd$map, $author$project$Main$HomeMsg, pageCmds));
-				case 'Login':
-					var _v6 = $author$project$Page$Home$init(user.b);
-					var pageModel = _v6.a;
-					var pageCmds = _v6.b;
-					return _Utils_Tuple2(
-						$author$project$Main$Home(pageModel),
-						A2($elm$core$Platform$Cmd$map, $author$project$Main$HomeMsg, pageCmds));
-				case 'Perfil':
-					var _v7 = $author$project$Page$Perfil$init(user.a);
-					var pageModel = _v7.a;
-					var pageCmds = _v7.b;
-					return _Utils_Tuple2(
-						$author$project$Main$Perfil(pageModel),
-						A2($elm$core$Platform$Cmd$map, $author$project$Main$PerfilMsg, pageCmds));
-				case 'Disciplina':
-					var disciplinaId = _v3.a;
-					var _v8 = $author$project$Page$Disciplina$init(disciplinaId);
-					var pageModel = _v8.a;
-					var pageCmds = _v8.b;
-					return _Utils_Tuple2(
-						$author$project$Main$Disciplina(pageModel),
-						A2($elm$core$Platform$Cmd$map, $author$project$Main$DisciplinaMsg, pageCmds));
-				case 'Professores':
-					var _v9 = $author$project$Page$Professores$init;
-					var pageModel = _v9.a;
-					var pageCmds = _v9.b;
-					return _Utils_Tuple2(
-						$author$project$Main$Professores(pageModel),
-						A2($elm$core$Platform$Cmd$map, $author$project$Main$ProfessoresMsg, pageCmds));
-				case 'Turma':
-					var turmaId = _v3.a;
-					var _v10 = $author$project$Page$Turma$init(
-						_Utils_Tuple2(user.a, turmaId));
-					var pageModel = _v10.a;
-					var pageCmds = _v10.b;
-					return _Utils_Tuple2(
-						$author$project$Main$Turma(pageModel),
-						A2($elm$core$Platform$Cmd$map, $author$project$Main$TurmaMsg, pageCmds));
-				case 'Professor':
-					var professorId = _v3.a;
-					var _v11 = $author$project$Page$Professor$init(
-						_Utils_Tuple2(user.a, professorId));
-					var pageModel = _v11.a;
-					var pageCmds = _v11.b;
-					return _Utils_Tuple2(
-						$author$project$Main$Professor(pageModel),
-						A2($elm$core$Platform$Cmd$map, $author$project$Main$ProfessorMsg, pageCmds));
-				default:
-					var _v12 = $author$project$Page$Denuncias$init;
-					var pageModel = _v12.a;
-					var pageCmds = _v12.b;
-					return _Utils_Tuple2(
-						$author$project$Main$Denuncias(pageModel),
-						A2($elm$core$Platform$Cmd$map, $author$project$Main$DenunciasMsg, pageCmds));
-			}
-		}();
-		var currentPage = _v2.a;
-		var mappedPageCmds = _v2.b;
-		return _Utils_Tuple2(
-			_Utils_update(
-				model,
-				{page: currentPage}),
-			$elm$core$Platform$Cmd$batch(
-				_List_fromArray(
-					[existingCmds, mappedPageCmds])));
-	} else {
-		var _v13 = $author$project$Page$Login$init;
-		var pageModel = _v13.a;
-		var pageCmds = _v13.b;
-		return _Utils_Tuple2(
-			_Utils_update(
-				model,
-				{
-					page: $author$project$Main$Login(pageModel),
-					route: $author$project$Route$Login
-				}),
-			A2($elm$core$Platform$Cmd$map, $author$project$Main$LoginMsg, pageCmds));
-	}
-};
-var $author$project$Route$NotFound = {$: 'NotFound'};
-var $author$project$Route$Denuncias = {$: 'Denuncias'};
-var $author$project$Route$Disciplina = function (a) {
-	return {$: 'Disciplina', a: a};
-};
-var $author$project$Route$Disciplinas = {$: 'Disciplinas'};
-var $author$project$Route$Home = {$: 'Home'};
-var $author$project$Route$Perfil = {$: 'Perfil'};
-var $author$project$Route$Professor = function (a) {
-	return {$: 'Professor', a: a};
-};
-var $author$project$Route$Professores = {$: 'Professores'};
-var $author$project$Route$Turma = function (a) {
-	return {$: 'Turma', a: a};
-};
-var $elm$url$Url$Parser$Parser = function (a) {
-	return {$: 'Parser', a: a};
-};
-var $elm$url$Url$Parser$State = F5(
-	function (visited, unvisited, params, frag, value) {
-		return {frag: frag, params: params, unvisited: unvisited, value: value, visited: visited};
-	});
-var $elm$url$Url$Parser$custom = F2(
-	function (tipe, stringToSomething) {
-		return $elm$url$Url$Parser$Parser(
-			function (_v0) {
-				var visited = _v0.visited;
-				var unvisited = _v0.unvisited;
-				var params = _v0.params;
-				var frag = _v0.frag;
-				var value = _v0.value;
-				if (!unvisited.b) {
-					return _List_Nil;
-				} else {
-					var next = unvisited.a;
-					var rest = unvisited.b;
-					var _v2 = stringToSomething(next);
-					if (_v2.$ === 'Just') {
-						var nextValue = _v2.a;
-						return _List_fromArray(
-							[
-								A5(
-								$elm$url$Url$Parser$State,
-								A2($elm$core$List$cons, next, visited),
-								rest,
-								params,
-								frag,
-								value(nextValue))
-							]);
-					} else {
-						return _List_Nil;
-					}
-				}
-			});
-	});
-var $elm$url$Url$Parser$int = A2($elm$url$Url$Parser$custom, 'NUMBER', $elm$core$String$toInt);
-var $elm$url$Url$Parser$mapState = F2(
-	function (func, _v0) {
-		var visited = _v0.visited;
-		var unvisited = _v0.unvisited;
-		var params = _v0.params;
-		var frag = _v0.frag;
-		var value = _v0.value;
-		return A5(
-			$elm$url$Url$Parser$State,
-			visited,
-			unvisited,
-			params,
-			frag,
-			func(value));
-	});
-var $elm$url$Url$Parser$map = F2(
-	function (subValue, _v0) {
-		var parseArg = _v0.a;
-		return $elm$url$Url$Parser$Parser(
-			function (_v1) {
-				var visited = _v1.visited;
-				var unvisited = _v1.unvisited;
-				var params = _v1.params;
-				var frag = _v1.frag;
-				var value = _v1.value;
-				return A2(
-					$elm$core$List$map,
-					$elm$url$Url$Parser$mapState(value),
-					parseArg(
-						A5($elm$url$Url$Parser$State, visited, unvisited, params, frag, subValue)));
-			});
-	});
-var $elm$core$List$append = F2(
-	function (xs, ys) {
-		if (!ys.b) {
-			return xs;
-		} else {
-			return A3($elm$core$List$foldr, $elm$core$List$cons, ys, xs);
-		}
-	});
-var $elm$core$List$concat = function (lists) {
-	return A3($elm$core$List$foldr, $elm$core$List$append, _List_Nil, lists);
-};
-var $elm$core$List$concatMap = F2(
-	function (f, list) {
-		return $elm$core$List$concat(
-			A2($elm$core$List$map, f, list));
-	});
-var $elm$url$Url$Parser$oneOf = function (parsers) {
-	return $elm$url$Url$Parser$Parser(
-		function (state) {
-			return A2(
-				$elm$core$List$concatMap,
-				function (_v0) {
-					var parser = _v0.a;
-					return parser(state);
-				},
-				parsers);
-		});
-};
-var $elm$url$Url$Parser$s = function (str) {
-	return $elm$url$Url$Parser$Parser(
-		function (_v0) {
-			var visited = _v0.visited;
-			var unvisited = _v0.unvisited;
-			var params = _v0.params;
-			var frag = _v0.frag;
-			var value = _v0.value;
-			if (!unvisited.b) {
-				return _List_Nil;
-			} else {
-				var next = unvisited.a;
-				var rest = unvisited.b;
-				return _Utils_eq(next, str) ? _List_fromArray(
-					[
-						A5(
-						$elm$url$Url$Parser$State,
-						A2($elm$core$List$cons, next, visited),
-						rest,
-						params,
-						frag,
-						value)
-					]) : _List_Nil;
-			}
-		});
-};
-var $elm$url$Url$Parser$slash = F2(
-	function (_v0, _v1) {
-		var parseBefore = _v0.a;
-		var parseAfter = _v1.a;
-		return $elm$url$Url$Parser$Parser(
-			function (state) {
-				return A2(
-					$elm$core$List$concatMap,
-					parseAfter,
-					parseBefore(state));
-			});
-	});
-var $elm$url$Url$Parser$top = $elm$url$Url$Parser$Parser(
-	function (state) {
-		return _List_fromArray(
-			[state]);
-	});
-var $author$project$Route$matchRoute = $elm$url$Url$Parser$oneOf(
-	_List_fromArray(
-		[
-			A2($elm$url$Url$Parser$map, $author$project$Route$Home, $elm$url$Url$Parser$top),
-			A2(
-			$elm$url$Url$Parser$map,
-			$author$project$Route$Disciplinas,
-			$elm$url$Url$Parser$s('disciplinas')),
-			A2(
-			$elm$url$Url$Parser$map,
-			$author$project$Route$Home,
-			$elm$url$Url$Parser$s('home')),
-			A2(
-			$elm$url$Url$Parser$map,
-			$author$project$Route$Login,
-			$elm$url$Url$Parser$s('login')),
-			A2(
-			$elm$url$Url$Parser$map,
-			$author$project$Route$Login,
-			$elm$url$Url$Parser$s('register')),
-			A2(
-			$elm$url$Url$Parser$map,
-			$author$project$Route$Perfil,
-			$elm$url$Url$Parser$s('perfil')),
-			A2(
-			$elm$url$Url$Parser$map,
-			$author$project$Route$Turma,
-			A2(
-				$elm$url$Url$Parser$slash,
-				$elm$url$Url$Parser$s('turma'),
-				$elm$url$Url$Parser$int)),
-			A2(
-			$elm$url$Url$Parser$map,
-			$author$project$Route$Disciplina,
-			A2(
-				$elm$url$Url$Parser$slash,
-				$elm$url$Url$Parser$s('disciplina'),
-				$elm$url$Url$Parser$int)),
-			A2(
-			$elm$url$Url$Parser$map,
-			$author$project$Route$Professor,
-			A2(
-				$elm$url$Url$Parser$slash,
-				$elm$url$Url$Parser$s('professor'),
-				$elm$url$Url$Parser$int)),
-			A2(
-			$elm$url$Url$Parser$map,
-			$author$project$Route$Professores,
-			$elm$url$Url$Parser$s('professores')),
-			A2(
-			$elm$url$Url$Parser$map,
-			$author$project$Route$Denuncias,
-			$elm$url$Url$Parser$s('denuncias'))
-		]));
-var $elm$url$Url$Parser$getFirstMatch = function (states) {
-	getFirstMatch:
-	while (true) {
-		if (!states.b) {
-			return $elm$core$Maybe$Nothing;
-		} else {
-			var state = states.a;
-			var rest = states.b;
-			var _v1 = state.unvisited;
-			if (!_v1.b) {
-				return $elm$core$Maybe$Just(state.value);
-			} else {
-				if ((_v1.a === '') && (!_v1.b.b)) {
-					return $elm$core$Maybe$Just(state.value);
-				} else {
-					var $temp$states = rest;
-					states = $temp$states;
-					continue getFirstMatch;
-				}
-			}
-		}
-	}
-};
-var $elm$url$Url$Parser$removeFinalEmpty = function (segments) {
-	if (!segments.b) {
-		return _List_Nil;
-	} else {
-		if ((segments.a === '') && (!segments.b.b)) {
-			return _List_Nil;
-		} else {
-			var segment = segments.a;
-			var rest = segments.b;
-			return A2(
-				$elm$core$List$cons,
-				segment,
-				$elm$url$Url$Parser$removeFinalEmpty(rest));
-		}
-	}
-};
-var $elm$url$Url$Parser$preparePath = function (path) {
-	var _v0 = A2($elm$core$String$split, '/', path);
-	if (_v0.b && (_v0.a === '')) {
-		var segments = _v0.b;
-		return $elm$url$Url$Parser$removeFinalEmpty(segments);
-	} else {
-		var segments = _v0;
-		return $elm$url$Url$Parser$removeFinalEmpty(segments);
-	}
-};
-var $elm$url$Url$Parser$addToParametersHelp = F2(
-	function (value, maybeList) {
-		if (maybeList.$ === 'Nothing') {
-			return $elm$core$Maybe$Just(
-				_List_fromArray(
-					[value]));
-		} else {
-			var list = maybeList.a;
-			return $elm$core$Maybe$Just(
-				A2($elm$core$List$cons, value, list));
-		}
-	});
-var $elm$url$Url$percentDecode = _Url_percentDecode;
-var $elm$url$Url$Parser$addParam = F2(
-	function (segment, dict) {
-		var _v0 = A2($elm$core$String$split, '=', segment);
-		if ((_v0.b && _v0.b.b) && (!_v0.b.b.b)) {
-			var rawKey = _v0.a;
-			var _v1 = _v0.b;
-			var rawValue = _v1.a;
-			var _v2 = $elm$url$Url$percentDecode(rawKey);
-			if (_v2.$ === 'Nothing') {
-				return dict;
-			} else {
-				var key = _v2.a;
-				var _v3 = $elm$url$Url$percentDecode(rawValue);
-				if (_v3.$ === 'Nothing') {
-					return dict;
-				} else {
-					var value = _v3.a;
-					return A3(
-						$elm$core$Dict$update,
-						key,
-						$elm$url$Url$Parser$addToParametersHelp(value),
-						dict);
-				}
-			}
-		} else {
-			return dict;
-		}
-	});
-var $elm$url$Url$Parser$prepareQuery = function (maybeQuery) {
-	if (maybeQuery.$ === 'Nothing') {
-		return $elm$core$Dict$empty;
-	} else {
-		var qry = maybeQuery.a;
-		return A3(
-			$elm$core$List$foldr,
-			$elm$url$Url$Parser$addParam,
-			$elm$core$Dict$empty,
-			A2($elm$core$String$split, '&', qry));
-	}
-};
-var $elm$url$Url$Parser$parse = F2(
-	function (_v0, url) {
-		var parser = _v0.a;
-		return $elm$url$Url$Parser$getFirstMatch(
-			parser(
-				A5(
-					$elm$url$Url$Parser$State,
-					_List_Nil,
-					$elm$url$Url$Parser$preparePath(url.path),
-					$elm$url$Url$Parser$prepareQuery(url.query),
-					url.fragment,
-					$elm$core$Basics$identity)));
-	});
-var $author$project$Route$parseUrl = function (url) {
-	var _v0 = A2($elm$url$Url$Parser$parse, $author$project$Route$matchRoute, url);
-	if (_v0.$ === 'Just') {
-		var route = _v0.a;
-		return route;
-	} else {
-		return $author$project$Route$NotFound;
-	}
-};
-var $author$project$Main$init = F3(
-	function (user, url, navKey) {
-		var model = {
-			navKey: navKey,
-			page: $author$project$Main$NotFoundPage,
-			route: $author$project$Route$parseUrl(url),
-			user: user
-		};
-		return $author$project$Main$initCurrentPage(
-			_Utils_Tuple2(model, $elm$core$Platform$Cmd$none));
-	});
-var $elm$core$Platform$Sub$batch = _Platform_batch;
-var $elm$core$Platform$Sub$none = $elm$core$Platform$Sub$batch(_List_Nil);
-var $elm$json$Json$Decode$null = _Json_decodeNull;
-var $elm$json$Json$Decode$oneOf = _Json_oneOf;
-var $elm$browser$Browser$Navigation$load = _Browser_load;
-var $elm$browser$Browser$Navigation$pushUrl = _Browser_pushUrl;
-var $elm$json$Json$Encode$int = _Json_wrap;
-var $author$project$Main$removeUserIdFromStorage = _Platform_outgoingPort('removeUserIdFromStorage', $elm$json$Json$Encode$int);
-var $elm$json$Json$Encode$bool = _Json_wrap;
-var $elm$json$Json$Encode$list = F2(
-	function (func, entries) {
-		return _Json_wrap(
-			A3(
-				$elm$core$List$foldl,
-				_Json_addEntry(func),
-				_Json_emptyArray(_Utils_Tuple0),
-				entries));
-	});
-var $author$project$Main$sendUserIdToStorage = _Platform_outgoingPort(
-	'sendUserIdToStorage',
-	function ($) {
-		var a = $.a;
-		var b = $.b;
-		return A2(
-			$elm$json$Json$Encode$list,
-			$elm$core$Basics$identity,
-			_List_fromArray(
-				[
-					$elm$json$Json$Encode$int(a),
-					$elm$json$Json$Encode$bool(b)
-				]));
-	});
-var $elm$url$Url$addPort = F2(
-	function (maybePort, starter) {
-		if (maybePort.$ === 'Nothing') {
-			return starter;
-		} else {
-			var port_ = maybePort.a;
-			return starter + (':' + $elm$core$String$fromInt(port_));
-		}
-	});
-var $elm$url$Url$addPrefixed = F3(
-	function (prefix, maybeSegment, starter) {
-		if (maybeSegment.$ === 'Nothing') {
-			return starter;
-		} else {
-			var segment = maybeSegment.a;
-			return _Utils_ap(
-				starter,
-				_Utils_ap(prefix, segment));
-		}
-	});
-var $elm$url$Url$toString = function (url) {
-	var http = function () {
-		var _v0 = url.protocol;
-		if (_v0.$ === 'Http') {
-			return 'http://';
-		} else {
-			return 'https://';
-		}
-	}();
-	return A3(
-		$elm$url$Url$addPrefixed,
-		'#',
-		url.fragment,
-		A3(
-			$elm$url$Url$addPrefixed,
-			'?',
-			url.query,
-			_Utils_ap(
-				A2(
-					$elm$url$Url$addPort,
-					url.port_,
-					_Utils_ap(http, url.host)),
-				url.path)));
-};
-var $author$project$Page$Denuncias$WebRemoveAvaliacaoData = function (a) {
-	return {$: 'WebRemoveAvaliacaoData', a: a};
-};
-var $author$project$Page$Denuncias$banirUsuarioUrl = function (id) {
-	return 'http://127.0.0.1:5000/api/avaliacao/userban/' + $elm$core$String$fromInt(id);
-};
-var $author$project$Page$Denuncias$removeAvaliacaoDecoder = A2($elm$json$Json$Decode$field, 'message', $elm$json$Json$Decode$string);
-var $author$project$Page$Denuncias$banirUsuarioCmd = function (avaliacaoId) {
-	return $elm$http$Http$request(
-		{
-			body: $elm$http$Http$emptyBody,
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Denuncias$WebRemoveAvaliacaoData, $author$project$Page$Denuncias$removeAvaliacaoDecoder),
-			headers: _List_Nil,
-			method: 'DELETE',
-			timeout: $elm$core$Maybe$Nothing,
-			tracker: $elm$core$Maybe$Nothing,
-			url: $author$project$Page$Denuncias$banirUsuarioUrl(avaliacaoId)
-		});
-};
-var $author$project$ErrorMsg$buildErrorMsg = function (httpError) {
-	switch (httpError.$) {
-		case 'BadUrl':
-			var message = httpError.a;
-			return message;
-		case 'Timeout':
-			return 'Server is taking too long to respond. Please try again later.';
-		case 'NetworkError':
-			return 'Unable to reach server.';
-		case 'BadStatus':
-			var statusCode = httpError.a;
-			return 'Request failed with status code: ' + $elm$core$String$fromInt(statusCode);
-		default:
-			var message = httpError.a;
-			return message;
-	}
-};
-var $author$project$Page$Denuncias$removeAvaliacaoUrl = function (id) {
-	return 'http://127.0.0.1:5000/api/avaliacao/' + $elm$core$String$fromInt(id);
-};
-var $author$project$Page$Denuncias$removeAvaliacaoCmd = function (avaliacaoId) {
-	return $elm$http$Http$request(
-		{
-			body: $elm$http$Http$emptyBody,
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Denuncias$WebRemoveAvaliacaoData, $author$project$Page$Denuncias$removeAvaliacaoDecoder),
-			headers: _List_Nil,
-			method: 'DELETE',
-			timeout: $elm$core$Maybe$Nothing,
-			tracker: $elm$core$Maybe$Nothing,
-			url: $author$project$Page$Denuncias$removeAvaliacaoUrl(avaliacaoId)
-		});
-};
-var $author$project$Page$Denuncias$WebRemoveDenunciaData = function (a) {
-	return {$: 'WebRemoveDenunciaData', a: a};
-};
-var $author$project$Page$Denuncias$removeDenunciaDecoder = A2($elm$json$Json$Decode$field, 'message', $elm$json$Json$Decode$string);
-var $author$project$Page$Denuncias$removeDenunciaUrl = function (id) {
-	return 'http://127.0.0.1:5000/api/denuncia/' + $elm$core$String$fromInt(id);
-};
-var $author$project$Page$Denuncias$removeDenunciaCmd = function (denunciaId) {
-	return $elm$http$Http$request(
-		{
-			body: $elm$http$Http$emptyBody,
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Denuncias$WebRemoveDenunciaData, $author$project$Page$Denuncias$removeDenunciaDecoder),
-			headers: _List_Nil,
-			method: 'DELETE',
-			timeout: $elm$core$Maybe$Nothing,
-			tracker: $elm$core$Maybe$Nothing,
-			url: $author$project$Page$Denuncias$removeDenunciaUrl(denunciaId)
-		});
-};
-var $author$project$Page$Denuncias$update = F2(
-	function (msg, model) {
-		switch (msg.$) {
-			case 'WebData':
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var denuncias = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{denuncias: denuncias}),
-						$elm$core$Platform$Cmd$none);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								errorMsg: $elm$core$Maybe$Just(
-									$author$project$ErrorMsg$buildErrorMsg(httpError))
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-			case 'WebRemoveDenunciaData':
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var message = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								errorMsg: $elm$core$Maybe$Just(message)
-							}),
-						$author$project$Page$Denuncias$getDenuncias);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								errorMsg: $elm$core$Maybe$Just(
-									$author$project$ErrorMsg$buildErrorMsg(httpError))
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-			case 'WebRemoveAvaliacaoData':
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var message = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								errorMsg: $elm$core$Maybe$Just(message)
-							}),
-						$elm$core$Platform$Cmd$none);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								errorMsg: $elm$core$Maybe$Just(
-									$author$project$ErrorMsg$buildErrorMsg(httpError))
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-			case 'RemoverAvaliacao':
-				var avaliacaoId = msg.a;
-				var denunciaId = msg.b;
-				return _Utils_Tuple2(
-					model,
-					$elm$core$Platform$Cmd$batch(
-						_List_fromArray(
-							[
-								$author$project$Page$Denuncias$removeAvaliacaoCmd(avaliacaoId),
-								$author$project$Page$Denuncias$removeDenunciaCmd(denunciaId)
-							])));
-			case 'RemoverDenuncia':
-				var denunciaId = msg.a;
-				return _Utils_Tuple2(
-					model,
-					$author$project$Page$Denuncias$removeDenunciaCmd(denunciaId));
-			default:
-				var avaliacaoId = msg.a;
-				return _Utils_Tuple2(
-					model,
-					$author$project$Page$Denuncias$banirUsuarioCmd(avaliacaoId));
-		}
-	});
-var $author$project$Page$Disciplina$update = F2(
-	function (msg, model) {
-		var result = msg.a;
-		if (result.$ === 'Ok') {
-			var disciplina = result.a;
-			return _Utils_Tuple2(
-				_Utils_update(
-					model,
-					{disciplina: disciplina}),
-				$elm$core$Platform$Cmd$none);
-		} else {
-			var httpError = result.a;
-			return _Utils_Tuple2(
-				_Utils_update(
-					model,
-					{
-						errorMsg: $elm$core$Maybe$Just(
-							$author$project$ErrorMsg$buildErrorMsg(httpError))
-					}),
-				$elm$core$Platform$Cmd$none);
-		}
-	});
-var $author$project$Page$Home$update = F2(
-	function (msg, model) {
-		return _Utils_Tuple2(model, $elm$core$Platform$Cmd$none);
-	});
-var $author$project$Page$ListDisciplinas$update = F2(
-	function (msg, model) {
-		var result = msg.a;
-		if (result.$ === 'Ok') {
-			var disciplinas = result.a;
-			return _Utils_Tuple2(
-				_Utils_update(
-					model,
-					{disciplinas: disciplinas}),
-				$elm$core$Platform$Cmd$none);
-		} else {
-			var httpError = result.a;
-			return _Utils_Tuple2(
-				_Utils_update(
-					model,
-					{
-						errorMsg: $elm$core$Maybe$Just(
-							$author$project$ErrorMsg$buildErrorMsg(httpError))
-					}),
-				$elm$core$Platform$Cmd$none);
-		}
-	});
-var $author$project$Page$Login$WebLoginData = function (a) {
-	return {$: 'WebLoginData', a: a};
-};
-var $elm$http$Http$jsonBody = function (value) {
-	return A2(
-		_Http_pair,
-		'application/json',
-		A2($elm$json$Json$Encode$encode, 0, value));
-};
-var $author$project$Page$Login$loginUrl = 'http://127.0.0.1:5000/api/user';
-var $elm$core$Tuple$pair = F2(
-	function (a, b) {
-		return _Utils_Tuple2(a, b);
-	});
-var $author$project$Page$Login$userIdDecoder = A3(
-	$elm$json$Json$Decode$map2,
-	$elm$core$Tuple$pair,
-	A2($elm$json$Json$Decode$field, 'user_id', $elm$json$Json$Decode$int),
-	A2($elm$json$Json$Decode$field, 'is_admin', $elm$json$Json$Decode$bool));
-var $elm$json$Json$Encode$object = function (pairs) {
-	return _Json_wrap(
-		A3(
-			$elm$core$List$foldl,
-			F2(
-				function (_v0, obj) {
-					var k = _v0.a;
-					var v = _v0.b;
-					return A3(_Json_addField, k, v, obj);
-				}),
-			_Json_emptyObject(_Utils_Tuple0),
-			pairs));
-};
-var $elm$json$Json$Encode$string = _Json_wrap;
-var $author$project$Page$Login$userLoginEncoder = function (user) {
-	return $elm$json$Json$Encode$object(
-		_List_fromArray(
-			[
-				_Utils_Tuple2(
-				'email',
-				$elm$json$Json$Encode$string(user.email)),
-				_Utils_Tuple2(
-				'password',
-				$elm$json$Json$Encode$string(user.password))
-			]));
-};
-var $author$project$Page$Login$authUserCmd = function (model) {
-	return $elm$http$Http$request(
-		{
-			body: $elm$http$Http$jsonBody(
-				$author$project$Page$Login$userLoginEncoder(model.loginUser)),
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Login$WebLoginData, $author$project$Page$Login$userIdDecoder),
-			headers: _List_Nil,
-			method: 'POST',
-			timeout: $elm$core$Maybe$Nothing,
-			tracker: $elm$core$Maybe$Nothing,
-			url: $author$project$Page$Login$loginUrl
-		});
-};
-var $author$project$Page$Login$loginUpdateEmail = F2(
-	function (user, value) {
-		return _Utils_update(
-			user,
-			{email: value});
-	});
-var $author$project$Page$Login$loginUpdatePassword = F2(
-	function (user, value) {
-		return _Utils_update(
-			user,
-			{password: value});
-	});
-var $author$project$Page$Login$registerUpdateCurso = F2(
-	function (user, value) {
-		return _Utils_update(
-			user,
-			{curso: value});
-	});
-var $author$project$Page$Login$registerUpdateEmail = F2(
-	function (user, value) {
-		return _Utils_update(
-			user,
-			{email: value});
-	});
-var $author$project$Page$Login$registerUpdateMatricula = F2(
-	function (user, value) {
-		return _Utils_update(
-			user,
-			{matricula: value});
-	});
-var $author$project$Page$Login$registerUpdateNome = F2(
-	function (user, value) {
-		return _Utils_update(
-			user,
-			{nome: value});
-	});
-var $author$project$Page$Login$registerUpdatePassword = F2(
-	function (user, value) {
-		return _Utils_update(
-			user,
-			{password: value});
-	});
-var $author$project$Page$Login$WebRegisterData = function (a) {
-	return {$: 'WebRegisterData', a: a};
-};
-var $author$project$Page$Login$registerUrl = 'http://127.0.0.1:5000/api/user/register';
-var $author$project$Page$Login$userRegisterEncoder = function (user) {
-	return $elm$json$Json$Encode$object(
-		_List_fromArray(
-			[
-				_Utils_Tuple2(
-				'email',
-				$elm$json$Json$Encode$string(user.email)),
-				_Utils_Tuple2(
-				'nome',
-				$elm$json$Json$Encode$string(user.nome)),
-				_Utils_Tuple2(
-				'matricula',
-				$elm$json$Json$Encode$string(user.matricula)),
-				_Utils_Tuple2(
-				'curso',
-				$elm$json$Json$Encode$string(user.curso)),
-				_Utils_Tuple2(
-				'password',
-				$elm$json$Json$Encode$string(user.password))
-			]));
-};
-var $author$project$Page$Login$registerUserCmd = function (model) {
-	return $elm$http$Http$request(
-		{
-			body: $elm$http$Http$jsonBody(
-				$author$project$Page$Login$userRegisterEncoder(model.registerUser)),
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Login$WebRegisterData, $author$project$Page$Login$userIdDecoder),
-			headers: _List_Nil,
-			method: 'POST',
-			timeout: $elm$core$Maybe$Nothing,
-			tracker: $elm$core$Maybe$Nothing,
-			url: $author$project$Page$Login$registerUrl
-		});
-};
-var $author$project$Page$Login$update = F2(
-	function (msg, model) {
-		switch (msg.$) {
-			case 'LoginSetEmail':
-				var email = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{
-							loginUser: A2($author$project$Page$Login$loginUpdateEmail, model.loginUser, email)
-						}),
-					$elm$core$Platform$Cmd$none);
-			case 'LoginSetPassword':
-				var password = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{
-							loginUser: A2($author$project$Page$Login$loginUpdatePassword, model.loginUser, password)
-						}),
-					$elm$core$Platform$Cmd$none);
-			case 'RegisterSetEmail':
-				var email = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{
-							registerUser: A2($author$project$Page$Login$registerUpdateEmail, model.registerUser, email)
-						}),
-					$elm$core$Platform$Cmd$none);
-			case 'RegisterSetNome':
-				var nome = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{
-							registerUser: A2($author$project$Page$Login$registerUpdateNome, model.registerUser, nome)
-						}),
-					$elm$core$Platform$Cmd$none);
-			case 'RegisterSetMatricula':
-				var matricula = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{
-							registerUser: A2($author$project$Page$Login$registerUpdateMatricula, model.registerUser, matricula)
-						}),
-					$elm$core$Platform$Cmd$none);
-			case 'RegisterSetCurso':
-				var curso = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{
-							registerUser: A2($author$project$Page$Login$registerUpdateCurso, model.registerUser, curso)
-						}),
-					$elm$core$Platform$Cmd$none);
-			case 'RegisterSetPassword':
-				var password = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{
-							registerUser: A2($author$project$Page$Login$registerUpdatePassword, model.registerUser, password)
-						}),
-					$elm$core$Platform$Cmd$none);
-			case 'ClickLogin':
-				return _Utils_Tuple2(
-					model,
-					$author$project$Page$Login$authUserCmd(model));
-			case 'ClickRegister':
-				return _Utils_Tuple2(
-					model,
-					$author$project$Page$Login$registerUserCmd(model));
-			case 'WebLoginData':
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var user = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								user: $elm$core$Maybe$Just(user)
-							}),
-						$elm$core$Platform$Cmd$none);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								loginErrorMsg: $elm$core$Maybe$Just('Email or Password Invalid')
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-			default:
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var user = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								user: $elm$core$Maybe$Just(user)
-							}),
-						$elm$core$Platform$Cmd$none);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								registerErrorMsg: $elm$core$Maybe$Just('Fail to register user')
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-		}
-	});
-var $author$project$Page$Perfil$UpdatingPassword = {$: 'UpdatingPassword'};
-var $author$project$Page$Perfil$UpdatingUser = {$: 'UpdatingUser'};
-var $author$project$Page$Perfil$WebDeleteUser = function (a) {
-	return {$: 'WebDeleteUser', a: a};
-};
-var $author$project$Page$Perfil$deleteUserDecoder = A2($elm$json$Json$Decode$field, 'message', $elm$json$Json$Decode$string);
-var $author$project$Page$Perfil$deleteUserUrl = function (userId) {
-	return 'http://127.0.0.1:5000/api/user/' + $elm$core$String$fromInt(userId);
-};
-var $author$project$Page$Perfil$deleteUserCmd = function (model) {
-	return $elm$http$Http$request(
-		{
-			body: $elm$http$Http$emptyBody,
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Perfil$WebDeleteUser, $author$project$Page$Perfil$deleteUserDecoder),
-			headers: _List_Nil,
-			method: 'DELETE',
-			timeout: $elm$core$Maybe$Nothing,
-			tracker: $elm$core$Maybe$Nothing,
-			url: $author$project$Page$Perfil$deleteUserUrl(model.userId)
-		});
-};
-var $author$project$Page$Perfil$updateCurrentPassword = F2(
-	function (model, value) {
-		return _Utils_update(
-			model,
-			{
-				passwordInfo: function (p) {
-					return _Utils_update(
-						p,
-						{currentPassword: value});
-				}(model.passwordInfo)
-			});
-	});
-var $author$project$Page$Perfil$updateCurso = F2(
-	function (model, value) {
-		return _Utils_update(
-			model,
-			{
-				updatingUser: function (u) {
-					return _Utils_update(
-						u,
-						{curso: value});
-				}(model.updatingUser)
-			});
-	});
-var $author$project$Page$Perfil$updateEmail = F2(
-	function (model, value) {
-		return _Utils_update(
-			model,
-			{
-				updatingUser: function (u) {
-					return _Utils_update(
-						u,
-						{email: value});
-				}(model.updatingUser)
-			});
-	});
-var $author$project$Page$Perfil$updateMatricula = F2(
-	function (model, value) {
-		return _Utils_update(
-			model,
-			{
-				updatingUser: function (u) {
-					return _Utils_update(
-						u,
-						{matricula: value});
-				}(model.updatingUser)
-			});
-	});
-var $author$project$Page$Perfil$updateNewPassword = F2(
-	function (model, value) {
-		return _Utils_update(
-			model,
-			{
-				passwordInfo: function (p) {
-					return _Utils_update(
-						p,
-						{newPassword: value});
-				}(model.passwordInfo)
-			});
-	});
-var $author$project$Page$Perfil$updateNome = F2(
-	function (model, value) {
-		return _Utils_update(
-			model,
-			{
-				updatingUser: function (u) {
-					return _Utils_update(
-						u,
-						{nome: value});
-				}(model.updatingUser)
-			});
-	});
-var $author$project$Page$Perfil$WebPasswordData = function (a) {
-	return {$: 'WebPasswordData', a: a};
-};
-var $author$project$Page$Perfil$updatePasswordDecoder = A2($elm$json$Json$Decode$field, 'message', $elm$json$Json$Decode$string);
-var $author$project$Page$Perfil$updatePasswordEncoder = function (password) {
-	return $elm$json$Json$Encode$object(
-		_List_fromArray(
-			[
-				_Utils_Tuple2(
-				'current_password',
-				$elm$json$Json$Encode$string(password.currentPassword)),
-				_Utils_Tuple2(
-				'new_password',
-				$elm$json$Json$Encode$string(password.newPassword))
-			]));
-};
-var $author$project$Page$Perfil$updatePasswordUrl = function (userId) {
-	return 'http://127.0.0.1:5000/api/user/' + ($elm$core$String$fromInt(userId) + '/password');
-};
-var $author$project$Page$Perfil$updatePasswordCmd = function (model) {
-	return $elm$http$Http$request(
-		{
-			body: $elm$http$Http$jsonBody(
-				$author$project$Page$Perfil$updatePasswordEncoder(model.passwordInfo)),
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Perfil$WebPasswordData, $author$project$Page$Perfil$updatePasswordDecoder),
-			headers: _List_Nil,
-			method: 'PUT',
-			timeout: $elm$core$Maybe$Nothing,
-			tracker: $elm$core$Maybe$Nothing,
-			url: $author$project$Page$Perfil$updatePasswordUrl(model.userId)
-		});
-};
-var $author$project$Page$Perfil$WebUpdateUserData = function (a) {
-	return {$: 'WebUpdateUserData', a: a};
-};
-var $author$project$Page$Perfil$userUpdateEncoder = function (user) {
-	return $elm$json$Json$Encode$object(
-		_List_fromArray(
-			[
-				_Utils_Tuple2(
-				'email',
-				$elm$json$Json$Encode$string(user.email)),
-				_Utils_Tuple2(
-				'nome',
-				$elm$json$Json$Encode$string(user.nome)),
-				_Utils_Tuple2(
-				'matricula',
-				$elm$json$Json$Encode$string(user.matricula)),
-				_Utils_Tuple2(
-				'curso',
-				$elm$json$Json$Encode$string(user.curso))
-			]));
-};
-var $author$project$Page$Perfil$updateUserCmd = function (model) {
-	return $elm$http$Http$request(
-		{
-			body: $elm$http$Http$jsonBody(
-				$author$project$Page$Perfil$userUpdateEncoder(model.updatingUser)),
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Perfil$WebUpdateUserData, $author$project$Page$Perfil$userDecoder),
-			headers: _List_Nil,
-			method: 'PUT',
-			timeout: $elm$core$Maybe$Nothing,
-			tracker: $elm$core$Maybe$Nothing,
-			url: $author$project$Page$Perfil$userUrl(model.userId)
-		});
-};
-var $author$project$Page$Perfil$update = F2(
-	function (msg, model) {
-		switch (msg.$) {
-			case 'WebUserData':
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var user = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								state: $author$project$Page$Perfil$Showing,
-								updatingUser: user,
-								user: $elm$core$Maybe$Just(user)
-							}),
-						$elm$core$Platform$Cmd$none);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								errorMsg: $elm$core$Maybe$Just(
-									$author$project$ErrorMsg$buildErrorMsg(httpError))
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-			case 'WebUpdateUserData':
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var user = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								infoMsg: $elm$core$Maybe$Just('SUCESS: User updated'),
-								state: $author$project$Page$Perfil$Showing,
-								updatingUser: user,
-								user: $elm$core$Maybe$Just(user)
-							}),
-						$elm$core$Platform$Cmd$none);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								infoMsg: $elm$core$Maybe$Just('FAIL:  error in update user')
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-			case 'WebPasswordData':
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var infoMsg = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								infoMsg: $elm$core$Maybe$Just('SUCESS: Password updated'),
-								state: $author$project$Page$Perfil$Showing
-							}),
-						$elm$core$Platform$Cmd$none);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								infoMsg: $elm$core$Maybe$Just('FAIL: current password is wrong')
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-			case 'WebDeleteUser':
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var infoMsg = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								infoMsg: $elm$core$Maybe$Just('SUCESS: User deleted sucessfully'),
-								state: $author$project$Page$Perfil$Showing
-							}),
-						$elm$core$Platform$Cmd$none);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								infoMsg: $elm$core$Maybe$Just('FAIL: Fail to delete user')
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-			case 'SetNome':
-				var nome = msg.a;
-				return _Utils_Tuple2(
-					A2($author$project$Page$Perfil$updateNome, model, nome),
-					$elm$core$Platform$Cmd$none);
-			case 'SetMatricula':
-				var matricula = msg.a;
-				return _Utils_Tuple2(
-					A2($author$project$Page$Perfil$updateMatricula, model, matricula),
-					$elm$core$Platform$Cmd$none);
-			case 'SetEmail':
-				var email = msg.a;
-				return _Utils_Tuple2(
-					A2($author$project$Page$Perfil$updateEmail, model, email),
-					$elm$core$Platform$Cmd$none);
-			case 'SetCurso':
-				var curso = msg.a;
-				return _Utils_Tuple2(
-					A2($author$project$Page$Perfil$updateCurso, model, curso),
-					$elm$core$Platform$Cmd$none);
-			case 'SetNewPassword':
-				var newPassword = msg.a;
-				return _Utils_Tuple2(
-					A2($author$project$Page$Perfil$updateNewPassword, model, newPassword),
-					$elm$core$Platform$Cmd$none);
-			case 'SetCurrentPassword':
-				var currentPassword = msg.a;
-				return _Utils_Tuple2(
-					A2($author$project$Page$Perfil$updateCurrentPassword, model, currentPassword),
-					$elm$core$Platform$Cmd$none);
-			case 'ClickUpdateUser':
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{state: $author$project$Page$Perfil$UpdatingUser}),
-					$elm$core$Platform$Cmd$none);
-			case 'ClickUpdatePassword':
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{state: $author$project$Page$Perfil$UpdatingPassword}),
-					$elm$core$Platform$Cmd$none);
-			case 'ClickCancel':
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{state: $author$project$Page$Perfil$Showing}),
-					$elm$core$Platform$Cmd$none);
-			case 'ClickSendUserUpdate':
-				return _Utils_Tuple2(
-					model,
-					$author$project$Page$Perfil$updateUserCmd(model));
-			case 'ClickSendPasswordUpdate':
-				return _Utils_Tuple2(
-					model,
-					$author$project$Page$Perfil$updatePasswordCmd(model));
-			case 'Loggout':
-				return _Utils_Tuple2(model, $elm$core$Platform$Cmd$none);
-			default:
-				return _Utils_Tuple2(
-					model,
-					$author$project$Page$Perfil$deleteUserCmd(model));
-		}
-	});
-var $author$project$Page$Professor$addAvalicao = F2(
-	function (professor, avaliacao) {
-		return _Utils_update(
-			professor,
-			{
-				avaliacoes: _Utils_ap(
-					professor.avaliacoes,
-					_List_fromArray(
-						[avaliacao])),
-				qtdAvaliacoes: professor.qtdAvaliacoes + 1,
-				sumAvaliacoes: professor.sumAvaliacoes + avaliacao.pontuacao
-			});
-	});
-var $author$project$Page$Professor$WebNewAvaliacaoData = function (a) {
-	return {$: 'WebNewAvaliacaoData', a: a};
-};
-var $author$project$Page$Professor$newAvaliacaoEncoder = function (avaliacao) {
-	return $elm$json$Json$Encode$object(
-		_List_fromArray(
-			[
-				_Utils_Tuple2(
-				'user_id',
-				$elm$json$Json$Encode$int(avaliacao.userId)),
-				_Utils_Tuple2(
-				'comentario',
-				$elm$json$Json$Encode$string(avaliacao.comentario)),
-				_Utils_Tuple2(
-				'pontuacao',
-				$elm$json$Json$Encode$int(avaliacao.pontuacao))
-			]));
-};
-var $author$project$Page$Professor$newAvaliacaoUrl = function (id) {
-	return 'http://127.0.0.1:5000/api/professor/' + ($elm$core$String$fromInt(id) + '/avaliacao');
-};
-var $author$project$Page$Professor$newAvaliacaoCmd = function (model) {
-	return $elm$http$Http$request(
-		{
-			body: $elm$http$Http$jsonBody(
-				$author$project$Page$Professor$newAvaliacaoEncoder(model.newAvaliacao)),
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Professor$WebNewAvaliacaoData, $author$project$Page$Professor$avaliacaoDecoder),
-			headers: _List_Nil,
-			method: 'POST',
-			timeout: $elm$core$Maybe$Nothing,
-			tracker: $elm$core$Maybe$Nothing,
-			url: $author$project$Page$Professor$newAvaliacaoUrl(model.professorId)
-		});
-};
-var $author$project$Page$Professor$updateComentario = F2(
-	function (avaliacao, value) {
-		return _Utils_update(
-			avaliacao,
-			{comentario: value});
-	});
-var $elm$core$Basics$modBy = _Basics_modBy;
-var $elm$core$Maybe$withDefault = F2(
-	function (_default, maybe) {
-		if (maybe.$ === 'Just') {
-			var value = maybe.a;
-			return value;
-		} else {
-			return _default;
-		}
-	});
-var $author$project$Page$Professor$updatePontuacao = F2(
-	function (avaliacao, value) {
-		return _Utils_update(
-			avaliacao,
-			{
-				pontuacao: A2(
-					$elm$core$Basics$modBy,
-					6,
-					A2(
-						$elm$core$Maybe$withDefault,
-						0,
-						$elm$core$String$toInt(value)))
-			});
-	});
-var $author$project$Page$Professor$update = F2(
-	function (msg, model) {
-		switch (msg.$) {
-			case 'WebProfessorData':
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var professor = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{professor: professor}),
-						$elm$core$Platform$Cmd$none);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								errorMsg: $elm$core$Maybe$Just(
-									$author$project$ErrorMsg$buildErrorMsg(httpError))
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-			case 'WebNewAvaliacaoData':
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var avaliacao = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								professor: A2($author$project$Page$Professor$addAvalicao, model.professor, avaliacao)
-							}),
-						$elm$core$Platform$Cmd$none);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								errorMsg: $elm$core$Maybe$Just(
-									$author$project$ErrorMsg$buildErrorMsg(httpError))
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-			case 'SetComentario':
-				var comentario = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{
-							newAvaliacao: A2($author$project$Page$Professor$updateComentario, model.newAvaliacao, comentario)
-						}),
-					$elm$core$Platform$Cmd$none);
-			case 'SetPontuacao':
-				var pontuacao = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{
-							newAvaliacao: A2($author$project$Page$Professor$updatePontuacao, model.newAvaliacao, pontuacao)
-						}),
-					$elm$core$Platform$Cmd$none);
-			default:
-				return _Utils_Tuple2(
-					model,
-					$author$project$Page$Professor$newAvaliacaoCmd(model));
-		}
-	});
-var $author$project$Page$Professores$update = F2(
-	function (msg, model) {
-		var result = msg.a;
-		if (result.$ === 'Ok') {
-			var professores = result.a;
-			return _Utils_Tuple2(
-				_Utils_update(
-					model,
-					{professores: professores}),
-				$elm$core$Platform$Cmd$none);
-		} else {
-			var httpError = result.a;
-			return _Utils_Tuple2(
-				_Utils_update(
-					model,
-					{
-						errorMsg: $elm$core$Maybe$Just(
-							$author$project$ErrorMsg$buildErrorMsg(httpError))
-					}),
-				$elm$core$Platform$Cmd$none);
-		}
-	});
-var $author$project$Page$Turma$Editing = function (a) {
-	return {$: 'Editing', a: a};
-};
-var $author$project$Page$Turma$Showing = {$: 'Showing'};
-var $author$project$Page$Turma$addAvalicao = F2(
-	function (turma, avaliacao) {
-		return _Utils_update(
-			turma,
-			{
-				avaliacoes: _Utils_ap(
-					turma.avaliacoes,
-					_List_fromArray(
-						[avaliacao])),
-				qtdAvaliacoes: turma.qtdAvaliacoes + 1,
-				sumAvaliacoes: turma.sumAvaliacoes + avaliacao.pontuacao
-			});
-	});
-var $author$project$Page$Turma$WebDenunciaData = function (a) {
-	return {$: 'WebDenunciaData', a: a};
-};
-var $author$project$Page$Turma$addDenuncia = 'http://127.0.0.1:5000/api/denuncias';
-var $author$project$Page$Turma$denunciaDecoder = A2($elm$json$Json$Decode$field, 'message', $elm$json$Json$Decode$string);
-var $author$project$Page$Turma$denunciaEncoder = function (avaliacaoId) {
-	return $elm$json$Json$Encode$object(
-		_List_fromArray(
-			[
-				_Utils_Tuple2(
-				'avaliacao_id',
-				$elm$json$Json$Encode$int(avaliacaoId))
-			]));
-};
-var $author$project$Page$Turma$denunciaCmd = function (avaliacaoId) {
-	return $elm$http$Http$request(
-		{
-			body: $elm$http$Http$jsonBody(
-				$author$project$Page$Turma$denunciaEncoder(avaliacaoId)),
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Turma$WebDenunciaData, $author$project$Page$Turma$denunciaDecoder),
-			headers: _List_Nil,
-			method: 'POST',
-			timeout: $elm$core$Maybe$Nothing,
-			tracker: $elm$core$Maybe$Nothing,
-			url: $author$project$Page$Turma$addDenuncia
-		});
-};
-var $author$project$Page$Turma$WebRemoveAvaliacaoData = function (a) {
-	return {$: 'WebRemoveAvaliacaoData', a: a};
-};
-var $author$project$Page$Turma$editAvaliacaoEncoder = function (avaliacao) {
-	return $elm$json$Json$Encode$object(
-		_List_fromArray(
-			[
-				_Utils_Tuple2(
-				'comentario',
-				$elm$json$Json$Encode$string(avaliacao.comentario)),
-				_Utils_Tuple2(
-				'pontuacao',
-				$elm$json$Json$Encode$int(avaliacao.pontuacao))
-			]));
-};
-var $author$project$Page$Turma$editAvaliacaoUrl = function (id) {
-	return 'http://127.0.0.1:5000/api/avaliacao/' + $elm$core$String$fromInt(id);
-};
-var $author$project$Page$Turma$removeAvaliacaoDecoder = A2($elm$json$Json$Decode$field, 'message', $elm$json$Json$Decode$string);
-var $author$project$Page$Turma$editComentarioCmd = F2(
-	function (model, id) {
-		return $elm$http$Http$request(
-			{
-				body: $elm$http$Http$jsonBody(
-					$author$project$Page$Turma$editAvaliacaoEncoder(model.editingAvaliacao)),
-				expect: A2($elm$http$Http$expectJson, $author$project$Page$Turma$WebRemoveAvaliacaoData, $author$project$Page$Turma$removeAvaliacaoDecoder),
-				headers: _List_Nil,
-				method: 'PUT',
-				timeout: $elm$core$Maybe$Nothing,
-				tracker: $elm$core$Maybe$Nothing,
-				url: $author$project$Page$Turma$editAvaliacaoUrl(id)
-			});
-	});
-var $author$project$Page$Turma$emptyAvaliacao = {comentario: '', id: 0, pontuacao: 0, userId: 0, userNome: ''};
-var $elm$core$List$filter = F2(
-	function (isGood, list) {
-		return A3(
-			$elm$core$List$foldr,
-			F2(
-				function (x, xs) {
-					return isGood(x) ? A2($elm$core$List$cons, x, xs) : xs;
-				}),
-			_List_Nil,
-			list);
-	});
-var $elm$core$List$head = function (list) {
-	if (list.b) {
-		var x = list.a;
-		var xs = list.b;
-		return $elm$core$Maybe$Just(x);
-	} else {
-		return $elm$core$Maybe$Nothing;
-	}
-};
-var $author$project$Page$Turma$toEdtingAvaliacao = function (avaliacao) {
-	return {comentario: avaliacao.comentario, pontuacao: avaliacao.pontuacao, userNome: avaliacao.userNome};
-};
-var $author$project$Page$Turma$getEditAvaliacao = F2(
-	function (id, avaliacoes) {
-		return $author$project$Page$Turma$toEdtingAvaliacao(
-			A2(
-				$elm$core$Maybe$withDefault,
-				$author$project$Page$Turma$emptyAvaliacao,
-				$elm$core$List$head(
-					A2(
-						$elm$core$List$filter,
-						function (a) {
-							return _Utils_eq(a.id, id);
-						},
-						avaliacoes))));
-	});
-var $author$project$Page$Turma$WebNewAvaliacaoData = function (a) {
-	return {$: 'WebNewAvaliacaoData', a: a};
-};
-var $author$project$Page$Turma$newAvaliacaoEncoder = function (avaliacao) {
-	return $elm$json$Json$Encode$object(
-		_List_fromArray(
-			[
-				_Utils_Tuple2(
-				'user_id',
-				$elm$json$Json$Encode$int(avaliacao.userId)),
-				_Utils_Tuple2(
-				'comentario',
-				$elm$json$Json$Encode$string(avaliacao.comentario)),
-				_Utils_Tuple2(
-				'pontuacao',
-				$elm$json$Json$Encode$int(avaliacao.pontuacao))
-			]));
-};
-var $author$project$Page$Turma$newAvaliacaoUrl = function (id) {
-	return 'http://127.0.0.1:5000/api/turma/' + ($elm$core$String$fromInt(id) + '/avaliacao');
-};
-var $author$project$Page$Turma$newAvaliacaoCmd = function (model) {
-	return $elm$http$Http$request(
-		{
-			body: $elm$http$Http$jsonBody(
-				$author$project$Page$Turma$newAvaliacaoEncoder(model.newAvaliacao)),
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Turma$WebNewAvaliacaoData, $author$project$Page$Turma$avaliacaoDecoder),
-			headers: _List_Nil,
-			method: 'POST',
-			timeout: $elm$core$Maybe$Nothing,
-			tracker: $elm$core$Maybe$Nothing,
-			url: $author$project$Page$Turma$newAvaliacaoUrl(model.turmaId)
-		});
-};
-var $author$project$Page$Turma$removeAvaliacaoUrl = function (id) {
-	return 'http://127.0.0.1:5000/api/avaliacao/' + $elm$core$String$fromInt(id);
-};
-var $author$project$Page$Turma$removeAvaliacaoCmd = function (avaliacaoId) {
-	return $elm$http$Http$request(
-		{
-			body: $elm$http$Http$emptyBody,
-			expect: A2($elm$http$Http$expectJson, $author$project$Page$Turma$WebRemoveAvaliacaoData, $author$project$Page$Turma$removeAvaliacaoDecoder),
-			headers: _List_Nil,
-			method: 'DELETE',
-			timeout: $elm$core$Maybe$Nothing,
-			tracker: $elm$core$Maybe$Nothing,
-			url: $author$project$Page$Turma$removeAvaliacaoUrl(avaliacaoId)
-		});
-};
-var $author$project$Page$Turma$updateComentario = F2(
-	function (avaliacao, value) {
-		return _Utils_update(
-			avaliacao,
-			{comentario: value});
-	});
-var $author$project$Page$Turma$updateEditComentario = F2(
-	function (avaliacao, value) {
-		return _Utils_update(
-			avaliacao,
-			{comentario: value});
-	});
-var $author$project$Page$Turma$updateEditPontuacao = F2(
-	function (avaliacao, value) {
-		return _Utils_update(
-			avaliacao,
-			{
-				pontuacao: A2(
-					$elm$core$Basics$modBy,
-					6,
-					A2(
-						$elm$core$Maybe$withDefault,
-						0,
-						$elm$core$String$toInt(value)))
-			});
-	});
-var $author$project$Page$Turma$updatePontuacao = F2(
-	function (avaliacao, value) {
-		return _Utils_update(
-			avaliacao,
-			{
-				pontuacao: A2(
-					$elm$core$Basics$modBy,
-					6,
-					A2(
-						$elm$core$Maybe$withDefault,
-						0,
-						$elm$core$String$toInt(value)))
-			});
-	});
-var $author$project$Page$Turma$update = F2(
-	function (msg, model) {
-		switch (msg.$) {
-			case 'WebTurmaData':
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var turma = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{turma: turma}),
-						$elm$core$Platform$Cmd$none);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								errorMsg: $elm$core$Maybe$Just(
-									$author$project$ErrorMsg$buildErrorMsg(httpError))
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-			case 'WebNewAvaliacaoData':
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var avaliacao = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								turma: A2($author$project$Page$Turma$addAvalicao, model.turma, avaliacao)
-							}),
-						$elm$core$Platform$Cmd$none);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								errorMsg: $elm$core$Maybe$Just(
-									$author$project$ErrorMsg$buildErrorMsg(httpError))
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-			case 'WebDenunciaData':
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var message = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								errorMsg: $elm$core$Maybe$Just(message)
-							}),
-						$elm$core$Platform$Cmd$none);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								errorMsg: $elm$core$Maybe$Just(
-									$author$project$ErrorMsg$buildErrorMsg(httpError))
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-			case 'WebRemoveAvaliacaoData':
-				var result = msg.a;
-				if (result.$ === 'Ok') {
-					var message = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								errorMsg: $elm$core$Maybe$Just(message)
-							}),
-						$elm$core$Platform$Cmd$none);
-				} else {
-					var httpError = result.a;
-					return _Utils_Tuple2(
-						_Utils_update(
-							model,
-							{
-								errorMsg: $elm$core$Maybe$Just(
-									$author$project$ErrorMsg$buildErrorMsg(httpError))
-							}),
-						$elm$core$Platform$Cmd$none);
-				}
-			case 'SetComentario':
-				var comentario = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{
-							newAvaliacao: A2($author$project$Page$Turma$updateComentario, model.newAvaliacao, comentario)
-						}),
-					$elm$core$Platform$Cmd$none);
-			case 'SetPontuacao':
-				var pontuacao = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{
-							newAvaliacao: A2($author$project$Page$Turma$updatePontuacao, model.newAvaliacao, pontuacao)
-						}),
-					$elm$core$Platform$Cmd$none);
-			case 'SetEditComentario':
-				var comentario = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{
-							editingAvaliacao: A2($author$project$Page$Turma$updateEditComentario, model.editingAvaliacao, comentario)
-						}),
-					$elm$core$Platform$Cmd$none);
-			case 'SetEditPontuacao':
-				var comentario = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{
-							editingAvaliacao: A2($author$project$Page$Turma$updateEditPontuacao, model.editingAvaliacao, comentario)
-						}),
-					$elm$core$Platform$Cmd$none);
-			case 'ClickNewComentario':
-				return _Utils_Tuple2(
-					model,
-					$author$project$Page$Turma$newAvaliacaoCmd(model));
-			case 'Denuncia':
-				var avaliacaoId = msg.a;
-				return _Utils_Tuple2(
-					model,
-					$author$project$Page$Turma$denunciaCmd(avaliacaoId));
-			case 'RemoverAvaliacao':
-				var avaliacaoId = msg.a;
-				return _Utils_Tuple2(
-					model,
-					$author$project$Page$Turma$removeAvaliacaoCmd(avaliacaoId));
-			case 'EditarAvaliacao':
-				var avaliacaoId = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{
-							editingAvaliacao: A2($author$project$Page$Turma$getEditAvaliacao, avaliacaoId, model.turma.avaliacoes),
-							state: $author$project$Page$Turma$Editing(avaliacaoId)
-						}),
-					$elm$core$Platform$Cmd$none);
-			case 'CancelarUpdate':
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{state: $author$project$Page$Turma$Showing}),
-					$elm$core$Platform$Cmd$none);
-			default:
-				var id = msg.a;
-				return _Utils_Tuple2(
-					_Utils_update(
-						model,
-						{state: $author$project$Page$Turma$Showing}),
-					A2($author$project$Page$Turma$editComentarioCmd, model, id));
-		}
-	});
-var $author$project$Main$update = F2(
-	function (msg, model) {
-		var _v0 = _Utils_Tuple2(msg, model.page);
-		_v0$4:
-		while (true) {
-			_v0$13:
-			while (true) {
-				switch (_v0.a.$) {
-					case 'DisciplinasMsg':
-						if (_v0.b.$ === 'Disciplinas') {
-							var subMsg = _v0.a.a;
-							var pageModel = _v0.b.a;
-							var _v1 = A2($author$project$Page$ListDisciplinas$update, subMsg, pageModel);
-							var updatedPageModel = _v1.a;
-							var updatedCmd = _v1.b;
-							return _Utils_Tuple2(
-								_Utils_update(
-									model,
-									{
-										page: $author$project$Main$Disciplinas(updatedPageModel)
-									}),
-								A2($elm$core$Platform$Cmd$map, $author$project$Main$DisciplinasMsg, updatedCmd));
-						} else {
-							break _v0$13;
-						}
-					case 'HomeMsg':
-						if (_v0.b.$ === 'Home') {
-							var subMsg = _v0.a.a;
-							var pageModel = _v0.b.a;
-							var _v3 = A2($author$project$Page$Home$update, subMsg, pageModel);
-							var updatedPageModel = _v3.a;
-							var updatedCmd = _v3.b;
-							return _Utils_Tuple2(
-								_Utils_update(
-									model,
-									{
-										page: $author$project$Main$Home(updatedPageModel)
-									}),
-								A2($elm$core$Platform$Cmd$map, $author$project$Main$HomeMsg, updatedCmd));
-						} else {
-							break _v0$13;
-						}
-					case 'PerfilMsg':
-						if (_v0.b.$ === 'Perfil') {
-							switch (_v0.a.a.$) {
-								case 'Loggout':
-									var _v2 = _v0.a.a;
-									var pageModel = _v0.b.a;
-									return _Utils_Tuple2(
-										_Utils_update(
-											model,
-											{user: $elm$core$Maybe$Nothing}),
-										$elm$core$Platform$Cmd$batch(
-											_List_fromArray(
-												[
-													A2($elm$browser$Browser$Navigation$pushUrl, model.navKey, '/login'),
-													$author$project$Main$removeUserIdFromStorage(0)
-												])));
-								case 'WebDeleteUser':
-									if (_v0.a.a.a.$ === 'Ok') {
-										var infoMsg = _v0.a.a.a.a;
-										var pageModel = _v0.b.a;
-										return _Utils_Tuple2(
-											_Utils_update(
-												model,
-												{user: $elm$core$Maybe$Nothing}),
-											$elm$core$Platform$Cmd$batch(
-												_List_fromArray(
-													[
-														A2($elm$browser$Browser$Navigation$pushUrl, model.navKey, '/login'),
-														$author$project$Main$removeUserIdFromStorage(0)
-													])));
-									} else {
-										break _v0$4;
-									}
-								default:
-									break _v0$4;
-							}
-						} else {
-							break _v0$13;
-						}
-					case 'DisciplinaMsg':
-						if (_v0.b.$ === 'Disciplina') {
-							var subMsg = _v0.a.a;
-							var pageModel = _v0.b.a;
-							var _v5 = A2($author$project$Page$Disciplina$update, subMsg, pageModel);
-							var updatedPageModel = _v5.a;
-							var updatedCmd = _v5.b;
-							return _Utils_Tuple2(
-								_Utils_update(
-									model,
-									{
-										page: $author$project$Main$Disciplina(updatedPageModel)
-									}),
-								A2($elm$core$Platform$Cmd$map, $author$project$Main$DisciplinaMsg, updatedCmd));
-						} else {
-							break _v0$13;
-						}
-					case 'TurmaMsg':
-						if (_v0.b.$ === 'Turma') {
-							var subMsg = _v0.a.a;
-							var pageModel = _v0.b.a;
-							var _v6 = A2($author$project$Page$Turma$update, subMsg, pageModel);
-							var updatedPageModel = _v6.a;
-							var updatedCmd = _v6.b;
-							return _Utils_Tuple2(
-								_Utils_update(
-									model,
-									{
-										page: $author$project$Main$Turma(updatedPageModel)
-									}),
-								A2($elm$core$Platform$Cmd$map, $author$project$Main$TurmaMsg, updatedCmd));
-						} else {
-							break _v0$13;
-						}
-					case 'ProfessorMsg':
-						if (_v0.b.$ === 'Professor') {
-							var subMsg = _v0.a.a;
-							var pageModel = _v0.b.a;
-							var _v7 = A2($author$project$Page$Professor$update, subMsg, pageModel);
-							var updatedPageModel = _v7.a;
-							var updatedCmd = _v7.b;
-							return _Utils_Tuple2(
-								_Utils_update(
-									model,
-									{
-										page: $author$project$Main$Professor(updatedPageModel)
-									}),
-								A2($elm$core$Platform$Cmd$map, $author$project$Main$ProfessorMsg, updatedCmd));
-						} else {
-							break _v0$13;
-						}
-					case 'ProfessoresMsg':
-						if (_v0.b.$ === 'Professores') {
-							var subMsg = _v0.a.a;
-							var pageModel = _v0.b.a;
-							var _v8 = A2($author$project$Page$Professores$update, subMsg, pageModel);
-							var updatedPageModel = _v8.a;
-							var updatedCmd = _v8.b;
-							return _Utils_Tuple2(
-								_Utils_update(
-									model,
-									{
-										page: $author$project$Main$Professores(updatedPageModel)
-									}),
-								A2($elm$core$Platform$Cmd$map, $author$project$Main$ProfessoresMsg, updatedCmd));
-						} else {
-							break _v0$13;
-						}
-					case 'DenunciasMsg':
-						if (_v0.b.$ === 'Denuncias') {
-							var subMsg = _v0.a.a;
-							var pageModel = _v0.b.a;
-							var _v9 = A2($author$project$Page$Denuncias$update, subMsg, pageModel);
-							var updatedPageModel = _v9.a;
-							var updatedCmd = _v9.b;
-							return _Utils_Tuple2(
-								_Utils_update(
-									model,
-									{
-										page: $author$project$Main$Denuncias(updatedPageModel)
-									}),
-								A2($elm$core$Platform$Cmd$map, $author$project$Main$DenunciasMsg, updatedCmd));
-						} else {
-							break _v0$13;
-						}
-					case 'LoginMsg':
-						if (_v0.b.$ === 'Login') {
-							var subMsg = _v0.a.a;
-							var pageModel = _v0.b.a;
-							var _v10 = A2($author$project$Page$Login$update, subMsg, pageModel);
-							var updatedPageModel = _v10.a;
-							var updatedCmd = _v10.b;
-							var _v11 = updatedPageModel.user;
-							if (_v11.$ === 'Just') {
-								var user = _v11.a;
-								return _Utils_Tuple2(
-									_Utils_update(
-										model,
-										{
-											user: $elm$core$Maybe$Just(user)
-										}),
-									$elm$core$Platform$Cmd$batch(
-										_List_fromArray(
-											[
-												A2($elm$browser$Browser$Navigation$pushUrl, model.navKey, '/home'),
-												$author$project$Main$sendUserIdToStorage(user)
-											])));
-							} else {
-								return _Utils_Tuple2(
-									_Utils_update(
-										model,
-										{
-											page: $author$project$Main$Login(updatedPageModel)
-										}),
-									A2($elm$core$Platform$Cmd$map, $author$project$Main$LoginMsg, updatedCmd));
-							}
-						} else {
-							break _v0$13;
-						}
-					case 'LinkClicked':
-						var urlRequest = _v0.a.a;
-						if (urlRequest.$ === 'Internal') {
-							var url = urlRequest.a;
-							return _Utils_Tuple2(
-								model,
-								A2(
-									$elm$browser$Browser$Navigation$pushUrl,
-									model.navKey,
-									$elm$url$Url$toString(url)));
-						} else {
-							var url = urlRequest.a;
-							return _Utils_Tuple2(
-								model,
-								$elm$browser$Browser$Navigation$load(url));
-						}
-					default:
-						var url = _v0.a.a;
-						var newRoute = $author$project$Route$parseUrl(url);
-						return $author$project$Main$initCurrentPage(
-							_Utils_Tuple2(
-								_Utils_update(
-									model,
-									{route: newRoute}),
-								$elm$core$Platform$Cmd$none));
-				}
-			}
-			return _Utils_Tuple2(model, $elm$core$Platform$Cmd$none);
-		}
-		var subMsg = _v0.a.a;
-		var pageModel = _v0.b.a;
-		var _v4 = A2($author$project$Page$Perfil$update, subMsg, pageModel);
-		var updatedPageModel = _v4.a;
-		var updatedCmd = _v4.b;
-		return _Utils_Tuple2(
-			_Utils_update(
-				model,
-				{
-					page: $author$project$Main$Perfil(updatedPageModel)
-				}),
-			A2($elm$core$Platform$Cmd$map, $author$project$Main$PerfilMsg, updatedCmd));
-	});
-var $elm$virtual_dom$VirtualDom$map = _VirtualDom_map;
-var $elm$html$Html$map = $elm$virtual_dom$VirtualDom$map;
-var $elm$html$Html$h3 = _VirtualDom_node('h3');
-var $elm$virtual_dom$VirtualDom$text = _VirtualDom_text;
-var $elm$html$Html$text = $elm$virtual_dom$VirtualDom$text;
-var $author$project$Main$notFoundView = A2(
-	$elm$html$Html$h3,
-	_List_Nil,
-	_List_fromArray(
-		[
-			$elm$html$Html$text('Oops! The page you requested was not found!')
-		]));
-var $elm$html$Html$div = _VirtualDom_node('div');
-var $elm$html$Html$ul = _VirtualDom_node('ul');
-var $author$project$Page$Denuncias$BanirUsuario = function (a) {
-	return {$: 'BanirUsuario', a: a};
-};
-var $author$project$Page$Denuncias$RemoverAvaliacao = F2(
-	function (a, b) {
-		return {$: 'RemoverAvaliacao', a: a, b: b};
-	});
-var $author$project$Page$Denuncias$RemoverDenuncia = function (a) {
-	return {$: 'RemoverDenuncia', a: a};
-};
-var $elm$html$Html$button = _VirtualDom_node('button');
-var $elm$html$Html$hr = _VirtualDom_node('hr');
-var $elm$virtual_dom$VirtualDom$Normal = function (a) {
-	return {$: 'Normal', a: a};
-};
-var $elm$virtual_dom$VirtualDom$on = _VirtualDom_on;
-var $elm$html$Html$Events$on = F2(
-	function (event, decoder) {
-		return A2(
-			$elm$virtual_dom$VirtualDom$on,
-			event,
-			$elm$virtual_dom$VirtualDom$Normal(decoder));
-	});
-var $elm$html$Html$Events$onClick = function (msg) {
-	return A2(
-		$elm$html$Html$Events$on,
-		'click',
-		$elm$json$Json$Decode$succeed(msg));
-};
-var $elm$html$Html$p = _VirtualDom_node('p');
-var $author$project$Page$Denuncias$viewDenuncia = function (denuncia) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2($elm$html$Html$hr, _List_Nil, _List_Nil),
-				A2(
-				$elm$html$Html$p,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Comentario: ' + denuncia.comentario)
-					])),
-				A2(
-				$elm$html$Html$button,
-				_List_fromArray(
-					[
-						$elm$html$Html$Events$onClick(
-						A2($author$project$Page$Denuncias$RemoverAvaliacao, denuncia.avaliacaoId, denuncia.id))
-					]),
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Remover Comentario')
-					])),
-				A2(
-				$elm$html$Html$button,
-				_List_fromArray(
-					[
-						$elm$html$Html$Events$onClick(
-						$author$project$Page$Denuncias$BanirUsuario(denuncia.avaliacaoId))
-					]),
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Banir Usuario')
-					])),
-				A2(
-				$elm$html$Html$button,
-				_List_fromArray(
-					[
-						$elm$html$Html$Events$onClick(
-						$author$project$Page$Denuncias$RemoverDenuncia(denuncia.id))
-					]),
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Manter comentario')
-					]))
-			]));
-};
-var $author$project$Page$Denuncias$viewDenuncias = function (model) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Denuncias')
-					])),
-				A2(
-				$elm$html$Html$ul,
-				_List_Nil,
-				A2($elm$core$List$map, $author$project$Page$Denuncias$viewDenuncia, model.denuncias))
-			]));
-};
-var $author$project$Page$Denuncias$viewError = function (model) {
-	var _v0 = model.errorMsg;
-	if (_v0.$ === 'Just') {
-		var message = _v0.a;
-		return A2(
-			$elm$html$Html$div,
-			_List_Nil,
-			_List_fromArray(
-				[
-					A2(
-					$elm$html$Html$p,
-					_List_Nil,
-					_List_fromArray(
-						[
-							$elm$html$Html$text(message)
-						]))
-				]));
-	} else {
-		return A2($elm$html$Html$div, _List_Nil, _List_Nil);
-	}
-};
-var $author$project$Page$Denuncias$view = function (model) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				$author$project$Page$Denuncias$viewError(model),
-				$author$project$Page$Denuncias$viewDenuncias(model)
-			]));
-};
-var $elm$html$Html$a = _VirtualDom_node('a');
-var $elm$html$Html$Attributes$stringProperty = F2(
-	function (key, string) {
-		return A2(
-			_VirtualDom_property,
-			key,
-			$elm$json$Json$Encode$string(string));
-	});
-var $elm$html$Html$Attributes$href = function (url) {
-	return A2(
-		$elm$html$Html$Attributes$stringProperty,
-		'href',
-		_VirtualDom_noJavaScriptUri(url));
-};
-var $elm$html$Html$li = _VirtualDom_node('li');
-var $author$project$Page$Disciplina$professorUrl = function (id) {
-	return '/professor/' + $elm$core$String$fromInt(id);
-};
-var $author$project$Page$Disciplina$viewProfessor = function (professor) {
-	return A2(
-		$elm$html$Html$li,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$a,
-				_List_fromArray(
-					[
-						$elm$html$Html$Attributes$href(
-						$author$project$Page$Disciplina$professorUrl(professor.id))
-					]),
-				_List_fromArray(
-					[
-						$elm$html$Html$text(professor.nome)
-					]))
-			]));
-};
-var $author$project$Page$Disciplina$viewDisciplina = function (disciplina) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text(disciplina.nome)
-					])),
-				A2(
-				$elm$html$Html$p,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Professores:')
-					])),
-				A2(
-				$elm$html$Html$ul,
-				_List_Nil,
-				A2($elm$core$List$map, $author$project$Page$Disciplina$viewProfessor, disciplina.professores))
-			]));
-};
-var $author$project$Page$Disciplina$viewError = function (errorMessage) {
-	var errorHeading = 'Couldn\'t fetch disciplina at this time.';
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text(errorHeading)
-					])),
-				$elm$html$Html$text('Error: ' + errorMessage)
-			]));
-};
-var $author$project$Page$Disciplina$viewDisciplinaOrError = function (model) {
-	var _v0 = model.errorMsg;
-	if (_v0.$ === 'Just') {
-		var message = _v0.a;
-		return $author$project$Page$Disciplina$viewError(message);
-	} else {
-		return $author$project$Page$Disciplina$viewDisciplina(model.disciplina);
-	}
-};
-var $author$project$Page$Disciplina$view = function (model) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				$author$project$Page$Disciplina$viewDisciplinaOrError(model)
-			]));
-};
-var $author$project$Page$Home$disciplinasPath = '/disciplinas/';
-var $author$project$Page$Home$perfilPath = '/perfil/';
-var $author$project$Page$Home$professoresPath = '/professores/';
-var $author$project$Page$Home$denunciasPath = '/denuncias/';
-var $author$project$Page$Home$viewDenuncias = function (model) {
-	return model.isAdmin ? A2(
-		$elm$html$Html$p,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$a,
-				_List_fromArray(
-					[
-						$elm$html$Html$Attributes$href($author$project$Page$Home$denunciasPath)
-					]),
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Denuncias')
-					]))
-			])) : A2($elm$html$Html$div, _List_Nil, _List_Nil);
-};
-var $author$project$Page$Home$view = function (model) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Página Home')
-					])),
-				A2(
-				$elm$html$Html$div,
-				_List_Nil,
-				_List_fromArray(
-					[
-						A2(
-						$elm$html$Html$p,
-						_List_Nil,
-						_List_fromArray(
-							[
-								A2(
-								$elm$html$Html$a,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$href($author$project$Page$Home$disciplinasPath)
-									]),
-								_List_fromArray(
-									[
-										$elm$html$Html$text('Disciplinas')
-									]))
-							])),
-						A2(
-						$elm$html$Html$p,
-						_List_Nil,
-						_List_fromArray(
-							[
-								A2(
-								$elm$html$Html$a,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$href($author$project$Page$Home$professoresPath)
-									]),
-								_List_fromArray(
-									[
-										$elm$html$Html$text('Professores')
-									]))
-							])),
-						A2(
-						$elm$html$Html$p,
-						_List_Nil,
-						_List_fromArray(
-							[
-								A2(
-								$elm$html$Html$a,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$href($author$project$Page$Home$perfilPath)
-									]),
-								_List_fromArray(
-									[
-										$elm$html$Html$text('User')
-									]))
-							])),
-						$author$project$Page$Home$viewDenuncias(model)
-					]))
-			]));
-};
-var $author$project$Page$ListDisciplinas$disciplinaUrl = function (id) {
-	return '/disciplina/' + $elm$core$String$fromInt(id);
-};
-var $author$project$Page$ListDisciplinas$viewDisciplina = function (disciplina) {
-	return A2(
-		$elm$html$Html$li,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$a,
-				_List_fromArray(
-					[
-						$elm$html$Html$Attributes$href(
-						$author$project$Page$ListDisciplinas$disciplinaUrl(disciplina.id))
-					]),
-				_List_fromArray(
-					[
-						$elm$html$Html$text(disciplina.nome)
-					]))
-			]));
-};
-var $author$project$Page$ListDisciplinas$viewDisciplinas = function (disciplinas) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Disciplinas:')
-					])),
-				A2(
-				$elm$html$Html$ul,
-				_List_Nil,
-				A2($elm$core$List$map, $author$project$Page$ListDisciplinas$viewDisciplina, disciplinas))
-			]));
-};
-var $author$project$Page$ListDisciplinas$viewError = function (errorMessage) {
-	var errorHeading = 'Couldn\'t fetch disciplinas at this time.';
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text(errorHeading)
-					])),
-				$elm$html$Html$text('Error: ' + errorMessage)
-			]));
-};
-var $author$project$Page$ListDisciplinas$viewDisciplinasOrError = function (model) {
-	var _v0 = model.errorMsg;
-	if (_v0.$ === 'Just') {
-		var message = _v0.a;
-		return $author$project$Page$ListDisciplinas$viewError(message);
-	} else {
-		return $author$project$Page$ListDisciplinas$viewDisciplinas(model.disciplinas);
-	}
-};
-var $author$project$Page$ListDisciplinas$view = function (model) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				$author$project$Page$ListDisciplinas$viewDisciplinasOrError(model)
-			]));
-};
-var $author$project$Page$Login$ClickLogin = {$: 'ClickLogin'};
-var $author$project$Page$Login$ClickRegister = {$: 'ClickRegister'};
-var $author$project$Page$Login$LoginSetEmail = function (a) {
-	return {$: 'LoginSetEmail', a: a};
-};
-var $author$project$Page$Login$LoginSetPassword = function (a) {
-	return {$: 'LoginSetPassword', a: a};
-};
-var $author$project$Page$Login$RegisterSetCurso = function (a) {
-	return {$: 'RegisterSetCurso', a: a};
-};
-var $author$project$Page$Login$RegisterSetEmail = function (a) {
-	return {$: 'RegisterSetEmail', a: a};
-};
-var $author$project$Page$Login$RegisterSetMatricula = function (a) {
-	return {$: 'RegisterSetMatricula', a: a};
-};
-var $author$project$Page$Login$RegisterSetNome = function (a) {
-	return {$: 'RegisterSetNome', a: a};
-};
-var $author$project$Page$Login$RegisterSetPassword = function (a) {
-	return {$: 'RegisterSetPassword', a: a};
-};
-var $elm$html$Html$Attributes$for = $elm$html$Html$Attributes$stringProperty('htmlFor');
-var $elm$html$Html$Attributes$id = $elm$html$Html$Attributes$stringProperty('id');
-var $elm$html$Html$input = _VirtualDom_node('input');
-var $elm$html$Html$label = _VirtualDom_node('label');
-var $elm$html$Html$Events$alwaysStop = function (x) {
-	return _Utils_Tuple2(x, true);
-};
-var $elm$virtual_dom$VirtualDom$MayStopPropagation = function (a) {
-	return {$: 'MayStopPropagation', a: a};
-};
-var $elm$html$Html$Events$stopPropagationOn = F2(
-	function (event, decoder) {
-		return A2(
-			$elm$virtual_dom$VirtualDom$on,
-			event,
-			$elm$virtual_dom$VirtualDom$MayStopPropagation(decoder));
-	});
-var $elm$json$Json$Decode$at = F2(
-	function (fields, decoder) {
-		return A3($elm$core$List$foldr, $elm$json$Json$Decode$field, decoder, fields);
-	});
-var $elm$html$Html$Events$targetValue = A2(
-	$elm$json$Json$Decode$at,
-	_List_fromArray(
-		['target', 'value']),
-	$elm$json$Json$Decode$string);
-var $elm$html$Html$Events$onInput = function (tagger) {
-	return A2(
-		$elm$html$Html$Events$stopPropagationOn,
-		'input',
-		A2(
-			$elm$json$Json$Decode$map,
-			$elm$html$Html$Events$alwaysStop,
-			A2($elm$json$Json$Decode$map, tagger, $elm$html$Html$Events$targetValue)));
-};
-var $elm$html$Html$Attributes$type_ = $elm$html$Html$Attributes$stringProperty('type');
-var $elm$html$Html$Attributes$value = $elm$html$Html$Attributes$stringProperty('value');
-var $elm$html$Html$h4 = _VirtualDom_node('h4');
-var $author$project$Page$Login$viewError = function (errorMessage) {
-	if (errorMessage.$ === 'Nothing') {
-		return A2($elm$html$Html$div, _List_Nil, _List_Nil);
-	} else {
-		var msg = errorMessage.a;
-		return A2(
-			$elm$html$Html$div,
-			_List_Nil,
-			_List_fromArray(
-				[
-					A2(
-					$elm$html$Html$h4,
-					_List_Nil,
-					_List_fromArray(
-						[
-							$elm$html$Html$text('Error: ' + msg)
-						]))
-				]));
-	}
-};
-var $author$project$Page$Login$view = function (model) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$div,
-				_List_Nil,
-				_List_fromArray(
-					[
-						A2(
-						$elm$html$Html$h3,
-						_List_Nil,
-						_List_fromArray(
-							[
-								$elm$html$Html$text('Login')
-							])),
-						$author$project$Page$Login$viewError(model.loginErrorMsg),
-						A2(
-						$elm$html$Html$div,
-						_List_Nil,
-						_List_fromArray(
-							[
-								A2(
-								$elm$html$Html$label,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$for('email')
-									]),
-								_List_fromArray(
-									[
-										$elm$html$Html$text('Email:')
-									])),
-								A2(
-								$elm$html$Html$input,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$id('email'),
-										$elm$html$Html$Attributes$type_('text'),
-										$elm$html$Html$Attributes$value(model.loginUser.email),
-										$elm$html$Html$Events$onInput($author$project$Page$Login$LoginSetEmail)
-									]),
-								_List_Nil)
-							])),
-						A2(
-						$elm$html$Html$div,
-						_List_Nil,
-						_List_fromArray(
-							[
-								A2(
-								$elm$html$Html$label,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$for('password')
-									]),
-								_List_fromArray(
-									[
-										$elm$html$Html$text('Password:')
-									])),
-								A2(
-								$elm$html$Html$input,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$id('password'),
-										$elm$html$Html$Attributes$type_('password'),
-										$elm$html$Html$Attributes$value(model.loginUser.password),
-										$elm$html$Html$Events$onInput($author$project$Page$Login$LoginSetPassword)
-									]),
-								_List_Nil)
-							])),
-						A2(
-						$elm$html$Html$div,
-						_List_Nil,
-						_List_fromArray(
-							[
-								A2(
-								$elm$html$Html$button,
-								_List_fromArray(
-									[
-										$elm$html$Html$Events$onClick($author$project$Page$Login$ClickLogin)
-									]),
-								_List_fromArray(
-									[
-										$elm$html$Html$text('Login')
-									]))
-							]))
-					])),
-				A2(
-				$elm$html$Html$div,
-				_List_Nil,
-				_List_fromArray(
-					[
-						A2(
-						$elm$html$Html$h3,
-						_List_Nil,
-						_List_fromArray(
-							[
-								$elm$html$Html$text('Register')
-							])),
-						$author$project$Page$Login$viewError(model.registerErrorMsg),
-						A2(
-						$elm$html$Html$div,
-						_List_Nil,
-						_List_fromArray(
-							[
-								A2(
-								$elm$html$Html$label,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$for('email')
-									]),
-								_List_fromArray(
-									[
-										$elm$html$Html$text('Email:')
-									])),
-								A2(
-								$elm$html$Html$input,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$id('email'),
-										$elm$html$Html$Attributes$type_('text'),
-										$elm$html$Html$Attributes$value(model.registerUser.email),
-										$elm$html$Html$Events$onInput($author$project$Page$Login$RegisterSetEmail)
-									]),
-								_List_Nil)
-							])),
-						A2(
-						$elm$html$Html$div,
-						_List_Nil,
-						_List_fromArray(
-							[
-								A2(
-								$elm$html$Html$label,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$for('nome')
-									]),
-								_List_fromArray(
-									[
-										$elm$html$Html$text('Nome:')
-									])),
-								A2(
-								$elm$html$Html$input,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$id('nome'),
-										$elm$html$Html$Attributes$type_('text'),
-										$elm$html$Html$Attributes$value(model.registerUser.nome),
-										$elm$html$Html$Events$onInput($author$project$Page$Login$RegisterSetNome)
-									]),
-								_List_Nil)
-							])),
-						A2(
-						$elm$html$Html$div,
-						_List_Nil,
-						_List_fromArray(
-							[
-								A2(
-								$elm$html$Html$label,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$for('matricula')
-									]),
-								_List_fromArray(
-									[
-										$elm$html$Html$text('Matricula:')
-									])),
-								A2(
-								$elm$html$Html$input,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$id('matricula'),
-										$elm$html$Html$Attributes$type_('text'),
-										$elm$html$Html$Attributes$value(model.registerUser.matricula),
-										$elm$html$Html$Events$onInput($author$project$Page$Login$RegisterSetMatricula)
-									]),
-								_List_Nil)
-							])),
-						A2(
-						$elm$html$Html$div,
-						_List_Nil,
-						_List_fromArray(
-							[
-								A2(
-								$elm$html$Html$label,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$for('curso')
-									]),
-								_List_fromArray(
-									[
-										$elm$html$Html$text('Curso:')
-									])),
-								A2(
-								$elm$html$Html$input,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$id('curso'),
-										$elm$html$Html$Attributes$type_('text'),
-										$elm$html$Html$Attributes$value(model.registerUser.curso),
-										$elm$html$Html$Events$onInput($author$project$Page$Login$RegisterSetCurso)
-									]),
-								_List_Nil)
-							])),
-						A2(
-						$elm$html$Html$div,
-						_List_Nil,
-						_List_fromArray(
-							[
-								A2(
-								$elm$html$Html$label,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$for('password')
-									]),
-								_List_fromArray(
-									[
-										$elm$html$Html$text('Password:')
-									])),
-								A2(
-								$elm$html$Html$input,
-								_List_fromArray(
-									[
-										$elm$html$Html$Attributes$id('password'),
-										$elm$html$Html$Attributes$type_('password'),
-										$elm$html$Html$Attributes$value(model.registerUser.password),
-										$elm$html$Html$Events$onInput($author$project$Page$Login$RegisterSetPassword)
-									]),
-								_List_Nil)
-							])),
-						A2(
-						$elm$html$Html$div,
-						_List_Nil,
-						_List_fromArray(
-							[
-								A2(
-								$elm$html$Html$button,
-								_List_fromArray(
-									[
-										$elm$html$Html$Events$onClick($author$project$Page$Login$ClickRegister)
-									]),
-								_List_fromArray(
-									[
-										$elm$html$Html$text('Login')
-									]))
-							]))
-					]))
-			]));
-};
-var $author$project$Page$Perfil$viewError = function (errorMessage) {
-	var errorHeading = 'Couldn\'t fetch user at this time.';
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text(errorHeading)
-					])),
-				$elm$html$Html$text('Error: ' + errorMessage)
-			]));
-};
-var $author$project$Page$Perfil$ClickCancel = {$: 'ClickCancel'};
-var $author$project$Page$Perfil$ClickSendPasswordUpdate = {$: 'ClickSendPasswordUpdate'};
-var $author$project$Page$Perfil$SetCurrentPassword = function (a) {
-	return {$: 'SetCurrentPassword', a: a};
-};
-var $author$project$Page$Perfil$SetNewPassword = function (a) {
-	return {$: 'SetNewPassword', a: a};
-};
-var $author$project$Page$Perfil$viewInfoMsg = function (infoMsg) {
-	if (infoMsg.$ === 'Just') {
-		var msg = infoMsg.a;
-		return A2(
-			$elm$html$Html$div,
-			_List_Nil,
-			_List_fromArray(
-				[
-					$elm$html$Html$text(msg)
-				]));
-	} else {
-		return A2($elm$html$Html$div, _List_Nil, _List_Nil);
-	}
-};
-var $author$project$Page$Perfil$viewUpdatePassword = F2(
-	function (passwordInfo, infoMsg) {
-		return A2(
-			$elm$html$Html$div,
-			_List_Nil,
-			_List_fromArray(
-				[
-					$author$project$Page$Perfil$viewInfoMsg(infoMsg),
-					A2(
-					$elm$html$Html$div,
-					_List_Nil,
-					_List_fromArray(
-						[
-							A2(
-							$elm$html$Html$div,
-							_List_Nil,
-							_List_fromArray(
-								[
-									A2(
-									$elm$html$Html$label,
-									_List_fromArray(
-										[
-											$elm$html$Html$Attributes$for('currentPassord')
-										]),
-									_List_fromArray(
-										[
-											$elm$html$Html$text('Current Password:')
-										])),
-									A2(
-									$elm$html$Html$input,
-									_List_fromArray(
-										[
-											$elm$html$Html$Attributes$id('currentPassword'),
-											$elm$html$Html$Attributes$type_('password'),
-											$elm$html$Html$Attributes$value(passwordInfo.currentPassword),
-											$elm$html$Html$Events$onInput($author$project$Page$Perfil$SetCurrentPassword)
-										]),
-									_List_Nil)
-								])),
-							A2(
-							$elm$html$Html$div,
-							_List_Nil,
-							_List_fromArray(
-								[
-									A2(
-									$elm$html$Html$label,
-									_List_fromArray(
-										[
-											$elm$html$Html$Attributes$for('newPassword')
-										]),
-									_List_fromArray(
-										[
-											$elm$html$Html$text('New Password:')
-										])),
-									A2(
-									$elm$html$Html$input,
-									_List_fromArray(
-										[
-											$elm$html$Html$Attributes$id('newPassword'),
-											$elm$html$Html$Attributes$type_('password'),
-											$elm$html$Html$Attributes$value(passwordInfo.newPassword),
-											$elm$html$Html$Events$onInput($author$project$Page$Perfil$SetNewPassword)
-										]),
-									_List_Nil)
-								]))
-						])),
-					A2(
-					$elm$html$Html$div,
-					_List_Nil,
-					_List_fromArray(
-						[
-							A2(
-							$elm$html$Html$button,
-							_List_fromArray(
-								[
-									$elm$html$Html$Events$onClick($author$project$Page$Perfil$ClickCancel)
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Cancel')
-								])),
-							A2(
-							$elm$html$Html$button,
-							_List_fromArray(
-								[
-									$elm$html$Html$Events$onClick($author$project$Page$Perfil$ClickSendPasswordUpdate)
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Update Password')
-								]))
-						]))
-				]));
-	});
-var $author$project$Page$Perfil$ClickSendUserUpdate = {$: 'ClickSendUserUpdate'};
-var $author$project$Page$Perfil$SetCurso = function (a) {
-	return {$: 'SetCurso', a: a};
-};
-var $author$project$Page$Perfil$SetEmail = function (a) {
-	return {$: 'SetEmail', a: a};
-};
-var $author$project$Page$Perfil$SetMatricula = function (a) {
-	return {$: 'SetMatricula', a: a};
-};
-var $author$project$Page$Perfil$SetNome = function (a) {
-	return {$: 'SetNome', a: a};
-};
-var $author$project$Page$Perfil$viewUpdateUser = F2(
-	function (user, infoMsg) {
-		return A2(
-			$elm$html$Html$div,
-			_List_Nil,
-			_List_fromArray(
-				[
-					$author$project$Page$Perfil$viewInfoMsg(infoMsg),
-					A2(
-					$elm$html$Html$div,
-					_List_Nil,
-					_List_fromArray(
-						[
-							A2(
-							$elm$html$Html$label,
-							_List_fromArray(
-								[
-									$elm$html$Html$Attributes$for('nome')
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Nome:')
-								])),
-							A2(
-							$elm$html$Html$input,
-							_List_fromArray(
-								[
-									$elm$html$Html$Attributes$id('nome'),
-									$elm$html$Html$Attributes$type_('text'),
-									$elm$html$Html$Attributes$value(user.nome),
-									$elm$html$Html$Events$onInput($author$project$Page$Perfil$SetNome)
-								]),
-							_List_Nil)
-						])),
-					A2(
-					$elm$html$Html$div,
-					_List_Nil,
-					_List_fromArray(
-						[
-							A2(
-							$elm$html$Html$label,
-							_List_fromArray(
-								[
-									$elm$html$Html$Attributes$for('email')
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Email:')
-								])),
-							A2(
-							$elm$html$Html$input,
-							_List_fromArray(
-								[
-									$elm$html$Html$Attributes$id('email'),
-									$elm$html$Html$Attributes$type_('text'),
-									$elm$html$Html$Attributes$value(user.email),
-									$elm$html$Html$Events$onInput($author$project$Page$Perfil$SetEmail)
-								]),
-							_List_Nil)
-						])),
-					A2(
-					$elm$html$Html$div,
-					_List_Nil,
-					_List_fromArray(
-						[
-							A2(
-							$elm$html$Html$label,
-							_List_fromArray(
-								[
-									$elm$html$Html$Attributes$for('matricula')
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Matricula:')
-								])),
-							A2(
-							$elm$html$Html$input,
-							_List_fromArray(
-								[
-									$elm$html$Html$Attributes$id('matricula'),
-									$elm$html$Html$Attributes$type_('text'),
-									$elm$html$Html$Attributes$value(user.matricula),
-									$elm$html$Html$Events$onInput($author$project$Page$Perfil$SetMatricula)
-								]),
-							_List_Nil)
-						])),
-					A2(
-					$elm$html$Html$div,
-					_List_Nil,
-					_List_fromArray(
-						[
-							A2(
-							$elm$html$Html$label,
-							_List_fromArray(
-								[
-									$elm$html$Html$Attributes$for('curso')
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Curso:')
-								])),
-							A2(
-							$elm$html$Html$input,
-							_List_fromArray(
-								[
-									$elm$html$Html$Attributes$id('curso'),
-									$elm$html$Html$Attributes$type_('text'),
-									$elm$html$Html$Attributes$value(user.curso),
-									$elm$html$Html$Events$onInput($author$project$Page$Perfil$SetCurso)
-								]),
-							_List_Nil)
-						])),
-					A2(
-					$elm$html$Html$div,
-					_List_Nil,
-					_List_fromArray(
-						[
-							A2(
-							$elm$html$Html$button,
-							_List_fromArray(
-								[
-									$elm$html$Html$Events$onClick($author$project$Page$Perfil$ClickCancel)
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Cancel')
-								])),
-							A2(
-							$elm$html$Html$button,
-							_List_fromArray(
-								[
-									$elm$html$Html$Events$onClick($author$project$Page$Perfil$ClickSendUserUpdate)
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Update')
-								]))
-						]))
-				]));
-	});
-var $author$project$Page$Perfil$ClickDeleteUser = {$: 'ClickDeleteUser'};
-var $author$project$Page$Perfil$ClickUpdatePassword = {$: 'ClickUpdatePassword'};
-var $author$project$Page$Perfil$ClickUpdateUser = {$: 'ClickUpdateUser'};
-var $author$project$Page$Perfil$Loggout = {$: 'Loggout'};
-var $author$project$Page$Perfil$viewUserInfo = F2(
-	function (user, infoMsg) {
-		return A2(
-			$elm$html$Html$div,
-			_List_Nil,
-			_List_fromArray(
-				[
-					A2(
-					$elm$html$Html$div,
-					_List_Nil,
-					_List_fromArray(
-						[
-							$author$project$Page$Perfil$viewInfoMsg(infoMsg),
-							A2(
-							$elm$html$Html$p,
-							_List_Nil,
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Nome: ' + user.nome)
-								])),
-							A2(
-							$elm$html$Html$p,
-							_List_Nil,
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Email: ' + user.email)
-								])),
-							A2(
-							$elm$html$Html$p,
-							_List_Nil,
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Matricula: ' + user.matricula)
-								])),
-							A2(
-							$elm$html$Html$p,
-							_List_Nil,
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Curso: ' + user.curso)
-								]))
-						])),
-					A2(
-					$elm$html$Html$div,
-					_List_Nil,
-					_List_fromArray(
-						[
-							A2(
-							$elm$html$Html$button,
-							_List_fromArray(
-								[
-									$elm$html$Html$Events$onClick($author$project$Page$Perfil$ClickUpdateUser)
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Update')
-								])),
-							A2(
-							$elm$html$Html$button,
-							_List_fromArray(
-								[
-									$elm$html$Html$Events$onClick($author$project$Page$Perfil$ClickUpdatePassword)
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Update Password')
-								])),
-							A2(
-							$elm$html$Html$button,
-							_List_fromArray(
-								[
-									$elm$html$Html$Events$onClick($author$project$Page$Perfil$Loggout)
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Loggout')
-								])),
-							A2(
-							$elm$html$Html$button,
-							_List_fromArray(
-								[
-									$elm$html$Html$Events$onClick($author$project$Page$Perfil$ClickDeleteUser)
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Delete User')
-								]))
-						])),
-					A2(
-					$elm$html$Html$div,
-					_List_Nil,
-					_List_fromArray(
-						[
-							A2(
-							$elm$html$Html$p,
-							_List_Nil,
-							_List_fromArray(
-								[
-									A2(
-									$elm$html$Html$a,
-									_List_fromArray(
-										[
-											$elm$html$Html$Attributes$href('/home/')
-										]),
-									_List_fromArray(
-										[
-											$elm$html$Html$text('Home')
-										]))
-								]))
-						]))
-				]));
-	});
-var $author$project$Page$Perfil$viewUser = function (model) {
-	var _v0 = model.user;
-	if (_v0.$ === 'Just') {
-		var user = _v0.a;
-		var _v1 = model.state;
-		switch (_v1.$) {
-			case 'Showing':
-				return A2($author$project$Page$Perfil$viewUserInfo, user, model.infoMsg);
-			case 'UpdatingUser':
-				return A2($author$project$Page$Perfil$viewUpdateUser, model.updatingUser, model.infoMsg);
-			default:
-				return A2($author$project$Page$Perfil$viewUpdatePassword, model.passwordInfo, model.infoMsg);
-		}
-	} else {
-		return A2($elm$html$Html$div, _List_Nil, _List_Nil);
-	}
-};
-var $author$project$Page$Perfil$viewUserOrError = function (model) {
-	var _v0 = model.errorMsg;
-	if (_v0.$ === 'Just') {
-		var message = _v0.a;
-		return $author$project$Page$Perfil$viewError(message);
-	} else {
-		return $author$project$Page$Perfil$viewUser(model);
-	}
-};
-var $author$project$Page$Perfil$view = function (model) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				$author$project$Page$Perfil$viewUserOrError(model)
-			]));
-};
-var $author$project$Page$Professor$viewError = function (errorMessage) {
-	var errorHeading = 'Couldn\'t fetch disciplina at this time.';
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text(errorHeading)
-					])),
-				$elm$html$Html$text('Error: ' + errorMessage)
-			]));
-};
-var $author$project$Page$Professor$ClickNewComentario = {$: 'ClickNewComentario'};
-var $author$project$Page$Professor$SetComentario = function (a) {
-	return {$: 'SetComentario', a: a};
-};
-var $author$project$Page$Professor$SetPontuacao = function (a) {
-	return {$: 'SetPontuacao', a: a};
-};
-var $elm$html$Html$Attributes$size = function (n) {
-	return A2(
-		_VirtualDom_attribute,
-		'size',
-		$elm$core$String$fromInt(n));
-};
-var $author$project$Page$Professor$viewAddAvaliacao = function (avaliacao) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Adicione uma nova avaliação')
-					])),
-				A2(
-				$elm$html$Html$p,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Sua pontuacao será computada modulo 6')
-					])),
-				A2(
-				$elm$html$Html$div,
-				_List_Nil,
-				_List_fromArray(
-					[
-						A2(
-						$elm$html$Html$label,
-						_List_fromArray(
-							[
-								$elm$html$Html$Attributes$for('comentario')
-							]),
-						_List_fromArray(
-							[
-								$elm$html$Html$text('Comentario:')
-							])),
-						A2(
-						$elm$html$Html$input,
-						_List_fromArray(
-							[
-								$elm$html$Html$Attributes$id('comentario'),
-								$elm$html$Html$Attributes$type_('text'),
-								$elm$html$Html$Attributes$size(100),
-								$elm$html$Html$Attributes$value(avaliacao.comentario),
-								$elm$html$Html$Events$onInput($author$project$Page$Professor$SetComentario)
-							]),
-						_List_Nil)
-					])),
-				A2(
-				$elm$html$Html$div,
-				_List_Nil,
-				_List_fromArray(
-					[
-						A2(
-						$elm$html$Html$label,
-						_List_fromArray(
-							[
-								$elm$html$Html$Attributes$for('pontuacao')
-							]),
-						_List_fromArray(
-							[
-								$elm$html$Html$text('Pontuacao:')
-							])),
-						A2(
-						$elm$html$Html$input,
-						_List_fromArray(
-							[
-								$elm$html$Html$Attributes$id('pontuacao'),
-								$elm$html$Html$Attributes$type_('number'),
-								$elm$html$Html$Attributes$value(
-								$elm$core$String$fromInt(avaliacao.pontuacao)),
-								$elm$html$Html$Events$onInput($author$project$Page$Professor$SetPontuacao)
-							]),
-						_List_Nil)
-					])),
-				A2(
-				$elm$html$Html$div,
-				_List_Nil,
-				_List_fromArray(
-					[
-						A2(
-						$elm$html$Html$button,
-						_List_fromArray(
-							[
-								$elm$html$Html$Events$onClick($author$project$Page$Professor$ClickNewComentario)
-							]),
-						_List_fromArray(
-							[
-								$elm$html$Html$text('Comentar')
-							]))
-					]))
-			]));
-};
-var $author$project$Page$Professor$viewAvaliacao = function (avaliacao) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2($elm$html$Html$hr, _List_Nil, _List_Nil),
-				A2(
-				$elm$html$Html$p,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Username: ' + avaliacao.userNome)
-					])),
-				A2(
-				$elm$html$Html$p,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Comentario: ' + avaliacao.comentario)
-					])),
-				A2(
-				$elm$html$Html$p,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text(
-						'Pontuacao: ' + $elm$core$String$fromInt(avaliacao.pontuacao))
-					]))
-			]));
-};
-var $author$project$Page$Professor$turmaUrl = function (id) {
-	return '/turma/' + $elm$core$String$fromInt(id);
-};
-var $author$project$Page$Professor$viewTurma = function (turma) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2($elm$html$Html$hr, _List_Nil, _List_Nil),
-				A2(
-				$elm$html$Html$p,
-				_List_Nil,
-				_List_fromArray(
-					[
-						A2(
-						$elm$html$Html$a,
-						_List_fromArray(
-							[
-								$elm$html$Html$Attributes$href(
-								$author$project$Page$Professor$turmaUrl(turma.id))
-							]),
-						_List_fromArray(
-							[
-								$elm$html$Html$text(turma.nome)
-							]))
-					])),
-				A2(
-				$elm$html$Html$p,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Turma: ' + turma.numero)
-					]))
-			]));
-};
-var $author$project$Page$Professor$viewProfessor = function (model) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Nome: ' + model.professor.nome)
-					])),
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text(
-						'Nota: ' + $elm$core$String$fromInt((model.professor.sumAvaliacoes / model.professor.qtdAvaliacoes) | 0))
-					])),
-				A2(
-				$elm$html$Html$p,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Turmas:')
-					])),
-				A2(
-				$elm$html$Html$ul,
-				_List_Nil,
-				A2($elm$core$List$map, $author$project$Page$Professor$viewTurma, model.professor.turmas)),
-				A2(
-				$elm$html$Html$p,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Comentarios:')
-					])),
-				A2(
-				$elm$html$Html$ul,
-				_List_Nil,
-				A2($elm$core$List$map, $author$project$Page$Professor$viewAvaliacao, model.professor.avaliacoes)),
-				$author$project$Page$Professor$viewAddAvaliacao(model.newAvaliacao)
-			]));
-};
-var $author$project$Page$Professor$viewProfessorOrError = function (model) {
-	var _v0 = model.errorMsg;
-	if (_v0.$ === 'Just') {
-		var message = _v0.a;
-		return $author$project$Page$Professor$viewError(message);
-	} else {
-		return $author$project$Page$Professor$viewProfessor(model);
-	}
-};
-var $author$project$Page$Professor$view = function (model) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				$author$project$Page$Professor$viewProfessorOrError(model)
-			]));
-};
-var $author$project$Page$Professores$viewError = function (errorMessage) {
-	var errorHeading = 'Couldn\'t fetch professores at this time.';
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text(errorHeading)
-					])),
-				$elm$html$Html$text('Error: ' + errorMessage)
-			]));
-};
-var $author$project$Page$Professores$professorUrl = function (id) {
-	return '/professor/' + $elm$core$String$fromInt(id);
-};
-var $author$project$Page$Professores$viewDisciplina = function (disciplina) {
-	return A2(
-		$elm$html$Html$li,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$p,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text(disciplina)
-					]))
-			]));
-};
-var $author$project$Page$Professores$viewProfessor = function (professor) {
-	return A2(
-		$elm$html$Html$li,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$a,
-				_List_fromArray(
-					[
-						$elm$html$Html$Attributes$href(
-						$author$project$Page$Professores$professorUrl(professor.id))
-					]),
-				_List_fromArray(
-					[
-						$elm$html$Html$text(professor.nome)
-					])),
-				A2(
-				$elm$html$Html$ul,
-				_List_Nil,
-				A2($elm$core$List$map, $author$project$Page$Professores$viewDisciplina, professor.disciplinas))
-			]));
-};
-var $author$project$Page$Professores$viewProfessores = function (professores) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Professores:')
-					])),
-				A2(
-				$elm$html$Html$ul,
-				_List_Nil,
-				A2($elm$core$List$map, $author$project$Page$Professores$viewProfessor, professores))
-			]));
-};
-var $author$project$Page$Professores$viewProfessorOrError = function (model) {
-	var _v0 = model.errorMsg;
-	if (_v0.$ === 'Just') {
-		var message = _v0.a;
-		return $author$project$Page$Professores$viewError(message);
-	} else {
-		return $author$project$Page$Professores$viewProfessores(model.professores);
-	}
-};
-var $author$project$Page$Professores$view = function (model) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				$author$project$Page$Professores$viewProfessorOrError(model)
-			]));
-};
-var $author$project$Page$Turma$viewError = function (model) {
-	var _v0 = model.errorMsg;
-	if (_v0.$ === 'Just') {
-		var message = _v0.a;
-		return A2(
-			$elm$html$Html$div,
-			_List_Nil,
-			_List_fromArray(
-				[
-					A2(
-					$elm$html$Html$p,
-					_List_Nil,
-					_List_fromArray(
-						[
-							$elm$html$Html$text(message)
-						]))
-				]));
-	} else {
-		return A2($elm$html$Html$div, _List_Nil, _List_Nil);
-	}
-};
-var $author$project$Page$Turma$ClickNewComentario = {$: 'ClickNewComentario'};
-var $author$project$Page$Turma$SetComentario = function (a) {
-	return {$: 'SetComentario', a: a};
-};
-var $author$project$Page$Turma$SetPontuacao = function (a) {
-	return {$: 'SetPontuacao', a: a};
-};
-var $author$project$Page$Turma$viewAddAvaliacao = function (avaliacao) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Adicione uma nova avaliação')
-					])),
-				A2(
-				$elm$html$Html$p,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Sua pontuacao será computada modulo 6')
-					])),
-				A2(
-				$elm$html$Html$div,
-				_List_Nil,
-				_List_fromArray(
-					[
-						A2(
-						$elm$html$Html$label,
-						_List_fromArray(
-							[
-								$elm$html$Html$Attributes$for('comentario')
-							]),
-						_List_fromArray(
-							[
-								$elm$html$Html$text('Comentario:')
-							])),
-						A2(
-						$elm$html$Html$input,
-						_List_fromArray(
-							[
-								$elm$html$Html$Attributes$id('comentario'),
-								$elm$html$Html$Attributes$type_('text'),
-								$elm$html$Html$Attributes$size(100),
-								$elm$html$Html$Attributes$value(avaliacao.comentario),
-								$elm$html$Html$Events$onInput($author$project$Page$Turma$SetComentario)
-							]),
-						_List_Nil)
-					])),
-				A2(
-				$elm$html$Html$div,
-				_List_Nil,
-				_List_fromArray(
-					[
-						A2(
-						$elm$html$Html$label,
-						_List_fromArray(
-							[
-								$elm$html$Html$Attributes$for('pontuacao')
-							]),
-						_List_fromArray(
-							[
-								$elm$html$Html$text('Pontuacao:')
-							])),
-						A2(
-						$elm$html$Html$input,
-						_List_fromArray(
-							[
-								$elm$html$Html$Attributes$id('pontuacao'),
-								$elm$html$Html$Attributes$type_('number'),
-								$elm$html$Html$Attributes$value(
-								$elm$core$String$fromInt(avaliacao.pontuacao)),
-								$elm$html$Html$Events$onInput($author$project$Page$Turma$SetPontuacao)
-							]),
-						_List_Nil)
-					])),
-				A2(
-				$elm$html$Html$div,
-				_List_Nil,
-				_List_fromArray(
-					[
-						A2(
-						$elm$html$Html$button,
-						_List_fromArray(
-							[
-								$elm$html$Html$Events$onClick($author$project$Page$Turma$ClickNewComentario)
-							]),
-						_List_fromArray(
-							[
-								$elm$html$Html$text('Comentar')
-							]))
-					]))
-			]));
-};
-var $author$project$Page$Turma$CancelarUpdate = {$: 'CancelarUpdate'};
-var $author$project$Page$Turma$ClickUpdateComentario = function (a) {
-	return {$: 'ClickUpdateComentario', a: a};
-};
-var $author$project$Page$Turma$SetEditComentario = function (a) {
-	return {$: 'SetEditComentario', a: a};
-};
-var $author$project$Page$Turma$SetEditPontuacao = function (a) {
-	return {$: 'SetEditPontuacao', a: a};
-};
-var $author$project$Page$Turma$viewEditingAvaliacao = F2(
-	function (avId, avaliacao) {
-		return A2(
-			$elm$html$Html$div,
-			_List_Nil,
-			_List_fromArray(
-				[
-					A2($elm$html$Html$hr, _List_Nil, _List_Nil),
-					A2(
-					$elm$html$Html$p,
-					_List_Nil,
-					_List_fromArray(
-						[
-							$elm$html$Html$text('Username: ' + avaliacao.userNome)
-						])),
-					A2(
-					$elm$html$Html$div,
-					_List_Nil,
-					_List_fromArray(
-						[
-							A2(
-							$elm$html$Html$label,
-							_List_fromArray(
-								[
-									$elm$html$Html$Attributes$for('comentario')
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Comentario:')
-								])),
-							A2(
-							$elm$html$Html$input,
-							_List_fromArray(
-								[
-									$elm$html$Html$Attributes$id('comentario'),
-									$elm$html$Html$Attributes$type_('text'),
-									$elm$html$Html$Attributes$size(100),
-									$elm$html$Html$Attributes$value(avaliacao.comentario),
-									$elm$html$Html$Events$onInput($author$project$Page$Turma$SetEditComentario)
-								]),
-							_List_Nil)
-						])),
-					A2(
-					$elm$html$Html$div,
-					_List_Nil,
-					_List_fromArray(
-						[
-							A2(
-							$elm$html$Html$label,
-							_List_fromArray(
-								[
-									$elm$html$Html$Attributes$for('pontuacao')
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Pontuacao:')
-								])),
-							A2(
-							$elm$html$Html$input,
-							_List_fromArray(
-								[
-									$elm$html$Html$Attributes$id('pontuacao'),
-									$elm$html$Html$Attributes$type_('number'),
-									$elm$html$Html$Attributes$value(
-									$elm$core$String$fromInt(avaliacao.pontuacao)),
-									$elm$html$Html$Events$onInput($author$project$Page$Turma$SetEditPontuacao)
-								]),
-							_List_Nil)
-						])),
-					A2(
-					$elm$html$Html$div,
-					_List_Nil,
-					_List_fromArray(
-						[
-							A2(
-							$elm$html$Html$button,
-							_List_fromArray(
-								[
-									$elm$html$Html$Events$onClick(
-									$author$project$Page$Turma$ClickUpdateComentario(avId))
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Update')
-								])),
-							A2(
-							$elm$html$Html$button,
-							_List_fromArray(
-								[
-									$elm$html$Html$Events$onClick($author$project$Page$Turma$CancelarUpdate)
-								]),
-							_List_fromArray(
-								[
-									$elm$html$Html$text('Cancelar')
-								]))
-						]))
-				]));
-	});
-var $author$project$Page$Turma$Denuncia = function (a) {
-	return {$: 'Denuncia', a: a};
-};
-var $author$project$Page$Turma$EditarAvaliacao = function (a) {
-	return {$: 'EditarAvaliacao', a: a};
-};
-var $author$project$Page$Turma$RemoverAvaliacao = function (a) {
-	return {$: 'RemoverAvaliacao', a: a};
-};
-var $author$project$Page$Turma$viewNormalAvaliacao = F2(
-	function (myId, avaliacao) {
-		return A2(
-			$elm$html$Html$div,
-			_List_Nil,
-			_List_fromArray(
-				[
-					A2($elm$html$Html$hr, _List_Nil, _List_Nil),
-					A2(
-					$elm$html$Html$p,
-					_List_Nil,
-					_List_fromArray(
-						[
-							$elm$html$Html$text('Username: ' + avaliacao.userNome)
-						])),
-					A2(
-					$elm$html$Html$p,
-					_List_Nil,
-					_List_fromArray(
-						[
-							$elm$html$Html$text('Comentario: ' + avaliacao.comentario)
-						])),
-					A2(
-					$elm$html$Html$p,
-					_List_Nil,
-					_List_fromArray(
-						[
-							$elm$html$Html$text(
-							'Pontuacao: ' + $elm$core$String$fromInt(avaliacao.pontuacao))
-						])),
-					A2(
-					$elm$html$Html$button,
-					_List_fromArray(
-						[
-							$elm$html$Html$Events$onClick(
-							$author$project$Page$Turma$Denuncia(avaliacao.id))
-						]),
-					_List_fromArray(
-						[
-							$elm$html$Html$text('Denuncia')
-						])),
-					_Utils_eq(avaliacao.userId, myId) ? A2(
-					$elm$html$Html$button,
-					_List_fromArray(
-						[
-							$elm$html$Html$Events$onClick(
-							$author$project$Page$Turma$RemoverAvaliacao(avaliacao.id))
-						]),
-					_List_fromArray(
-						[
-							$elm$html$Html$text('Apagar')
-						])) : A2($elm$html$Html$div, _List_Nil, _List_Nil),
-					_Utils_eq(avaliacao.userId, myId) ? A2(
-					$elm$html$Html$button,
-					_List_fromArray(
-						[
-							$elm$html$Html$Events$onClick(
-							$author$project$Page$Turma$EditarAvaliacao(avaliacao.id))
-						]),
-					_List_fromArray(
-						[
-							$elm$html$Html$text('Editar')
-						])) : A2($elm$html$Html$div, _List_Nil, _List_Nil)
-				]));
-	});
-var $author$project$Page$Turma$viewAvaliacao = F4(
-	function (myId, state, edAvaliacao, avaliacao) {
-		if (state.$ === 'Editing') {
-			var avaliacaoId = state.a;
-			return _Utils_eq(avaliacao.id, avaliacaoId) ? A2($author$project$Page$Turma$viewEditingAvaliacao, avaliacao.id, edAvaliacao) : A2($author$project$Page$Turma$viewNormalAvaliacao, myId, avaliacao);
-		} else {
-			return A2($author$project$Page$Turma$viewNormalAvaliacao, myId, avaliacao);
-		}
-	});
-var $author$project$Page$Turma$viewTurma = function (model) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Disciplina: ' + model.turma.disciplinaNome)
-					])),
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Professor: ' + model.turma.professorNome)
-					])),
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Turma: ' + model.turma.numero)
-					])),
-				A2(
-				$elm$html$Html$h3,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text(
-						'Nota: ' + $elm$core$String$fromInt((model.turma.sumAvaliacoes / model.turma.qtdAvaliacoes) | 0))
-					])),
-				A2(
-				$elm$html$Html$p,
-				_List_Nil,
-				_List_fromArray(
-					[
-						$elm$html$Html$text('Comentarios:')
-					])),
-				A2(
-				$elm$html$Html$ul,
-				_List_Nil,
-				A2(
-					$elm$core$List$map,
-					A3($author$project$Page$Turma$viewAvaliacao, model.userId, model.state, model.editingAvaliacao),
-					model.turma.avaliacoes)),
-				$author$project$Page$Turma$viewAddAvaliacao(model.newAvaliacao)
-			]));
-};
-var $author$project$Page$Turma$view = function (model) {
-	return A2(
-		$elm$html$Html$div,
-		_List_Nil,
-		_List_fromArray(
-			[
-				$author$project$Page$Turma$viewError(model),
-				$author$project$Page$Turma$viewTurma(model)
-			]));
-};
-var $author$project$Main$currentView = function (model) {
-	var _v0 = model.page;
-	switch (_v0.$) {
-		case 'NotFoundPage':
-			return $author$project$Main$notFoundView;
-		case 'Disciplinas':
-			var pageModel = _v0.a;
-			return A2(
-				$elm$html$Html$map,
-				$author$project$Main$DisciplinasMsg,
-				$author$project$Page$ListDisciplinas$view(pageModel));
-		case 'Home':
-			var pageModel = _v0.a;
-			return A2(
-				$elm$html$Html$map,
-				$author$project$Main$HomeMsg,
-				$author$project$Page$Home$view(pageModel));
-		case 'Login':
-			var pageModel = _v0.a;
-			return A2(
-				$elm$html$Html$map,
-				$author$project$Main$LoginMsg,
-				$author$project$Page$Login$view(pageModel));
-		case 'Perfil':
-			var pageModel = _v0.a;
-			return A2(
-				$elm$html$Html$map,
-				$author$project$Main$PerfilMsg,
-				$author$project$Page$Perfil$view(pageModel));
-		case 'Disciplina':
-			var pageModel = _v0.a;
-			return A2(
-				$elm$html$Html$map,
-				$author$project$Main$DisciplinaMsg,
-				$author$project$Page$Disciplina$view(pageModel));
-		case 'Professores':
-			var pageModel = _v0.a;
-			return A2(
-				$elm$html$Html$map,
-				$author$project$Main$ProfessoresMsg,
-				$author$project$Page$Professores$view(pageModel));
-		case 'Turma':
-			var pageModel = _v0.a;
-			return A2(
-				$elm$html$Html$map,
-				$author$project$Main$TurmaMsg,
-				$author$project$Page$Turma$view(pageModel));
-		case 'Professor':
-			var pageModel = _v0.a;
-			return A2(
-				$elm$html$Html$map,
-				$author$project$Main$ProfessorMsg,
-				$author$project$Page$Professor$view(pageModel));
-		default:
-			var pageModel = _v0.a;
-			return A2(
-				$elm$html$Html$map,
-				$author$project$Main$DenunciasMsg,
-				$author$project$Page$Denuncias$view(pageModel));
-	}
-};
-var $author$project$Main$view = function (model) {
-	return {
-		body: _List_fromArray(
-			[
-				$author$project$Main$currentView(model)
-			]),
-		title: 'Post App'
-	};
-};
-var $author$project$Main$main = $elm$browser$Browser$application(
-	{
-		init: $author$project$Main$init,
-		onUrlChange: $author$project$Main$UrlChanged,
-		onUrlRequest: $author$project$Main$LinkClicked,
-		subscriptions: function (_v0) {
-			return $elm$core$Platform$Sub$none;
-		},
-		update: $author$project$Main$update,
-		view: $author$project$Main$view
-	});
-_Platform_export({'Main':{'init':$author$project$Main$main(
-	$elm$json$Json$Decode$oneOf(
-		_List_fromArray(
-			[
-				$elm$json$Json$Decode$null($elm$core$Maybe$Nothing),
-				A2(
-				$elm$json$Json$Decode$map,
-				$elm$core$Maybe$Just,
-				A2(
-					$elm$json$Json$Decode$andThen,
-					function (_v0) {
-						return A2(
-							$elm$json$Json$Decode$andThen,
-							function (_v1) {
-								return $elm$json$Json$Decode$succeed(
-									_Utils_Tuple2(_v0, _v1));
-							},
-							A2($elm$json$Json$Decode$index, 1, $elm$json$Json$Decode$bool));
-					},
-					A2($elm$json$Json$Decode$index, 0, $elm$json$Json$Decode$int)))
-			])))(0)}});}(this));
\ No newline at end of file
@@ -0,0 +1,50 @@
+module Api exposing (authHeader, expectPage, pageUrl)
+
+import Dict
+import Http
+import Json.Decode as Decode exposing (Decoder)
+
+-- Token devolvido pelo login, mandado nas rotas que exigem sessao
+authHeader : String -> Http.Header
+authHeader token =
+    Http.header "Authorization" ("Bearer " ++ token)
+
+-- Maior pagina que o backend aceita
+pageSize : String
+pageSize =
+    "500"
+
+pageUrl : String -> Maybe String -> String
+pageUrl url cursor =
+    case cursor of
+        Just after ->
+            url ++ "?limit=" ++ pageSize ++ "&after=" ++ after
+
+        Nothing ->
+            url ++ "?limit=" ++ pageSize
+
+-- As listagens sao paginadas: o cursor da proxima pagina vem no header X-Next-Cursor
+expectPage : (Result Http.Error ( a, Maybe String ) -> msg) -> Decoder a -> Http.Expect msg
+expectPage toMsg decoder =
+    Http.expectStringResponse toMsg <|
+        \response ->
+            case response of
+                Http.BadUrl_ url ->
+                    Err (Http.BadUrl url)
+
+                Http.Timeout_ ->
+                    Err Http.Timeout
+
+                Http.NetworkError_ ->
+                    Err Http.NetworkError
+
+                Http.BadStatus_ metadata _ ->
+                    Err (Http.BadStatus metadata.statusCode)
+
+                Http.GoodStatus_ metadata body ->
+                    case Decode.decodeString decoder body of
+                        Ok value ->
+                            Ok ( value, Dict.get "x-next-cursor" metadata.headers )
+
+                        Err err ->
+                            Err (Http.BadBody (Decode.errorToString err))
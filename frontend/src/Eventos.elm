@@ -0,0 +1,123 @@
+port module Eventos exposing (Evento(..), abrir, aplicar, fechar, recebidos)
+
+import Json.Decode as Decode exposing (Decoder)
+
+-- O index.html mantem um EventSource por vez, aberto por abrirEventos. Cada evento
+-- "avaliacao" chega por eventoRecebido; depois de uma reconexao chega um objeto sem "op"
+port abrirEventos : String -> Cmd msg
+port fecharEventos : () -> Cmd msg
+port eventoRecebido : (Decode.Value -> msg) -> Sub msg
+
+type alias Avaliacao =
+    { id : Int
+    , userId : Int
+    , userNome: String
+    , comentario: String
+    , pontuacao: Int
+    }
+
+type Evento
+    = Inserida Avaliacao
+    | Alterada Avaliacao
+    | Removida Int
+    -- Eventos podem ter sido perdidos (reconexao, comentario grande demais para o
+    -- NOTIFY): a pagina busca tudo de novo
+    | Recarregar
+
+abrir : String -> Cmd msg
+abrir url =
+    abrirEventos url
+
+fechar : Cmd msg
+fechar =
+    fecharEventos ()
+
+recebidos : (Evento -> msg) -> Sub msg
+recebidos toMsg =
+    eventoRecebido
+        (\value ->
+            Decode.decodeValue eventoDecoder value
+                |> Result.withDefault Recarregar
+                |> toMsg
+        )
+
+-- Aplica o evento na lista ja carregada e nos contadores, sem buscar a pagina de novo.
+-- Recarregar fica com a pagina
+aplicar : Evento -> { a | avaliacoes : List Avaliacao, qtdAvaliacoes : Int, sumAvaliacoes : Int } -> { a | avaliacoes : List Avaliacao, qtdAvaliacoes : Int, sumAvaliacoes : Int }
+aplicar evento alvo =
+    case evento of
+        Inserida avaliacao ->
+            -- A avaliacao do proprio usuario chega pela resposta do POST e pelo evento
+            case buscar avaliacao.id alvo.avaliacoes of
+                Just _ ->
+                    alvo
+
+                Nothing ->
+                    { alvo | avaliacoes = alvo.avaliacoes ++ [avaliacao]
+                    , qtdAvaliacoes = alvo.qtdAvaliacoes + 1
+                    , sumAvaliacoes = alvo.sumAvaliacoes + avaliacao.pontuacao
+                    }
+
+        Alterada avaliacao ->
+            case buscar avaliacao.id alvo.avaliacoes of
+                Just antiga ->
+                    { alvo | avaliacoes = List.map (\a -> if a.id == avaliacao.id then avaliacao else a) alvo.avaliacoes
+                    , sumAvaliacoes = alvo.sumAvaliacoes - antiga.pontuacao + avaliacao.pontuacao
+                    }
+
+                -- Ainda nao carregada: vem atualizada na proxima pagina
+                Nothing ->
+                    alvo
+
+        Removida avaliacaoId ->
+            case buscar avaliacaoId alvo.avaliacoes of
+                Just antiga ->
+                    { alvo | avaliacoes = List.filter (\a -> a.id /= avaliacaoId) alvo.avaliacoes
+                    , qtdAvaliacoes = alvo.qtdAvaliacoes - 1
+                    , sumAvaliacoes = alvo.sumAvaliacoes - antiga.pontuacao
+                    }
+
+                Nothing ->
+                    alvo
+
+        Recarregar ->
+            alvo
+
+buscar : Int -> List Avaliacao -> Maybe Avaliacao
+buscar avaliacaoId avaliacoes =
+    List.filter (\a -> a.id == avaliacaoId) avaliacoes
+        |> List.head
+
+-- Payload da trigger da migration 009: {op, tipo, alvo_id, avaliacao, incompleto?}
+eventoDecoder : Decoder Evento
+eventoDecoder =
+    Decode.oneOf
+        [ Decode.field "incompleto" Decode.bool
+            |> Decode.andThen (\_ -> Decode.succeed Recarregar)
+        , Decode.field "op" Decode.string
+            |> Decode.andThen opDecoder
+        ]
+
+opDecoder : String -> Decoder Evento
+opDecoder op =
+    case op of
+        "INSERT" ->
+            Decode.map Inserida (Decode.field "avaliacao" avaliacaoDecoder)
+
+        "UPDATE" ->
+            Decode.map Alterada (Decode.field "avaliacao" avaliacaoDecoder)
+
+        "DELETE" ->
+            Decode.map Removida (Decode.at [ "avaliacao", "id" ] Decode.int)
+
+        _ ->
+            Decode.succeed Recarregar
+
+avaliacaoDecoder : Decoder Avaliacao
+avaliacaoDecoder =
+    Decode.map5 Avaliacao
+        (Decode.field "id" Decode.int)
+        (Decode.field "user_id" Decode.int)
+        (Decode.field "user_nome" Decode.string)
+        (Decode.field "comentario" Decode.string)
+        (Decode.field "pontuacao" Decode.int)
@@ -15,12 +15,14 @@ import Page.Professores
 import Page.Turma
 import Page.Professor
 import Page.Denuncias
+import Eventos
 
 import Json.Decode as Decode exposing (..)
 import Json.Encode as Encode exposing (..)
 
+-- (user_id, is_admin, token da sessao)
 type alias User =
-    (Int, Bool)
+    (Int, Bool, String)
 
 type alias Model =
     { route : Route
@@ -71,7 +73,7 @@ init user url navKey =
 initCurrentPage : ( Model, Cmd Msg ) -> ( Model, Cmd Msg )
 initCurrentPage ( model, existingCmds ) =
     case model.user of
-        Just user ->
+        Just ( userId, isAdmin, token ) ->
             let
                 ( currentPage, mappedPageCmds ) =
                     case model.route of
@@ -88,21 +90,21 @@ initCurrentPage ( model, existingCmds ) =
                         Route.Home ->
                             let
                                 ( pageModel, pageCmds ) =
-                                    Page.Home.init (Tuple.second user)
+                                    Page.Home.init isAdmin
                             in
                             ( Home pageModel, Cmd.map HomeMsg pageCmds )
 
                         Route.Login ->
                             let
                                 ( pageModel, pageCmds ) =
-                                    Page.Home.init (Tuple.second user)
+                                    Page.Home.init isAdmin
                             in
                             ( Home pageModel, Cmd.map HomeMsg pageCmds )
 
                         Route.Perfil ->
                             let
                                 ( pageModel, pageCmds ) =
-                                    Page.Perfil.init (Tuple.first user)
+                                    Page.Perfil.init ( userId, token )
                             in
                             ( Perfil pageModel, Cmd.map PerfilMsg pageCmds )
 
@@ -123,26 +125,26 @@ initCurrentPage ( model, existingCmds ) =
                         ( Route.Turma  turmaId ) ->
                             let
                                 ( pageModel, pageCmds ) =
-                                    Page.Turma.init ( (Tuple.first user), turmaId )
+                                    Page.Turma.init ( userId, token, turmaId )
                             in
                             ( Turma pageModel, Cmd.map TurmaMsg pageCmds )
 
                         ( Route.Professor  professorId ) ->
                             let
                                 ( pageModel, pageCmds ) =
-                                    Page.Professor.init ( (Tuple.first user), professorId )
+                                    Page.Professor.init ( userId, token, professorId )
                             in
                             ( Professor pageModel, Cmd.map ProfessorMsg pageCmds )
 
                         Route.Denuncias ->
                             let
                                 ( pageModel, pageCmds ) =
-                                    Page.Denuncias.init
+                                    Page.Denuncias.init token
                             in
                             ( Denuncias pageModel, Cmd.map DenunciasMsg pageCmds )
             in
             ( { model | page = currentPage }
-            , Cmd.batch [ existingCmds, mappedPageCmds ]
+            , Cmd.batch [ existingCmds, mappedPageCmds, eventosCmd model.route ]
             )
             
         Nothing ->
@@ -150,9 +152,34 @@ initCurrentPage ( model, existingCmds ) =
                     Page.Login.init
             in
             ( { model | page = (Login pageModel), route = Route.Login }
-            , Cmd.map LoginMsg pageCmds
+            , Cmd.batch [ Cmd.map LoginMsg pageCmds, Eventos.fechar ]
             )
 
+-- So as paginas de turma e professor escutam o stream SSE; trocar de pagina fecha o anterior
+eventosCmd : Route -> Cmd Msg
+eventosCmd route =
+    case route of
+        ( Route.Turma turmaId ) ->
+            Eventos.abrir (Page.Turma.eventosUrl turmaId)
+
+        ( Route.Professor professorId ) ->
+            Eventos.abrir (Page.Professor.eventosUrl professorId)
+
+        _ ->
+            Eventos.fechar
+
+subscriptions : Model -> Sub Msg
+subscriptions model =
+    case model.page of
+        Turma pageModel ->
+            Sub.map TurmaMsg (Page.Turma.subscriptions pageModel)
+
+        Professor pageModel ->
+            Sub.map ProfessorMsg (Page.Professor.subscriptions pageModel)
+
+        _ ->
+            Sub.none
+
 view : Model -> Document Msg
 view model =
     { title = "Post App"
@@ -353,7 +380,7 @@ main =
         { init = init
         , view = view
         , update = update
-        , subscriptions = \_ -> Sub.none
+        , subscriptions = subscriptions
         , onUrlRequest = LinkClicked
         , onUrlChange = UrlChanged
         }
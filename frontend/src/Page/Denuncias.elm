@@ -6,12 +6,13 @@ import Html.Attributes exposing (..)
 import Html.Events exposing (onClick)
 import Http
 import ErrorMsg exposing ( buildErrorMsg )
+import Api
 
 import Json.Decode as Decode exposing (..)
 import Json.Encode as Encode exposing (..)
 
 type Msg
-    = WebData ( Result Http.Error ( List Denuncia ) )
+    = WebData ( Result Http.Error ( List Denuncia, Maybe String ) )
     | WebRemoveAvaliacaoData ( Result Http.Error ( String ) )
     | WebRemoveDenunciaData ( Result Http.Error ( String ) )
     | RemoverAvaliacao Int Int
@@ -27,6 +28,7 @@ type alias Model =
     { denuncias : List Denuncia
     , errorMsg : Maybe String
     , state : State
+    , token : String
     }
 
 type alias Denuncia =
@@ -76,8 +78,11 @@ update msg model =
     case msg of
         WebData result ->
             case result of 
-                Ok denuncias ->
-                    ( { model | denuncias = denuncias }, Cmd.none )
+                Ok ( denuncias, Just cursor ) ->
+                    ( { model | denuncias = model.denuncias ++ denuncias }, getDenuncias model.token (Just cursor) )
+
+                Ok ( denuncias, Nothing ) ->
+                    ( { model | denuncias = model.denuncias ++ denuncias }, Cmd.none )
                     
                 Err httpError ->
                     ( { model | errorMsg = Just (buildErrorMsg httpError) }, Cmd.none )
@@ -85,7 +90,7 @@ update msg model =
         WebRemoveDenunciaData result ->
             case result of 
                 Ok message ->
-                    ( { model | errorMsg = Just (message) }, getDenuncias )
+                    ( { model | errorMsg = Just (message), denuncias = [] }, getDenuncias model.token Nothing )
                     
                 Err httpError ->
                     ( { model | errorMsg = Just (buildErrorMsg httpError) }, Cmd.none )
@@ -99,36 +104,42 @@ update msg model =
                     ( { model | errorMsg = Just (buildErrorMsg httpError) }, Cmd.none )
 
         ( RemoverAvaliacao avaliacaoId denunciaId ) ->
-           ( model, Cmd.batch [removeAvaliacaoCmd avaliacaoId
-                              ,removeDenunciaCmd denunciaId
+           ( model, Cmd.batch [removeAvaliacaoCmd model.token avaliacaoId
+                              ,removeDenunciaCmd model.token denunciaId
                               ])
 
         ( RemoverDenuncia denunciaId ) ->
-           ( model, removeDenunciaCmd denunciaId )
+           ( model, removeDenunciaCmd model.token denunciaId )
 
         ( BanirUsuario avaliacaoId ) ->
-           ( model, banirUsuarioCmd avaliacaoId )
+           ( model, banirUsuarioCmd model.token avaliacaoId )
 
 
 
-init : ( Model, Cmd Msg )
-init =
+init : String -> ( Model, Cmd Msg )
+init token =
     ( { denuncias = []
       , errorMsg = Nothing
       , state = Loading
+      , token = token
       }
-    , getDenuncias
+    , getDenuncias token Nothing
     )
 
 denunciasUrl : String
 denunciasUrl =
     "http://127.0.0.1:5000/api/denuncias"
 
-getDenuncias: Cmd Msg
-getDenuncias =
-    Http.get
-        { url = denunciasUrl
-        , expect = Http.expectJson WebData (Decode.list denunciaDecoder)
+getDenuncias: String -> Maybe String -> Cmd Msg
+getDenuncias token cursor =
+    Http.request
+        { method = "GET"
+        , url = Api.pageUrl denunciasUrl cursor
+        , body = Http.emptyBody
+        , expect = Api.expectPage WebData (Decode.list denunciaDecoder)
+        , headers = [ Api.authHeader token ]
+        , timeout = Nothing
+        , tracker = Nothing
         }
 
 denunciaDecoder: Decoder Denuncia
@@ -143,14 +154,14 @@ removeAvaliacaoUrl id =
     "http://127.0.0.1:5000/api/avaliacao/" ++ String.fromInt(id)
 
 
-removeAvaliacaoCmd : Int -> Cmd Msg
-removeAvaliacaoCmd avaliacaoId =
+removeAvaliacaoCmd : String -> Int -> Cmd Msg
+removeAvaliacaoCmd token avaliacaoId =
     Http.request
         { method = "DELETE"
         , url = removeAvaliacaoUrl avaliacaoId
         , body = Http.emptyBody
         , expect = Http.expectJson WebRemoveAvaliacaoData removeAvaliacaoDecoder
-        , headers = []
+        , headers = [ Api.authHeader token ]
         , timeout = Nothing
         , tracker = Nothing
         }
@@ -164,14 +175,14 @@ removeDenunciaUrl id =
     "http://127.0.0.1:5000/api/denuncia/" ++ String.fromInt(id)
                      
 
-removeDenunciaCmd : Int -> Cmd Msg
-removeDenunciaCmd denunciaId =
+removeDenunciaCmd : String -> Int -> Cmd Msg
+removeDenunciaCmd token denunciaId =
     Http.request
         { method = "DELETE"
         , url = removeDenunciaUrl  denunciaId
         , body = Http.emptyBody
         , expect = Http.expectJson WebRemoveDenunciaData removeDenunciaDecoder
-        , headers = []
+        , headers = [ Api.authHeader token ]
         , timeout = Nothing
         , tracker = Nothing
         }
@@ -185,14 +196,14 @@ banirUsuarioUrl : Int -> String
 banirUsuarioUrl id =
     "http://127.0.0.1:5000/api/avaliacao/userban/" ++ String.fromInt(id)
                      
-banirUsuarioCmd: Int -> Cmd Msg
-banirUsuarioCmd avaliacaoId =
+banirUsuarioCmd: String -> Int -> Cmd Msg
+banirUsuarioCmd token avaliacaoId =
     Http.request
         { method = "DELETE"
         , url = banirUsuarioUrl  avaliacaoId
         , body = Http.emptyBody
         , expect = Http.expectJson WebRemoveAvaliacaoData removeAvaliacaoDecoder
-        , headers = []
+        , headers = [ Api.authHeader token ]
         , timeout = Nothing
         , tracker = Nothing
         }
@@ -5,12 +5,13 @@ import Html exposing (..)
 import Html.Attributes exposing (..)
 import Http
 import ErrorMsg exposing ( buildErrorMsg )
+import Api
 
 import Json.Decode as Decode exposing (..)
 import Json.Encode as Encode exposing (..)
 
 type Msg
-    = WebData ( Result Http.Error ( List DisciplinaItem ) )
+    = WebData ( Result Http.Error ( List DisciplinaItem, Maybe String ) )
 
 
 view : Model -> Html Msg
@@ -61,8 +62,11 @@ update msg model =
     case msg of
         WebData result ->
             case result of 
-                Ok disciplinas ->
-                    ( { model | disciplinas = disciplinas }, Cmd.none )
+                Ok ( disciplinas, Just cursor ) ->
+                    ( { model | disciplinas = model.disciplinas ++ disciplinas }, getDisciplinaList (Just cursor) )
+
+                Ok ( disciplinas, Nothing ) ->
+                    ( { model | disciplinas = model.disciplinas ++ disciplinas }, Cmd.none )
                     
                 Err httpError ->
                     ( { model | errorMsg = Just (buildErrorMsg httpError) }, Cmd.none )
@@ -78,7 +82,7 @@ init =
     ( { disciplinas = []
       , errorMsg = Nothing
       }
-    , getDisciplinaList
+    , getDisciplinaList Nothing
     )
 
 type alias DisciplinaItem =
@@ -90,11 +94,11 @@ disciplinaListUrl : String
 disciplinaListUrl =
     "http://127.0.0.1:5000/api/disciplinas"
 
-getDisciplinaList : Cmd Msg
-getDisciplinaList =
+getDisciplinaList : Maybe String -> Cmd Msg
+getDisciplinaList cursor =
     Http.get
-        { url = disciplinaListUrl
-        , expect = Http.expectJson WebData disciplinaListDecoder
+        { url = Api.pageUrl disciplinaListUrl cursor
+        , expect = Api.expectPage WebData disciplinaListDecoder
         }
 
 disciplinaListDecoder : Decoder (List DisciplinaItem)
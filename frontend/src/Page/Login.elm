@@ -21,8 +21,8 @@ type Msg
     | RegisterSetPassword String
     | ClickLogin
     | ClickRegister
-    | WebRegisterData ( Result Http.Error ( (Int, Bool) ) )
-    | WebLoginData ( Result Http.Error ( (Int, Bool) ) )
+    | WebRegisterData ( Result Http.Error ( (Int, Bool, String) ) )
+    | WebLoginData ( Result Http.Error ( (Int, Bool, String) ) )
 
 
 type alias LoginUser =
@@ -41,7 +41,7 @@ type alias RegisterUser =
 type alias Model =
     { loginErrorMsg: Maybe String
     , registerErrorMsg: Maybe String
-    , user: Maybe (Int, Bool)
+    , user: Maybe (Int, Bool, String)
     , loginUser: LoginUser
     , registerUser: RegisterUser
     }
@@ -192,11 +192,12 @@ userRegisterEncoder user =
         , ("password", Encode.string user.password)
         ]
 
-userIdDecoder : Decoder (Int, Bool)
+userIdDecoder : Decoder (Int, Bool, String)
 userIdDecoder =
-    Decode.map2 Tuple.pair
+    Decode.map3 (\userId isAdmin token -> (userId, isAdmin, token))
     (Decode.field "user_id" Decode.int)
     (Decode.field "is_admin" Decode.bool)
+    (Decode.field "token" Decode.string)
 
 
 loginUpdateEmail : LoginUser -> String -> LoginUser
@@ -6,6 +6,7 @@ import Html.Attributes exposing (..)
 import Html.Events exposing (onInput, onClick)
 import Http
 import ErrorMsg exposing ( buildErrorMsg )
+import Api
 
 import Json.Decode as Decode exposing (..)
 import Json.Encode as Encode exposing (..)
@@ -48,6 +49,7 @@ type alias Model =
     , infoMsg : Maybe String
     , state : PerfilState
     , userId: Int
+    , token: String
     , passwordInfo : PasswordInfo
     }
 
@@ -307,17 +309,18 @@ update msg model =
         ClickDeleteUser ->
             ( model, deleteUserCmd model )
 
-init : Int -> ( Model, Cmd Msg )
-init userId =
+init : (Int, String) -> ( Model, Cmd Msg )
+init (userId, token) =
     ( { user = Nothing
       , errorMsg = Nothing
       , infoMsg = Nothing
       , state = Showing
       , updatingUser = emptyUser
       , userId = userId
+      , token = token
       , passwordInfo = emptyPasswordInfo
       }
-    , getUserCmd userId
+    , getUserCmd userId token
     )
 
 deleteUserDecoder : Decoder String
@@ -335,7 +338,7 @@ deleteUserCmd model =
         , url = deleteUserUrl model.userId
         , body = Http.emptyBody
         , expect = Http.expectJson WebDeleteUser deleteUserDecoder
-        , headers = []
+        , headers = [ Api.authHeader model.token ]
         , timeout = Nothing
         , tracker = Nothing
         }
@@ -344,11 +347,16 @@ userUrl: Int ->  String
 userUrl userId =
     "http://127.0.0.1:5000/api/user/" ++ (String.fromInt userId)
 
-getUserCmd : Int -> Cmd Msg
-getUserCmd userId =
-    Http.get
-        { url = userUrl userId
+getUserCmd : Int -> String -> Cmd Msg
+getUserCmd userId token =
+    Http.request
+        { method = "GET"
+        , url = userUrl userId
+        , body = Http.emptyBody
         , expect = Http.expectJson WebUserData userDecoder
+        , headers = [ Api.authHeader token ]
+        , timeout = Nothing
+        , tracker = Nothing
         }
 
 userDecoder : Decoder User
@@ -375,7 +383,7 @@ updateUserCmd model =
         , url = userUrl model.userId
         , body = Http.jsonBody (userUpdateEncoder model.updatingUser)
         , expect = Http.expectJson WebUpdateUserData userDecoder
-        , headers = []
+        , headers = [ Api.authHeader model.token ]
         , timeout = Nothing
         , tracker = Nothing
         }
@@ -402,7 +410,7 @@ updatePasswordCmd model =
         , url = updatePasswordUrl model.userId
         , body = Http.jsonBody (updatePasswordEncoder model.passwordInfo)
         , expect = Http.expectJson WebPasswordData updatePasswordDecoder
-        , headers = []
+        , headers = [ Api.authHeader model.token ]
         , timeout = Nothing
         , tracker = Nothing
         }
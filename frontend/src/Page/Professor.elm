@@ -1,4 +1,4 @@
-module Page.Professor exposing (Model, Msg, view, init, update)
+module Page.Professor exposing (Model, Msg, view, init, update, subscriptions, eventosUrl)
 
 import Browser
 import Html exposing (..)
@@ -6,6 +6,8 @@ import Html.Attributes exposing (..)
 import Html.Events exposing (onClick, onInput)
 import Http
 import ErrorMsg exposing ( buildErrorMsg )
+import Api
+import Eventos
 
 import Json.Decode as Decode exposing (..)
 import Json.Encode as Encode exposing (..)
@@ -16,6 +18,7 @@ type Msg
     | SetComentario String
     | SetPontuacao String
     | ClickNewComentario
+    | EventoRecebido Eventos.Evento
 
 type State
     = Showing
@@ -24,6 +27,7 @@ type State
 type alias Model =
     { professor : Professor
     , professorId : Int
+    , token : String
     , errorMsg : Maybe String
     , state : State
     , newAvaliacao : NewAvaliacao
@@ -34,6 +38,7 @@ type alias Professor =
     , turmas : List Turma
     , qtdAvaliacoes : Int
     , sumAvaliacoes : Int
+    , img : Maybe String
     , avaliacoes : List Avaliacao
     }
 
@@ -63,6 +68,7 @@ emptyProfessor =
     , turmas = []
     , qtdAvaliacoes = 0
     , sumAvaliacoes = 0
+    , img = Nothing
     , avaliacoes = []
     }
 
@@ -85,7 +91,8 @@ viewProfessorOrError model =
 viewProfessor : Model -> Html Msg
 viewProfessor model =
     div []
-        [ h3 [] [ text ("Nome: " ++ model.professor.nome) ]
+        [ viewImagem model.professor.img
+        , h3 [] [ text ("Nome: " ++ model.professor.nome) ]
         , h3 [] [ text ("Nota: " ++ String.fromInt(model.professor.sumAvaliacoes // model.professor.qtdAvaliacoes)) ]
         , p [] [ text "Turmas:" ]
         , ul [] (List.map viewTurma model.professor.turmas)
@@ -94,6 +101,16 @@ viewProfessor model =
         , viewAddAvaliacao model.newAvaliacao
         ]
 
+-- O backend manda so o caminho da foto, servida por /api/professor/{id}/image
+viewImagem : Maybe String -> Html Msg
+viewImagem imagem =
+    case imagem of
+        Just path ->
+            img [ src ("http://127.0.0.1:5000" ++ path) ] []
+
+        Nothing ->
+            div [] []
+
 viewAddAvaliacao : NewAvaliacao -> Html Msg
 viewAddAvaliacao avaliacao =
     div []
@@ -163,13 +180,6 @@ updatePontuacao avaliacao value =
                                               |> modBy 6)  }
 
 
-addAvalicao : Professor -> Avaliacao -> Professor
-addAvalicao professor avaliacao =
-    { professor | avaliacoes = professor.avaliacoes ++ [avaliacao]
-    , qtdAvaliacoes = professor.qtdAvaliacoes + 1
-    , sumAvaliacoes = professor.sumAvaliacoes + avaliacao.pontuacao
-    }
-        
 update : Msg -> Model -> ( Model, Cmd Msg )
 update msg model =
     case msg of
@@ -184,7 +194,7 @@ update msg model =
         WebNewAvaliacaoData result ->
             case result of 
                 Ok avaliacao ->
-                    ( { model | professor = addAvalicao model.professor avaliacao }, Cmd.none )
+                    ( { model | professor = Eventos.aplicar (Eventos.Inserida avaliacao) model.professor }, Cmd.none )
                     
                 Err httpError ->
                     ( { model | errorMsg = Just (buildErrorMsg httpError) }, Cmd.none )
@@ -198,12 +208,24 @@ update msg model =
         ( ClickNewComentario) ->
             (model, newAvaliacaoCmd model)
 
+        ( EventoRecebido Eventos.Recarregar ) ->
+            ( model, getProfessor model.professorId )
 
+        ( EventoRecebido evento ) ->
+            ( { model | professor = Eventos.aplicar evento model.professor }, Cmd.none )
 
-init : (Int, Int) -> ( Model, Cmd Msg )
-init (userId, professorId) =
+-- Avaliacoes novas, alteradas e removidas chegam pelo stream SSE do professor
+subscriptions : Model -> Sub Msg
+subscriptions _ =
+    Eventos.recebidos EventoRecebido
+
+
+
+init : (Int, String, Int) -> ( Model, Cmd Msg )
+init (userId, token, professorId) =
     ( { professor = emptyProfessor
       , professorId = professorId
+      , token = token
       , errorMsg = Nothing
       , state = Loading
       , newAvaliacao = { userId = userId, comentario = "", pontuacao = 0 }
@@ -215,6 +237,10 @@ professorUrl : Int -> String
 professorUrl id =
     "http://127.0.0.1:5000/api/professor/" ++ (String.fromInt id)
 
+eventosUrl : Int -> String
+eventosUrl id =
+    professorUrl id ++ "/eventos"
+
 getProfessor: Int -> Cmd Msg
 getProfessor professorId =
     Http.get
@@ -224,11 +250,12 @@ getProfessor professorId =
 
 professorDecoder: Decoder Professor
 professorDecoder =
-    Decode.map5 Professor
+    Decode.map6 Professor
         (Decode.field "nome" Decode.string)
         (Decode.field "turmas" (Decode.list turmaDecoder))
         (Decode.field "qtd_avaliacoes" Decode.int)
         (Decode.field "sum_avaliacoes" Decode.int)
+        (Decode.field "img" (Decode.nullable Decode.string))
         (Decode.field "avaliacoes" (Decode.list avaliacaoDecoder))
 
 turmaDecoder : Decoder Turma
@@ -266,7 +293,7 @@ newAvaliacaoCmd model =
         , url = newAvaliacaoUrl model.professorId
         , body = Http.jsonBody (newAvaliacaoEncoder model.newAvaliacao)
         , expect = Http.expectJson WebNewAvaliacaoData avaliacaoDecoder
-        , headers = []
+        , headers = [ Api.authHeader model.token ]
         , timeout = Nothing
         , tracker = Nothing
         }
@@ -5,12 +5,13 @@ import Html exposing (..)
 import Html.Attributes exposing (..)
 import Http
 import ErrorMsg exposing ( buildErrorMsg )
+import Api
 
 import Json.Decode as Decode exposing (..)
 import Json.Encode as Encode exposing (..)
 
 type Msg
-    = WebData ( Result Http.Error ( List Professor ) )
+    = WebData ( Result Http.Error ( List Professor, Maybe String ) )
 
 type State
     = Showing
@@ -84,8 +85,11 @@ update msg model =
     case msg of
         WebData result ->
             case result of 
-                Ok professores ->
-                    ( { model | professores = professores }, Cmd.none )
+                Ok ( professores, Just cursor ) ->
+                    ( { model | professores = model.professores ++ professores }, getProfessores (Just cursor) )
+
+                Ok ( professores, Nothing ) ->
+                    ( { model | professores = model.professores ++ professores }, Cmd.none )
                     
                 Err httpError ->
                     ( { model | errorMsg = Just (buildErrorMsg httpError) }, Cmd.none )
@@ -98,18 +102,18 @@ init =
       , errorMsg = Nothing
       , state = Loading
       }
-    , getProfessores
+    , getProfessores Nothing
     )
 
 professoresUrl : String
 professoresUrl =
-    "http://127.0.0.1:5000/api/professores/"
+    "http://127.0.0.1:5000/api/professores"
 
-getProfessores: Cmd Msg
-getProfessores =
+getProfessores: Maybe String -> Cmd Msg
+getProfessores cursor =
     Http.get
-        { url = professoresUrl
-        , expect = Http.expectJson WebData (Decode.list professoresDecoder)
+        { url = Api.pageUrl professoresUrl cursor
+        , expect = Api.expectPage WebData (Decode.list professoresDecoder)
         }
 
 professoresDecoder : Decoder Professor
@@ -1,4 +1,4 @@
-module Page.Turma exposing (Model, Msg, view, init, update)
+module Page.Turma exposing (Model, Msg, view, init, update, subscriptions, eventosUrl)
 
 import Browser
 import Html exposing (..)
@@ -6,12 +6,14 @@ import Html.Attributes exposing (..)
 import Html.Events exposing (onClick, onInput)
 import Http
 import ErrorMsg exposing ( buildErrorMsg )
+import Api
+import Eventos
 
 import Json.Decode as Decode exposing (..)
 import Json.Encode as Encode exposing (..)
 
 type Msg
-    = WebTurmaData ( Result Http.Error ( Turma ) )
+    = WebTurmaData ( Result Http.Error ( Turma, Maybe String ) )
     | WebNewAvaliacaoData ( Result Http.Error ( Avaliacao ) )
     | WebDenunciaData ( Result Http.Error ( String ) )
     | WebRemoveAvaliacaoData ( Result Http.Error ( String ) )
@@ -25,6 +27,7 @@ type Msg
     | ClickNewComentario
     | ClickUpdateComentario Int
     | CancelarUpdate
+    | EventoRecebido Eventos.Evento
 
 
 type State
@@ -36,6 +39,7 @@ type alias Model =
     { turma : Turma
     , turmaId : Int
     , userId : Int
+    , token : String
     , errorMsg : Maybe String
     , state : State
     , newAvaliacao : NewAvaliacao
@@ -230,20 +234,21 @@ updatePontuacao avaliacao value =
                                               |> modBy 6)  }
 
 
-addAvalicao : Turma -> Avaliacao -> Turma
-addAvalicao turma avaliacao =
-    { turma | avaliacoes = turma.avaliacoes ++ [avaliacao]
-    , qtdAvaliacoes = turma.qtdAvaliacoes + 1
-    , sumAvaliacoes = turma.sumAvaliacoes + avaliacao.pontuacao
-    }
-        
+-- Cada pagina traz a turma com o proximo trecho das avaliacoes
+addAvaliacoes : Turma -> Turma -> Turma
+addAvaliacoes turma pagina =
+    { pagina | avaliacoes = turma.avaliacoes ++ pagina.avaliacoes }
+
 update : Msg -> Model -> ( Model, Cmd Msg )
 update msg model =
     case msg of
         WebTurmaData result ->
             case result of 
-                Ok turma ->
-                    ( { model | turma = turma }, Cmd.none )
+                Ok ( turma, Just cursor ) ->
+                    ( { model | turma = addAvaliacoes model.turma turma }, getTurma model.turmaId (Just cursor) )
+
+                Ok ( turma, Nothing ) ->
+                    ( { model | turma = addAvaliacoes model.turma turma }, Cmd.none )
                     
                 Err httpError ->
                     ( { model | errorMsg = Just (buildErrorMsg httpError) }, Cmd.none )
@@ -251,7 +256,7 @@ update msg model =
         WebNewAvaliacaoData result ->
             case result of 
                 Ok avaliacao ->
-                    ( { model | turma = addAvalicao model.turma avaliacao }, Cmd.none )
+                    ( { model | turma = Eventos.aplicar (Eventos.Inserida avaliacao) model.turma }, Cmd.none )
                     
                 Err httpError ->
                     ( { model | errorMsg = Just (buildErrorMsg httpError) }, Cmd.none )
@@ -288,10 +293,10 @@ update msg model =
             (model, newAvaliacaoCmd model)
 
         ( Denuncia avaliacaoId) ->
-            (model, denunciaCmd avaliacaoId)
+            (model, denunciaCmd model.token avaliacaoId)
 
         ( RemoverAvaliacao avaliacaoId) ->
-           ( model, removeAvaliacaoCmd avaliacaoId )
+           ( model, removeAvaliacaoCmd model.token avaliacaoId )
 
         ( EditarAvaliacao avaliacaoId) ->
            ( { model | state = (Editing avaliacaoId), editingAvaliacao = getEditAvaliacao avaliacaoId model.turma.avaliacoes }, Cmd.none )
@@ -302,6 +307,17 @@ update msg model =
         ( ClickUpdateComentario id) ->
             ( { model | state = Showing } , editComentarioCmd model id)
 
+        ( EventoRecebido Eventos.Recarregar ) ->
+            ( { model | turma = emptyTurma }, getTurma model.turmaId Nothing )
+
+        ( EventoRecebido evento ) ->
+            ( { model | turma = Eventos.aplicar evento model.turma }, Cmd.none )
+
+-- Avaliacoes novas, alteradas e removidas chegam pelo stream SSE da turma
+subscriptions : Model -> Sub Msg
+subscriptions _ =
+    Eventos.recebidos EventoRecebido
+
 toEdtingAvaliacao : Avaliacao -> EditingAvaliacao
 toEdtingAvaliacao avaliacao =
     { comentario = avaliacao.comentario
@@ -318,28 +334,33 @@ getEditAvaliacao id avaliacoes =
         |> toEdtingAvaliacao
         
 
-init : (Int, Int) -> ( Model, Cmd Msg )
-init (userId, turmaId) =
+init : (Int, String, Int) -> ( Model, Cmd Msg )
+init (userId, token, turmaId) =
     ( { turma = emptyTurma
       , turmaId = turmaId
       , userId = userId
+      , token = token
       , errorMsg = Nothing
       , state = Loading
       , newAvaliacao = { userId = userId, comentario = "", pontuacao = 0 }
       , editingAvaliacao = { comentario = "", pontuacao = 0, userNome = "" }
       }
-    , getTurma turmaId
+    , getTurma turmaId Nothing
     )
 
 turmaUrl : Int -> String
 turmaUrl id =
     "http://127.0.0.1:5000/api/turma/" ++ (String.fromInt id)
 
-getTurma: Int -> Cmd Msg
-getTurma turmaId =
+eventosUrl : Int -> String
+eventosUrl id =
+    turmaUrl id ++ "/eventos"
+
+getTurma: Int -> Maybe String -> Cmd Msg
+getTurma turmaId cursor =
     Http.get
-        { url = turmaUrl turmaId
-        , expect = Http.expectJson WebTurmaData turmaDecoder
+        { url = Api.pageUrl (turmaUrl turmaId) cursor
+        , expect = Api.expectPage WebTurmaData turmaDecoder
         }
 
 turmaDecoder: Decoder Turma
@@ -382,7 +403,7 @@ newAvaliacaoCmd model =
         , url = newAvaliacaoUrl model.turmaId
         , body = Http.jsonBody (newAvaliacaoEncoder model.newAvaliacao)
         , expect = Http.expectJson WebNewAvaliacaoData avaliacaoDecoder
-        , headers = []
+        , headers = [ Api.authHeader model.token ]
         , timeout = Nothing
         , tracker = Nothing
         }
@@ -391,14 +412,14 @@ addDenuncia : String
 addDenuncia =
     "http://127.0.0.1:5000/api/denuncias"
         
-denunciaCmd : Int -> Cmd Msg
-denunciaCmd avaliacaoId =
+denunciaCmd : String -> Int -> Cmd Msg
+denunciaCmd token avaliacaoId =
     Http.request
         { method = "POST"
         , url = addDenuncia
         , body = Http.jsonBody (denunciaEncoder avaliacaoId)
         , expect = Http.expectJson WebDenunciaData denunciaDecoder
-        , headers = []
+        , headers = [ Api.authHeader token ]
         , timeout = Nothing
         , tracker = Nothing
         }
@@ -418,14 +439,14 @@ removeAvaliacaoUrl id =
     "http://127.0.0.1:5000/api/avaliacao/" ++ String.fromInt(id)
                      
 
-removeAvaliacaoCmd : Int -> Cmd Msg
-removeAvaliacaoCmd avaliacaoId =
+removeAvaliacaoCmd : String -> Int -> Cmd Msg
+removeAvaliacaoCmd token avaliacaoId =
     Http.request
         { method = "DELETE"
         , url = removeAvaliacaoUrl avaliacaoId
         , body = Http.emptyBody
         , expect = Http.expectJson WebRemoveAvaliacaoData removeAvaliacaoDecoder
-        , headers = []
+        , headers = [ Api.authHeader token ]
         , timeout = Nothing
         , tracker = Nothing
         }
@@ -453,7 +474,7 @@ editComentarioCmd model id =
         , url = editAvaliacaoUrl id
         , body = Http.jsonBody (editAvaliacaoEncoder model.editingAvaliacao)
         , expect = Http.expectJson WebRemoveAvaliacaoData removeAvaliacaoDecoder
-        , headers = []
+        , headers = [ Api.authHeader model.token ]
         , timeout = Nothing
         , tracker = Nothing
         }